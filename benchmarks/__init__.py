@@ -0,0 +1 @@
+"""Event Agent Benchmarks"""
@@ -0,0 +1,378 @@
+"""
+Finance API Benchmark Suite
+
+httpx ASGI transport로 FastAPI 앱을 프로세스 내에서 호출하여 엔드포인트별 지연/처리량 측정.
+- 데이터 규모별(기본 1k/10k/100k, 최대 1M 예산 항목) 저장소 직접 시딩
+  (스폰서: 항목 수의 1/10, 리포트: 1/100, 이벤트: 1/1000, 이벤트당 스폰서십 패키지 1개)
+- 엔드포인트: 예산 항목 생성, 필터 목록 조회, 예산 요약(전체 / If-None-Match 304), 리포트 생성,
+  스폰서 상태 변경, 예산 항목 수정(단건 / 100건 일괄)
+- 결과: p50/p95/p99/mean 지연(ms), 처리량(req/s)을 JSON 파일로 기록 → 실행 간 비교
+- 저장소 백엔드는 FINANCE_STORAGE_BACKEND 환경 변수로 선택 (결과에 함께 기록)
+
+실행:
+    python -m benchmarks.bench_api --sizes 1000,10000,100000 --requests 500
+    python -m benchmarks.bench_api --sizes 1000000 --baseline benchmarks/results/<이전 결과>.json
+
+Author: Event Agent System
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import time
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+from uuid import UUID, uuid4
+
+import httpx
+
+from main import app
+from routers.finance import repository
+from schemas.financial import (
+    BudgetCategory,
+    BudgetLineItem,
+    FinancialReport,
+    Sponsor,
+    SponsorshipPackage,
+    SponsorshipStatus,
+    SponsorshipTier,
+)
+from storage import FinanceRepository
+
+
+RESULTS_DIR = Path(__file__).parent / "results"
+SEED_BATCH = 10_000
+
+# 일괄 수정 요청당 항목 수
+BATCH_UPDATE_SIZE = 100
+
+# 요청 하나를 만들어 보내는 함수: (client, rng) → response
+Operation = Callable[[httpx.AsyncClient, random.Random], Awaitable[httpx.Response]]
+
+
+# =============================================================================
+# SEEDING
+# =============================================================================
+
+class Dataset:
+    """시딩된 데이터의 ID 목록 (요청 파라미터 선택용)"""
+
+    def __init__(self, events: List[UUID], sponsors: List[UUID], items: List[UUID]):
+        self.events = events
+        self.sponsors = sponsors
+        self.items = items
+
+
+async def seed(repo: FinanceRepository, items: int) -> Dataset:
+    """예산 항목 / 스폰서 / 리포트를 저장소에 직접 일괄 적재"""
+    await repo.reset()
+    rng = random.Random(42)
+    categories = list(BudgetCategory)
+    statuses = list(SponsorshipStatus)
+    events = [uuid4() for _ in range(max(1, items // 1000))]
+    item_ids: List[UUID] = []
+
+    for start in range(0, items, SEED_BATCH):
+        batch = []
+        for i in range(start, min(items, start + SEED_BATCH)):
+            unit_cost = Decimal(rng.randint(100, 1_000_000)) / 100
+            quantity = Decimal(rng.randint(1, 20))
+            batch.append(BudgetLineItem(
+                event_id=events[i % len(events)],
+                category=categories[i % len(categories)],
+                name=f"Line item {i}",
+                unit_cost=unit_cost,
+                quantity=quantity,
+                projected_amount=unit_cost * quantity,
+                actual_amount=unit_cost * quantity * Decimal(rng.randint(50, 130)) / 100,
+            ))
+        await repo.budget_items.add_many(batch)
+        item_ids.extend(item.id for item in batch)
+
+    # 이벤트당 패키지 1개, 스폰서는 이벤트에 고르게 연결
+    packages = [
+        SponsorshipPackage(
+            event_id=event_id, tier=SponsorshipTier.GOLD, tier_name="Gold", amount=Decimal("50000")
+        )
+        for event_id in events
+    ]
+    await repo.sponsorship_packages.add_many(packages)
+
+    sponsors = []
+    batch = []
+    for i in range(max(10, items // 10)):
+        package = packages[i % len(packages)]
+        sponsor = Sponsor(
+            company_name=f"Sponsor {i}",
+            industry="technology",
+            contact_name=f"Contact {i}",
+            contact_email=f"sponsor{i}@example.com",
+            package_id=package.id,
+            event_id=package.event_id,
+            status=statuses[i % len(statuses)],
+            committed_amount=Decimal(rng.randint(1_000, 100_000)),
+        )
+        sponsors.append(sponsor.id)
+        batch.append(sponsor)
+    await repo.sponsors.add_many(batch)
+
+    await repo.reports.add_many([
+        FinancialReport(
+            event_id=events[i % len(events)],
+            report_name=f"Report {i}",
+            period_start=date(2026, 1, 1),
+            period_end=date(2026, 12, 31),
+            total_budget=Decimal("100000"),
+            total_actual=Decimal("90000"),
+        )
+        for i in range(max(10, items // 100))
+    ])
+    return Dataset(events, sponsors, item_ids)
+
+
+# =============================================================================
+# OPERATIONS
+# =============================================================================
+
+def build_operations(data: Dataset) -> Dict[str, Operation]:
+    """엔드포인트별 요청 생성기"""
+    categories = [c.value for c in BudgetCategory]
+    statuses = [s.value for s in SponsorshipStatus]
+
+    async def create_item(client: httpx.AsyncClient, rng: random.Random) -> httpx.Response:
+        return await client.post("/finance/budget-items", json={
+            "event_id": str(rng.choice(data.events)),
+            "category": rng.choice(categories),
+            "name": "Benchmark item",
+            "unit_cost": str(Decimal(rng.randint(100, 100_000)) / 100),
+            "quantity": str(rng.randint(1, 20)),
+        })
+
+    async def list_items(client: httpx.AsyncClient, rng: random.Random) -> httpx.Response:
+        return await client.get("/finance/budget-items", params={
+            "event_id": str(rng.choice(data.events)),
+            "category": rng.choice(categories),
+            "limit": 100,
+        })
+
+    async def summary(client: httpx.AsyncClient, rng: random.Random) -> httpx.Response:
+        return await client.get(f"/finance/budget-items/summary/{rng.choice(data.events)}")
+
+    etags: Dict[UUID, str] = {}
+
+    async def summary_conditional(client: httpx.AsyncClient, rng: random.Random) -> httpx.Response:
+        # 대시보드 폴링: 마지막으로 받은 ETag로 재요청 (변경 없으면 304)
+        event_id = rng.choice(data.events)
+        headers = {"If-None-Match": etags[event_id]} if event_id in etags else {}
+        response = await client.get(f"/finance/budget-items/summary/{event_id}", headers=headers)
+        etags[event_id] = response.headers["ETag"]
+        return response
+
+    async def generate_report(client: httpx.AsyncClient, rng: random.Random) -> httpx.Response:
+        return await client.post("/finance/reports/generate", json={
+            "event_id": str(rng.choice(data.events)),
+            "period_start": "2026-01-01",
+            "period_end": "2026-12-31",
+            "total_attendees": 500,
+            "paid_attendees": 450,
+        })
+
+    async def sponsor_status(client: httpx.AsyncClient, rng: random.Random) -> httpx.Response:
+        return await client.patch(
+            f"/finance/sponsors/{rng.choice(data.sponsors)}/status",
+            params={"status": rng.choice(statuses)},
+        )
+
+    async def update_item(client: httpx.AsyncClient, rng: random.Random) -> httpx.Response:
+        return await client.patch(f"/finance/budget-items/{rng.choice(data.items)}", json={
+            "actual_amount": str(Decimal(rng.randint(100, 100_000)) / 100),
+            "status": "paid",
+        })
+
+    async def batch_update_items(client: httpx.AsyncClient, rng: random.Random) -> httpx.Response:
+        # 월말 마감: 100건의 실제 지출액 + PAID 처리를 한 요청으로
+        return await client.patch("/finance/budget-items", json={"updates": [
+            {
+                "id": str(item_id),
+                "changes": {"actual_amount": str(Decimal(rng.randint(100, 100_000)) / 100), "status": "paid"},
+            }
+            for item_id in rng.sample(data.items, min(BATCH_UPDATE_SIZE, len(data.items)))
+        ]})
+
+    return {
+        "create_budget_item": create_item,
+        "list_budget_items": list_items,
+        "budget_summary": summary,
+        "budget_summary_304": summary_conditional,
+        "generate_report": generate_report,
+        "update_sponsor_status": sponsor_status,
+        "update_budget_item": update_item,
+        "batch_update_budget_items": batch_update_items,
+    }
+
+
+# =============================================================================
+# MEASUREMENT
+# =============================================================================
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """nearest-rank 백분위 (정렬된 값 기준)"""
+    rank = max(1, math.ceil(q / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+async def measure(
+    client: httpx.AsyncClient,
+    operation: Operation,
+    requests: int,
+    concurrency: int,
+    warmup: int,
+) -> Dict[str, Any]:
+    """요청을 concurrency개 워커로 나누어 실행하고 지연 분포 / 처리량 계산"""
+    rng = random.Random(7)
+    for _ in range(warmup):
+        await operation(client, rng)
+
+    latencies: List[float] = []
+    errors = 0
+    remaining = iter(range(requests))
+
+    async def worker() -> None:
+        nonlocal errors
+        for _ in remaining:
+            start = time.perf_counter()
+            response = await operation(client, rng)
+            latencies.append(time.perf_counter() - start)
+            if response.status_code >= 400:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "requests": requests,
+        "errors": errors,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "mean_ms": round(sum(latencies) / len(latencies) * 1000, 3),
+        "throughput_rps": round(requests / elapsed, 1),
+    }
+
+
+# =============================================================================
+# REPORTING
+# =============================================================================
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_table(size: int, seed_seconds: float, endpoints: Dict[str, Dict[str, Any]]) -> None:
+    print(f"\nitems={size:,} (seeded in {seed_seconds:.1f}s)")
+    print(f"{'endpoint':<24}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'req/s':>10}{'errors':>8}")
+    for name, stats in endpoints.items():
+        print(f"{name:<24}{stats['p50_ms']:>10.2f}{stats['p95_ms']:>10.2f}{stats['p99_ms']:>10.2f}"
+              f"{stats['throughput_rps']:>10.0f}{stats['errors']:>8}")
+
+
+def print_comparison(current: Dict[str, Any], baseline: Dict[str, Any]) -> None:
+    """이전 결과 대비 p50 / p99 / 처리량 변화율"""
+    print(f"\ncompared with {baseline.get('revision')} ({baseline.get('timestamp')})")
+    previous = {run["items"]: run["endpoints"] for run in baseline.get("runs", [])}
+    for run in current["runs"]:
+        before = previous.get(run["items"])
+        if before is None:
+            continue
+        print(f"items={run['items']:,}")
+        for name, stats in run["endpoints"].items():
+            if name not in before:
+                continue
+
+            def change(key: str) -> str:
+                old = before[name][key]
+                return f"{(stats[key] - old) / old * 100:+.1f}%" if old else "n/a"
+
+            print(f"  {name:<24}p50 {change('p50_ms'):>8}  p99 {change('p99_ms'):>8}"
+                  f"  req/s {change('throughput_rps'):>8}")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Finance API benchmark suite")
+    parser.add_argument("--sizes", default="1000,10000,100000",
+                        help="쉼표로 구분한 예산 항목 수 (예: 1000,10000,100000,1000000)")
+    parser.add_argument("--requests", type=int, default=500, help="엔드포인트별 요청 수")
+    parser.add_argument("--concurrency", type=int, default=1, help="동시 요청 수")
+    parser.add_argument("--warmup", type=int, default=20, help="엔드포인트별 워밍업 요청 수")
+    parser.add_argument("--endpoints", default=None, help="측정할 엔드포인트 (쉼표 구분, 기본: 전체)")
+    parser.add_argument("--output", default=None, help="결과 JSON 경로 (기본: benchmarks/results/)")
+    parser.add_argument("--baseline", default=None, help="비교할 이전 결과 JSON")
+    args = parser.parse_args()
+
+    backend = os.getenv("FINANCE_STORAGE_BACKEND", "memory")
+    result: Dict[str, Any] = {
+        "benchmark": "finance_api",
+        "timestamp": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "backend": backend,
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "runs": [],
+    }
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for size in (int(s) for s in args.sizes.split(",")):
+            start = time.perf_counter()
+            data = await seed(repository, size)
+            seed_seconds = time.perf_counter() - start
+
+            operations = build_operations(data)
+            if args.endpoints:
+                wanted = args.endpoints.split(",")
+                operations = {name: op for name, op in operations.items() if name in wanted}
+
+            endpoints = {
+                name: await measure(client, operation, args.requests, args.concurrency, args.warmup)
+                for name, operation in operations.items()
+            }
+            result["runs"].append({
+                "items": size,
+                "sponsors": len(data.sponsors),
+                "events": len(data.events),
+                "seed_seconds": round(seed_seconds, 2),
+                "endpoints": endpoints,
+            })
+            print_table(size, seed_seconds, endpoints)
+    await repository.close()
+
+    output = Path(args.output) if args.output else (
+        RESULTS_DIR / f"bench_api_{backend}_{datetime.utcnow():%Y%m%dT%H%M%S}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, indent=2))
+    print(f"\nresults written to {output}")
+
+    if args.baseline:
+        print_comparison(result, json.loads(Path(args.baseline).read_text()))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,262 @@
+"""
+Journal / Snapshot Benchmark
+
+In-Memory 저장소 저널(storage.journal)의 쓰기 지연 영향과 재시작 복구 시간 측정.
+- write: 저널 없음 / 있음 저장소에서 단건 add · replace 지연 (p50 / p99 µs)
+  저널 쪽은 flush 태스크가 같은 프로세스에서 group commit(fsync)을 수행하는 상태로 측정
+- seed: 예산 항목 --records 건을 add_many로 적재 (저널 기록) → 스냅샷 시간
+- restart: 새 프로세스에서 open() (스냅샷 적재 + 저널 재생) 시간, 복구 건수, 최대 RSS
+  --tail N: 스냅샷 이후 N건 수정을 저널에만 남기고(비정상 종료) 재생 비용 포함
+- 복구한 레코드 / 이벤트 집계가 원본과 일치하는지 표본 검증
+- 결과: benchmarks/results/ JSON
+
+실행:
+    python -m benchmarks.bench_journal --records 1000000
+    python -m benchmarks.bench_journal --records 200000 --tail 50000 --writes 5000
+
+Author: Event Agent System
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+from uuid import UUID, uuid4
+
+from schemas.financial import BudgetCategory, BudgetLineItem, BudgetStatus
+from storage.memory import MemoryFinanceRepository
+
+
+ROOT = Path(__file__).resolve().parent.parent
+RESULTS_DIR = Path(__file__).parent / "results"
+
+SEED_BATCH = 10_000
+
+# 자식 프로세스: 저널 디렉터리에서 복구 후 시간 / 건수 / 표본 / 집계를 JSON으로 출력
+CHILD = r'''
+import asyncio, json, resource, sys, time
+from uuid import UUID
+
+async def main():
+    started = time.perf_counter()
+    from storage.memory import MemoryFinanceRepository
+    repo = MemoryFinanceRepository(journal_dir=sys.argv[1])
+    imported = time.perf_counter()
+    await repo.open()
+    opened = time.perf_counter()
+    sample = [UUID(value) for value in json.loads(sys.argv[2])]
+    records = await repo.budget_items.get_many(sample)
+    event_id = UUID(sys.argv[3])
+    aggregate = await repo.budget_aggregate(event_id)
+    drift = await repo.check_budget_aggregate(event_id)
+    stats = repo.journal.stats()
+    print(json.dumps({
+        "import_s": imported - started,
+        "open_s": opened - imported,
+        "count": await repo.budget_items.count(),
+        "sample": {str(k): v.model_dump_json() for k, v in records.items()},
+        "aggregate_projected": str(aggregate.total_projected),
+        "drift": len(drift),
+        "recovered_records": stats["recovered_records"],
+        "replayed_records": stats["replayed_records"],
+        "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }))
+
+asyncio.run(main())
+'''
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """nearest-rank 백분위 (정렬된 값 기준)"""
+    rank = max(1, math.ceil(q / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def make_items(count: int, events: List[UUID], rng: random.Random) -> List[BudgetLineItem]:
+    categories = list(BudgetCategory)
+    base = datetime(2026, 1, 1)
+    items = []
+    for i in range(count):
+        unit_cost = Decimal(rng.randint(1_000, 500_000)) / 100
+        quantity = Decimal(rng.choice((1, 1, 1, 2, 5, 10)))
+        items.append(BudgetLineItem(
+            event_id=events[i % len(events)],
+            category=categories[i % len(categories)],
+            name=f"Line item {i}",
+            vendor_name=f"Vendor {i % 2_000}" if i % 3 else None,
+            reference_number=f"PO-{i:08d}",
+            unit_cost=unit_cost,
+            quantity=quantity,
+            projected_amount=unit_cost * quantity,
+            payment_due_date=date(2026, 1, 1) + timedelta(days=i % 365),
+            created_at=base + timedelta(microseconds=i),
+            updated_at=base + timedelta(microseconds=i),
+        ))
+    return items
+
+
+def summarize(latencies: List[float]) -> Dict[str, float]:
+    values = sorted(latencies)
+    return {
+        "p50_us": round(percentile(values, 50) * 1e6, 1),
+        "p99_us": round(percentile(values, 99) * 1e6, 1),
+        "mean_us": round(sum(values) / len(values) * 1e6, 1),
+    }
+
+
+async def write_latency(repo: MemoryFinanceRepository, items: List[BudgetLineItem]) -> Dict[str, Any]:
+    """단건 add 후 같은 항목 replace (버전 + 1), 호출별 지연"""
+    adds: List[float] = []
+    replaces: List[float] = []
+    for item in items:
+        begin = time.perf_counter()
+        await repo.budget_items.add(item)
+        adds.append(time.perf_counter() - begin)
+        # flush 태스크가 실행될 기회 (실제 서버처럼 요청 사이에 이벤트 루프 양보)
+        await asyncio.sleep(0)
+    for item in items:
+        updated = item.model_copy(update={"actual_amount": item.projected_amount, "version": item.version + 1})
+        begin = time.perf_counter()
+        await repo.budget_items.replace(updated)
+        replaces.append(time.perf_counter() - begin)
+        await asyncio.sleep(0)
+    return {"add": summarize(adds), "replace": summarize(replaces)}
+
+
+def restart(directory: str, sample: List[BudgetLineItem], event_id: UUID) -> Dict[str, Any]:
+    env = dict(os.environ, PYTHONPATH=str(ROOT))
+    begin = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-c", CHILD, directory, json.dumps([str(item.id) for item in sample]), str(event_id)],
+        cwd=ROOT, env=env, capture_output=True, text=True,
+    )
+    elapsed = time.perf_counter() - begin
+    if completed.returncode != 0:
+        raise RuntimeError(f"restart child failed:\n{completed.stderr or completed.stdout}")
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    result["process_s"] = elapsed
+    return result
+
+
+async def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Journal / snapshot benchmark")
+    parser.add_argument("--records", type=int, default=1_000_000, help="적재할 예산 항목 수")
+    parser.add_argument("--events", type=int, default=1_000)
+    parser.add_argument("--writes", type=int, default=2_000, help="지연 측정용 단건 쓰기 수")
+    parser.add_argument("--tail", type=int, default=0, help="스냅샷 이후 저널에만 남길 수정 수")
+    parser.add_argument("--directory", default=None, help="저널 디렉터리 (기본: 임시 디렉터리, 종료 시 삭제)")
+    parser.add_argument("--output", default=None, help="결과 JSON 경로 (기본: benchmarks/results/)")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(42)
+    events = [uuid4() for _ in range(args.events)]
+    directory = args.directory or tempfile.mkdtemp(prefix="finance-journal-")
+    result: Dict[str, Any] = {
+        "benchmark": "journal",
+        "timestamp": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "records": args.records,
+        "tail": args.tail,
+    }
+    try:
+        # 1) 쓰기 지연: 저널 없음 vs 있음
+        write_items = make_items(args.writes, events, rng)
+        plain = MemoryFinanceRepository()
+        result["write_plain"] = await write_latency(plain, write_items)
+        latency_dir = os.path.join(directory, "latency")
+        journaled = MemoryFinanceRepository(journal_dir=latency_dir)
+        await journaled.open()
+        result["write_journal"] = await write_latency(journaled, [item.model_copy() for item in write_items])
+        await journaled.close()
+        result["journal_commits"] = journaled.journal.commits
+        shutil.rmtree(latency_dir)
+        for name in ("add", "replace"):
+            print(f"write {name:<8} plain p50 {result['write_plain'][name]['p50_us']:>7.1f}µs "
+                  f"p99 {result['write_plain'][name]['p99_us']:>7.1f}µs | journal p50 "
+                  f"{result['write_journal'][name]['p50_us']:>7.1f}µs p99 {result['write_journal'][name]['p99_us']:>7.1f}µs")
+        print(f"  {result['journal_commits']} group commits for {2 * args.writes} writes")
+
+        # 2) 적재 + 스냅샷
+        data_dir = os.path.join(directory, "data")
+        repo = MemoryFinanceRepository(journal_dir=data_dir, snapshot_every=args.records * 10 + 1)
+        await repo.open()
+        begin = time.perf_counter()
+        items = make_items(args.records, events, rng)
+        built = time.perf_counter() - begin
+        begin = time.perf_counter()
+        for start in range(0, len(items), SEED_BATCH):
+            await repo.budget_items.add_many(items[start:start + SEED_BATCH])
+        await repo.journal.flush()
+        seeded = time.perf_counter() - begin
+        begin = time.perf_counter()
+        await repo.journal.snapshot()
+        snapshot = time.perf_counter() - begin
+        size = sum(path.stat().st_size for path in Path(data_dir).glob("snapshot-*.bin"))
+        result["seed"] = {"build_s": built, "add_many_s": seeded, "snapshot_s": snapshot, "snapshot_mb": size / 2**20}
+        print(f"seed     {args.records:,} items: build {built:.1f}s, add_many+journal {seeded:.1f}s, "
+              f"snapshot {snapshot:.1f}s ({size / 2**20:.0f} MiB)")
+
+        # 3) 스냅샷 이후 수정 (저널에만 남음), close() 없이 재시작 → 재생 포함 복구
+        if args.tail:
+            changed = []
+            for item in rng.sample(items, args.tail):
+                updated = item.model_copy(update={"status": BudgetStatus.APPROVED, "version": item.version + 1})
+                await repo.budget_items.replace(updated)
+                changed.append(updated)
+            await repo.journal.flush()
+            by_id = {item.id: item for item in changed}
+            items = [by_id.get(item.id, item) for item in items]
+
+        sample = rng.sample(items, min(200, len(items)))
+        expected_projected = (await repo.budget_aggregate(events[0])).total_projected
+        del repo
+
+        restarted = restart(data_dir, sample, events[0])
+        expected = {str(item.id): item.model_dump_json() for item in sample}
+        if restarted["count"] != args.records or restarted["sample"] != expected:
+            raise AssertionError("recovered records differ from the originals")
+        if restarted["aggregate_projected"] != str(expected_projected) or restarted["drift"]:
+            raise AssertionError("recovered aggregates differ from the originals")
+        del restarted["sample"]
+        result["restart"] = restarted
+        print(f"restart  open {restarted['open_s']:.2f}s (snapshot {restarted['recovered_records']:,} records, "
+              f"replayed {restarted['replayed_records']:,}), process {restarted['process_s']:.2f}s, "
+              f"max RSS {restarted['max_rss_mb']:.0f} MiB")
+    finally:
+        if not args.directory:
+            shutil.rmtree(directory, ignore_errors=True)
+
+    output = Path(args.output) if args.output else (
+        RESULTS_DIR / f"bench_journal_{datetime.utcnow():%Y%m%dT%H%M%S}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, indent=2))
+    print(f"\nresults written to {output}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
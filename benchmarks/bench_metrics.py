@@ -0,0 +1,65 @@
+"""
+Metrics Middleware Overhead Benchmark
+
+MetricsMiddleware가 요청당 추가하는 시간 측정.
+- 최소 ASGI 앱을 미들웨어 없이 / 있이 직접 호출하여 요청당 시간 차이 계산
+
+실행:
+    python -m benchmarks.bench_metrics --requests 200000
+
+Author: Event Agent System
+"""
+
+import argparse
+import asyncio
+import time
+from types import SimpleNamespace
+
+from services.metrics import MetricsMiddleware, RequestMetrics
+
+
+ROUTE = SimpleNamespace(path="/finance/budget-items/{item_id}")
+BODY = b'{"ok":true}'
+
+
+async def app(scope, receive, send):
+    """라우팅 결과만 흉내 내는 최소 ASGI 앱"""
+    scope["route"] = ROUTE
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": BODY})
+
+
+async def receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def send(message):
+    pass
+
+
+async def run(handler, requests: int) -> float:
+    """요청당 평균 소요 시간 (µs)"""
+    start = time.perf_counter()
+    for _ in range(requests):
+        await handler({"type": "http", "method": "GET", "path": "/x"}, receive, send)
+    return (time.perf_counter() - start) / requests * 1e6
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Metrics middleware overhead benchmark")
+    parser.add_argument("--requests", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    wrapped = MetricsMiddleware(app, RequestMetrics())
+    bare_us = min([await run(app, args.requests) for _ in range(args.repeat)])
+    wrapped_us = min([await run(wrapped, args.requests) for _ in range(args.repeat)])
+
+    print(f"requests={args.requests}")
+    print(f"{'bare app':<20}{bare_us:>10.2f} µs/request")
+    print(f"{'with metrics':<20}{wrapped_us:>10.2f} µs/request")
+    print(f"{'overhead':<20}{wrapped_us - bare_us:>10.2f} µs/request")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
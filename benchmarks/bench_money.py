@@ -0,0 +1,92 @@
+"""
+Money Arithmetic Benchmark
+
+Decimal 경로와 통화 최소 단위 정수(schemas.money) 경로의 합계·차이 계산 비교.
+- 합계: sum(projected)
+- 차이: sum(projected - actual) (항목별 variance 후 합산)
+- 두 경로 결과가 정확히 일치하는지 함께 검증
+
+실행:
+    python -m benchmarks.bench_money --items 1000000
+
+Author: Event Agent System
+"""
+
+import argparse
+import random
+import time
+from decimal import Decimal
+from typing import Callable, Dict, List, Tuple
+
+from schemas.money import CURRENCY_EXPONENTS, MinorMoney, from_minor, to_minor
+
+
+def make_amounts(count: int, currency: str) -> Tuple[List[Decimal], List[Decimal]]:
+    """벤치마크용 (projected, actual) 금액 생성 (통화 소수 자릿수 이내)"""
+    rng = random.Random(42)
+    exponent = Decimal(1).scaleb(-CURRENCY_EXPONENTS[currency])
+    projected = [Decimal(rng.randint(100, 100_000_000)) * exponent for _ in range(count)]
+    actual = [Decimal(rng.randint(0, 100_000_000)) * exponent for _ in range(count)]
+    return projected, actual
+
+
+def timed(fn: Callable, repeat: int) -> Tuple[float, object]:
+    """repeat 회 중 최소 소요 시간(초)과 결과"""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def run(count: int, currency: str, repeat: int) -> Dict[str, Tuple[float, float]]:
+    projected, actual = make_amounts(count, currency)
+    projected_units = [to_minor(amount, currency) for amount in projected]
+    actual_units = [to_minor(amount, currency) for amount in actual]
+    projected_money = [MinorMoney(units, currency) for units in projected_units]
+
+    cases = {
+        "sum": (
+            lambda: sum(projected, Decimal("0")),
+            lambda: from_minor(sum(projected_units), currency),
+        ),
+        "variance": (
+            lambda: sum(map(Decimal.__sub__, projected, actual), Decimal("0")),
+            lambda: from_minor(sum(map(int.__sub__, projected_units, actual_units)), currency),
+        ),
+        "sum (MinorMoney objects)": (
+            lambda: sum(projected, Decimal("0")),
+            lambda: MinorMoney.sum(projected_money, currency).to_decimal(),
+        ),
+    }
+
+    results: Dict[str, Tuple[float, float]] = {}
+    for label, (decimal_fn, minor_fn) in cases.items():
+        decimal_time, decimal_result = timed(decimal_fn, repeat)
+        minor_time, minor_result = timed(minor_fn, repeat)
+        if decimal_result != minor_result:
+            raise AssertionError(f"{label}: {decimal_result} != {minor_result}")
+        results[label] = (decimal_time, minor_time)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Decimal vs minor-unit money arithmetic benchmark")
+    parser.add_argument("--items", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--currencies", default="USD,KRW")
+    args = parser.parse_args()
+
+    for currency in args.currencies.split(","):
+        results = run(args.items, currency, args.repeat)
+        print(f"\nitems={args.items} currency={currency}")
+        print(f"{'operation':<28}{'decimal (ms)':>14}{'minor (ms)':>14}{'speedup':>10}")
+        for label, (decimal_time, minor_time) in results.items():
+            print(f"{label:<28}{decimal_time * 1000:>14.1f}{minor_time * 1000:>14.1f}"
+                  f"{decimal_time / minor_time:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+Transaction Reconciliation Benchmark
+
+거래 대사 처리량 측정 (기본: 거래 1M건, 예산 항목 10k건).
+- 거래 구성: budget_line_item_id 지정 40%, 참조 번호 30%, 거래처+금액 20%, 미매칭 10%
+- engine: 해시 테이블 구성 + 매칭만 (저장소 I/O 제외)
+- endpoint: POST /finance/transactions/reconcile 전체 경로
+  (미대사 거래 조회 → 매칭 → 예산 항목 / 거래 일괄 저장)
+- 매칭 수가 생성한 거래 구성과 일치하는지, 항목 actual_amount 합계가 반영 금액과 같은지 검증
+- 저장소 백엔드는 FINANCE_STORAGE_BACKEND 환경 변수로 선택
+
+실행:
+    python -m benchmarks.bench_reconciliation --transactions 1000000 --items 10000
+    FINANCE_STORAGE_BACKEND=sqlite python -m benchmarks.bench_reconciliation --transactions 100000
+
+Author: Event Agent System
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import time
+from decimal import Decimal
+from typing import List, Tuple
+from uuid import UUID, uuid4
+
+import httpx
+
+from main import app
+from routers.finance import repository
+from schemas.financial import (
+    BudgetCategory,
+    BudgetLineItem,
+    PaymentMethod,
+    Transaction,
+    TransactionType,
+)
+from services.reconciliation import BudgetItemIndex, MatchRule, reconcile
+from storage import FinanceRepository
+
+
+SEED_BATCH = 10_000
+
+
+async def seed(
+    repo: FinanceRepository, transactions: int, items: int, events: int
+) -> Tuple[List[BudgetLineItem], int]:
+    """예산 항목과 미대사 거래를 저장소에 직접 적재, (항목 목록, 매칭 예상 수) 반환"""
+    await repo.reset()
+    rng = random.Random(42)
+    event_ids: List[UUID] = [uuid4() for _ in range(events)]
+    categories = list(BudgetCategory)
+
+    budget_items = []
+    for i in range(items):
+        amount = Decimal(rng.randint(10_000, 10_000_000)) / 100
+        budget_items.append(BudgetLineItem(
+            event_id=event_ids[i % events],
+            category=categories[i % len(categories)],
+            name=f"Line item {i}",
+            vendor_name=f"Vendor {i}",
+            reference_number=f"PO-{i:08d}",
+            unit_cost=amount,
+            projected_amount=amount,
+        ))
+    for start in range(0, items, SEED_BATCH):
+        await repo.budget_items.add_many(budget_items[start:start + SEED_BATCH])
+
+    expected = 0
+    batch: List[Transaction] = []
+    for i in range(transactions):
+        item = budget_items[rng.randrange(items)]
+        roll = i % 10
+        fields = {}
+        amount = Decimal(rng.randint(100, 100_000)) / 100
+        if roll < 4:
+            fields["budget_line_item_id"] = item.id
+        elif roll < 7:
+            fields["reference_number"] = item.reference_number.lower()
+        elif roll < 9:
+            fields["vendor_name"] = item.vendor_name.upper()
+            amount = item.projected_amount
+        else:
+            fields["reference_number"] = f"UNKNOWN-{i}"
+        expected += roll < 9
+        batch.append(Transaction(
+            event_id=item.event_id,
+            transaction_type=TransactionType.EXPENSE,
+            amount=amount,
+            payment_method=PaymentMethod.BANK_TRANSFER,
+            description=f"Payment {i}",
+            recorded_by="bench",
+            **fields,
+        ))
+        if len(batch) == SEED_BATCH:
+            await repo.transactions.add_many(batch)
+            batch = []
+    if batch:
+        await repo.transactions.add_many(batch)
+    return budget_items, expected
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Transaction reconciliation benchmark")
+    parser.add_argument("--transactions", type=int, default=1_000_000)
+    parser.add_argument("--items", type=int, default=10_000)
+    parser.add_argument("--events", type=int, default=10)
+    args = parser.parse_args()
+    backend = os.getenv("FINANCE_STORAGE_BACKEND", "memory")
+
+    start = time.perf_counter()
+    budget_items, expected = await seed(repository, args.transactions, args.items, args.events)
+    print(f"backend={backend} transactions={args.transactions:,} items={args.items:,} "
+          f"seed={time.perf_counter() - start:.1f}s")
+
+    pending = await repository.transactions.find(is_reconciled=False)
+    start = time.perf_counter()
+    plan = reconcile(pending, BudgetItemIndex(budget_items))
+    engine = time.perf_counter() - start
+    if len(plan.matched) != expected:
+        raise AssertionError(f"engine matched {len(plan.matched)}, expected {expected}")
+    print(f"  engine    {engine:8.2f}s  {args.transactions / engine:>12,.0f} tx/s  "
+          + "  ".join(f"{rule.value}={plan.matched_by[rule]:,}" for rule in MatchRule))
+    del pending, plan
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        start = time.perf_counter()
+        response = await client.post("/finance/transactions/reconcile", json={})
+        endpoint = time.perf_counter() - start
+    response.raise_for_status()
+    result = response.json()
+    if result["matched"] != expected:
+        raise AssertionError(f"endpoint matched {result['matched']}, expected {expected}")
+    print(f"  endpoint  {endpoint:8.2f}s  {args.transactions / endpoint:>12,.0f} tx/s  "
+          f"matched={result['matched']:,} unmatched={result['unmatched']:,} "
+          f"updated_items={result['updated_items']:,}")
+
+    actual = sum(item.actual_amount for item in await repository.budget_items.find())
+    reconciled = sum(
+        tx.amount for tx in await repository.transactions.find(is_reconciled=True)
+    )
+    if actual != reconciled:
+        raise AssertionError(f"actual_amount total {actual} != reconciled total {reconciled}")
+    await repository.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
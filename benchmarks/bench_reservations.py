@@ -0,0 +1,346 @@
+"""
+Sponsorship Reservation Stress Benchmark
+
+스폰서십 패키지 수량 확보 경합에서 초과 판매가 없는지 검증하고 처리량을 측정.
+- 패키지 --packages개 (각 --capacity개), 수량보다 훨씬 많은 --claims건의 확보 요청을
+  워커 프로세스 k개가 나눠 동시에 실행 (워커당 --concurrency개 동시 요청, httpx ASGI transport)
+- 요청 혼합: 보류(POST /sponsorship-packages/{id}/reservations)와
+  보류 없는 직접 판매(PATCH /sponsors/{id}/status?status=contracted, --direct-ratio)가 같은 수량을 두고 경쟁
+- 검증 (패키지별):
+  성공 응답 수 ≤ max_sponsors (초과 판매 0), 성공 수 = held_count + sold_count,
+  HELD 보류 수 = held_count, CONVERTED 보류 수 = sold_count, 수요가 수량보다 많으면 전부 판매 (유실 0)
+- memory 백엔드는 워커 1개만 (프로세스 로컬 저장소), sqlite / sharded는 여러 워커가 같은 파일 공유
+- 결과: benchmarks/results/ JSON
+
+실행:
+    python -m benchmarks.bench_reservations --claims 5000 --concurrency 1000
+    python -m benchmarks.bench_reservations --backends sharded,sqlite --workers 1,2,4 --packages 10 --capacity 5
+
+Author: Event Agent System
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+from uuid import UUID, uuid4
+
+from benchmarks.bench_workers import git_revision, read_message, signal, storage_env
+from schemas.financial import ReservationStatus, Sponsor, SponsorshipPackage, SponsorshipTier
+from storage import FinanceRepository, create_repository
+
+
+ROOT = Path(__file__).resolve().parent.parent
+RESULTS_DIR = Path(__file__).parent / "results"
+
+# 워커 프로세스: 설정 JSON 한 줄(표준 입력, 요청 목록이 argv에는 너무 큼) → (memory면 직접 적재) → "ready" → 시작 신호 → 측정 결과 JSON
+# → 확인 신호 → 0번 워커만 패키지 / 보류 현황 JSON
+CHILD = r'''
+import asyncio, json, math, sys, time
+
+config = json.loads(sys.stdin.readline())
+import main
+import httpx
+from benchmarks.bench_reservations import inventory, seed_inventory
+from routers.finance import repository
+
+
+async def run():
+    latencies, status, won = [], {}, {}
+
+    async def operation(client, op):
+        kind, package, sponsor = op
+        if kind == "hold":
+            response = await client.post(
+                f"/finance/sponsorship-packages/{package}/reservations",
+                json={"holder": f"rep-{config['index']}", "ttl_seconds": 3600},
+            )
+        else:
+            response = await client.patch(
+                f"/finance/sponsors/{sponsor}/status",
+                params={"status": "contracted", "package_id": package},
+            )
+        if response.status_code < 300:
+            won[package] = won.get(package, 0) + 1
+        return response
+
+    async with main.app.router.lifespan_context(main.app):
+        if config["seed_packages"]:
+            await seed_inventory(repository, config["seed_packages"], config["seed_sponsors"])
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+            print("ready", flush=True)
+            sys.stdin.readline()
+
+            pending = iter(config["operations"])
+
+            async def loop():
+                for op in pending:
+                    begin = time.perf_counter()
+                    response = await operation(client, op)
+                    latencies.append(time.perf_counter() - begin)
+                    status[response.status_code] = status.get(response.status_code, 0) + 1
+
+            begin = time.perf_counter()
+            await asyncio.gather(*(loop() for _ in range(config["concurrency"])))
+            elapsed = time.perf_counter() - begin
+
+            latencies.sort()
+            print(json.dumps({
+                "requests": len(latencies),
+                "elapsed": elapsed,
+                "status": status,
+                "won": won,
+                "p50_ms": latencies[len(latencies) // 2] * 1000,
+                "p99_ms": latencies[min(len(latencies) - 1, math.ceil(len(latencies) * 0.99) - 1)] * 1000,
+            }), flush=True)
+
+            sys.stdin.readline()
+            if config["index"] == 0:
+                print(json.dumps(await inventory(repository, config["packages"])), flush=True)
+
+
+asyncio.run(run())
+'''
+
+
+def package_specs(count: int, capacity: int) -> List[Dict[str, Any]]:
+    return [
+        {"id": str(uuid4()), "event_id": str(uuid4()), "capacity": capacity}
+        for _ in range(count)
+    ]
+
+
+async def seed_inventory(
+    repo: FinanceRepository, packages: Sequence[Dict[str, Any]], sponsors: Sequence[str]
+) -> None:
+    """패키지 / 스폰서 적재 (ID는 부모가 정해 워커 간 공유)"""
+    await repo.sponsorship_packages.add_many([
+        SponsorshipPackage(
+            id=UUID(spec["id"]),
+            event_id=UUID(spec["event_id"]),
+            tier=SponsorshipTier.GOLD,
+            tier_name="Gold",
+            amount=Decimal("10000"),
+            max_sponsors=spec["capacity"],
+        )
+        for spec in packages
+    ])
+    await repo.sponsors.add_many([
+        Sponsor(
+            id=UUID(sponsor_id),
+            company_name=f"Sponsor {i}",
+            industry="bench",
+            contact_name="Bench",
+            contact_email=f"sponsor{i}@example.com",
+        )
+        for i, sponsor_id in enumerate(sponsors)
+    ])
+
+
+async def inventory(repo: FinanceRepository, packages: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+    """패키지별 수량 필드와 상태별 보류 수"""
+    state: Dict[str, Dict[str, Any]] = {}
+    for package_id in packages:
+        package = await repo.sponsorship_packages.get(UUID(package_id))
+        reservations = await repo.sponsorship_reservations.find(
+            event_id=package.event_id, package_id=package.id
+        )
+        counts = Counter(reservation.status.value for reservation in reservations)
+        state[package_id] = {
+            "max_sponsors": package.max_sponsors,
+            "sold_count": package.sold_count,
+            "held_count": package.held_count,
+            "held_reservations": counts.get(ReservationStatus.HELD.value, 0),
+            "converted_reservations": counts.get(ReservationStatus.CONVERTED.value, 0),
+        }
+    return state
+
+
+def operations(
+    packages: Sequence[Dict[str, Any]], sponsors: Sequence[str], claims: int, direct_ratio: float, rng: random.Random
+) -> List[List[Optional[str]]]:
+    """확보 요청 목록: [종류, 패키지 ID, 스폰서 ID(직접 판매)], 스폰서는 요청마다 다름"""
+    ops: List[List[Optional[str]]] = []
+    for i in range(claims):
+        package = rng.choice(packages)["id"]
+        if i < len(sponsors) and rng.random() < direct_ratio:
+            ops.append(["sale", package, sponsors[i]])
+        else:
+            ops.append(["hold", package, None])
+    return ops
+
+
+def run_workers(count: int, env: Dict[str, str], configs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """워커 count개 시작 → 모두 준비되면 동시에 시작 → 결과 수집 → 0번 워커의 현황"""
+    children = [
+        subprocess.Popen(
+            [sys.executable, "-c", CHILD],
+            cwd=ROOT, env=env, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True,
+        )
+        for _ in configs[:count]
+    ]
+    try:
+        for child, config in zip(children, configs):
+            child.stdin.write(json.dumps(config) + "\n")
+            child.stdin.flush()
+        for child in children:
+            read_message(child, "ready")
+        signal(children)
+        results = [json.loads(read_message(child, "{")) for child in children]
+        signal(children)
+        results[0]["inventory"] = json.loads(read_message(children[0], "{"))
+        for child in children:
+            child.communicate()
+            if child.returncode != 0:
+                raise RuntimeError(f"worker exited with {child.returncode}")
+        return results
+    finally:
+        for child in children:
+            if child.poll() is None:
+                child.kill()
+
+
+def verify(results: List[Dict[str, Any]], demand: Dict[str, int]) -> Dict[str, Any]:
+    """패키지별 성공 응답 수 vs 수량 / 저장된 수량 필드 / 보류 레코드"""
+    won: Counter = Counter()
+    for result in results:
+        won.update(result["won"])
+    oversold = lost = mismatched = 0
+    for package_id, state in results[0]["inventory"].items():
+        sold = won.get(package_id, 0)
+        oversold += max(0, sold - state["max_sponsors"])
+        lost += max(0, min(demand.get(package_id, 0), state["max_sponsors"]) - sold)
+        if (
+            state["held_count"] + state["sold_count"] != sold
+            or state["held_reservations"] != state["held_count"]
+            or state["converted_reservations"] != state["sold_count"]
+        ):
+            mismatched += 1
+    return {
+        "granted": sum(won.values()),
+        "oversold": oversold,
+        "lost_slots": lost,
+        "mismatched_packages": mismatched,
+        "ok": oversold == 0 and lost == 0 and mismatched == 0,
+    }
+
+
+async def run_backend(backend: str, args: argparse.Namespace, directory: str) -> Dict[str, Any]:
+    path = os.path.join(directory, f"{backend}.db")
+    env = storage_env(backend, path, args.shards)
+    shared = backend != "memory"
+    repo = create_repository(backend=backend, sqlite_path=path, shards=args.shards) if shared else None
+    rng = random.Random(42)
+
+    runs: List[Dict[str, Any]] = []
+    for workers in args.workers:
+        if not shared and workers > 1:
+            print(f"  workers={workers:<3} skipped (memory storage is process-local)")
+            continue
+        packages = package_specs(args.packages, args.capacity)
+        sponsors = [str(uuid4()) for _ in range(int(args.claims * args.direct_ratio * 2) + 1)]
+        ops = operations(packages, sponsors, args.claims, args.direct_ratio, rng)
+        demand = Counter(op[1] for op in ops)
+        if shared:
+            await repo.reset()
+            await seed_inventory(repo, packages, sponsors)
+        configs = [
+            {
+                "index": index,
+                "operations": ops[index::workers],
+                "concurrency": args.concurrency,
+                "packages": [spec["id"] for spec in packages],
+                "seed_packages": [] if shared else packages,
+                "seed_sponsors": [] if shared else sponsors,
+            }
+            for index in range(workers)
+        ]
+        results = run_workers(workers, env, configs)
+        checked = verify(results, demand)
+
+        requests = sum(result["requests"] for result in results)
+        elapsed = max(result["elapsed"] for result in results)
+        status: Dict[str, int] = {}
+        for result in results:
+            for code, value in result["status"].items():
+                status[code] = status.get(code, 0) + value
+        run = {
+            "workers": workers,
+            "claims": requests,
+            "slots": args.packages * args.capacity,
+            "throughput_rps": round(requests / elapsed, 1),
+            "p50_ms": round(sorted(result["p50_ms"] for result in results)[len(results) // 2], 3),
+            "p99_ms": round(max(result["p99_ms"] for result in results), 3),
+            "status": status,
+            "check": checked,
+        }
+        runs.append(run)
+        print(f"  workers={workers:<3} {run['throughput_rps']:>9,.1f} claims/s  p50 {run['p50_ms']:.1f}ms "
+              f"p99 {run['p99_ms']:.1f}ms  status {status}  granted {checked['granted']}/{run['slots']}  "
+              f"oversold {checked['oversold']}  ok={checked['ok']}")
+        if not checked["ok"]:
+            raise AssertionError(f"{backend} with {workers} workers: {checked}")
+    if repo is not None:
+        await repo.close()
+    return {"backend": backend, "runs": runs}
+
+
+async def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Sponsorship reservation stress benchmark")
+    parser.add_argument("--backends", default="memory,sharded", help="쉼표 구분 백엔드 (memory, sqlite, sharded)")
+    parser.add_argument("--workers", default="1,2", help="쉼표 구분 워커 수 (memory는 1만)")
+    parser.add_argument("--shards", type=int, default=4, help="sharded 백엔드 샤드 수")
+    parser.add_argument("--packages", type=int, default=50)
+    parser.add_argument("--capacity", type=int, default=20, help="패키지당 max_sponsors")
+    parser.add_argument("--claims", type=int, default=5_000, help="워커 수별 전체 확보 요청 수")
+    parser.add_argument("--direct-ratio", type=float, default=0.2, help="보류 없는 직접 판매 요청 비율")
+    parser.add_argument("--concurrency", type=int, default=1_000, help="워커당 동시 요청 수")
+    parser.add_argument("--output", default=None, help="결과 JSON 경로 (기본: benchmarks/results/)")
+    args = parser.parse_args(argv)
+    args.workers = [int(value) for value in args.workers.split(",")]
+
+    result: Dict[str, Any] = {
+        "benchmark": "reservations",
+        "timestamp": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "packages": args.packages,
+        "capacity": args.capacity,
+        "claims": args.claims,
+        "direct_ratio": args.direct_ratio,
+        "concurrency": args.concurrency,
+        "backends": [],
+    }
+    directory = tempfile.mkdtemp(prefix="finance-reservations-")
+    try:
+        for backend in args.backends.split(","):
+            print(f"backend={backend} packages={args.packages} capacity={args.capacity} claims={args.claims:,}")
+            result["backends"].append(await run_backend(backend, args, directory))
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    output = Path(args.output) if args.output else (
+        RESULTS_DIR / f"bench_reservations_{datetime.utcnow():%Y%m%dT%H%M%S}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, indent=2))
+    print(f"\nresults written to {output}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
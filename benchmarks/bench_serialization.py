@@ -0,0 +1,140 @@
+"""
+Response Serialization Benchmark
+
+예산 항목 목록(Page[BudgetLineItem]) 응답 직렬화 경로 비교.
+- jsonable_encoder: FastAPI jsonable_encoder → JSONResponse (json.dumps)
+- route default: response_model 라우트의 기본 직렬화 (응답 검증 포함, ASGI 호출)
+- fast path: services.serialization.ResponseSerializer (TypeAdapter.dump_json, ASGI 호출)
+- 세 경로의 JSON 결과가 동일한지 함께 검증
+
+실행:
+    python -m benchmarks.bench_serialization --sizes 1000,10000,100000
+
+Author: Event Agent System
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from decimal import Decimal
+from typing import Awaitable, Callable, Dict, List, Tuple
+from uuid import uuid4
+
+from fastapi import FastAPI
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response
+
+from routers.finance import Page
+from schemas.financial import BudgetCategory, BudgetLineItem
+from services.serialization import ResponseSerializer
+
+
+def make_page(count: int) -> Page[BudgetLineItem]:
+    """벤치마크용 예산 항목 페이지"""
+    event_id = uuid4()
+    categories = list(BudgetCategory)
+    items = [
+        BudgetLineItem(
+            event_id=event_id,
+            category=categories[i % len(categories)],
+            name=f"Line item {i}",
+            unit_cost=Decimal(i % 1000) + Decimal("0.25"),
+            quantity=Decimal(i % 7 + 1),
+            projected_amount=(Decimal(i % 1000) + Decimal("0.25")) * (i % 7 + 1),
+            actual_amount=Decimal(i % 500),
+        )
+        for i in range(count)
+    ]
+    return Page[BudgetLineItem](items=items, next_cursor="cursor", total_count=count)
+
+
+def build_app(page: Page[BudgetLineItem], serializer: ResponseSerializer) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/default", response_model=Page[BudgetLineItem])
+    async def default_route():
+        return page
+
+    @app.get("/fast", response_model=Page[BudgetLineItem])
+    async def fast_route() -> Response:
+        return serializer.response(page)
+
+    return app
+
+
+async def call(app: FastAPI, path: str) -> bytes:
+    """ASGI 앱 직접 호출 (HTTP 클라이언트 오버헤드 제외)"""
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "root_path": "",
+        "query_string": b"", "headers": [], "server": ("bench", 80), "client": ("bench", 1),
+    }
+    chunks: List[bytes] = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return b"".join(chunks)
+
+
+async def timed(fn: Callable[[], Awaitable[bytes]], repeat: int) -> Tuple[float, bytes]:
+    """repeat 회 중 최소 소요 시간(초)과 결과"""
+    best = float("inf")
+    body = b""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        body = await fn()
+        best = min(best, time.perf_counter() - start)
+    return best, body
+
+
+async def run(count: int, repeat: int) -> Dict[str, Tuple[float, int]]:
+    page = make_page(count)
+    serializer = ResponseSerializer(Page[BudgetLineItem])
+    app = build_app(page, serializer)
+
+    async def encoder_path() -> bytes:
+        return JSONResponse(jsonable_encoder(page)).body
+
+    paths = {
+        "jsonable_encoder": encoder_path,
+        "route default": lambda: call(app, "/default"),
+        "fast path": lambda: call(app, "/fast"),
+    }
+    results: Dict[str, Tuple[float, int]] = {}
+    expected = None
+    for label, fn in paths.items():
+        elapsed, body = await timed(fn, repeat)
+        decoded = json.loads(body)
+        if expected is None:
+            expected = decoded
+        elif decoded != expected:
+            raise AssertionError(f"{label}: response differs from jsonable_encoder output")
+        results[label] = (elapsed, len(body))
+    return results
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Finance response serialization benchmark")
+    parser.add_argument("--sizes", default="1000,10000,100000")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for count in (int(size) for size in args.sizes.split(",")):
+        results = await run(count, args.repeat)
+        baseline = results["jsonable_encoder"][0]
+        print(f"\nitems={count}")
+        print(f"{'path':<20}{'time (ms)':>12}{'items/s':>14}{'bytes':>14}{'speedup':>10}")
+        for label, (elapsed, size) in results.items():
+            print(f"{label:<20}{elapsed * 1000:>12.1f}{count / elapsed:>14,.0f}{size:>14,}"
+                  f"{baseline / elapsed:>9.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,233 @@
+"""
+Cold Start Benchmark
+
+새 파이썬 프로세스에서 앱 모듈 로드부터 첫 응답까지의 시간을 단계별로 측정.
+- import: `import main` (FastAPI, 스키마, 라우터 구성)
+- lifespan: 앱 시작 훅 (라우트 처리 상태 워밍업) — --no-lifespan이면 생략
+  (lifespan을 실행하지 않는 호스트에서는 첫 요청이 이 비용을 부담)
+- first / second: 같은 요청의 첫 번째 / 두 번째 응답 시간
+- openapi_first / openapi_cached: /openapi.json 첫 생성 / 캐시 응답 시간
+- ready: 모듈 로드 시작부터 첫 응답 완료까지 (콜드 스타트 → 첫 응답)
+- process: 인터프리터 시작부터 자식 프로세스 종료까지 (부모에서 측정)
+- 요청은 httpx 없이 ASGI 앱을 직접 호출 (측정에 클라이언트 임포트 비용이 섞이지 않도록)
+- 결과: 단계별 중앙값 / p95 / 최소(ms)를 JSON 파일로 기록 → 실행 간 비교
+
+실행:
+    python -m benchmarks.bench_startup --runs 20
+    python -m benchmarks.bench_startup --runs 20 --no-lifespan --path /health
+    python -m benchmarks.bench_startup --baseline benchmarks/results/<이전 결과>.json --importtime 15
+
+Author: Event Agent System
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import re
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+
+ROOT = Path(__file__).resolve().parent.parent
+RESULTS_DIR = Path(__file__).parent / "results"
+
+PHASES = ("import", "lifespan", "first", "second", "openapi_first", "openapi_cached", "ready", "process")
+
+# 자식 프로세스: 단계별 시간(ms)을 마지막 줄에 JSON으로 출력
+CHILD = r'''
+import time
+started = time.perf_counter()
+import main
+imported = time.perf_counter()
+
+import asyncio
+import json
+import sys
+
+path, run_lifespan = sys.argv[1], sys.argv[2] == "1"
+
+
+async def call(target):
+    raw_path, _, query = target.partition("?")
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": raw_path, "raw_path": raw_path.encode(), "root_path": "",
+        "query_string": query.encode(), "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 0), "server": ("bench", 80),
+    }
+    status = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            status.append(message["status"])
+
+    begin = time.perf_counter()
+    await main.app(scope, receive, send)
+    if status[0] >= 400:
+        raise SystemExit(f"GET {target} -> {status[0]}")
+    return (time.perf_counter() - begin) * 1000
+
+
+async def measure():
+    timings = {"import": (imported - started) * 1000}
+    if run_lifespan:
+        begin = time.perf_counter()
+        async with main.app.router.lifespan_context(main.app):
+            timings["lifespan"] = (time.perf_counter() - begin) * 1000
+            await requests(timings)
+    else:
+        await requests(timings)
+    return timings
+
+
+async def requests(timings):
+    timings["first"] = await call(path)
+    timings["ready"] = (time.perf_counter() - started) * 1000
+    timings["second"] = await call(path)
+    timings["openapi_first"] = await call("/openapi.json")
+    timings["openapi_cached"] = await call("/openapi.json")
+
+
+print(json.dumps(asyncio.run(measure())))
+'''
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """nearest-rank 백분위 (정렬된 값 기준)"""
+    rank = max(1, math.ceil(q / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_child(path: str, lifespan: bool) -> Dict[str, float]:
+    env = dict(os.environ, PYTHONPATH=str(ROOT))
+    begin = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-c", CHILD, path, "1" if lifespan else "0"],
+        cwd=ROOT, env=env, capture_output=True, text=True,
+    )
+    elapsed = (time.perf_counter() - begin) * 1000
+    if completed.returncode != 0:
+        raise RuntimeError(f"startup child failed:\n{completed.stderr or completed.stdout}")
+    timings = json.loads(completed.stdout.strip().splitlines()[-1])
+    timings["process"] = elapsed
+    return timings
+
+
+def summarize(samples: List[Dict[str, float]]) -> Dict[str, Dict[str, float]]:
+    summary: Dict[str, Dict[str, float]] = {}
+    for phase in PHASES:
+        values = sorted(sample[phase] for sample in samples if phase in sample)
+        if not values:
+            continue
+        summary[phase] = {
+            "p50_ms": round(percentile(values, 50), 2),
+            "p95_ms": round(percentile(values, 95), 2),
+            "min_ms": round(values[0], 2),
+        }
+    return summary
+
+
+def import_profile(top: int) -> List[Dict[str, Any]]:
+    """-X importtime 결과에서 누적 시간이 큰 모듈 top개 (한 번 실행)"""
+    env = dict(os.environ, PYTHONPATH=str(ROOT))
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True,
+    )
+    rows = []
+    for line in completed.stderr.splitlines():
+        match = re.match(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)", line)
+        if match:
+            rows.append({
+                "module": match.group(4),
+                "self_ms": int(match.group(1)) / 1000,
+                "cumulative_ms": int(match.group(2)) / 1000,
+            })
+    rows.sort(key=lambda row: row["cumulative_ms"], reverse=True)
+    return rows[:top]
+
+
+def print_table(summary: Dict[str, Dict[str, float]]) -> None:
+    print(f"{'phase':<18}{'p50 ms':>10}{'p95 ms':>10}{'min ms':>10}")
+    for phase, stats in summary.items():
+        print(f"{phase:<18}{stats['p50_ms']:>10.1f}{stats['p95_ms']:>10.1f}{stats['min_ms']:>10.1f}")
+
+
+def print_comparison(current: Dict[str, Any], baseline: Dict[str, Any]) -> None:
+    """이전 결과 대비 단계별 p50 변화율"""
+    print(f"\ncompared with {baseline.get('revision')} ({baseline.get('timestamp')})")
+    before = baseline.get("phases", {})
+    for phase, stats in current["phases"].items():
+        old = before.get(phase, {}).get("p50_ms")
+        if old:
+            print(f"  {phase:<18}p50 {(stats['p50_ms'] - old) / old * 100:+8.1f}%")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Cold start benchmark")
+    parser.add_argument("--runs", type=int, default=10, help="새 프로세스 실행 횟수")
+    parser.add_argument("--path", default="/finance/budget-items?limit=1", help="첫 요청 경로")
+    parser.add_argument("--no-lifespan", action="store_true", help="lifespan(워밍업) 없이 측정")
+    parser.add_argument("--importtime", type=int, default=0, help="임포트 누적 시간 상위 N개 모듈 출력")
+    parser.add_argument("--output", default=None, help="결과 JSON 경로 (기본: benchmarks/results/)")
+    parser.add_argument("--baseline", default=None, help="비교할 이전 결과 JSON")
+    args = parser.parse_args(argv)
+
+    lifespan = not args.no_lifespan
+    # 첫 실행은 바이트코드 캐시(.pyc) 생성 → 측정에서 제외
+    run_child(args.path, lifespan)
+    samples = [run_child(args.path, lifespan) for _ in range(args.runs)]
+
+    result: Dict[str, Any] = {
+        "benchmark": "cold_start",
+        "timestamp": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "backend": os.getenv("FINANCE_STORAGE_BACKEND", "memory"),
+        "path": args.path,
+        "lifespan": lifespan,
+        "runs": args.runs,
+        "phases": summarize(samples),
+    }
+    print(f"runs={args.runs} path={args.path} lifespan={lifespan}")
+    print_table(result["phases"])
+
+    if args.importtime:
+        result["imports"] = import_profile(args.importtime)
+        print(f"\n{'module':<40}{'cumulative ms':>15}{'self ms':>10}")
+        for row in result["imports"]:
+            print(f"{row['module']:<40}{row['cumulative_ms']:>15.1f}{row['self_ms']:>10.1f}")
+
+    output = Path(args.output) if args.output else (
+        RESULTS_DIR / f"bench_startup_{datetime.utcnow():%Y%m%dT%H%M%S}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, indent=2))
+    print(f"\nresults written to {output}")
+
+    if args.baseline:
+        print_comparison(result, json.loads(Path(args.baseline).read_text()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Storage Backend Benchmark
+
+In-Memory / SQLite 재무 저장소의 쓰기·읽기 처리량 비교.
+
+실행:
+    python -m benchmarks.bench_storage_backends --items 20000 --events 20
+
+Author: Event Agent System
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+from decimal import Decimal
+from typing import Callable, Dict, List
+from uuid import UUID, uuid4
+
+from schemas.financial import BudgetCategory, BudgetLineItem, BudgetStatus
+from storage import FinanceRepository, create_repository
+
+
+def make_items(count: int, events: List[UUID]) -> List[BudgetLineItem]:
+    """벤치마크용 예산 항목 생성"""
+    rng = random.Random(42)
+    categories = list(BudgetCategory)
+    items = []
+    for i in range(count):
+        unit_cost = Decimal(rng.randint(100, 1_000_000)) / 100
+        quantity = Decimal(rng.randint(1, 50))
+        items.append(BudgetLineItem(
+            event_id=events[i % len(events)],
+            category=categories[i % len(categories)],
+            name=f"Line item {i}",
+            unit_cost=unit_cost,
+            quantity=quantity,
+            projected_amount=unit_cost * quantity,
+        ))
+    return items
+
+
+async def timed(label: str, ops: int, fn: Callable, results: Dict[str, float]) -> None:
+    start = time.perf_counter()
+    await fn()
+    elapsed = time.perf_counter() - start
+    results[label] = ops / elapsed if elapsed else float("inf")
+
+
+async def run_backend(repo: FinanceRepository, items: List[BudgetLineItem], events: List[UUID]) -> Dict[str, float]:
+    results: Dict[str, float] = {}
+    rng = random.Random(7)
+    sample = [rng.choice(items).id for _ in range(min(len(items), 5000))]
+
+    async def write():
+        for item in items:
+            await repo.budget_items.add(item)
+
+    async def get():
+        for item_id in sample:
+            await repo.budget_items.get(item_id)
+
+    async def update():
+        for item_id in sample[:1000]:
+            await repo.budget_items.update(
+                item_id, lambda item: item.model_copy(update={"status": BudgetStatus.APPROVED})
+            )
+
+    async def find():
+        for event_id in events:
+            await repo.budget_items.find(event_id=event_id)
+
+    async def summary():
+        for event_id in events:
+            await repo.budget_aggregate(event_id)
+
+    await timed("write (items/s)", len(items), write, results)
+    await timed("get by id (ops/s)", len(sample), get, results)
+    await timed("update (ops/s)", min(len(sample), 1000), update, results)
+    await timed("find by event (items/s)", len(items), find, results)
+    await timed("summary (ops/s)", len(events), summary, results)
+    return results
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Finance storage backend benchmark")
+    parser.add_argument("--items", type=int, default=20000)
+    parser.add_argument("--events", type=int, default=20)
+    args = parser.parse_args()
+
+    events = [uuid4() for _ in range(args.events)]
+    items = make_items(args.items, events)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        backends = {
+            "memory": create_repository("memory"),
+            "sqlite": create_repository("sqlite", sqlite_path=os.path.join(tmp, "bench.db")),
+        }
+        table: Dict[str, Dict[str, float]] = {}
+        for name, repo in backends.items():
+            table[name] = await run_backend(repo, items, events)
+            await repo.close()
+
+    print(f"\nitems={args.items} events={args.events}")
+    print(f"{'metric':<28}" + "".join(f"{name:>16}" for name in table))
+    for metric in next(iter(table.values())):
+        print(f"{metric:<28}" + "".join(f"{table[name][metric]:>16,.0f}" for name in table))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
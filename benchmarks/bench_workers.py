@@ -0,0 +1,327 @@
+"""
+Multi-Worker Scaling Benchmark
+
+같은 데이터를 공유하는 워커 프로세스 수(1 → N)에 따른 전체 처리량 측정.
+- 부모가 공유 저장소(sharded / sqlite)를 시딩한 뒤 워커 프로세스 k개를 띄운다
+- 각 워커: 앱 lifespan 실행 → 준비 신호 → 동시에 시작 → --duration 초 동안
+  httpx ASGI transport로 요청 혼합을 닫힌 루프(--concurrency개 동시 요청)로 실행
+  (uvicorn 프로세스 관리 / HTTP 파싱은 제외하고 워커 프로세스 안의 앱 + 저장소 비용만 측정)
+- 요청 혼합: 이벤트별 항목 목록, 예산 요약, 항목 수정(PATCH), 항목 생성(POST)
+  (--write-ratio: 쓰기 비율, 쓰기는 수정 / 생성 반반)
+- 처리량 = 모든 워커 완료 요청 합 / 시간, 확장 효율 = k 워커 처리량 / (k × 1 워커 처리량)
+- 실행마다 정합성 검증: 항목 수 = 시딩 + 생성 성공 수, 표본 이벤트 집계 drift 없음,
+  여러 워커가 같은 이벤트 요약에 같은 값을 응답
+- 결과: benchmarks/results/ JSON (CPU 수 포함 — 코어 수보다 많은 워커는 확장되지 않는다)
+
+실행:
+    python -m benchmarks.bench_workers --workers 1,2,4 --duration 10
+    python -m benchmarks.bench_workers --backends sharded,sqlite --shards 8 --workers 1,2,4,8
+
+Author: Event Agent System
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+from uuid import UUID, uuid4
+
+from schemas.financial import BudgetCategory, BudgetLineItem
+from storage import FinanceRepository, create_repository
+
+
+ROOT = Path(__file__).resolve().parent.parent
+RESULTS_DIR = Path(__file__).parent / "results"
+
+SEED_BATCH = 10_000
+
+# 워커 프로세스: 준비되면 "ready" 출력 → 표준 입력으로 시작 신호 → 측정 결과 JSON 출력
+# → 확인 신호 → 검증용 이벤트 요약 JSON 출력
+CHILD = r'''
+import asyncio, json, math, random, sys, time
+
+config = json.loads(sys.argv[1])
+import main
+import httpx
+
+
+async def run():
+    rng = random.Random(config["seed"])
+    events, items = config["events"], config["items"]
+    latencies, created, status = [], [], {}
+
+    async def operation(client):
+        roll = rng.random()
+        if roll < config["write_ratio"] / 2:
+            response = await client.post("/finance/budget-items", json={
+                "event_id": rng.choice(events), "category": "venue",
+                "name": "bench", "unit_cost": "12.50", "quantity": 2,
+            })
+            if response.status_code < 300:
+                created.append(response.json()["event_id"])
+            return response
+        if roll < config["write_ratio"]:
+            return await client.patch(
+                f"/finance/budget-items/{rng.choice(items)}", json={"actual_amount": "10.00"}
+            )
+        if roll < (1 + config["write_ratio"]) / 2:
+            return await client.get("/finance/budget-items", params={"event_id": rng.choice(events), "limit": 20})
+        return await client.get(f"/finance/budget-items/summary/{rng.choice(events)}")
+
+    async with main.app.router.lifespan_context(main.app):
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+            for _ in range(20):
+                await operation(client)
+            print("ready", flush=True)
+            sys.stdin.readline()
+
+            deadline = time.perf_counter() + config["duration"]
+
+            async def loop():
+                while time.perf_counter() < deadline:
+                    begin = time.perf_counter()
+                    response = await operation(client)
+                    latencies.append(time.perf_counter() - begin)
+                    status[response.status_code] = status.get(response.status_code, 0) + 1
+
+            begin = time.perf_counter()
+            await asyncio.gather(*(loop() for _ in range(config["concurrency"])))
+            elapsed = time.perf_counter() - begin
+
+            latencies.sort()
+            print(json.dumps({
+                "requests": len(latencies),
+                "elapsed": elapsed,
+                "status": status,
+                "created": created,
+                "p50_ms": latencies[len(latencies) // 2] * 1000,
+                "p99_ms": latencies[min(len(latencies) - 1, math.ceil(len(latencies) * 0.99) - 1)] * 1000,
+            }), flush=True)
+
+            # 모든 워커의 쓰기가 끝난 뒤 같은 이벤트 요약 응답
+            sys.stdin.readline()
+            summary = (await client.get(f"/finance/budget-items/summary/{config['check_event']}")).json()
+            print(json.dumps(summary), flush=True)
+
+
+asyncio.run(run())
+'''
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def storage_env(backend: str, path: str, shards: int) -> Dict[str, str]:
+    return dict(
+        os.environ,
+        PYTHONPATH=str(ROOT),
+        FINANCE_STORAGE_BACKEND=backend,
+        FINANCE_SQLITE_PATH=path,
+        FINANCE_SQLITE_SHARDS=str(shards),
+    )
+
+
+async def seed(repo: FinanceRepository, events: int, per_event: int) -> Dict[str, List[str]]:
+    """이벤트 × 항목 적재, 요청 파라미터용 ID 목록 반환"""
+    await repo.reset()
+    rng = random.Random(42)
+    categories = list(BudgetCategory)
+    event_ids: List[UUID] = [uuid4() for _ in range(events)]
+    items = []
+    for i in range(events * per_event):
+        unit_cost = Decimal(rng.randint(100, 1_000_000)) / 100
+        items.append(BudgetLineItem(
+            event_id=event_ids[i % events],
+            category=categories[i % len(categories)],
+            name=f"Line item {i}",
+            unit_cost=unit_cost,
+            projected_amount=unit_cost,
+        ))
+    for start in range(0, len(items), SEED_BATCH):
+        await repo.budget_items.add_many(items[start:start + SEED_BATCH])
+    return {
+        "events": [str(event_id) for event_id in event_ids],
+        "items": [str(item.id) for item in items],
+    }
+
+
+def read_message(child: subprocess.Popen, prefix: str) -> str:
+    """워커 표준 출력에서 prefix로 시작하는 다음 줄 (앱 시작 로그 등은 건너뜀)"""
+    for line in child.stdout:
+        if line.startswith(prefix):
+            return line
+    raise RuntimeError(f"worker exited before sending {prefix!r} (exit code {child.wait()})")
+
+
+def signal(children: List[subprocess.Popen]) -> None:
+    for child in children:
+        child.stdin.write("go\n")
+        child.stdin.flush()
+
+
+def run_workers(count: int, env: Dict[str, str], config: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """워커 count개 시작 → 모두 준비되면 동시에 시작 신호 → 결과 수집 → 요약 확인"""
+    children = []
+    for index in range(count):
+        child_config = dict(config, seed=index)
+        children.append(subprocess.Popen(
+            [sys.executable, "-c", CHILD, json.dumps(child_config)],
+            cwd=ROOT, env=env, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True,
+        ))
+    try:
+        for child in children:
+            read_message(child, "ready")
+        signal(children)
+        results = [json.loads(read_message(child, "{")) for child in children]
+        signal(children)
+        for result, child in zip(results, children):
+            result["check_summary"] = json.loads(read_message(child, "{"))
+            child.communicate()
+            if child.returncode != 0:
+                raise RuntimeError(f"worker exited with {child.returncode}")
+        return results
+    finally:
+        for child in children:
+            if child.poll() is None:
+                child.kill()
+
+
+async def verify(
+    repo: FinanceRepository, expected_count: int, sample: Sequence[str], results: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """항목 수 / 집계 drift / 워커 간 같은 요약 응답"""
+    count = await repo.budget_items.count()
+    drift = 0
+    for event_id in sample:
+        drift += len(await repo.check_budget_aggregate(UUID(event_id)))
+    summaries = {json.dumps(result["check_summary"], sort_keys=True) for result in results}
+    return {
+        "count": count,
+        "expected_count": expected_count,
+        "drift": drift,
+        "summaries_agree": len(summaries) == 1,
+        "ok": count == expected_count and drift == 0 and len(summaries) == 1,
+    }
+
+
+async def run_backend(backend: str, args: argparse.Namespace, directory: str) -> Dict[str, Any]:
+    path = os.path.join(directory, f"{backend}.db")
+    env = storage_env(backend, path, args.shards)
+    repo = create_repository(backend=backend, sqlite_path=path, shards=args.shards)
+    begin = time.perf_counter()
+    data = await seed(repo, args.events, args.items_per_event)
+    print(f"backend={backend} events={args.events:,} items={len(data['items']):,} "
+          f"seed={time.perf_counter() - begin:.1f}s")
+
+    config = {
+        "events": data["events"],
+        "items": data["items"],
+        "write_ratio": args.write_ratio,
+        "duration": args.duration,
+        "concurrency": args.concurrency,
+        "check_event": data["events"][0],
+    }
+    expected_count = len(data["items"])
+    runs: List[Dict[str, Any]] = []
+    for workers in args.workers:
+        results = run_workers(workers, env, config)
+        created = [event_id for result in results for event_id in result["created"]]
+        expected_count += len(created)
+        checked = await verify(repo, expected_count, data["events"][:20] + sorted(set(created))[:20], results)
+        requests = sum(result["requests"] for result in results)
+        elapsed = max(result["elapsed"] for result in results)
+        status: Dict[str, int] = {}
+        for result in results:
+            for code, value in result["status"].items():
+                status[code] = status.get(code, 0) + value
+        run = {
+            "workers": workers,
+            "requests": requests,
+            "throughput_rps": round(requests / elapsed, 1),
+            "p50_ms": round(sorted(result["p50_ms"] for result in results)[len(results) // 2], 3),
+            "p99_ms": round(max(result["p99_ms"] for result in results), 3),
+            "status": status,
+            "consistency": checked,
+        }
+        base = runs[0]["throughput_rps"] / runs[0]["workers"] if runs else run["throughput_rps"] / workers
+        run["efficiency"] = round(run["throughput_rps"] / (workers * base), 3)
+        runs.append(run)
+        print(f"  workers={workers:<3} {run['throughput_rps']:>9,.1f} req/s  efficiency {run['efficiency']:.2f}  "
+              f"p50 {run['p50_ms']:.2f}ms p99 {run['p99_ms']:.2f}ms  status {status}  "
+              f"consistent={checked['ok']}")
+        if not checked["ok"]:
+            raise AssertionError(f"{backend} with {workers} workers is inconsistent: {checked}")
+    await repo.close()
+    return {"backend": backend, "runs": runs}
+
+
+async def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Multi-worker scaling benchmark")
+    parser.add_argument("--backends", default="sharded", help="쉼표 구분 백엔드 (sharded, sqlite)")
+    parser.add_argument("--workers", default="1,2,4", help="쉼표 구분 워커 수")
+    parser.add_argument("--shards", type=int, default=4, help="sharded 백엔드 샤드 수")
+    parser.add_argument("--events", type=int, default=200)
+    parser.add_argument("--items-per-event", type=int, default=50)
+    parser.add_argument("--write-ratio", type=float, default=0.2, help="쓰기 요청 비율 (수정 / 생성 반반)")
+    parser.add_argument("--concurrency", type=int, default=8, help="워커당 동시 요청 수")
+    parser.add_argument("--duration", type=float, default=5.0, help="워커 수별 측정 시간 (초)")
+    parser.add_argument("--output", default=None, help="결과 JSON 경로 (기본: benchmarks/results/)")
+    args = parser.parse_args(argv)
+    args.workers = [int(value) for value in args.workers.split(",")]
+
+    cpus = os.cpu_count() or 1
+    if max(args.workers) > cpus:
+        print(f"note: {cpus} CPU(s) available; runs with more workers than CPUs cannot scale")
+
+    result: Dict[str, Any] = {
+        "benchmark": "workers",
+        "timestamp": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": cpus,
+        "shards": args.shards,
+        "events": args.events,
+        "items_per_event": args.items_per_event,
+        "write_ratio": args.write_ratio,
+        "concurrency": args.concurrency,
+        "duration": args.duration,
+        "backends": [],
+    }
+    directory = tempfile.mkdtemp(prefix="finance-workers-")
+    try:
+        for backend in args.backends.split(","):
+            result["backends"].append(await run_backend(backend, args, directory))
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    output = Path(args.output) if args.output else (
+        RESULTS_DIR / f"bench_workers_{datetime.utcnow():%Y%m%dT%H%M%S}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, indent=2))
+    print(f"\nresults written to {output}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -10,11 +10,19 @@ Author: Event Agent System
 Version: 0.1.0
 """
 
+import time
+
+# 콜드 스타트 측정 기준: 무거운 임포트(FastAPI, 스키마, 라우터) 이전
+import_started = time.perf_counter()
+
+import asyncio
+import gc
+import os
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 
 # Cloudflare Workers 환경 감지
 try:
@@ -25,20 +33,80 @@ except ImportError:
     IS_WORKERS = False
 
 from routers.finance import router as finance_router
+from routers.finance import repository as finance_repository
+from routers.finance import expire_reservations_periodically, report_jobs
+from services.metrics import CONTENT_TYPE, MetricsMiddleware, RequestMetrics, render_prometheus
+
+
+# 라우트별 요청 지표 (/metrics), 콜드 스타트 단계 시간 포함
+request_metrics = RequestMetrics(started=import_started)
+started_at = time.monotonic()
 
 
 # =============================================================================
 # APP LIFESPAN
 # =============================================================================
 
+# 워밍업 요청 경로 (어떤 라우트와도 매칭되지 않음)
+WARMUP_PATH = "/__warmup__"
+
+
+async def warm_up(app: FastAPI) -> None:
+    """
+    첫 요청 전에 라우트 처리 상태를 미리 구성.
+
+    FastAPI는 include_router한 라우트의 요청 처리 상태(파라미터 / 본문 / 응답 필드 검증기)를
+    첫 요청의 라우트 매칭 때 만든다. 매칭되지 않는 경로로 라우터를 직접 호출하면 모든 라우트를
+    한 번씩 매칭 시도하며 그 상태를 만들고, 엔드포인트 실행이나 요청 지표 기록 없이 404로 끝난다.
+    OpenAPI 문서는 여기서 만들지 않는다 (첫 /openapi.json 요청 시 생성 후 캐시).
+    """
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": WARMUP_PATH,
+        "raw_path": WARMUP_PATH.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+        "client": None,
+        "server": None,
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    await app.router(scope, receive, send)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """앱 시작/종료 시 실행되는 로직"""
     # Startup
     print("🚀 Event Agent API Starting...")
     print("📚 CMP-IS Domain D: Financial Management - Active")
+    # 저장된 상태 복구 (memory 백엔드 + FINANCE_JOURNAL_DIR: 스냅샷 적재 + 저널 재생)
+    await finance_repository.open()
+    request_metrics.mark_startup("storage")
+    await warm_up(app)
+    request_metrics.mark_startup("warmup")
+    # FINANCE_GC_FREEZE=1: 시작 시 만든 객체(복구한 레코드 포함)를 영구 세대로 옮겨 이후 전체 GC가
+    # 매번 다시 훑지 않게 함 (프로세스 전역 설정이므로 기본은 끔)
+    if os.environ.get("FINANCE_GC_FREEZE") == "1":
+        gc.freeze()
+    # 만료된 스폰서십 패키지 보류 주기적 정리
+    reservation_sweeper = asyncio.create_task(expire_reservations_periodically())
     yield
     # Shutdown
+    reservation_sweeper.cancel()
+    await asyncio.gather(reservation_sweeper, return_exceptions=True)
+    await report_jobs.close()
+    await finance_repository.close()
     print("👋 Event Agent API Shutting down...")
 
 
@@ -96,6 +164,14 @@ app.add_middleware(
 )
 
 
+# =============================================================================
+# METRICS MIDDLEWARE
+# =============================================================================
+
+# 마지막에 등록 → 가장 바깥에서 CORS 처리까지 포함하여 측정
+app.add_middleware(MetricsMiddleware, metrics=request_metrics)
+
+
 # =============================================================================
 # ROUTERS
 # =============================================================================
@@ -131,13 +207,24 @@ async def root():
     tags=["Health"],
 )
 async def health_check():
-    """헬스체크 엔드포인트"""
-    return {
-        "status": "healthy",
+    """헬스체크 엔드포인트 (재무 저장소 가용성 확인, 실패 시 503)"""
+    try:
+        await finance_repository.ping()
+        storage_status = "active"
+    except Exception:
+        storage_status = "unavailable"
+    healthy = storage_status == "active"
+
+    content = {
+        "status": "healthy" if healthy else "degraded",
         "api_version": "0.1.0",
+        "uptime_seconds": round(time.monotonic() - started_at, 1),
+        "startup_ms": {phase: round(seconds * 1000, 1) for phase, seconds in request_metrics.startup.items()},
+        "requests_in_flight": request_metrics.in_flight,
         "domains": {
             "financial_management": {
-                "status": "active",
+                "status": storage_status,
+                "storage_backend": finance_repository.backend,
                 "reference": "CMP-IS Domain D",
                 "skills": [
                     "Skill 7: Manage Event Funding",
@@ -151,6 +238,29 @@ async def health_check():
             "human_resources": {"status": "planned", "reference": "CMP-IS Domain E"},
         },
     }
+    return JSONResponse(status_code=200 if healthy else 503, content=content)
+
+
+@app.get(
+    "/metrics",
+    summary="운영 지표",
+    description="""
+Prometheus 텍스트 포맷 운영 지표를 반환합니다.
+
+- 라우트별 지연/응답 크기 히스토그램, 상태 코드별 요청 수, 오류 수, 처리 중 요청 수
+- 재무 저장소 컬렉션별 레코드/인덱스 수, 예산 집계 조회 hit/miss
+- 리포트 생성 작업 큐 대기 / 실행 중 작업 수, 대기 · 실행 시간
+    """,
+    tags=["Health"],
+    response_class=PlainTextResponse,
+)
+async def metrics():
+    """Prometheus 지표"""
+    stats = await finance_repository.stats()
+    return PlainTextResponse(
+        render_prometheus(request_metrics, finance_repository.backend, stats, {"reports": report_jobs.stats()}),
+        media_type=CONTENT_TYPE,
+    )
 
 
 # =============================================================================
@@ -181,6 +291,10 @@ if IS_WORKERS:
             return await asgi.fetch(app, request, self.env)
 
 
+# 모듈 로드(앱 구성) 완료: 이후 시간은 워밍업 / 첫 응답 단계로 기록
+request_metrics.mark_startup("import")
+
+
 # =============================================================================
 # RUN (for local development)
 # =============================================================================
@@ -188,10 +302,19 @@ if IS_WORKERS:
 if __name__ == "__main__":
     import uvicorn
 
+    # 워커 프로세스 수 (uvicorn과 같은 WEB_CONCURRENCY, 기본 1)
+    workers = int(os.environ.get("WEB_CONCURRENCY", "1"))
+    if workers > 1 and not finance_repository.shared:
+        raise SystemExit(
+            f"{finance_repository.backend} storage is per-process; "
+            "set FINANCE_STORAGE_BACKEND=sqlite or sharded to run several workers"
+        )
+
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        reload=workers == 1,
+        workers=workers,
         log_level="info",
     )
@@ -3,31 +3,88 @@ Financial Management API Router
 
 이벤트 재무 관리 API 엔드포인트.
 - CMP-IS Domain D (Skills 7, 8, 9) 준수
-- In-Memory 저장소 (MVP 단계)
+- 저장소 백엔드 선택 가능: In-Memory 인덱스 (기본) / SQLite (FINANCE_STORAGE_BACKEND)
 
 Author: Event Agent System
 """
 
-from datetime import date, datetime
+import asyncio
+import logging
+import os
+from datetime import date, datetime, timedelta
 from decimal import Decimal
-from typing import List, Optional
-from uuid import UUID, uuid4
+from enum import Enum
+from typing import TYPE_CHECKING, AbstractSet, Any, Callable, Dict, Generic, List, Optional, Set, Tuple, Type, TypeVar, Union
+from uuid import UUID, uuid4, uuid5
 
-from fastapi import APIRouter, HTTPException, Query
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, Header, HTTPException, Query, Request
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, Field, ValidationError, model_validator
 
 from schemas.financial import (
+    Budget,
     BudgetLineItem,
     BudgetCategory,
     BudgetStatus,
     CostType,
     CurrencyCode,
     FinancialReport,
+    PricingTier,
+    ReservationStatus,
     SponsorshipPackage,
+    SponsorshipReservation,
     SponsorshipTier,
     Sponsor,
     SponsorshipStatus,
+    Transaction,
+    TransactionType,
+    PaymentMethod,
+    CashFlowProjection,
+    UTCDateTime,
 )
+from schemas.money import MAX_AMOUNT, check_amount, quantize
+from services.cashflow import (
+    CashFlowBasis,
+    CashFlowIndex,
+    CashFlowIndexCache,
+    CashFlowPeriod,
+    budget_flows,
+    period_bounds,
+    project,
+    sponsor_flows,
+    transaction_flows,
+)
+from services.bulk_import import ImportFormat, batched, detect_format, iter_csv, iter_ndjson
+from services.export import (
+    MEDIA_TYPES,
+    ExportFormat,
+    csv_stream,
+    export_columns,
+    iter_records,
+    ndjson_stream,
+)
+from services.fx import CurrencyConversion, CurrencyConverter, FXRateError, FXRateSource
+from services.jobs import Job, JobQueue, JobStatus, QueueFull
+from services.pricing import AvailableTiers, PriceQuote, PricingIndex, PricingIndexCache
+from services.reconciliation import BudgetItemIndex, ReconciliationPlan, ReconciliationResult, reconcile
+from services.serialization import ResponseSerializer
+from storage import (
+    BudgetAggregate,
+    Collection,
+    FinanceRepository,
+    PartialWrite,
+    SoldOut,
+    SponsorRevenue,
+    VersionConflict,
+    create_repository,
+)
+from storage.aggregates import CONTRACTED_STATUSES
+from storage.pagination import decode_cursor, encode_cursor
+
+if TYPE_CHECKING:
+    from services.analytics import ColumnarLedger
+
+logger = logging.getLogger(__name__)
 
 
 # =============================================================================
@@ -42,20 +99,61 @@ router = APIRouter(
 
 
 # =============================================================================
-# IN-MEMORY STORAGE
+# STORAGE
 # =============================================================================
 
-# 예산 항목 저장소
-budget_items_db: List[BudgetLineItem] = []
+# 재무 저장소 (budget_items, sponsorship_packages, sponsors, reports)
+# 백엔드는 storage.config 환경 변수로 선택
+repository: FinanceRepository = create_repository()
+
+# 열 지향 분석용 예산 항목 사본 (변경 구독으로 증분 갱신)
+# 첫 분석 요청 시 생성 → NumPy 임포트를 콜드 스타트 경로에서 제외
+budget_ledger: Optional["ColumnarLedger"] = None
+
+# 보고 통화 환산: 환율 파일(FINANCE_FX_RATES_PATH, 변경 시 재로드) + 환산 결과 캐시
+fx_converter = CurrencyConverter(FXRateSource())
+
+# 이벤트별 현금 흐름 인덱스 (이벤트 리비전이 바뀌면 재구성)
+cashflow_indexes = CashFlowIndexCache()
+
+# 이벤트별 가격 등급 구간 인덱스 (이벤트 리비전이 바뀌면 재구성)
+pricing_indexes = PricingIndexCache()
+
+# 대량 견적 요청당 최대 등록 수
+MAX_QUOTE_REGISTRATIONS = 1_000_000
+
+# 스폰서십 패키지 보류 TTL (초): 기본 / 최대, 만료 보류 정리 주기
+DEFAULT_HOLD_TTL_SECONDS = 900
+MAX_HOLD_TTL_SECONDS = 7 * 24 * 3600
+RESERVATION_SWEEP_SECONDS = float(os.environ.get("FINANCE_RESERVATION_SWEEP_SECONDS", "5"))
+
+# 비동기 리포트 생성 작업 (동시 실행 수 / 대기 한도는 환경 변수, 같은 요청은 중복 제거)
+report_jobs = JobQueue(
+    workers=int(os.environ.get("FINANCE_REPORT_JOB_WORKERS", "2")),
+    max_queued=int(os.environ.get("FINANCE_REPORT_JOB_QUEUE", "100")),
+)
+
+# 작업 상태 조회 시 완료 대기 최대 시간 (초)
+MAX_JOB_WAIT_SECONDS = 30.0
 
-# 스폰서십 패키지 저장소
-sponsorship_packages_db: List[SponsorshipPackage] = []
+# 거래 대사 작업 직렬화 (동시 실행 시 같은 거래가 두 번 반영되지 않도록)
+reconciliation_lock = asyncio.Lock()
 
-# 스폰서 저장소
-sponsors_db: List[Sponsor] = []
+# 대사 응답에 포함할 최대 미매칭 거래 수
+MAX_UNMATCHED_TRANSACTIONS = 1000
 
-# 리포트 저장소
-reports_db: List[FinancialReport] = []
+# 현금 흐름 조회 최대 기간 수
+MAX_CASHFLOW_PERIODS = 520
+
+# 목록 조회 페이지 크기
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+# 대량 등록 응답에 포함할 최대 행 오류 수
+MAX_IMPORT_ERRORS = 1000
+
+# 일괄 수정 요청당 최대 항목 수
+MAX_BATCH_UPDATES = 1000
 
 
 # =============================================================================
@@ -69,13 +167,20 @@ class BudgetItemCreate(BaseModel):
     name: str = Field(..., description="항목명", max_length=200)
     description: Optional[str] = Field(None, description="상세 설명")
     vendor_name: Optional[str] = Field(None, description="공급업체명")
+    reference_number: Optional[str] = Field(None, description="참조 번호 (PO, 송장 번호)")
     cost_type: CostType = Field(default=CostType.VARIABLE, description="고정비/변동비")
-    unit_cost: Decimal = Field(..., description="단가", ge=0)
-    quantity: Decimal = Field(default=Decimal("1"), description="수량", ge=0)
+    unit_cost: Decimal = Field(..., description="단가", ge=0, le=MAX_AMOUNT)
+    quantity: Decimal = Field(default=Decimal("1"), description="수량", ge=0, le=MAX_AMOUNT)
     currency: CurrencyCode = Field(default=CurrencyCode.USD, description="통화")
     payment_due_date: Optional[date] = Field(None, description="결제 예정일")
     notes: Optional[str] = Field(None, description="비고")
 
+    @model_validator(mode="after")
+    def check_projected(self) -> "BudgetItemCreate":
+        """예상 금액(unit_cost × quantity)도 금액 범위 이내"""
+        check_amount(self.unit_cost * self.quantity)
+        return self
+
 
 class BudgetItemUpdate(BaseModel):
     """예산 항목 수정 요청"""
@@ -83,14 +188,48 @@ class BudgetItemUpdate(BaseModel):
     name: Optional[str] = None
     description: Optional[str] = None
     vendor_name: Optional[str] = None
+    reference_number: Optional[str] = None
     cost_type: Optional[CostType] = None
-    unit_cost: Optional[Decimal] = None
-    quantity: Optional[Decimal] = None
-    actual_amount: Optional[Decimal] = None
+    unit_cost: Optional[Decimal] = Field(None, ge=-MAX_AMOUNT, le=MAX_AMOUNT)
+    quantity: Optional[Decimal] = Field(None, ge=-MAX_AMOUNT, le=MAX_AMOUNT)
+    actual_amount: Optional[Decimal] = Field(None, ge=-MAX_AMOUNT, le=MAX_AMOUNT)
     status: Optional[BudgetStatus] = None
     notes: Optional[str] = None
 
 
+class BudgetItemPatch(BaseModel):
+    """일괄 수정 요청의 항목별 변경"""
+    id: UUID = Field(..., description="예산 항목 ID")
+    changes: BudgetItemUpdate = Field(..., description="변경할 필드 (단건 수정과 동일)")
+    if_match: Optional[str] = Field(None, description="수정 전 조회한 ETag (단건 수정의 If-Match)")
+
+
+class BudgetItemBatchUpdate(BaseModel):
+    """예산 항목 일괄 수정 요청"""
+    updates: List[BudgetItemPatch] = Field(..., min_length=1, max_length=MAX_BATCH_UPDATES)
+    all_or_nothing: bool = Field(False, description="true면 하나라도 실패 시 아무것도 수정하지 않음")
+
+
+class BudgetItemPatchResult(BaseModel):
+    """일괄 수정 항목별 결과"""
+    id: UUID
+    status: int = Field(
+        ...,
+        description="200 수정, 404 없음, 412 버전 불일치, 422 금액 범위 초과, 424 다른 항목 실패로 미적용 (all_or_nothing)",
+    )
+    item: Optional[BudgetLineItem] = Field(None, description="수정된 항목 (200) / 현재 항목 (412)")
+    detail: Optional[str] = None
+
+
+class BudgetItemBatchResult(BaseModel):
+    """예산 항목 일괄 수정 결과"""
+    all_or_nothing: bool
+    applied: bool = Field(..., description="변경이 저장되었는지 (all_or_nothing 실패 시 false)")
+    updated: int
+    failed: int
+    results: List[BudgetItemPatchResult]
+
+
 class ReportGenerateRequest(BaseModel):
     """리포트 생성 요청"""
     event_id: UUID = Field(..., description="이벤트 ID")
@@ -102,6 +241,102 @@ class ReportGenerateRequest(BaseModel):
     period_end: date = Field(..., description="기간 종료일")
     total_attendees: int = Field(default=0, description="총 참석자 수")
     paid_attendees: int = Field(default=0, description="유료 참석자 수")
+    reporting_currency: Optional[CurrencyCode] = Field(
+        default=None,
+        description="보고 통화 (기본: 항목 통화가 하나면 그 통화, 여럿이면 환율 테이블 기준 통화)"
+    )
+
+
+class ReportGenerationMode(str, Enum):
+    """리포트 생성 방식"""
+    SYNC = "sync"
+    ASYNC = "async"
+
+
+class ReportJob(BaseModel):
+    """비동기 리포트 생성 작업 상태"""
+    id: UUID = Field(..., description="작업 ID")
+    status: JobStatus = Field(..., description="queued | running | succeeded | failed")
+    request: ReportGenerateRequest = Field(..., description="생성 요청")
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    report: Optional[FinancialReport] = Field(None, description="생성된 리포트 (succeeded)")
+    error: Optional[str] = Field(None, description="실패 사유 (failed)")
+
+
+class TransactionCreate(BaseModel):
+    """거래 기록 요청"""
+    event_id: UUID = Field(..., description="이벤트 ID")
+    budget_line_item_id: Optional[UUID] = Field(None, description="연결된 예산 항목 ID")
+    transaction_type: TransactionType = Field(..., description="거래 유형")
+    amount: Decimal = Field(..., description="거래 금액", ge=-MAX_AMOUNT, le=MAX_AMOUNT)
+    currency: CurrencyCode = Field(default=CurrencyCode.USD, description="통화")
+    payment_method: PaymentMethod = Field(..., description="결제 수단")
+    description: str = Field(..., description="거래 설명", max_length=500)
+    reference_number: Optional[str] = Field(None, description="참조 번호 (영수증, 송장 번호)")
+    vendor_name: Optional[str] = Field(None, description="거래처명")
+    transaction_date: Optional[UTCDateTime] = Field(
+        None, description="거래 일시 (기본: 현재, 시간대가 있으면 UTC로 변환)"
+    )
+    recorded_by: str = Field(..., description="기록자")
+    notes: Optional[str] = Field(None, description="비고")
+
+
+class ReconcileRequest(BaseModel):
+    """거래 대사 요청"""
+    event_id: Optional[UUID] = Field(None, description="대사할 이벤트 (기본: 전체)")
+    dry_run: bool = Field(False, description="true면 매칭 결과만 반환하고 저장하지 않음")
+
+
+class ReservationCreate(BaseModel):
+    """스폰서십 패키지 보류 요청"""
+    holder: str = Field(..., description="보류 요청자 (영업 담당자 등)", max_length=200)
+    sponsor_id: Optional[UUID] = Field(None, description="대상 스폰서 ID (CONTRACTED 시 이 보류가 판매로 전환)")
+    ttl_seconds: int = Field(
+        DEFAULT_HOLD_TTL_SECONDS, ge=1, le=MAX_HOLD_TTL_SECONDS, description="보류 유지 시간 (초)"
+    )
+
+
+class PricingTierCreate(BaseModel):
+    """가격 등급 생성 요청"""
+    event_id: UUID = Field(..., description="이벤트 ID")
+    name: str = Field(..., description="등급명 (예: Early Bird, Regular, On-site)", max_length=100)
+    description: Optional[str] = Field(None, description="등급 설명")
+    base_price: Decimal = Field(..., ge=Decimal("0"), le=MAX_AMOUNT, description="기본 가격")
+    currency: CurrencyCode = Field(default=CurrencyCode.USD, description="통화")
+    member_discount_rate: Decimal = Field(
+        Decimal("0"), ge=Decimal("0"), le=Decimal("100"), description="회원 할인율 (%)"
+    )
+    valid_from: Optional[UTCDateTime] = Field(
+        None, description="적용 시작일 (생략 시 제한 없음, 시간대가 있으면 UTC로 변환)"
+    )
+    valid_until: Optional[UTCDateTime] = Field(
+        None, description="적용 종료일 (생략 시 제한 없음, 시간대가 있으면 UTC로 변환)"
+    )
+    max_quantity: Optional[int] = Field(None, ge=0, description="최대 판매 수량 (생략 시 무제한)")
+    sold_quantity: int = Field(0, ge=0, description="판매된 수량")
+
+
+class PriceQuoteRequest(BaseModel):
+    """대량 등록 견적 요청 (열 단위: i번째 등록 = timestamps[i], members[i])"""
+    event_id: UUID = Field(..., description="이벤트 ID")
+    timestamps: List[datetime] = Field(
+        ..., max_length=MAX_QUOTE_REGISTRATIONS, description="등록 예정 시각 (시간대 없으면 UTC)"
+    )
+    members: Optional[List[bool]] = Field(None, description="회원 여부 (생략 시 모두 비회원)")
+    consume_capacity: bool = Field(True, description="등록 시각 순서대로 등급 남은 수량 소진")
+    include_quotes: bool = Field(False, description="등록별 배정 등급 / 가격 포함")
+
+
+class CashFlowReport(BaseModel):
+    """이벤트 현금 흐름 (기간별)"""
+    event_id: UUID
+    currency: str = Field(..., description="보고 통화")
+    period_type: CashFlowPeriod
+    basis: CashFlowBasis = Field(..., description="기초 잔액 누적 기준")
+    rates_version: Optional[str] = Field(None, description="환산에 사용한 환율 테이블 버전 (환산 없으면 null)")
+    periods: List[CashFlowProjection]
 
 
 class BudgetSummary(BaseModel):
@@ -112,6 +347,219 @@ class BudgetSummary(BaseModel):
     total_variance: Decimal
     by_category: dict
     by_status: dict
+    by_currency: dict = Field(default_factory=dict, description="통화별 소계 (환산 전 원 통화 금액)")
+    converted: Optional[CurrencyConversion] = Field(
+        None, description="보고 통화 환산 합계 (보고 통화 지정 또는 다중 통화 이벤트)"
+    )
+
+
+T = TypeVar("T")
+
+
+class Page(BaseModel, Generic[T]):
+    """키셋 페이지 응답"""
+    items: List[T]
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 null)")
+    total_count: Optional[int] = Field(None, description="전체 건수 (include_total=true인 경우)")
+
+
+class BulkImportRowError(BaseModel):
+    """대량 등록 행 오류"""
+    row: int = Field(..., description="데이터 행 번호 (1부터, CSV 헤더 제외)")
+    errors: List[dict] = Field(..., description="검증 오류 (loc, msg, type)")
+
+
+class BulkImportResult(BaseModel):
+    """대량 등록 결과"""
+    total_rows: int
+    imported: int
+    failed: int
+    errors: List[BulkImportRowError] = Field(default_factory=list)
+    errors_truncated: bool = Field(False, description="오류가 많아 일부만 포함된 경우 true")
+
+
+class AggregateConsistency(BaseModel):
+    """예산 집계 정합성 검사 결과"""
+    event_id: UUID
+    consistent: bool
+    drift: List[dict] = Field(default_factory=list, description="불일치 항목 (field, cached, recomputed)")
+
+
+# =============================================================================
+# RESPONSE SERIALIZERS
+# =============================================================================
+
+# 응답 모델별 사전 컴파일된 TypeAdapter (JSON bytes 직접 생성)
+BUDGET_JSON = ResponseSerializer(Budget)
+BUDGET_ITEM_JSON = ResponseSerializer(BudgetLineItem)
+BUDGET_ITEM_PAGE_JSON = ResponseSerializer(Page[BudgetLineItem])
+BUDGET_ITEM_BATCH_JSON = ResponseSerializer(BudgetItemBatchResult)
+BUDGET_SUMMARY_JSON = ResponseSerializer(BudgetSummary)
+BULK_IMPORT_JSON = ResponseSerializer(BulkImportResult)
+CONSISTENCY_JSON = ResponseSerializer(AggregateConsistency)
+REPORT_JSON = ResponseSerializer(FinancialReport)
+REPORT_PAGE_JSON = ResponseSerializer(Page[FinancialReport])
+REPORT_JOB_JSON = ResponseSerializer(ReportJob)
+PACKAGE_JSON = ResponseSerializer(SponsorshipPackage)
+PACKAGE_PAGE_JSON = ResponseSerializer(Page[SponsorshipPackage])
+SPONSOR_JSON = ResponseSerializer(Sponsor)
+SPONSOR_PAGE_JSON = ResponseSerializer(Page[Sponsor])
+TRANSACTION_JSON = ResponseSerializer(Transaction)
+TRANSACTION_PAGE_JSON = ResponseSerializer(Page[Transaction])
+RESERVATION_JSON = ResponseSerializer(SponsorshipReservation)
+RESERVATION_PAGE_JSON = ResponseSerializer(Page[SponsorshipReservation])
+PRICING_TIER_JSON = ResponseSerializer(PricingTier)
+PRICING_TIER_PAGE_JSON = ResponseSerializer(Page[PricingTier])
+AVAILABLE_TIERS_JSON = ResponseSerializer(AvailableTiers)
+PRICE_QUOTE_JSON = ResponseSerializer(PriceQuote)
+CASH_FLOW_JSON = ResponseSerializer(CashFlowReport)
+RECONCILIATION_JSON = ResponseSerializer(ReconciliationResult)
+
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+async def paginate(
+    collection: Collection,
+    limit: int,
+    cursor: Optional[str],
+    include_total: bool,
+    **filters: Any,
+) -> Page:
+    """컬렉션 키셋 페이지 조회 → Page 응답"""
+    try:
+        after = decode_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid cursor: {cursor}")
+
+    items, next_key = await collection.page(limit, after, **filters)
+    total = await collection.count(**filters) if include_total else None
+    return Page(items=items, next_cursor=encode_cursor(next_key), total_count=total)
+
+
+def record_etag(record: Any) -> str:
+    """레코드 버전 → ETag"""
+    return f'"{record.version}"'
+
+
+def parse_if_match(header: Optional[str]) -> Optional[Set[int]]:
+    """
+    If-Match 헤더 → 허용 버전 집합.
+    헤더가 없거나 `*`이면 None (무조건 수정), 약한 ETag(W/)는 강한 비교 규칙에 따라 무시.
+    """
+    if header is None or header.strip() == "*":
+        return None
+    versions: Set[int] = set()
+    for tag in header.split(","):
+        tag = tag.strip()
+        if tag.startswith('"') and tag.endswith('"') and tag[1:-1].isdigit():
+            versions.add(int(tag[1:-1]))
+    return versions
+
+
+def precondition_failed(current: Any) -> HTTPException:
+    """If-Match 불일치 → 412 (현재 ETag 포함)"""
+    return HTTPException(
+        status_code=412,
+        detail=f"Record {current.id} was modified (current version {current.version})",
+        headers={"ETag": record_etag(current)},
+    )
+
+
+async def revision_etag(event_id: Optional[UUID] = None) -> str:
+    """
+    이벤트(또는 전체) 변경 리비전 → 약한 ETag.
+    데이터 조회 전에 읽으므로, 그 사이 변경이 있어도 다음 요청에서 새 ETag로 갱신된다.
+    """
+    return f'W/"{await repository.revision(event_id)}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 약한 비교 (W/ 접두사 무시, `*`는 항상 일치)"""
+    if if_none_match is None:
+        return False
+    opaque = etag.removeprefix("W/")
+    return any(
+        tag == "*" or tag.removeprefix("W/") == opaque
+        for tag in (t.strip() for t in if_none_match.split(","))
+    )
+
+
+def not_modified(etag: str) -> Response:
+    """304 Not Modified (본문 없음)"""
+    return Response(status_code=304, headers={"ETag": etag})
+
+
+def fx_tag(day: date) -> str:
+    """환산 결과에 영향을 주는 환율 상태 (ETag용): 테이블 버전 + 적용일"""
+    try:
+        table = fx_converter.source.table()
+        return f"{table.version}@{table.effective_date(day)}"
+    except FXRateError:
+        return "none"
+
+
+def conversion_target(aggregate: BudgetAggregate, requested: Optional[CurrencyCode]) -> Optional[str]:
+    """
+    환산할 보고 통화 (None이면 환산 불필요: 항목이 모두 보고 통화이거나 단일 통화).
+    보고 통화를 지정하지 않은 다중 통화 이벤트는 환율 테이블 기준 통화로 환산.
+    """
+    currencies = set(aggregate.by_currency)
+    if requested is not None:
+        return None if currencies <= {requested.value} else requested.value
+    if len(currencies) <= 1:
+        return None
+    try:
+        return fx_converter.source.table().base
+    except FXRateError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+
+def convert_aggregate(
+    event_id: UUID,
+    revision: Optional[str],
+    aggregate: BudgetAggregate,
+    currency: str,
+    day: date,
+) -> CurrencyConversion:
+    """이벤트 통화별 소계 → 보고 통화 (이벤트 리비전 기준 캐시, 리비전을 모르면 캐시 없이)"""
+    cache_key = (event_id, revision) if revision is not None else None
+    try:
+        return fx_converter.convert(aggregate.by_currency, currency, day, cache_key=cache_key)
+    except FXRateError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+
+async def package_event_id(package_id: UUID) -> UUID:
+    """스폰서십 패키지의 이벤트 ID (패키지가 없으면 404)"""
+    package = await repository.sponsorship_packages.get(package_id)
+    if package is None:
+        raise HTTPException(status_code=404, detail=f"Sponsorship package {package_id} not found")
+    return package.event_id
+
+
+def export_response(
+    collection: Collection,
+    model: type,
+    filename: str,
+    format: ExportFormat,
+    fields: Optional[str],
+    **filters: Any,
+) -> StreamingResponse:
+    """컬렉션 스트리밍 내보내기 응답"""
+    try:
+        columns = export_columns(model, fields)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+    pages = iter_records(collection, **filters)
+    body = csv_stream(pages, columns) if format == ExportFormat.CSV else ndjson_stream(pages, columns)
+    return StreamingResponse(
+        body,
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{format.value}"'},
+    )
 
 
 # =============================================================================
@@ -132,17 +580,115 @@ class BudgetSummary(BaseModel):
 **출력**: 생성된 예산 항목 (ID, 예상금액 자동 계산)
     """
 )
-async def create_budget_item(item: BudgetItemCreate) -> BudgetLineItem:
+async def create_budget_item(item: BudgetItemCreate) -> Response:
     """예산 항목 생성"""
-    # projected_amount 자동 계산
+    budget_item = build_budget_item(item)
+    await repository.budget_items.add(budget_item)
+    return BUDGET_ITEM_JSON.response(
+        budget_item, status_code=201, headers={"ETag": record_etag(budget_item)}
+    )
+
+
+@router.post(
+    "/budget-items/import",
+    response_model=BulkImportResult,
+    summary="예산 항목 대량 등록",
+    description="""
+NDJSON 또는 CSV 요청 본문을 스트리밍으로 읽어 예산 항목을 일괄 등록합니다.
+
+**입력 형식**: `Content-Type: application/x-ndjson` 또는 `text/csv` (`format`으로 지정 가능)
+- NDJSON: 한 줄에 `BudgetItemCreate` JSON 객체 하나
+- CSV: 첫 줄 헤더 (`event_id,category,name,unit_cost,quantity,...`)
+
+**처리 방식**:
+- `batch_size` 단위로 검증 후 일괄 저장 (메모리 사용량 일정)
+- 잘못된 행은 건너뛰고 행 번호별 오류를 반환 (전체 중단 없음)
+    """
+)
+async def import_budget_items(
+    request: Request,
+    format: Optional[ImportFormat] = Query(None, description="입력 형식 (기본: Content-Type으로 판별)"),
+    batch_size: int = Query(1000, ge=1, le=10000, description="배치 크기"),
+) -> Response:
+    """예산 항목 대량 등록"""
+    return await bulk_import(
+        request, format, batch_size, BudgetItemCreate, build_budget_item, repository.budget_items
+    )
+
+
+async def bulk_import(
+    request: Request,
+    format: Optional[ImportFormat],
+    batch_size: int,
+    schema: Type[BaseModel],
+    build: Callable[[Any], BaseModel],
+    collection: Collection,
+) -> Response:
+    """NDJSON/CSV 본문 → schema 검증 → build → 배치 단위 add_many"""
+    fmt = format or detect_format(request.headers.get("content-type", ""))
+    if fmt == ImportFormat.CSV:
+        rows = iter_csv(request.stream())
+        validate = schema.model_validate
+    else:
+        rows = iter_ndjson(request.stream())
+        validate = schema.model_validate_json
+
+    total = imported = failed = 0
+    errors: List[BulkImportRowError] = []
+    async for batch in batched(rows, batch_size):
+        records: List[BaseModel] = []
+        for row, payload in batch:
+            total += 1
+            try:
+                records.append(build(validate(payload)))
+            except ValidationError as exc:
+                failed += 1
+                if len(errors) < MAX_IMPORT_ERRORS:
+                    errors.append(BulkImportRowError(
+                        row=row,
+                        errors=[
+                            {"loc": list(e["loc"]), "msg": e["msg"], "type": e["type"]}
+                            for e in exc.errors(include_url=False)
+                        ],
+                    ))
+        imported += await collection.add_many(records)
+
+    return BULK_IMPORT_JSON.response(BulkImportResult(
+        total_rows=total,
+        imported=imported,
+        failed=failed,
+        errors=errors,
+        errors_truncated=failed > len(errors),
+    ))
+
+
+def budget_item_changes(
+    item: BudgetLineItem, update_data: dict, now: datetime
+) -> dict:
+    """
+    수정 요청 필드 → 레코드 변경 값 (unit_cost/quantity 변경 시에만 projected_amount 재계산)
+    재계산한 projected_amount가 금액 범위를 벗어나면 ValueError (저장 전)
+    """
+    changes = dict(update_data)
+    if "unit_cost" in update_data or "quantity" in update_data:
+        changes["projected_amount"] = check_amount(
+            update_data.get("unit_cost", item.unit_cost) * update_data.get("quantity", item.quantity)
+        )
+    changes["updated_at"] = now
+    return changes
+
+
+def build_budget_item(item: BudgetItemCreate) -> BudgetLineItem:
+    """생성 요청 → 예산 항목 (projected_amount 자동 계산)"""
     projected = item.unit_cost * item.quantity
 
-    budget_item = BudgetLineItem(
+    return BudgetLineItem(
         event_id=item.event_id,
         category=item.category,
         name=item.name,
         description=item.description,
         vendor_name=item.vendor_name,
+        reference_number=item.reference_number,
         cost_type=item.cost_type,
         unit_cost=item.unit_cost,
         quantity=item.quantity,
@@ -154,52 +700,83 @@ async def create_budget_item(item: BudgetItemCreate) -> BudgetLineItem:
         notes=item.notes,
     )
 
-    budget_items_db.append(budget_item)
-    return budget_item
-
 
 @router.get(
     "/budget-items",
-    response_model=List[BudgetLineItem],
+    response_model=Page[BudgetLineItem],
     summary="예산 항목 전체 조회",
     description="""
-저장된 모든 예산 항목을 조회합니다.
+저장된 예산 항목을 페이지 단위로 조회합니다.
 
 **필터링 옵션**:
 - `event_id`: 특정 이벤트의 항목만 조회
 - `category`: 특정 카테고리만 조회
 - `status`: 특정 상태만 조회
+
+**페이지네이션**: `limit` + `cursor` (응답의 `next_cursor`를 다음 요청에 전달).
+정렬 기준은 `(created_at, id)`이며 `include_total=true`이면 전체 건수를 함께 반환합니다.
+
+**조건부 조회**: 응답 `ETag`를 `If-None-Match`로 보내면 변경이 없을 때 304를 반환합니다.
+(`event_id` 지정 시 해당 이벤트의 변경만 반영)
     """
 )
 async def list_budget_items(
     event_id: Optional[UUID] = Query(None, description="이벤트 ID로 필터"),
     category: Optional[BudgetCategory] = Query(None, description="카테고리로 필터"),
     status: Optional[BudgetStatus] = Query(None, description="상태로 필터"),
-) -> List[BudgetLineItem]:
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    include_total: bool = Query(False, description="전체 건수 포함 여부"),
+    if_none_match: Optional[str] = Header(None, description="이전 응답의 ETag (변경 없으면 304)"),
+) -> Response:
     """예산 항목 목록 조회"""
-    result = budget_items_db
+    etag = await revision_etag(event_id)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    page = await paginate(
+        repository.budget_items, limit, cursor, include_total,
+        event_id=event_id, category=category, status=status,
+    )
+    return BUDGET_ITEM_PAGE_JSON.response(page, headers={"ETag": etag})
 
-    if event_id:
-        result = [i for i in result if i.event_id == event_id]
-    if category:
-        result = [i for i in result if i.category == category]
-    if status:
-        result = [i for i in result if i.status == status]
 
-    return result
+@router.get(
+    "/budget-items/export",
+    response_class=StreamingResponse,
+    summary="예산 항목 내보내기",
+    description="""
+예산 항목을 NDJSON 또는 CSV로 스트리밍 내보내기합니다.
+
+- 페이지 단위로 읽어 바로 전송하므로 건수와 무관하게 메모리 사용량이 일정합니다.
+- `fields`로 필요한 컬럼만 선택할 수 있습니다 (예: `name,projected_amount,variance`).
+- 필터: `event_id`, `category`, `status`
+    """
+)
+async def export_budget_items(
+    event_id: Optional[UUID] = Query(None, description="이벤트 ID로 필터"),
+    category: Optional[BudgetCategory] = Query(None, description="카테고리로 필터"),
+    status: Optional[BudgetStatus] = Query(None, description="상태로 필터"),
+    format: ExportFormat = Query(ExportFormat.NDJSON, description="내보내기 형식"),
+    fields: Optional[str] = Query(None, description="쉼표로 구분한 필드 목록 (기본: 전체)"),
+):
+    """예산 항목 내보내기"""
+    return export_response(
+        repository.budget_items, BudgetLineItem, "budget_items", format, fields,
+        event_id=event_id, category=category, status=status,
+    )
 
 
 @router.get(
     "/budget-items/{item_id}",
     response_model=BudgetLineItem,
     summary="예산 항목 단일 조회",
-    description="ID로 특정 예산 항목을 조회합니다."
+    description="ID로 특정 예산 항목을 조회합니다. 응답 `ETag`는 레코드 버전입니다."
 )
-async def get_budget_item(item_id: UUID) -> BudgetLineItem:
+async def get_budget_item(item_id: UUID) -> Response:
     """예산 항목 단일 조회"""
-    for item in budget_items_db:
-        if item.id == item_id:
-            return item
+    item = await repository.budget_items.get(item_id)
+    if item is not None:
+        return BUDGET_ITEM_JSON.response(item, headers={"ETag": record_etag(item)})
     raise HTTPException(status_code=404, detail=f"Budget item {item_id} not found")
 
 
@@ -215,28 +792,140 @@ async def get_budget_item(item_id: UUID) -> BudgetLineItem:
 - 상태 변경 (DRAFT → APPROVED → PAID)
 - 수량/단가 조정
 
+**동시 수정 방지**: 조회 응답의 `ETag`를 `If-Match` 헤더로 전달하면
+그 사이 다른 수정이 있었을 때 412 (Precondition Failed)를 반환합니다.
+
 **CMP-IS Reference**: Skill 8.3 - Monitor and revise budget
     """
 )
-async def update_budget_item(item_id: UUID, update: BudgetItemUpdate) -> BudgetLineItem:
+async def update_budget_item(
+    item_id: UUID,
+    update: BudgetItemUpdate,
+    if_match: Optional[str] = Header(None, description="수정 전 조회한 ETag"),
+) -> Response:
     """예산 항목 수정"""
-    for i, item in enumerate(budget_items_db):
-        if item.id == item_id:
-            # 업데이트할 필드만 적용
-            update_data = update.model_dump(exclude_unset=True)
-            updated_item = item.model_copy(update=update_data)
-
-            # unit_cost나 quantity가 변경되면 projected_amount 재계산
-            if "unit_cost" in update_data or "quantity" in update_data:
-                updated_item = updated_item.model_copy(
-                    update={"projected_amount": updated_item.unit_cost * updated_item.quantity}
-                )
+    # 업데이트할 필드만 적용
+    update_data = update.model_dump(exclude_unset=True)
 
-            updated_item = updated_item.model_copy(update={"updated_at": datetime.utcnow()})
-            budget_items_db[i] = updated_item
-            return updated_item
+    def apply(item: BudgetLineItem) -> BudgetLineItem:
+        return item.model_copy(update=budget_item_changes(item, update_data, datetime.utcnow()))
 
-    raise HTTPException(status_code=404, detail=f"Budget item {item_id} not found")
+    try:
+        updated_item = await repository.budget_items.update(item_id, apply, parse_if_match(if_match))
+    except VersionConflict as exc:
+        raise precondition_failed(exc.current)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+    if updated_item is None:
+        raise HTTPException(status_code=404, detail=f"Budget item {item_id} not found")
+    return BUDGET_ITEM_JSON.response(updated_item, headers={"ETag": record_etag(updated_item)})
+
+
+@router.patch(
+    "/budget-items",
+    response_model=BudgetItemBatchResult,
+    summary="예산 항목 일괄 수정",
+    description="""
+여러 예산 항목을 한 번에 수정합니다 (최대 1000건, 예: 월말 마감 시 실제 지출액 입력 + PAID 처리).
+
+**처리 방식**:
+- 항목별 변경은 단건 수정(`PATCH /budget-items/{id}`)과 같은 규칙
+  (unit_cost/quantity가 바뀐 항목만 projected_amount 재계산, 버전 1 증가)
+- 전체를 한 번의 일괄 쓰기로 저장 → 이벤트 리비전 1회 증가, 예산 집계도 배치당 1회 갱신
+- 항목별 `if_match`(조회 응답의 ETag)가 현재 버전과 다르면 그 항목은 412
+- 재계산한 projected_amount가 금액 범위를 벗어나면 그 항목은 422 (저장 전에 검사, 검사한 버전에만 적용되며
+  그 사이 다른 수정이 있으면 412)
+
+**all_or_nothing**: true면 하나라도 실패(404/412/422)할 때 아무것도 저장하지 않고 409를 반환합니다.
+성공할 수 있었던 항목은 424로 표시됩니다. false(기본)면 성공한 항목만 저장하고 200을 반환합니다.
+같은 ID가 두 번 있는 배치와, sharded 저장소에서 여러 이벤트 샤드에 걸친 all_or_nothing 배치는 400입니다.
+
+**동시 수정**: 저장 직전 다른 프로세스가 항목을 먼저 수정하면 409를 반환합니다. 보통은 아무것도
+저장되지 않지만, sharded 저장소에서 여러 샤드에 걸친 배치는 먼저 저장된 샤드가 남을 수 있으며
+이때 `detail.saved_ids`에 저장된 항목을 알려줍니다.
+    """
+)
+async def update_budget_items(batch: BudgetItemBatchUpdate) -> Response:
+    """예산 항목 일괄 수정"""
+    now = datetime.utcnow()
+    record_ids = [patch.id for patch in batch.updates]
+    if len(set(record_ids)) != len(record_ids):
+        raise HTTPException(status_code=400, detail="Duplicate id in update batch")
+    update_data = [patch.changes.model_dump(exclude_unset=True) for patch in batch.updates]
+    expected = [parse_if_match(patch.if_match) for patch in batch.updates]
+
+    # projected_amount를 재계산하는 항목은 저장 전에 금액 범위를 항목별로 검사 (422).
+    # 검사한 버전에만 적용되도록 허용 버전을 고정 → 그 사이 수정되면 412
+    rejected: Dict[int, str] = {}
+    recomputed = [i for i, data in enumerate(update_data) if "unit_cost" in data or "quantity" in data]
+    if recomputed:
+        current = await repository.budget_items.get_many([record_ids[i] for i in recomputed])
+        for i in recomputed:
+            item = current.get(record_ids[i])
+            if item is None:
+                continue
+            expected[i] = {item.version} if expected[i] is None else expected[i] & {item.version}
+            if not expected[i]:
+                continue
+            try:
+                budget_item_changes(item, update_data[i], now)
+            except ValueError as exc:
+                rejected[i] = str(exc)
+
+    def changes_for(data: dict) -> Callable[[BudgetLineItem], dict]:
+        return lambda item: budget_item_changes(item, data, now)
+
+    accepted = [i for i in range(len(batch.updates)) if i not in rejected]
+    outcomes: Dict[int, Union[BudgetLineItem, VersionConflict, None]] = {}
+    if accepted and not (batch.all_or_nothing and rejected):
+        try:
+            written = await repository.budget_items.update_many(
+                [(record_ids[i], changes_for(update_data[i]), expected[i]) for i in accepted],
+                all_or_nothing=batch.all_or_nothing,
+            )
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc))
+        except VersionConflict as exc:
+            # 다른 프로세스가 같은 항목을 먼저 수정 (SQLite 공유 DB) → 일괄 쓰기 전체 롤백
+            raise HTTPException(status_code=409, detail=str(exc))
+        except PartialWrite as exc:
+            # 샤드 간 배치: 먼저 쓴 샤드는 저장된 채로 남음 → 저장된 항목을 그대로 알린다
+            raise HTTPException(status_code=409, detail={
+                "message": f"Batch partially applied: {exc.conflict}",
+                "saved_ids": [str(record.id) for record in exc.written],
+            })
+        outcomes = dict(zip(accepted, written))
+
+    failed = len(rejected) + sum(1 for outcome in outcomes.values() if not isinstance(outcome, BudgetLineItem))
+    applied = not (batch.all_or_nothing and failed)
+    results: List[BudgetItemPatchResult] = []
+    for i, patch in enumerate(batch.updates):
+        outcome = outcomes.get(i)
+        if i in rejected:
+            results.append(BudgetItemPatchResult(id=patch.id, status=422, detail=rejected[i]))
+        elif i in outcomes and outcome is None:
+            results.append(BudgetItemPatchResult(
+                id=patch.id, status=404, detail=f"Budget item {patch.id} not found",
+            ))
+        elif isinstance(outcome, VersionConflict):
+            results.append(BudgetItemPatchResult(
+                id=patch.id, status=412, item=outcome.current,
+                detail=f"Record {patch.id} was modified (current version {outcome.current.version})",
+            ))
+        elif applied:
+            results.append(BudgetItemPatchResult(id=patch.id, status=200, item=outcome))
+        else:
+            results.append(BudgetItemPatchResult(
+                id=patch.id, status=424, detail="Not applied: another item in the batch failed",
+            ))
+
+    return BUDGET_ITEM_BATCH_JSON.response(BudgetItemBatchResult(
+        all_or_nothing=batch.all_or_nothing,
+        applied=applied,
+        updated=len(batch.updates) - failed if applied else 0,
+        failed=failed,
+        results=results,
+    ), status_code=200 if applied else 409)
 
 
 @router.delete(
@@ -247,10 +936,8 @@ async def update_budget_item(item_id: UUID, update: BudgetItemUpdate) -> BudgetL
 )
 async def delete_budget_item(item_id: UUID):
     """예산 항목 삭제"""
-    for i, item in enumerate(budget_items_db):
-        if item.id == item_id:
-            budget_items_db.pop(i)
-            return
+    if await repository.budget_items.remove(item_id) is not None:
+        return
     raise HTTPException(status_code=404, detail=f"Budget item {item_id} not found")
 
 
@@ -266,52 +953,203 @@ async def delete_budget_item(item_id: UUID):
 - 총 예상/실제 금액
 - 카테고리별 집계
 - 상태별 집계
+- 통화별 소계 (`by_currency`, 원 통화 금액)
+
+**통화 환산**: `reporting_currency`를 지정하거나 항목 통화가 여럿이면 `converted`에
+보고 통화 환산 합계를 포함합니다. 환율은 `as_of`(기본: 오늘)에 적용되는 환율 테이블 값을
+사용하며, 환산은 통화별 소계에 적용되어 항목 수와 무관합니다.
+(`total_*`, `by_category`는 원 통화 금액의 단순 합계)
+
+**조건부 조회**: 응답 `ETag`(이벤트 변경 리비전 + 환율 버전)를 `If-None-Match`로 보내면
+그 사이 이벤트 데이터와 환율 변경이 없을 때 집계 없이 304를 반환합니다.
     """
 )
-async def get_budget_summary(event_id: UUID) -> BudgetSummary:
-    """예산 요약"""
-    items = [i for i in budget_items_db if i.event_id == event_id]
+async def get_budget_summary(
+    event_id: UUID,
+    reporting_currency: Optional[CurrencyCode] = Query(None, description="보고 통화"),
+    as_of: Optional[date] = Query(None, description="환율 적용 기준일 (기본: 오늘)"),
+    if_none_match: Optional[str] = Header(None, description="이전 응답의 ETag (변경 없으면 304)"),
+) -> Response:
+    """예산 요약 (증분 집계 기반, O(categories + currencies))"""
+    day = as_of or date.today()
+    revision = await repository.revision(event_id)
+    etag = f'W/"{revision}+{fx_tag(day)}"'
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    aggregate = await repository.budget_aggregate(event_id)
+    target = conversion_target(aggregate, reporting_currency)
+
+    return BUDGET_SUMMARY_JSON.response(BudgetSummary(
+        total_items=aggregate.total_items,
+        total_projected=aggregate.total_projected,
+        total_actual=aggregate.total_actual,
+        total_variance=aggregate.total_variance,
+        by_category={k: {"projected": float(v["projected"]), "actual": float(v["actual"]), "count": v["count"]} for k, v in aggregate.by_category.items()},
+        by_status=dict(aggregate.by_status),
+        by_currency={
+            code: {
+                "count": bucket["count"],
+                "projected": bucket["projected"],
+                "actual": bucket["actual"],
+            }
+            for code, bucket in aggregate.by_currency.items()
+        },
+        converted=(
+            convert_aggregate(event_id, revision, aggregate, target, day) if target is not None else None
+        ),
+    ), headers={"ETag": etag})
+
+
+@router.get(
+    "/budget-items/summary/{event_id}/consistency",
+    response_model=AggregateConsistency,
+    summary="예산 집계 정합성 검사",
+    description="""
+증분 방식으로 유지되는 이벤트 예산 집계를 전체 재계산 결과와 비교합니다.
+
+**출력**: 정합성 여부 및 불일치(drift) 항목 목록
+    """
+)
+async def check_budget_summary(event_id: UUID) -> Response:
+    """예산 집계 정합성 검사"""
+    drift = await repository.check_budget_aggregate(event_id)
+    return CONSISTENCY_JSON.response(AggregateConsistency(
+        event_id=event_id,
+        consistent=not drift,
+        drift=drift,
+    ))
+
+
+@router.get(
+    "/budgets/{event_id}",
+    response_model=Budget,
+    summary="이벤트 예산 조회",
+    description="""
+이벤트의 전체 예산(Budget)을 라인 항목과 함께 조회합니다.
+
+**집계**: `total_projected`, `total_actual`, `total_variance`, `contingency_amount`,
+`budget_by_category`는 라인 항목을 한 번만 순회해 계산한 값을 공유합니다.
+(원 통화 금액의 단순 합계, 통화 환산은 `/budget-items/summary/{event_id}` 사용)
 
+**조건부 조회**: 응답 `ETag`(이벤트 변경 리비전 + 조회 파라미터)를 `If-None-Match`로 보내면
+그 사이 이벤트 데이터 변경이 없을 때 항목 조회 없이 304를 반환합니다.
+    """
+)
+async def get_budget(
+    event_id: UUID,
+    fiscal_year: Optional[int] = Query(None, description="회계연도 (기본: 올해)"),
+    currency: CurrencyCode = Query(CurrencyCode.USD, description="예산 기본 통화"),
+    contingency_percentage: Decimal = Query(
+        Decimal("10"), ge=Decimal("0"), le=Decimal("50"), description="예비비 비율 (%)"
+    ),
+    if_none_match: Optional[str] = Header(None, description="이전 응답의 ETag (변경 없으면 304)"),
+) -> Response:
+    """이벤트 예산 (라인 항목 + 단일 순회 집계)"""
+    year = fiscal_year or date.today().year
+    revision = await repository.revision(event_id)
+    etag = f'W/"{revision}+{year}+{currency.value}+{contingency_percentage}"'
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    items = await repository.budget_items.find(event_id=event_id)
     if not items:
-        return BudgetSummary(
-            total_items=0,
-            total_projected=Decimal("0"),
-            total_actual=Decimal("0"),
-            total_variance=Decimal("0"),
-            by_category={},
-            by_status={},
+        raise HTTPException(status_code=404, detail=f"No budget items for event {event_id}")
+    return BUDGET_JSON.response(Budget(
+        # 같은 이벤트는 항상 같은 ID (같은 ETag의 응답 본문이 달라지지 않도록)
+        id=uuid5(event_id, "budget"),
+        event_id=event_id,
+        name=f"Event {event_id} Budget {year}",
+        fiscal_year=year,
+        currency=currency,
+        line_items=items,
+        contingency_percentage=contingency_percentage,
+        last_modified_date=max(item.updated_at for item in items),
+    ), headers={"ETag": etag})
+
+
+# =============================================================================
+# REPORT ENDPOINTS
+# =============================================================================
+
+async def report_inputs(
+    request: ReportGenerateRequest,
+) -> Tuple[Optional[str], BudgetAggregate, SponsorRevenue]:
+    """
+    리포트 계산 입력 스냅샷: (이벤트 리비전, 예산 누적 집계 사본, 스폰서 수익 집계 사본)
+    memory 저장소의 집계는 쓰기마다 제자리에서 갱신되므로 사본을 넘긴다 (스레드 풀 계산 중 변경 방지).
+    읽는 사이 리비전이 바뀌었으면 사본이 어느 리비전인지 알 수 없으므로 None (환산 캐시 미사용).
+    """
+    revision = await repository.revision(request.event_id)
+    aggregate = (await repository.budget_aggregate(request.event_id)).copy()
+    revenue = (await repository.sponsor_revenue(request.event_id)).copy()
+    if await repository.revision(request.event_id) != revision:
+        revision = None
+    return revision, aggregate, revenue
+
+
+def build_report(
+    request: ReportGenerateRequest,
+    revision: Optional[str],
+    aggregate: BudgetAggregate,
+    revenue: SponsorRevenue,
+) -> FinancialReport:
+    """입력 스냅샷 → 리포트 (저장소 접근 없음, 작업 스레드 풀에서도 실행)"""
+    # 금액 집계: 단일 통화면 그대로, 아니면 기간 종료일 환율로 보고 통화 환산
+    target = conversion_target(aggregate, request.reporting_currency)
+    if target is None:
+        total_budget = aggregate.total_projected
+        total_actual = aggregate.total_actual
+        currency = request.reporting_currency or next(iter(aggregate.by_currency), CurrencyCode.USD)
+    else:
+        conversion = convert_aggregate(
+            request.event_id, revision, aggregate, target, request.period_end
         )
+        total_budget = conversion.total_projected
+        total_actual = conversion.total_actual
+        currency = target
 
-    total_projected = sum(i.projected_amount for i in items)
-    total_actual = sum(i.actual_amount for i in items)
-
-    by_category = {}
-    for item in items:
-        cat = item.category.value
-        if cat not in by_category:
-            by_category[cat] = {"projected": Decimal("0"), "actual": Decimal("0"), "count": 0}
-        by_category[cat]["projected"] += item.projected_amount
-        by_category[cat]["actual"] += item.actual_amount
-        by_category[cat]["count"] += 1
-
-    by_status = {}
-    for item in items:
-        st = item.status.value
-        by_status[st] = by_status.get(st, 0) + 1
-
-    return BudgetSummary(
-        total_items=len(items),
-        total_projected=total_projected,
+    return FinancialReport(
+        event_id=request.event_id,
+        report_name=request.report_name,
+        period_start=request.period_start,
+        period_end=request.period_end,
+        currency=currency,
+        total_registration_revenue=Decimal("0"),  # TODO: 등록 시스템 연동
+        # 해당 이벤트 패키지를 선택한 계약 체결 스폰서의 확정 금액 (증분 집계, O(statuses))
+        total_sponsorship_revenue=revenue.contracted,
+        total_exhibit_revenue=Decimal("0"),  # TODO: 전시 시스템 연동
+        total_other_revenue=Decimal("0"),
+        total_budget=total_budget,
         total_actual=total_actual,
-        total_variance=total_projected - total_actual,
-        by_category={k: {"projected": float(v["projected"]), "actual": float(v["actual"]), "count": v["count"]} for k, v in by_category.items()},
-        by_status=by_status,
+        total_attendees=request.total_attendees,
+        paid_attendees=request.paid_attendees,
     )
 
 
-# =============================================================================
-# REPORT ENDPOINTS
-# =============================================================================
+async def run_report_job(request: ReportGenerateRequest) -> FinancialReport:
+    """작업 실행: 입력 읽기(이벤트 루프) → 계산(스레드 풀) → 저장(이벤트 루프)"""
+    revision, aggregate, revenue = await report_inputs(request)
+    report = await report_jobs.run_in_pool(build_report, request, revision, aggregate, revenue)
+    await repository.reports.add(report)
+    return report
+
+
+def report_job_response(job: Job, status_code: int = 200) -> Response:
+    """작업 상태 응답 (Location: 상태 조회 경로)"""
+    content = ReportJob(
+        id=job.id,
+        status=job.status,
+        request=job.payload,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+        report=job.result,
+        error=job.error,
+    )
+    return REPORT_JOB_JSON.response(
+        content, status_code=status_code, headers={"Location": f"/finance/reports/jobs/{job.id}"}
+    )
+
 
 @router.post(
     "/reports/generate",
@@ -322,58 +1160,105 @@ async def get_budget_summary(event_id: UUID) -> BudgetSummary:
 저장된 예산 항목들을 기반으로 재무 리포트를 자동 생성합니다.
 
 **자동 계산 항목**:
-- 총 예산 / 실제 지출
+- 총 예산 / 실제 지출 (다중 통화 이벤트는 `period_end` 환율로 `reporting_currency` 환산)
+- 스폰서십 수익 (이 이벤트의 패키지를 선택한 CONTRACTED / FULFILLED 스폰서 확정 금액)
 - ROI 백분율
 - 참석자당 비용
 
+**비동기 생성** (`mode=async`): 즉시 202와 작업 상태(`ReportJob`)를 반환하고 백그라운드에서 생성합니다.
+`Location`의 `GET /finance/reports/jobs/{job_id}`로 상태를 조회하거나 `wait`로 완료를 기다립니다.
+같은 내용의 요청이 대기 / 실행 중이면 새 작업을 만들지 않고 그 작업을 반환합니다.
+대기 작업이 한도를 넘으면 503 (`Retry-After`).
+
 **CMP-IS Reference**: Skill 8.3.i - Completing financial reports
-    """
+    """,
+    responses={202: {"model": ReportJob, "description": "비동기 생성 작업 접수 (mode=async)"}},
 )
-async def generate_report(request: ReportGenerateRequest) -> FinancialReport:
+async def generate_report(
+    request: ReportGenerateRequest,
+    mode: ReportGenerationMode = Query(ReportGenerationMode.SYNC, description="sync: 즉시 생성, async: 작업 접수 (202)"),
+) -> Response:
     """재무 리포트 생성"""
-    # 해당 이벤트의 예산 항목 필터링
-    event_items = [i for i in budget_items_db if i.event_id == request.event_id]
+    if mode == ReportGenerationMode.ASYNC:
+        try:
+            # 같은 내용(이벤트, 기간, 보고 통화, 이름, 참석자 수)의 요청은 하나의 작업으로
+            job, _ = report_jobs.submit(
+                request.model_dump_json(), lambda: run_report_job(request), payload=request
+            )
+        except QueueFull as exc:
+            raise HTTPException(status_code=503, detail=str(exc), headers={"Retry-After": "1"})
+        return report_job_response(job, status_code=202)
 
-    # 금액 집계
-    total_budget = sum(i.projected_amount for i in event_items)
-    total_actual = sum(i.actual_amount for i in event_items)
+    report = build_report(request, *await report_inputs(request))
+    await repository.reports.add(report)
+    return REPORT_JSON.response(report, status_code=201)
 
-    # 스폰서십 수익 계산 (해당 이벤트)
-    event_sponsors = [s for s in sponsors_db if s.status == SponsorshipStatus.CONTRACTED]
-    total_sponsorship = sum(s.committed_amount for s in event_sponsors)
 
-    report = FinancialReport(
-        event_id=request.event_id,
-        report_name=request.report_name,
-        period_start=request.period_start,
-        period_end=request.period_end,
-        total_registration_revenue=Decimal("0"),  # TODO: 등록 시스템 연동
-        total_sponsorship_revenue=total_sponsorship,
-        total_exhibit_revenue=Decimal("0"),  # TODO: 전시 시스템 연동
-        total_other_revenue=Decimal("0"),
-        total_budget=total_budget,
-        total_actual=total_actual,
-        total_attendees=request.total_attendees,
-        paid_attendees=request.paid_attendees,
-    )
+@router.get(
+    "/reports/jobs/{job_id}",
+    response_model=ReportJob,
+    summary="리포트 생성 작업 조회",
+    description="""
+비동기 리포트 생성 작업 상태를 조회합니다 (`succeeded`면 `report` 포함, `failed`면 `error`).
 
-    reports_db.append(report)
-    return report
+`wait`(초, 최대 30)를 주면 작업이 끝날 때까지 그 시간만큼 기다린 뒤 응답합니다 (long polling).
+작업 상태는 생성한 서버 프로세스에 보관되며 완료 후 최근 작업만 유지됩니다.
+    """
+)
+async def get_report_job(
+    job_id: UUID,
+    wait: float = Query(0, ge=0, le=MAX_JOB_WAIT_SECONDS, description="완료 대기 시간 (초)"),
+) -> Response:
+    """리포트 생성 작업 조회"""
+    job = report_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Report job {job_id} not found")
+    return report_job_response(await report_jobs.wait(job, wait))
 
 
 @router.get(
     "/reports",
-    response_model=List[FinancialReport],
+    response_model=Page[FinancialReport],
     summary="리포트 목록 조회",
-    description="생성된 모든 리포트를 조회합니다."
+    description="""
+생성된 리포트를 페이지 단위로 조회합니다.
+
+**페이지네이션**: `limit` + `cursor` (정렬 기준: `(report_date, id)`)
+
+**조건부 조회**: 응답 `ETag`를 `If-None-Match`로 보내면 변경이 없을 때 304를 반환합니다.
+    """
 )
 async def list_reports(
     event_id: Optional[UUID] = Query(None, description="이벤트 ID로 필터"),
-) -> List[FinancialReport]:
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    include_total: bool = Query(False, description="전체 건수 포함 여부"),
+    if_none_match: Optional[str] = Header(None, description="이전 응답의 ETag (변경 없으면 304)"),
+) -> Response:
     """리포트 목록 조회"""
-    if event_id:
-        return [r for r in reports_db if r.event_id == event_id]
-    return reports_db
+    etag = await revision_etag(event_id)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    page = await paginate(repository.reports, limit, cursor, include_total, event_id=event_id)
+    return REPORT_PAGE_JSON.response(page, headers={"ETag": etag})
+
+
+@router.get(
+    "/reports/export",
+    response_class=StreamingResponse,
+    summary="리포트 내보내기",
+    description="생성된 리포트를 NDJSON 또는 CSV로 스트리밍 내보내기합니다."
+)
+async def export_reports(
+    event_id: Optional[UUID] = Query(None, description="이벤트 ID로 필터"),
+    format: ExportFormat = Query(ExportFormat.NDJSON, description="내보내기 형식"),
+    fields: Optional[str] = Query(None, description="쉼표로 구분한 필드 목록 (기본: 전체)"),
+):
+    """리포트 내보내기"""
+    return export_response(
+        repository.reports, FinancialReport, "financial_reports", format, fields,
+        event_id=event_id,
+    )
 
 
 @router.get(
@@ -382,11 +1267,11 @@ async def list_reports(
     summary="리포트 상세 조회",
     description="특정 리포트를 조회합니다."
 )
-async def get_report(report_id: UUID) -> FinancialReport:
+async def get_report(report_id: UUID) -> Response:
     """리포트 상세 조회"""
-    for report in reports_db:
-        if report.id == report_id:
-            return report
+    report = await repository.reports.get(report_id)
+    if report is not None:
+        return REPORT_JSON.response(report)
     raise HTTPException(status_code=404, detail=f"Report {report_id} not found")
 
 
@@ -412,7 +1297,7 @@ async def create_sponsorship_package(
     amount: Decimal,
     max_sponsors: int = 1,
     currency: CurrencyCode = CurrencyCode.USD,
-) -> SponsorshipPackage:
+) -> Response:
     """스폰서십 패키지 생성"""
     package = SponsorshipPackage(
         event_id=event_id,
@@ -422,23 +1307,36 @@ async def create_sponsorship_package(
         max_sponsors=max_sponsors,
         currency=currency,
     )
-    sponsorship_packages_db.append(package)
-    return package
+    await repository.sponsorship_packages.add(package)
+    return PACKAGE_JSON.response(package, status_code=201)
 
 
 @router.get(
     "/sponsorship-packages",
-    response_model=List[SponsorshipPackage],
+    response_model=Page[SponsorshipPackage],
     summary="스폰서십 패키지 목록",
-    description="모든 스폰서십 패키지를 조회합니다."
+    description="""
+스폰서십 패키지를 페이지 단위로 조회합니다.
+
+**페이지네이션**: `limit` + `cursor` (응답의 `next_cursor`를 다음 요청에 전달).
+정렬 기준은 `(created_at, id)`이며 `include_total=true`이면 전체 건수를 함께 반환합니다.
+    """
 )
 async def list_sponsorship_packages(
     event_id: Optional[UUID] = Query(None),
-) -> List[SponsorshipPackage]:
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    include_total: bool = Query(False, description="전체 건수 포함 여부"),
+    if_none_match: Optional[str] = Header(None, description="이전 응답의 ETag (변경 없으면 304)"),
+) -> Response:
     """스폰서십 패키지 목록"""
-    if event_id:
-        return [p for p in sponsorship_packages_db if p.event_id == event_id]
-    return sponsorship_packages_db
+    etag = await revision_etag(event_id)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    page = await paginate(
+        repository.sponsorship_packages, limit, cursor, include_total, event_id=event_id
+    )
+    return PACKAGE_PAGE_JSON.response(page, headers={"ETag": etag})
 
 
 @router.post(
@@ -448,6 +1346,7 @@ async def list_sponsorship_packages(
     summary="스폰서 등록",
     description="""
 새로운 스폰서를 등록합니다.
+`package_id`를 지정하면 해당 패키지의 이벤트에 연결됩니다.
 
 **CMP-IS Reference**: Skill 7.1.d - Identifying potential sponsors
     """
@@ -458,7 +1357,8 @@ async def create_sponsor(
     contact_name: str,
     contact_email: str,
     contact_phone: Optional[str] = None,
-) -> Sponsor:
+    package_id: Optional[UUID] = None,
+) -> Response:
     """스폰서 등록"""
     sponsor = Sponsor(
         company_name=company_name,
@@ -466,24 +1366,40 @@ async def create_sponsor(
         contact_name=contact_name,
         contact_email=contact_email,
         contact_phone=contact_phone,
+        package_id=package_id,
+        event_id=await package_event_id(package_id) if package_id is not None else None,
     )
-    sponsors_db.append(sponsor)
-    return sponsor
+    await repository.sponsors.add(sponsor)
+    return SPONSOR_JSON.response(sponsor, status_code=201, headers={"ETag": record_etag(sponsor)})
 
 
 @router.get(
     "/sponsors",
-    response_model=List[Sponsor],
+    response_model=Page[Sponsor],
     summary="스폰서 목록",
-    description="등록된 모든 스폰서를 조회합니다."
+    description="""
+등록된 스폰서를 페이지 단위로 조회합니다.
+
+**페이지네이션**: `limit` + `cursor` (응답의 `next_cursor`를 다음 요청에 전달).
+정렬 기준은 `(created_at, id)`이며 `include_total=true`이면 전체 건수를 함께 반환합니다.
+    """
 )
 async def list_sponsors(
+    event_id: Optional[UUID] = Query(None, description="이벤트 ID로 필터 (패키지 기준)"),
     status: Optional[SponsorshipStatus] = Query(None),
-) -> List[Sponsor]:
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    include_total: bool = Query(False, description="전체 건수 포함 여부"),
+    if_none_match: Optional[str] = Header(None, description="이전 응답의 ETag (변경 없으면 304)"),
+) -> Response:
     """스폰서 목록"""
-    if status:
-        return [s for s in sponsors_db if s.status == status]
-    return sponsors_db
+    etag = await revision_etag(event_id)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    page = await paginate(
+        repository.sponsors, limit, cursor, include_total, event_id=event_id, status=status
+    )
+    return SPONSOR_PAGE_JSON.response(page, headers={"ETag": etag})
 
 
 @router.patch(
@@ -494,30 +1410,770 @@ async def list_sponsors(
 스폰서의 진행 상태를 변경합니다.
 
 **상태 흐름**: PROSPECT → CONTACTED → NEGOTIATING → COMMITTED → CONTRACTED → FULFILLED
+
+`package_id`를 지정하면 해당 패키지의 이벤트에 연결되며, 이벤트별 스폰서 수익 집계가
+같은 쓰기에서 갱신됩니다.
+
+**패키지 수량**: 패키지에 연결된 스폰서가 CONTRACTED / FULFILLED가 되면 패키지 수량 1개가 판매됩니다.
+`reservation_id`(또는 이 스폰서로 만든 유효한 보류)가 있으면 그 보류를 판매로 전환하고,
+없으면 남은 수량에서 바로 판매하며 남은 수량이 없으면 409를 반환합니다.
+CANCELLED가 되면 이 스폰서의 보류 / 판매 수량을 해제합니다. CONTRACTED / FULFILLED였던 스폰서가
+다른 상태로 바뀌거나 다른 패키지로 옮겨도 이전 패키지의 판매 수량을 해제합니다.
+
+**동시 수정 방지**: `If-Match`에 마지막으로 받은 `ETag`를 전달하면 버전 불일치 시 412를 반환합니다.
     """
 )
 async def update_sponsor_status(
     sponsor_id: UUID,
     status: SponsorshipStatus,
-    committed_amount: Optional[Decimal] = None,
+    committed_amount: Optional[Decimal] = Query(None, ge=-MAX_AMOUNT, le=MAX_AMOUNT),
     package_id: Optional[UUID] = None,
-) -> Sponsor:
+    reservation_id: Optional[UUID] = Query(None, description="판매로 전환할 보류 ID (CONTRACTED)"),
+    if_match: Optional[str] = Header(None, description="수정 전 조회한 ETag"),
+) -> Response:
     """스폰서 상태 변경"""
-    for i, sponsor in enumerate(sponsors_db):
-        if sponsor.id == sponsor_id:
-            update_data = {"status": status}
-            if committed_amount is not None:
-                update_data["committed_amount"] = committed_amount
-            if package_id is not None:
-                update_data["package_id"] = package_id
-            if status == SponsorshipStatus.CONTRACTED:
-                update_data["contract_signed_at"] = datetime.utcnow()
+    update_data = {"status": status}
+    if committed_amount is not None:
+        update_data["committed_amount"] = committed_amount
+    if package_id is not None:
+        update_data["package_id"] = package_id
+        update_data["event_id"] = await package_event_id(package_id)
+    if status == SponsorshipStatus.CONTRACTED:
+        update_data["contract_signed_at"] = datetime.utcnow()
+
+    # 수량 확보 전에 존재 / 버전을 확인 (실패할 요청이 수량을 점유하지 않도록)
+    expected_versions = parse_if_match(if_match)
+    sponsor = await repository.sponsors.get(sponsor_id)
+    if sponsor is None:
+        raise HTTPException(status_code=404, detail=f"Sponsor {sponsor_id} not found")
+    if expected_versions is not None and sponsor.version not in expected_versions:
+        raise precondition_failed(sponsor)
+
+    sold: Optional[SponsorshipReservation] = None
+    target_package = package_id or sponsor.package_id
+    if target_package is not None and status.value in CONTRACTED_STATUSES:
+        sold = await sell_package_slot(sponsor_id, target_package, reservation_id)
+
+    previous: List[Sponsor] = []
+
+    def apply(current: Sponsor) -> Sponsor:
+        # 해제 대상은 실제로 교체된 레코드 기준으로 정한다 (조회 이후 다른 요청이 바꿨을 수 있음)
+        previous[:] = [current]
+        return current.model_copy(update=update_data)
+
+    try:
+        updated = await repository.sponsors.update(sponsor_id, apply, expected_versions)
+    except VersionConflict as exc:
+        await undo_sale(sold)
+        raise precondition_failed(exc.current)
+    if updated is None:
+        await undo_sale(sold)
+        raise HTTPException(status_code=404, detail=f"Sponsor {sponsor_id} not found")
+
+    # 스폰서 갱신이 성공한 뒤에만 해제 (실패한 요청이 판매 수량을 풀어 초과 판매되지 않도록)
+    # CANCELLED면 대상 패키지의 보류 / 판매,
+    # 계약 상태(CONTRACTED / FULFILLED)를 벗어나거나 다른 패키지로 옮기면 이전 패키지의 판매
+    old = previous[0]
+    released: Set[UUID] = set()
+    if target_package is not None and status == SponsorshipStatus.CANCELLED:
+        released.add(target_package)
+    if old.package_id is not None and old.status.value in CONTRACTED_STATUSES and (
+        status.value not in CONTRACTED_STATUSES or updated.package_id != old.package_id
+    ):
+        released.add(old.package_id)
+    for released_package in released:
+        await release_sponsor_slots(sponsor_id, released_package)
+    return SPONSOR_JSON.response(updated, headers={"ETag": record_etag(updated)})
+
+
+# =============================================================================
+# SPONSORSHIP RESERVATION ENDPOINTS
+# =============================================================================
+
+def sold_out(exc: SoldOut) -> HTTPException:
+    """남은 수량 없음 → 409 (패키지 수량 현황 포함)"""
+    package = exc.package
+    return HTTPException(status_code=409, detail={
+        "message": str(exc),
+        "package_id": str(package.id),
+        "max_sponsors": package.max_sponsors,
+        "sold_count": package.sold_count,
+        "held_count": package.held_count,
+        "is_active": package.is_active,
+    })
+
+
+def reservation_conflict(reservation: SponsorshipReservation) -> HTTPException:
+    """허용되지 않는 보류 전이 → 409"""
+    return HTTPException(
+        status_code=409,
+        detail=f"Reservation {reservation.id} is {reservation.status.value}",
+    )
+
+
+async def sell_package_slot(
+    sponsor_id: UUID, package_id: UUID, reservation_id: Optional[UUID]
+) -> Optional[SponsorshipReservation]:
+    """
+    스폰서 계약 → 패키지 수량 1개 판매, 이번 요청에서 판매된 보류 반환 (이미 판매되어 있으면 None).
+    지정한 보류 → 이 스폰서의 유효한 보류 → 남은 수량 순으로 판매한다.
+    """
+    event_id = await package_event_id(package_id)
+    now = datetime.utcnow()
+    existing = await repository.sponsorship_reservations.find(
+        event_id=event_id, package_id=package_id, sponsor_id=sponsor_id
+    )
+    if any(r.status == ReservationStatus.CONVERTED for r in existing):
+        return None
+
+    candidates = [r.id for r in existing if r.status == ReservationStatus.HELD and r.expires_at > now]
+    if reservation_id is not None:
+        reservation = await repository.sponsorship_reservations.get(reservation_id)
+        if reservation is None:
+            raise HTTPException(status_code=404, detail=f"Reservation {reservation_id} not found")
+        if reservation.package_id != package_id:
+            raise HTTPException(
+                status_code=409, detail=f"Reservation {reservation_id} is for another package"
+            )
+        candidates = [reservation_id]
+
+    for candidate in candidates:
+        converted = await repository.settle_reservation(
+            candidate, ReservationStatus.CONVERTED, now, sponsor_id
+        )
+        if converted is not None and converted.status == ReservationStatus.CONVERTED:
+            return converted
+        if reservation_id is not None:
+            raise reservation_conflict(converted)
+
+    # 유효한 보류 없음 → 남은 수량에서 직접 판매
+    try:
+        return await repository.claim_package(SponsorshipReservation(
+            package_id=package_id,
+            event_id=event_id,
+            sponsor_id=sponsor_id,
+            status=ReservationStatus.CONVERTED,
+            expires_at=now,
+            closed_at=now,
+            created_at=now,
+        ))
+    except SoldOut as exc:
+        raise sold_out(exc)
+
+
+async def release_sponsor_slots(sponsor_id: UUID, package_id: UUID) -> None:
+    """스폰서 취소 / 계약 해제 → 이 스폰서의 보류 / 판매 수량 해제"""
+    event_id = await package_event_id(package_id)
+    now = datetime.utcnow()
+    for reservation in await repository.sponsorship_reservations.find(
+        event_id=event_id, package_id=package_id, sponsor_id=sponsor_id
+    ):
+        if reservation.status in (ReservationStatus.HELD, ReservationStatus.CONVERTED):
+            await repository.settle_reservation(reservation.id, ReservationStatus.RELEASED, now)
+
+
+async def undo_sale(sold: Optional[SponsorshipReservation]) -> None:
+    """스폰서 갱신 실패 시 이번 요청의 판매 취소 (수량 반환)"""
+    if sold is not None:
+        await repository.settle_reservation(sold.id, ReservationStatus.RELEASED, datetime.utcnow())
+
+
+async def expire_reservations_periodically(interval: float = RESERVATION_SWEEP_SECONDS) -> None:
+    """만료 보류 주기적 정리 (앱 수명 동안 실행, 워커마다 실행해도 트랜잭션 안에서 다시 확인)"""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await repository.expire_reservations(datetime.utcnow())
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # 한 번 실패해도 다음 주기에 다시 시도 (보류는 트랜잭션 안에서 다시 확인)
+            logger.exception("Reservation sweep failed")
+
+
+@router.post(
+    "/sponsorship-packages/{package_id}/reservations",
+    response_model=SponsorshipReservation,
+    status_code=201,
+    summary="스폰서십 패키지 수량 보류",
+    description="""
+패키지 수량 1개를 `ttl_seconds` 동안 보류합니다. 보류 중인 수량은 다른 요청이 확보할 수 없습니다.
+
+**원자성**: 남은 수량 확인과 보류 기록은 패키지 단위 원자 구간에서 함께 수행되므로
+동시 요청이 몰려도 `max_sponsors`를 넘겨 보류 / 판매되지 않습니다 (남은 수량이 없으면 409).
+서로 다른 패키지의 보류는 서로 기다리지 않습니다.
+
+**전환 / 만료**: 스폰서가 CONTRACTED가 되면 보류가 판매로 전환되고(`sold_count` + 1),
+만료 시각이 지나면 보류가 자동 해제됩니다 (`/finance/sponsorship-reservations/{id}/release`로 먼저 해제 가능).
+
+**CMP-IS Reference**: Skill 7.1.e - Producing sponsor benefit packages
+    """
+)
+async def reserve_sponsorship_package(package_id: UUID, request: ReservationCreate) -> Response:
+    """스폰서십 패키지 수량 보류"""
+    now = datetime.utcnow()
+    reservation = SponsorshipReservation(
+        package_id=package_id,
+        event_id=await package_event_id(package_id),
+        holder=request.holder,
+        sponsor_id=request.sponsor_id,
+        expires_at=now + timedelta(seconds=request.ttl_seconds),
+        created_at=now,
+    )
+    try:
+        claimed = await repository.claim_package(reservation)
+    except SoldOut as exc:
+        raise sold_out(exc)
+    if claimed is None:
+        raise HTTPException(status_code=404, detail=f"Sponsorship package {package_id} not found")
+    return RESERVATION_JSON.response(claimed, status_code=201)
+
+
+@router.get(
+    "/sponsorship-reservations",
+    response_model=Page[SponsorshipReservation],
+    summary="스폰서십 패키지 보류 목록",
+    description="""
+보류를 페이지 단위로 조회합니다.
+
+**페이지네이션**: `limit` + `cursor` (응답의 `next_cursor`를 다음 요청에 전달).
+정렬 기준은 `(created_at, id)`이며 `include_total=true`이면 전체 건수를 함께 반환합니다.
+    """
+)
+async def list_sponsorship_reservations(
+    event_id: Optional[UUID] = Query(None, description="이벤트 ID로 필터"),
+    package_id: Optional[UUID] = Query(None, description="패키지 ID로 필터"),
+    status: Optional[ReservationStatus] = Query(None, description="보류 상태로 필터"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    include_total: bool = Query(False, description="전체 건수 포함 여부"),
+    if_none_match: Optional[str] = Header(None, description="이전 응답의 ETag (변경 없으면 304)"),
+) -> Response:
+    """스폰서십 패키지 보류 목록"""
+    etag = await revision_etag(event_id)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    page = await paginate(
+        repository.sponsorship_reservations, limit, cursor, include_total,
+        event_id=event_id, package_id=package_id, status=status,
+    )
+    return RESERVATION_PAGE_JSON.response(page, headers={"ETag": etag})
+
+
+@router.get(
+    "/sponsorship-reservations/{reservation_id}",
+    response_model=SponsorshipReservation,
+    summary="스폰서십 패키지 보류 조회",
+)
+async def get_sponsorship_reservation(reservation_id: UUID) -> Response:
+    """스폰서십 패키지 보류 조회"""
+    reservation = await repository.sponsorship_reservations.get(reservation_id)
+    if reservation is None:
+        raise HTTPException(status_code=404, detail=f"Reservation {reservation_id} not found")
+    return RESERVATION_JSON.response(reservation)
+
+
+@router.post(
+    "/sponsorship-reservations/{reservation_id}/release",
+    response_model=SponsorshipReservation,
+    summary="스폰서십 패키지 보류 해제",
+    description="""
+보류(또는 전환된 판매)를 해제하여 패키지 수량을 반환합니다.
+이미 해제 / 만료된 보류는 그대로 반환합니다.
+    """
+)
+async def release_sponsorship_reservation(reservation_id: UUID) -> Response:
+    """스폰서십 패키지 보류 해제"""
+    reservation = await repository.settle_reservation(
+        reservation_id, ReservationStatus.RELEASED, datetime.utcnow()
+    )
+    if reservation is None:
+        raise HTTPException(status_code=404, detail=f"Reservation {reservation_id} not found")
+    return RESERVATION_JSON.response(reservation)
+
+
+# =============================================================================
+# TRANSACTION ENDPOINTS
+# =============================================================================
+
+@router.post(
+    "/transactions",
+    response_model=Transaction,
+    status_code=201,
+    summary="거래 기록",
+    description="""
+이벤트의 수입/지출/환불/조정 거래를 기록합니다.
+
+**원장**: 거래는 추가만 가능합니다 (수정/삭제 API 없음). 대사 상태(`is_reconciled`, 매칭 항목)는
+`/finance/transactions/reconcile`만 갱신합니다.
+
+**CMP-IS Reference**: Skill 9 - Manage Monetary Transactions
+    """
+)
+async def create_transaction(request: TransactionCreate) -> Response:
+    """거래 기록"""
+    transaction = build_transaction(request)
+    await repository.transactions.add(transaction)
+    return TRANSACTION_JSON.response(transaction, status_code=201)
+
+
+def build_transaction(request: TransactionCreate) -> Transaction:
+    """기록 요청 → 거래 (대사 전 상태)"""
+    return Transaction(**request.model_dump(exclude_none=True))
+
+
+@router.post(
+    "/transactions/import",
+    response_model=BulkImportResult,
+    summary="거래 대량 등록",
+    description="""
+은행/카드 거래 내역 등을 NDJSON 또는 CSV로 스트리밍 등록합니다.
+
+**입력 형식**: `Content-Type: application/x-ndjson` 또는 `text/csv` (`format`으로 지정 가능)
+- NDJSON: 한 줄에 `TransactionCreate` JSON 객체 하나
+- CSV: 첫 줄 헤더 (`event_id,transaction_type,amount,currency,payment_method,description,recorded_by,...`)
+
+잘못된 행은 건너뛰고 행 번호별 오류를 반환합니다. 등록 후 `/finance/transactions/reconcile`로 대사합니다.
+    """
+)
+async def import_transactions(
+    request: Request,
+    format: Optional[ImportFormat] = Query(None, description="입력 형식 (기본: Content-Type으로 판별)"),
+    batch_size: int = Query(1000, ge=1, le=10000, description="배치 크기"),
+) -> Response:
+    """거래 대량 등록"""
+    return await bulk_import(
+        request, format, batch_size, TransactionCreate, build_transaction, repository.transactions
+    )
+
+
+async def mark_reconciled(plan: ReconciliationPlan, unsaved: AbstractSet[UUID] = frozenset()) -> None:
+    """매칭된 거래를 대사 완료로 표시 (unsaved: 변경이 저장되지 않은 항목 → 그 항목의 거래는 제외)"""
+    await repository.transactions.replace_many([
+        tx.model_copy(update={"is_reconciled": True, "budget_line_item_id": item.id})
+        for tx, item in zip(plan.matched, plan.matched_items)
+        if item.id not in unsaved
+    ])
+
+
+@router.post(
+    "/transactions/reconcile",
+    response_model=ReconciliationResult,
+    summary="거래 일괄 대사",
+    description="""
+미대사 거래를 예산 항목과 매칭하고 항목의 `actual_amount`를 갱신합니다.
+
+**매칭 규칙** (순서대로, 모두 해시 조회):
+1. `budget_line_item_id` (지정된 거래는 해당 항목에만 매칭)
+2. 이벤트 + 참조 번호 (`reference_number`, 대소문자/앞뒤 공백 무시)
+3. 이벤트 + 거래처명 + 통화 + 금액 (= 항목 `projected_amount`)
+
+**반영**: EXPENSE는 더하고 REFUND는 빼며 ADJUSTMENT는 부호 그대로 반영합니다 (INCOME은 대상 아님).
+매칭된 거래는 `is_reconciled=true`와 매칭 항목 ID로 표시되어 다시 반영되지 않습니다.
+
+**미매칭**: 사유(`no_match`, `ambiguous`, `currency_mismatch`, `unknown_budget_item`)와 함께 반환하며
+거래는 미대사 상태로 남습니다.
+
+대사 중 다른 요청이 예산 항목을 수정하면 아무것도 저장하지 않고 409를 반환합니다 (재시도 가능).
+sharded 저장소에서 여러 이벤트 샤드에 걸친 대사는 먼저 저장된 샤드가 남을 수 있습니다. 이때 저장된
+항목에 매칭된 거래만 대사 완료로 표시하고(재시도 시 중복 반영 없음) 409 `detail.saved_item_ids`로 알려줍니다.
+
+**CMP-IS Reference**: 9.2 - Reconciling transactions
+    """
+)
+async def reconcile_transactions(request: ReconcileRequest) -> Response:
+    """거래 일괄 대사"""
+    async with reconciliation_lock:
+        items = await repository.budget_items.find(event_id=request.event_id)
+        pending = await repository.transactions.find(event_id=request.event_id, is_reconciled=False)
+        plan = reconcile(pending, BudgetItemIndex(items))
+
+        now = datetime.utcnow()
+        item_updates: List[BudgetLineItem] = []
+        for item in items:
+            delta = plan.deltas.get(item.id)
+            if not delta:
+                continue
+            actual = quantize(max(item.actual_amount + delta, Decimal("0")), item.currency)
+            item_updates.append(item.model_copy(update={
+                "actual_amount": actual,
+                "updated_at": now,
+                "version": item.version + 1,
+            }))
+
+        if not request.dry_run:
+            # 항목 → 거래 순으로 저장: 거래 표시 전에 실패하면 항목 변경 없이(409) 재시도 가능
+            try:
+                await repository.budget_items.replace_many(item_updates)
+            except VersionConflict as exc:
+                raise HTTPException(
+                    status_code=409,
+                    detail=f"Budget item {exc.current.id} was modified during reconciliation; retry",
+                )
+            except PartialWrite as exc:
+                # 일부 샤드만 저장됨 → 저장된 항목의 거래만 대사 완료로 표시 (재시도 시 중복 반영 방지)
+                saved = {record.id for record in exc.written}
+                await mark_reconciled(plan, {item.id for item in item_updates} - saved)
+                raise HTTPException(status_code=409, detail={
+                    "message": (
+                        f"Budget item {exc.conflict.current.id} was modified during reconciliation; "
+                        "saved items are reconciled, retry for the rest"
+                    ),
+                    "saved_item_ids": sorted(str(item_id) for item_id in saved),
+                })
+            await mark_reconciled(plan)
+
+    return RECONCILIATION_JSON.response(
+        plan.result(request.dry_run, len(item_updates), MAX_UNMATCHED_TRANSACTIONS)
+    )
+
+
+@router.get(
+    "/transactions",
+    response_model=Page[Transaction],
+    summary="거래 목록",
+    description="""
+기록된 거래를 페이지 단위로 조회합니다.
+
+**페이지네이션**: `limit` + `cursor` (정렬 기준: `(transaction_date, id)`)
+
+**조건부 조회**: 응답 `ETag`를 `If-None-Match`로 보내면 변경이 없을 때 304를 반환합니다.
+    """
+)
+async def list_transactions(
+    event_id: Optional[UUID] = Query(None, description="이벤트 ID로 필터"),
+    budget_line_item_id: Optional[UUID] = Query(None, description="예산 항목 ID로 필터"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    include_total: bool = Query(False, description="전체 건수 포함 여부"),
+    if_none_match: Optional[str] = Header(None, description="이전 응답의 ETag (변경 없으면 304)"),
+) -> Response:
+    """거래 목록"""
+    etag = await revision_etag(event_id)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    page = await paginate(
+        repository.transactions, limit, cursor, include_total,
+        event_id=event_id, budget_line_item_id=budget_line_item_id,
+    )
+    return TRANSACTION_PAGE_JSON.response(page, headers={"ETag": etag})
+
+
+# =============================================================================
+# PRICING ENDPOINTS
+# =============================================================================
+
+@router.post(
+    "/pricing-tiers",
+    response_model=PricingTier,
+    status_code=201,
+    summary="가격 등급 생성",
+    description="""
+이벤트 등록 가격 등급(Early Bird, Regular, On-site 등)을 생성합니다.
+
+적용 기간(`valid_from` ~ `valid_until`)은 양 끝을 포함하며, 생략한 쪽은 제한이 없습니다.
+회원 가격 = 기본 가격 × (1 − `member_discount_rate` / 100).
+
+**CMP-IS Reference**: 8.2 - Establish Pricing
+    """
+)
+async def create_pricing_tier(request: PricingTierCreate) -> Response:
+    """가격 등급 생성"""
+    tier = PricingTier(**request.model_dump(exclude_none=True))
+    await repository.pricing_tiers.add(tier)
+    return PRICING_TIER_JSON.response(tier, status_code=201)
+
+
+@router.get(
+    "/pricing-tiers",
+    response_model=Page[PricingTier],
+    summary="가격 등급 목록",
+    description="""
+가격 등급을 페이지 단위로 조회합니다.
+
+**페이지네이션**: `limit` + `cursor` (응답의 `next_cursor`를 다음 요청에 전달).
+정렬 기준은 `(created_at, id)`이며 `include_total=true`이면 전체 건수를 함께 반환합니다.
+    """
+)
+async def list_pricing_tiers(
+    event_id: Optional[UUID] = Query(None, description="이벤트 ID로 필터"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    include_total: bool = Query(False, description="전체 건수 포함 여부"),
+    if_none_match: Optional[str] = Header(None, description="이전 응답의 ETag (변경 없으면 304)"),
+) -> Response:
+    """가격 등급 목록"""
+    etag = await revision_etag(event_id)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    page = await paginate(repository.pricing_tiers, limit, cursor, include_total, event_id=event_id)
+    return PRICING_TIER_PAGE_JSON.response(page, headers={"ETag": etag})
+
+
+async def pricing_index(event_id: UUID) -> PricingIndex:
+    """이벤트 가격 등급 구간 인덱스 (리비전 단위 캐시)"""
+    revision = await repository.revision(event_id)
+
+    async def build() -> PricingIndex:
+        return PricingIndex(event_id, await repository.pricing_tiers.find(event_id=event_id))
+
+    return await pricing_indexes.get(event_id, revision, build)
+
+
+@router.get(
+    "/pricing-tiers/available",
+    response_model=AvailableTiers,
+    summary="시점별 구매 가능 가격 등급",
+    description="""
+시각 `at`(기본: 현재)에 구매 가능한 가격 등급과 기본/회원 가격을 가격 오름차순으로 반환합니다.
+적용 기간 밖이거나 매진된 등급은 제외됩니다.
+
+**성능**: 이벤트 등급의 적용 기간 경계로 나눈 구간 인덱스에서 이분 탐색 O(log n)으로 조회하며,
+인덱스는 이벤트 데이터가 바뀔 때만 재구성합니다. 가격은 통화 최소 단위로 반올림합니다.
+
+**CMP-IS Reference**: 8.2 - Establish Pricing
+    """
+)
+async def get_available_pricing_tiers(
+    event_id: UUID = Query(..., description="이벤트 ID"),
+    at: Optional[datetime] = Query(None, description="조회 시각 (기본: 현재, 시간대 없으면 UTC)"),
+) -> Response:
+    """시점별 구매 가능 가격 등급"""
+    index = await pricing_index(event_id)
+    return AVAILABLE_TIERS_JSON.response(index.available(at or datetime.utcnow()))
+
+
+@router.post(
+    "/pricing-tiers/quote",
+    response_model=PriceQuote,
+    summary="대량 등록 견적 (수익 예측)",
+    description="""
+예상 등록 목록(등록 시각, 회원 여부)에 가격 등급을 배정하고 등급별 / 통화별 예상 수익을 계산합니다.
+
+**입력**: 열 단위 배열 — `timestamps[i]`, `members[i]`가 i번째 등록 (`members` 생략 시 모두 비회원).
+
+**배정**: 각 등록은 그 시각에 구매 가능한 가장 싼 등급을 받습니다. `consume_capacity=true`(기본)면
+등록 시각 순서대로 등급의 남은 수량을 소진하고, 소진되면 다음으로 싼 등급으로 넘어갑니다.
+구매 가능한 등급이 없는 등록은 `unpriced`로 집계합니다.
+
+**성능**: 등록 시각 전체를 한 번의 벡터 연산(NumPy searchsorted)으로 구간에 매핑하고,
+금액은 통화 최소 단위 정수로 합산합니다. `include_quotes=true`면 등록별 배정 등급 / 가격을 요청 순서대로 함께 반환합니다.
+
+**CMP-IS Reference**: 8.2 - Establish Pricing
+    """
+)
+async def quote_registrations(request: PriceQuoteRequest) -> Response:
+    """대량 등록 견적"""
+    if request.members is not None and len(request.members) != len(request.timestamps):
+        raise HTTPException(status_code=422, detail="members must have the same length as timestamps")
+    index = await pricing_index(request.event_id)
+    quote = index.quote(
+        request.timestamps, request.members, request.consume_capacity, request.include_quotes
+    )
+    return PRICE_QUOTE_JSON.response(quote)
+
+
+# =============================================================================
+# CASH FLOW ENDPOINTS
+# =============================================================================
+
+async def build_cashflow_index(event_id: UUID) -> CashFlowIndex:
+    """이벤트 예산 항목 / 스폰서 / 거래를 한 번 읽어 현금 흐름 인덱스 구성"""
+    items = await repository.budget_items.find(event_id=event_id)
+    packages = await repository.sponsorship_packages.find(event_id=event_id)
+    sponsors = await repository.sponsors.find(event_id=event_id)
+    transactions = await repository.transactions.find(event_id=event_id)
+    package_currencies = {package.id: package.currency.value for package in packages}
+    return CashFlowIndex([
+        *budget_flows(items),
+        *sponsor_flows(sponsors, package_currencies, CurrencyCode.USD.value),
+        *transaction_flows(transactions),
+    ])
+
+
+@router.get(
+    "/cash-flow/{event_id}",
+    response_model=CashFlowReport,
+    summary="현금 흐름 예측",
+    description="""
+이벤트의 주별/월별 현금 흐름을 계산합니다.
+
+**데이터**:
+- 예상 지출: 예산 항목의 `payment_due_date` / `projected_amount` (취소 항목 제외)
+- 예상 수입: 금액 확정 이후(COMMITTED/CONTRACTED/FULFILLED) 스폰서의 확정 금액
+- 실제 수입/지출: 기록된 거래 (`/finance/transactions`)
+
+**잔액**: 첫 기간 기초 잔액 = `starting_balance` + 이전 누적 순흐름(`basis`: projected/actual),
+이후 기간의 기초 잔액은 이전 기간 기말 잔액입니다.
+
+**통화**: 항목 통화가 여럿이거나 `reporting_currency`가 다르면 기간 시작일 환율로 환산합니다.
+
+**조건부 조회**: 응답 `ETag`(이벤트 리비전 + 환율 버전)를 `If-None-Match`로 보내면 변경이 없을 때 304를 반환합니다.
+
+**성능**: 이벤트 데이터가 바뀔 때만 날짜 정렬 인덱스 + 누적합을 재구성하며,
+각 기간은 O(통화 수 × log n)으로 계산됩니다.
+
+**CMP-IS Reference**: 8.1.g - Detailing projected cash flow
+    """
+)
+async def get_cash_flow(
+    event_id: UUID,
+    period: CashFlowPeriod = Query(CashFlowPeriod.MONTHLY, description="기간 단위"),
+    start: Optional[date] = Query(None, description="시작일 (기본: 첫 현금 흐름 일자)"),
+    end: Optional[date] = Query(None, description="종료일 (기본: 마지막 현금 흐름 일자)"),
+    reporting_currency: Optional[CurrencyCode] = Query(None, description="보고 통화"),
+    basis: CashFlowBasis = Query(CashFlowBasis.PROJECTED, description="잔액 누적 기준"),
+    starting_balance: Decimal = Query(Decimal("0"), description="첫 흐름 이전 잔액 (보고 통화)"),
+    if_none_match: Optional[str] = Header(None, description="이전 응답의 ETag (변경 없으면 304)"),
+) -> Response:
+    """현금 흐름 예측"""
+    revision = await repository.revision(event_id)
+    try:
+        rates_tag = fx_converter.source.table().version
+    except FXRateError:
+        rates_tag = "none"
+    etag = f'W/"{revision}+{rates_tag}"'
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    index = await cashflow_indexes.get(event_id, revision, lambda: build_cashflow_index(event_id))
+
+    currencies = index.currencies
+    if reporting_currency is not None:
+        currency = reporting_currency.value
+    elif len(currencies) == 1:
+        currency = currencies[0]
+    else:
+        try:
+            currency = fx_converter.source.table().base if currencies else CurrencyCode.USD.value
+        except FXRateError as exc:
+            raise HTTPException(status_code=400, detail=str(exc))
+
+    span = index.span()
+    start = start or (span[0] if span else date.today())
+    end = end or (span[1] if span else start)
+    if end < start:
+        raise HTTPException(status_code=400, detail="end must not be earlier than start")
+    bounds = period_bounds(period, start, end)
+    if len(bounds) > MAX_CASHFLOW_PERIODS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many periods ({len(bounds)} > {MAX_CASHFLOW_PERIODS}); narrow start/end",
+        )
+
+    rates_version = None
+    if any(code != currency for code in currencies):
+        try:
+            table = fx_converter.source.table()
+        except FXRateError as exc:
+            raise HTTPException(status_code=400, detail=str(exc))
+        rates_version = table.version
+        factor = lambda code, day: table.factor(code, currency, day)
+    else:
+        factor = lambda code, day: Decimal("1")
+
+    try:
+        periods = project(index, event_id, period, bounds, currency, factor, basis, starting_balance)
+    except FXRateError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    return CASH_FLOW_JSON.response(CashFlowReport(
+        event_id=event_id,
+        currency=currency,
+        period_type=period,
+        basis=basis,
+        rates_version=rates_version,
+        periods=periods,
+    ), headers={"ETag": etag})
 
-            updated = sponsor.model_copy(update=update_data)
-            sponsors_db[i] = updated
-            return updated
 
-    raise HTTPException(status_code=404, detail=f"Sponsor {sponsor_id} not found")
+# =============================================================================
+# ANALYTICS ENDPOINTS
+# =============================================================================
+
+async def analytics_ledger() -> "ColumnarLedger":
+    """열 지향 예산 사본 (최초 호출 시 생성 + 변경 구독 + 전체 적재)"""
+    global budget_ledger
+    if budget_ledger is None:
+        from services.analytics import ColumnarLedger
+
+        budget_ledger = ColumnarLedger()
+        repository.budget_items.subscribe(budget_ledger)
+    # 공유 저장소: 다른 워커 프로세스의 쓰기는 구독으로 받지 못하므로 전역 리비전으로 검증
+    revision = await repository.revision() if repository.shared else None
+    await budget_ledger.ensure_loaded(repository.budget_items, revision)
+    return budget_ledger
+
+
+@router.get(
+    "/analytics/categories",
+    summary="카테고리별 예산 분석",
+    description="""
+열 지향(NumPy) 예산 사본에서 카테고리별 예상/실제/차이/건수를 집계합니다.
+`event_id`를 생략하면 전체 이벤트를 대상으로 합니다.
+
+**CMP-IS Reference**: Skill 8.3.d - Identifying variances
+    """
+)
+async def analytics_categories(
+    event_id: Optional[UUID] = Query(None, description="이벤트 ID (생략 시 전체)"),
+) -> dict:
+    """카테고리별 분석"""
+    ledger = await analytics_ledger()
+    return {"event_id": event_id, "by_category": ledger.category_breakdown(event_id)}
+
+
+@router.get(
+    "/analytics/over-budget",
+    summary="예산 초과 항목",
+    description="실제 지출이 예상 금액을 초과한 항목을 초과액이 큰 순서로 조회합니다."
+)
+async def analytics_over_budget(
+    event_id: Optional[UUID] = Query(None, description="이벤트 ID (생략 시 전체)"),
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE, description="최대 건수"),
+) -> dict:
+    """예산 초과 항목"""
+    ledger = await analytics_ledger()
+    return {"event_id": event_id, "items": ledger.over_budget(event_id, limit)}
+
+
+@router.get(
+    "/analytics/percentiles",
+    summary="금액 분포 백분위",
+    description="""
+항목 금액 분포의 백분위를 조회합니다 (nearest-rank, 실제 항목 값 반환).
+
+- `field`: `projected` | `actual` | `variance`
+- `q`: 백분위 (반복 지정 가능, 예: `q=50&q=90&q=99`)
+    """
+)
+async def analytics_percentiles(
+    field: str = Query("projected", description="금액 필드"),
+    q: List[float] = Query([50, 90, 99], description="백분위 (0~100)"),
+    event_id: Optional[UUID] = Query(None, description="이벤트 ID (생략 시 전체)"),
+) -> dict:
+    """금액 백분위"""
+    from services.analytics import AMOUNT_FIELDS
+
+    if field not in AMOUNT_FIELDS:
+        raise HTTPException(status_code=400, detail=f"field must be one of {', '.join(AMOUNT_FIELDS)}")
+    if any(not 0 <= v <= 100 for v in q):
+        raise HTTPException(status_code=400, detail="q must be between 0 and 100")
+    ledger = await analytics_ledger()
+    return {
+        "event_id": event_id,
+        "field": field,
+        "percentiles": ledger.percentiles(field, q, event_id),
+    }
+
+
+@router.get(
+    "/analytics/events",
+    summary="이벤트별 예산 비교",
+    description="모든 이벤트의 총 예상/실제/차이/건수를 한 번에 집계합니다 (교차 이벤트 분석)."
+)
+async def analytics_events() -> dict:
+    """이벤트별 총계"""
+    ledger = await analytics_ledger()
+    return {"events": ledger.event_totals()}
 
 
 # =============================================================================
@@ -528,12 +2184,9 @@ async def update_sponsor_status(
     "/reset",
     status_code=204,
     summary="데이터 초기화 (개발용)",
-    description="In-Memory 저장소의 모든 데이터를 초기화합니다. 개발/테스트 용도."
+    description="재무 저장소의 모든 데이터를 초기화합니다. 개발/테스트 용도."
 )
 async def reset_all_data():
     """모든 데이터 초기화"""
-    budget_items_db.clear()
-    sponsorship_packages_db.clear()
-    sponsors_db.clear()
-    reports_db.clear()
+    await repository.reset()
     return None
@@ -1,3 +1,4 @@
 """Event Agent Schemas"""
 
 from .financial import *
+from .money import *
@@ -12,13 +12,30 @@ Reference: specs/01_financial_tasks.md
 
 from __future__ import annotations
 
-from datetime import datetime, date
+from datetime import datetime, date, timezone
 from decimal import Decimal
 from enum import Enum
-from typing import Optional, List
+from typing import Annotated, Dict, Iterable, Optional, List, Tuple
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field, model_validator, computed_field
+from pydantic import AfterValidator, BaseModel, Field, PrivateAttr, model_validator, computed_field
+
+from schemas.money import MinorMoney
+
+
+# =============================================================================
+# DATETIME
+# =============================================================================
+
+def utc_naive(at: datetime) -> datetime:
+    """시간대가 있는 시각은 UTC 기준 naive로 변환 (저장 시각은 모두 UTC naive)"""
+    if at.tzinfo is None:
+        return at
+    return at.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+# 요청 시각 필드: 시간대가 있으면 UTC naive로 변환 → 저장된 시각과 비교 / 정렬 가능
+UTCDateTime = Annotated[datetime, AfterValidator(utc_naive)]
 
 
 # =============================================================================
@@ -103,6 +120,14 @@ class SponsorshipStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
+class ReservationStatus(str, Enum):
+    """스폰서십 패키지 수량 보류 상태"""
+    HELD = "held"             # 보류 중 (expires_at까지 수량 점유)
+    CONVERTED = "converted"   # 판매로 전환 (sold_count에 포함)
+    RELEASED = "released"     # 해제 (보류 취소 또는 판매 취소)
+    EXPIRED = "expired"       # TTL 만료로 자동 해제
+
+
 class PaymentMethod(str, Enum):
     """결제 수단 (CMP-IS 9.1)"""
     CASH = "cash"
@@ -141,7 +166,7 @@ class Money(BaseModel):
     )
 
     class Config:
-        json_encoders = {Decimal: lambda v: float(v)}
+        json_encoders = {Decimal: float}
 
 
 class TaxDetail(BaseModel):
@@ -212,6 +237,10 @@ class BudgetLineItem(BaseModel):
         default=None,
         description="공급업체명"
     )
+    reference_number: Optional[str] = Field(
+        default=None,
+        description="참조 번호 (PO, 송장 번호 — 거래 대사 키)"
+    )
     cost_type: CostType = Field(
         default=CostType.VARIABLE,
         description="고정비/변동비 구분 (CMP-IS 8.1.h)"
@@ -261,6 +290,11 @@ class BudgetLineItem(BaseModel):
         default_factory=datetime.utcnow,
         description="수정 일시"
     )
+    version: int = Field(
+        default=1,
+        ge=1,
+        description="레코드 버전 (수정 시마다 1 증가, ETag 값)"
+    )
 
     @computed_field
     @property
@@ -280,6 +314,11 @@ class BudgetLineItem(BaseModel):
             return Decimal("0")
         return (self.variance / self.projected_amount) * 100
 
+    @property
+    def projected_money(self) -> MinorMoney:
+        """예상 금액 (통화 최소 단위 정수, 응답에는 포함되지 않음)"""
+        return MinorMoney.from_decimal(self.projected_amount, self.currency)
+
     @model_validator(mode="after")
     def validate_amounts(self) -> "BudgetLineItem":
         """금액 검증: projected_amount = unit_cost * quantity"""
@@ -291,22 +330,52 @@ class BudgetLineItem(BaseModel):
         return self
 
     class Config:
-        json_encoders = {
-            Decimal: lambda v: float(v),
-            UUID: str,
-            datetime: lambda v: v.isoformat()
-        }
+        # UUID/datetime은 pydantic 기본 JSON 인코딩 사용 (Python 콜백 없이 직렬화)
+        json_encoders = {Decimal: float}
 
 
 # =============================================================================
 # BUDGET (전체 예산)
 # =============================================================================
 
+class BudgetTotals:
+    """Budget 라인 항목 집계 (한 번의 순회로 계산, 항목 추가/삭제 시 증분 갱신)"""
+
+    __slots__ = ("projected", "actual", "by_category")
+
+    def __init__(self):
+        self.projected = Decimal("0")
+        self.actual = Decimal("0")
+        self.by_category: Dict[str, Decimal] = {}
+
+    @classmethod
+    def from_items(cls, items: Iterable[BudgetLineItem]) -> BudgetTotals:
+        totals = cls()
+        for item in items:
+            totals.apply(item, 1)
+        return totals
+
+    def apply(self, item: BudgetLineItem, sign: int) -> None:
+        """항목 반영 (sign=1) / 제거 (sign=-1)"""
+        self.projected += sign * item.projected_amount
+        self.actual += sign * item.actual_amount
+        category = item.category.value
+        self.by_category[category] = (
+            self.by_category.get(category, Decimal("0")) + sign * item.projected_amount
+        )
+
+
 class Budget(BaseModel):
     """
     이벤트 전체 예산.
     Cvent API 호환: Budget Object
     CMP-IS Reference: Skill 8 - Manage Budget
+
+    집계 필드(total_*, contingency_amount, budget_by_category)는 line_items를 한 번만
+    순회해 캐시한 BudgetTotals에서 계산한다. line_items 변경은 add_line_item /
+    remove_line_item / replace_line_item(집계 증분 갱신) 또는 리스트 재할당으로 하며,
+    그 외 방법으로 리스트를 직접 수정했다면 invalidate_totals()를 호출한다.
+    (리스트 객체나 길이가 바뀐 경우는 자동으로 다시 계산)
     """
     id: UUID = Field(
         default_factory=uuid4,
@@ -364,39 +433,99 @@ class Budget(BaseModel):
         description="최종 수정일 (Cvent: lastModifiedDate)"
     )
 
+    # 집계 캐시: (집계한 line_items 리스트 객체, 그때의 길이, 집계)
+    _totals_cache: Optional[Tuple[list, int, BudgetTotals]] = PrivateAttr(default=None)
+
+    # -------------------------------------------------------------------------
+    # 라인 항목 변경 API (집계 캐시 유지)
+    # -------------------------------------------------------------------------
+
+    @property
+    def line_item_totals(self) -> BudgetTotals:
+        """캐시된 라인 항목 집계 (line_items 리스트가 바뀌었으면 다시 계산)"""
+        items = self.line_items
+        cache = self._totals_cache
+        if cache is None or cache[0] is not items or cache[1] != len(items):
+            cache = self._totals_cache = (items, len(items), BudgetTotals.from_items(items))
+        return cache[2]
+
+    def invalidate_totals(self) -> None:
+        """line_items를 제자리에서 직접 수정한 경우 집계 캐시 무효화"""
+        self._totals_cache = None
+
+    def add_line_item(self, item: BudgetLineItem) -> None:
+        """라인 항목 추가 (집계 O(1) 갱신)"""
+        totals = self._cached_totals()
+        self.line_items.append(item)
+        if totals is not None:
+            totals.apply(item, 1)
+            self._totals_cache = (self.line_items, len(self.line_items), totals)
+
+    def remove_line_item(self, item_id: UUID) -> Optional[BudgetLineItem]:
+        """ID로 라인 항목 삭제, 삭제된 항목 반환 (없으면 None)"""
+        for position, item in enumerate(self.line_items):
+            if item.id == item_id:
+                totals = self._cached_totals()
+                del self.line_items[position]
+                if totals is not None:
+                    totals.apply(item, -1)
+                    self._totals_cache = (self.line_items, len(self.line_items), totals)
+                return item
+        return None
+
+    def replace_line_item(self, item: BudgetLineItem) -> Optional[BudgetLineItem]:
+        """같은 ID의 라인 항목 교체, 이전 항목 반환 (없으면 None)"""
+        for position, old in enumerate(self.line_items):
+            if old.id == item.id:
+                totals = self._cached_totals()
+                self.line_items[position] = item
+                if totals is not None:
+                    totals.apply(old, -1)
+                    totals.apply(item, 1)
+                return old
+        return None
+
+    def _cached_totals(self) -> Optional[BudgetTotals]:
+        # 현재 line_items와 일치하는 캐시가 있을 때만 반환 (없으면 다음 조회 시 전체 계산)
+        cache = self._totals_cache
+        if cache is None or cache[0] is not self.line_items or cache[1] != len(self.line_items):
+            return None
+        return cache[2]
+
+    # -------------------------------------------------------------------------
+    # 집계 필드
+    # -------------------------------------------------------------------------
+
     @computed_field
     @property
     def total_projected(self) -> Decimal:
         """총 예상 예산"""
-        return sum(item.projected_amount for item in self.line_items)
+        return self.line_item_totals.projected
 
     @computed_field
     @property
     def total_actual(self) -> Decimal:
         """총 실제 지출"""
-        return sum(item.actual_amount for item in self.line_items)
+        return self.line_item_totals.actual
 
     @computed_field
     @property
     def total_variance(self) -> Decimal:
         """총 예산 차이"""
-        return self.total_projected - self.total_actual
+        totals = self.line_item_totals
+        return totals.projected - totals.actual
 
     @computed_field
     @property
     def contingency_amount(self) -> Decimal:
         """예비비 금액"""
-        return self.total_projected * (self.contingency_percentage / 100)
+        return self.line_item_totals.projected * (self.contingency_percentage / 100)
 
     @computed_field
     @property
     def budget_by_category(self) -> dict[str, Decimal]:
-        """카테고리별 예산 집계"""
-        result: dict[str, Decimal] = {}
-        for item in self.line_items:
-            cat = item.category.value
-            result[cat] = result.get(cat, Decimal("0")) + item.projected_amount
-        return result
+        """카테고리별 예산 집계 (캐시 보호를 위해 사본 반환)"""
+        return dict(self.line_item_totals.by_category)
 
 
 # =============================================================================
@@ -478,16 +607,24 @@ class SponsorshipPackage(BaseModel):
         default=0,
         description="판매된 수량"
     )
+    held_count: int = Field(
+        default=0,
+        description="보류 중인 수량 (만료 전 예약)"
+    )
     is_active: bool = Field(
         default=True,
         description="판매 가능 여부"
     )
+    created_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        description="생성 일시"
+    )
 
     @computed_field
     @property
     def available_count(self) -> int:
-        """남은 판매 가능 수량"""
-        return max(0, self.max_sponsors - self.sold_count)
+        """남은 판매 가능 수량 (판매 + 보류 제외)"""
+        return max(0, self.max_sponsors - self.sold_count - self.held_count)
 
     @computed_field
     @property
@@ -543,6 +680,10 @@ class Sponsor(BaseModel):
         default=None,
         description="선택한 패키지 ID"
     )
+    event_id: Optional[UUID] = Field(
+        default=None,
+        description="이벤트 ID (선택한 패키지의 event_id, 패키지 지정 시 설정)"
+    )
     status: SponsorshipStatus = Field(
         default=SponsorshipStatus.PROSPECT,
         description="진행 상태"
@@ -569,6 +710,59 @@ class Sponsor(BaseModel):
         default=None,
         description="비고"
     )
+    created_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        description="생성 일시"
+    )
+    version: int = Field(
+        default=1,
+        ge=1,
+        description="레코드 버전 (수정 시마다 1 증가, ETag 값)"
+    )
+
+
+class SponsorshipReservation(BaseModel):
+    """
+    스폰서십 패키지 수량 보류 (TTL).
+    보류 중에는 패키지 수량 1개를 점유하며, 스폰서가 CONTRACTED가 되면 판매로 전환된다.
+    """
+    id: UUID = Field(
+        default_factory=uuid4,
+        description="보류 ID"
+    )
+    package_id: UUID = Field(
+        ...,
+        description="스폰서십 패키지 ID"
+    )
+    event_id: UUID = Field(
+        ...,
+        description="이벤트 ID (패키지의 event_id)"
+    )
+    holder: Optional[str] = Field(
+        default=None,
+        description="보류 요청자 (영업 담당자 등, 보류 없는 직접 판매는 null)",
+        max_length=200
+    )
+    sponsor_id: Optional[UUID] = Field(
+        default=None,
+        description="대상 스폰서 ID (전환 시 설정)"
+    )
+    status: ReservationStatus = Field(
+        default=ReservationStatus.HELD,
+        description="보류 상태"
+    )
+    expires_at: datetime = Field(
+        ...,
+        description="보류 만료 일시 (HELD 상태에서만 의미)"
+    )
+    closed_at: Optional[datetime] = Field(
+        default=None,
+        description="전환 / 해제 / 만료 일시"
+    )
+    created_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        description="생성 일시"
+    )
 
 
 # =============================================================================
@@ -865,6 +1059,10 @@ class PricingTier(BaseModel):
         default_factory=uuid4,
         description="가격 등급 ID"
     )
+    event_id: UUID = Field(
+        ...,
+        description="소속 이벤트 ID"
+    )
     name: str = Field(
         ...,
         description="등급명 (예: Early Bird, Regular, On-site)",
@@ -876,7 +1074,12 @@ class PricingTier(BaseModel):
     )
     base_price: Decimal = Field(
         ...,
-        description="기본 가격"
+        description="기본 가격",
+        ge=Decimal("0")
+    )
+    currency: CurrencyCode = Field(
+        default=CurrencyCode.USD,
+        description="통화"
     )
     member_discount_rate: Decimal = Field(
         default=Decimal("0"),
@@ -900,6 +1103,10 @@ class PricingTier(BaseModel):
         default=0,
         description="판매된 수량"
     )
+    created_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        description="생성 일시"
+    )
 
     @computed_field
     @property
@@ -912,14 +1119,21 @@ class PricingTier(BaseModel):
     @property
     def is_available(self) -> bool:
         """구매 가능 여부"""
-        now = datetime.utcnow()
+        return self.available_at(datetime.utcnow())
+
+    def available_at(self, at: datetime) -> bool:
+        """주어진 시각의 구매 가능 여부 (적용 기간 양 끝 포함, 매진 제외)"""
         date_valid = True
-        if self.valid_from and now < self.valid_from:
+        if self.valid_from and at < self.valid_from:
             date_valid = False
-        if self.valid_until and now > self.valid_until:
+        if self.valid_until and at > self.valid_until:
             date_valid = False
-        quantity_valid = self.max_quantity is None or self.sold_quantity < self.max_quantity
-        return date_valid and quantity_valid
+        return date_valid and not self.sold_out
+
+    @property
+    def sold_out(self) -> bool:
+        """최대 판매 수량 도달 여부"""
+        return self.max_quantity is not None and self.sold_quantity >= self.max_quantity
 
 
 # =============================================================================
@@ -927,6 +1141,9 @@ class PricingTier(BaseModel):
 # =============================================================================
 
 __all__ = [
+    # Datetime
+    "utc_naive",
+    "UTCDateTime",
     # Enums
     "BudgetCategory",
     "BudgetStatus",
@@ -934,6 +1151,7 @@ __all__ = [
     "CurrencyCode",
     "SponsorshipTier",
     "SponsorshipStatus",
+    "ReservationStatus",
     "PaymentMethod",
     "TransactionType",
     # Base Models
@@ -942,10 +1160,12 @@ __all__ = [
     # Budget
     "BudgetLineItem",
     "Budget",
+    "BudgetTotals",
     # Sponsorship
     "SponsorBenefit",
     "SponsorshipPackage",
     "Sponsor",
+    "SponsorshipReservation",
     # Reports
     "FinancialReport",
     # Transactions
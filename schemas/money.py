@@ -0,0 +1,178 @@
+"""
+Fixed-Point Money
+
+통화별 최소 단위(minor unit) 정수로 금액을 표현하는 고정소수점 타입.
+- 내부 연산(합계, 차이 등)을 Decimal 대신 정수로 수행
+- JSON API는 기존과 동일하게 Decimal로 노출 (to_decimal)
+- 요청 금액 상한 MAX_AMOUNT: 모든 통화에서 최소 단위가 int64에 들어가는 범위 (check_amount)
+
+반올림 규칙:
+- Decimal → 최소 단위 변환 시 통화 소수 자릿수로 ROUND_HALF_EVEN (은행가 반올림)
+- 덧셈/뺄셈/부호 반전은 정확 (반올림 없음)
+- 배율 곱셈(scale)은 결과에 대해 한 번만 반올림
+- 서로 다른 통화 간 연산은 ValueError
+
+Author: Event Agent System
+"""
+
+from decimal import ROUND_HALF_EVEN, Decimal
+from typing import Dict, Iterable, Optional
+
+
+# ISO 4217 소수 자릿수 (JPY, KRW는 소수 단위 없음)
+# CurrencyCode(str Enum)와 ISO 코드 문자열 모두로 조회 가능
+CURRENCY_EXPONENTS: Dict[str, int] = {
+    "USD": 2,
+    "EUR": 2,
+    "GBP": 2,
+    "JPY": 0,
+    "KRW": 0,
+    "CNY": 2,
+    "SGD": 2,
+    "AUD": 2,
+}
+
+INT64_MIN = -(2 ** 63)
+INT64_MAX = 2 ** 63 - 1
+
+# 요청 금액 절댓값 상한: 소수 자릿수가 가장 큰 통화에서도 최소 단위 정수가 int64 범위
+# → 최소 단위 정수 경로(현금 흐름, 분석, 가격 견적)에서 항목 하나로 넘치지 않는다
+MAX_AMOUNT = Decimal(INT64_MAX // 10 ** max(CURRENCY_EXPONENTS.values()))
+
+_QUANTS: Dict[str, Decimal] = {
+    currency: Decimal(1).scaleb(-exponent) for currency, exponent in CURRENCY_EXPONENTS.items()
+}
+
+
+def _code(currency: str) -> str:
+    """CurrencyCode 또는 문자열 → ISO 코드 문자열"""
+    return getattr(currency, "value", currency)
+
+
+def to_minor(amount: Decimal, currency: str, rounding: str = ROUND_HALF_EVEN) -> int:
+    """Decimal 금액 → 최소 단위 정수"""
+    units = int(amount.scaleb(CURRENCY_EXPONENTS[_code(currency)]).to_integral_value(rounding=rounding))
+    if not INT64_MIN <= units <= INT64_MAX:
+        raise OverflowError(f"{amount} {_code(currency)} exceeds int64 minor units")
+    return units
+
+
+def check_amount(amount: Decimal) -> Decimal:
+    """요청 금액 범위 검사 (|amount| > MAX_AMOUNT면 ValueError)"""
+    if not -MAX_AMOUNT <= amount <= MAX_AMOUNT:
+        raise ValueError(f"Amount {amount} is out of range (max {MAX_AMOUNT})")
+    return amount
+
+
+def from_minor(units: int, currency: str) -> Decimal:
+    """최소 단위 정수 → Decimal (통화 소수 자릿수로 표현)"""
+    return Decimal(units).scaleb(-CURRENCY_EXPONENTS[_code(currency)])
+
+
+def quantize(amount: Decimal, currency: str, rounding: str = ROUND_HALF_EVEN) -> Decimal:
+    """Decimal 금액을 통화 최소 단위로 반올림"""
+    return amount.quantize(_QUANTS[_code(currency)], rounding=rounding)
+
+
+class MinorMoney:
+    """
+    통화 최소 단위 정수 금액 (불변).
+
+    예: MinorMoney(12345, USD) = 123.45 USD, MinorMoney(5000, KRW) = 5,000 KRW
+    """
+
+    __slots__ = ("units", "currency")
+
+    def __init__(self, units: int, currency: str = "USD"):
+        object.__setattr__(self, "units", units)
+        object.__setattr__(self, "currency", _code(currency))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("MinorMoney is immutable")
+
+    @classmethod
+    def from_decimal(
+        cls,
+        amount: Decimal,
+        currency: str = "USD",
+        rounding: str = ROUND_HALF_EVEN,
+    ) -> "MinorMoney":
+        return cls(to_minor(amount, currency, rounding), currency)
+
+    @classmethod
+    def zero(cls, currency: str = "USD") -> "MinorMoney":
+        return cls(0, currency)
+
+    @classmethod
+    def sum(cls, values: Iterable["MinorMoney"], currency: str) -> "MinorMoney":
+        """같은 통화 금액 합계 (정수 합산)"""
+        code = _code(currency)
+        total = 0
+        for value in values:
+            if value.currency != code:
+                raise ValueError(f"Currency mismatch: {value.currency} != {code}")
+            total += value.units
+        return cls(total, currency)
+
+    def to_decimal(self) -> Decimal:
+        return from_minor(self.units, self.currency)
+
+    def scale(self, factor: Decimal, rounding: str = ROUND_HALF_EVEN) -> "MinorMoney":
+        """배율 곱셈 (결과를 최소 단위로 한 번 반올림)"""
+        units = (Decimal(self.units) * factor).to_integral_value(rounding=rounding)
+        return MinorMoney(int(units), self.currency)
+
+    def ratio(self, other: "MinorMoney") -> Optional[Decimal]:
+        """self / other (0으로 나누면 None)"""
+        self._check(other)
+        if other.units == 0:
+            return None
+        return Decimal(self.units) / Decimal(other.units)
+
+    def _check(self, other: "MinorMoney") -> None:
+        if self.currency != other.currency:
+            raise ValueError(f"Currency mismatch: {self.currency} != {other.currency}")
+
+    def __add__(self, other: "MinorMoney") -> "MinorMoney":
+        self._check(other)
+        return MinorMoney(self.units + other.units, self.currency)
+
+    def __sub__(self, other: "MinorMoney") -> "MinorMoney":
+        self._check(other)
+        return MinorMoney(self.units - other.units, self.currency)
+
+    def __neg__(self) -> "MinorMoney":
+        return MinorMoney(-self.units, self.currency)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, MinorMoney):
+            return NotImplemented
+        return self.units == other.units and self.currency == other.currency
+
+    def __lt__(self, other: "MinorMoney") -> bool:
+        self._check(other)
+        return self.units < other.units
+
+    def __le__(self, other: "MinorMoney") -> bool:
+        self._check(other)
+        return self.units <= other.units
+
+    def __hash__(self) -> int:
+        return hash((self.units, self.currency))
+
+    def __bool__(self) -> bool:
+        return self.units != 0
+
+    def __repr__(self) -> str:
+        return f"MinorMoney({self.to_decimal()} {self.currency})"
+
+
+__all__ = [
+    "CURRENCY_EXPONENTS",
+    "MAX_AMOUNT",
+    "MinorMoney",
+    "check_amount",
+    "to_minor",
+    "from_minor",
+    "quantize",
+]
@@ -0,0 +1 @@
+"""Event Agent Services"""
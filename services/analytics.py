@@ -0,0 +1,375 @@
+"""
+Columnar Budget Analytics
+
+예산 항목을 열(column) 단위 NumPy 배열로 유지하여 집계/분산 분석을 벡터화.
+- 금액: 정수 int64 (AMOUNT_SCALE = 10^4, 소수점 4자리까지)
+  → 정수로 정확히 표현되지 않는 금액(소수 5자리 이상, 열 값 한도 밖)의 행은 금액 열을 0으로 두고
+    Decimal 값을 따로 보관하여 합계 / 초과 / 백분위 결과에 합류 (Decimal 경로와 정확히 일치)
+- category / status / cost_type / currency / event: 소형 정수 코드
+- 컬렉션 변경 구독(ChangeListener)으로 행 단위 증분 갱신 (삭제는 swap-remove)
+  → 갱신 실패 시 커밋된 쓰기를 실패시키지 않고 사본을 무효화, 다음 조회에서 다시 적재
+- 합계는 정수 연산 (오버플로 위험 시 Python int)
+
+Author: Event Agent System
+"""
+
+import asyncio
+from decimal import Decimal
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+import numpy as np
+
+from schemas.financial import BudgetCategory, BudgetLineItem, BudgetStatus, CostType, CurrencyCode
+from storage.base import ChangeListener, Collection
+
+
+# 금액 스케일: 1 단위 = 0.0001 (센트의 1/100)
+AMOUNT_SCALE = 4
+INT64_MAX = int(np.iinfo(np.int64).max)
+# 금액 열 값 한도: 두 값의 차이(variance, 초과액)도 int64 범위에 들도록 절반
+UNITS_LIMIT = INT64_MAX // 2
+
+CATEGORIES: List[BudgetCategory] = list(BudgetCategory)
+STATUSES: List[BudgetStatus] = list(BudgetStatus)
+COST_TYPES: List[CostType] = list(CostType)
+CURRENCIES: List[CurrencyCode] = list(CurrencyCode)
+
+CATEGORY_CODES = {c: i for i, c in enumerate(CATEGORIES)}
+STATUS_CODES = {s: i for i, s in enumerate(STATUSES)}
+COST_TYPE_CODES = {c: i for i, c in enumerate(COST_TYPES)}
+CURRENCY_CODES = {c: i for i, c in enumerate(CURRENCIES)}
+
+AMOUNT_FIELDS = ("projected", "actual", "variance")
+
+ZERO = Decimal("0")
+
+
+def to_units(amount: Decimal) -> Optional[int]:
+    """Decimal → 정수 스케일 단위 (반올림 없이 정확히 표현되지 않거나 UNITS_LIMIT 밖이면 None)"""
+    scaled = amount.scaleb(AMOUNT_SCALE)
+    if scaled != scaled.to_integral_value():
+        return None
+    units = int(scaled)
+    return units if -UNITS_LIMIT <= units <= UNITS_LIMIT else None
+
+
+def from_units(units: Any) -> Decimal:
+    """정수 스케일 단위 → Decimal"""
+    return Decimal(int(units)).scaleb(-AMOUNT_SCALE)
+
+
+def group_sum(codes: np.ndarray, values: np.ndarray, groups: int) -> List[int]:
+    """코드별 정수 합계 (np.add.at, 오버플로 위험 시 Python int)"""
+    if values.size and int(np.abs(values).max()) * values.size >= INT64_MAX:
+        totals = [0] * groups
+        for code, value in zip(codes.tolist(), values.tolist()):
+            totals[code] += value
+        return totals
+    out = np.zeros(groups, dtype=np.int64)
+    np.add.at(out, codes, values)
+    return [int(v) for v in out]
+
+
+# =============================================================================
+# COLUMNAR LEDGER
+# =============================================================================
+
+class ColumnarLedger(ChangeListener[BudgetLineItem]):
+    """
+    전체 예산 항목의 열 지향 사본.
+
+    행 추가는 용량 2배 확장 배열에 append, 삭제는 마지막 행을 빈 자리로
+    옮기는 swap-remove (O(1)). 이벤트별 조회는 event 코드 마스크로 벡터화.
+    정수 열로 표현되지 않는 금액의 행은 _spilled(ID → (projected, actual) Decimal)에 보관하고
+    그 행의 금액 열은 0 (합계에 영향 없음), exact 열은 False (행 단위 조회에서 제외 후 Decimal로 합류).
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self._size = 0
+        self._capacity = capacity
+        self._ids: List[Optional[UUID]] = [None] * capacity
+        self._rows: Dict[UUID, int] = {}
+        self._event_codes: Dict[UUID, int] = {}
+        self._events: List[UUID] = []
+        self.event = np.zeros(capacity, dtype=np.int32)
+        self.category = np.zeros(capacity, dtype=np.int8)
+        self.status = np.zeros(capacity, dtype=np.int8)
+        self.cost_type = np.zeros(capacity, dtype=np.int8)
+        self.currency = np.zeros(capacity, dtype=np.int8)
+        self.projected = np.zeros(capacity, dtype=np.int64)
+        self.actual = np.zeros(capacity, dtype=np.int64)
+        self.exact = np.ones(capacity, dtype=bool)
+        self._spilled: Dict[UUID, Tuple[Decimal, Decimal]] = {}
+        self._loaded = False
+        self._revision: Optional[Hashable] = None
+        self._load_lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    # -------------------------------------------------------------------------
+    # 적재 / 증분 갱신
+    # -------------------------------------------------------------------------
+
+    async def ensure_loaded(
+        self, collection: Collection[BudgetLineItem], revision: Optional[Hashable] = None
+    ) -> None:
+        """
+        최초 조회 시 컬렉션 전체를 한 번 적재 (이후에는 변경 구독으로 유지).
+        revision이 주어지면 (다른 프로세스도 쓰는 저장소: 구독으로는 그 쓰기를 받지 못함)
+        적재 시점 리비전과 다를 때 다시 적재한다.
+        """
+        if self._loaded and (revision is None or revision == self._revision):
+            return
+        async with self._load_lock:
+            if self._loaded and (revision is None or revision == self._revision):
+                return
+            self.collection_cleared()
+            for item in await collection.find():
+                self.upsert(item)
+            self._loaded = True
+            self._revision = revision
+
+    def record_changed(self, old: Optional[BudgetLineItem], new: Optional[BudgetLineItem]) -> None:
+        try:
+            if new is not None:
+                self.upsert(new)
+            elif old is not None:
+                self.delete(old.id)
+        except Exception:
+            # 쓰기는 이미 커밋됨 → 요청을 실패시키지 않고 사본을 무효화 (다음 조회에서 다시 적재)
+            self._loaded = False
+
+    def collection_cleared(self) -> None:
+        self._size = 0
+        self._rows.clear()
+        self._spilled.clear()
+        self._ids = [None] * self._capacity
+
+    def upsert(self, item: BudgetLineItem) -> None:
+        """행 추가 또는 같은 ID의 행 덮어쓰기"""
+        row = self._rows.get(item.id)
+        if row is None:
+            if self._size == self._capacity:
+                self._grow()
+            row = self._size
+            self._size += 1
+            self._rows[item.id] = row
+            self._ids[row] = item.id
+        self.event[row] = self._event_code(item.event_id)
+        self.category[row] = CATEGORY_CODES[item.category]
+        self.status[row] = STATUS_CODES[item.status]
+        self.cost_type[row] = COST_TYPE_CODES[item.cost_type]
+        self.currency[row] = CURRENCY_CODES[item.currency]
+        projected = to_units(item.projected_amount)
+        actual = to_units(item.actual_amount)
+        if projected is None or actual is None:
+            self._spilled[item.id] = (item.projected_amount, item.actual_amount)
+            projected = actual = 0
+        else:
+            self._spilled.pop(item.id, None)
+        self.projected[row] = projected
+        self.actual[row] = actual
+        self.exact[row] = item.id not in self._spilled
+
+    def delete(self, item_id: UUID) -> None:
+        """swap-remove: 마지막 행을 삭제 위치로 이동"""
+        row = self._rows.pop(item_id, None)
+        if row is None:
+            return
+        self._spilled.pop(item_id, None)
+        last = self._size - 1
+        if row != last:
+            for column in self._columns():
+                column[row] = column[last]
+            moved = self._ids[last]
+            self._ids[row] = moved
+            self._rows[moved] = row
+        self._ids[last] = None
+        self._size = last
+
+    def _event_code(self, event_id: UUID) -> int:
+        code = self._event_codes.get(event_id)
+        if code is None:
+            code = self._event_codes[event_id] = len(self._events)
+            self._events.append(event_id)
+        return code
+
+    def _columns(self) -> Sequence[np.ndarray]:
+        return (self.event, self.category, self.status, self.cost_type,
+                self.currency, self.projected, self.actual, self.exact)
+
+    def _grow(self) -> None:
+        self._capacity *= 2
+        for name in ("event", "category", "status", "cost_type", "currency", "projected", "actual", "exact"):
+            column = getattr(self, name)
+            grown = np.zeros(self._capacity, dtype=column.dtype)
+            grown[: self._size] = column[: self._size]
+            setattr(self, name, grown)
+        self._ids.extend([None] * (self._capacity - len(self._ids)))
+
+    # -------------------------------------------------------------------------
+    # 벡터화 조회
+    # -------------------------------------------------------------------------
+
+    def _mask(self, event_id: Optional[UUID]) -> Optional[np.ndarray]:
+        """이벤트 필터 마스크 (None이면 전체, 미등록 이벤트면 빈 마스크)"""
+        if event_id is None:
+            return None
+        code = self._event_codes.get(event_id)
+        if code is None:
+            return np.zeros(self._size, dtype=bool)
+        return self.event[: self._size] == code
+
+    def _view(self, column: np.ndarray, mask: Optional[np.ndarray]) -> np.ndarray:
+        values = column[: self._size]
+        return values if mask is None else values[mask]
+
+    def _exact(self, mask: Optional[np.ndarray]) -> Optional[np.ndarray]:
+        """마스크 중 금액 열 값이 정확한 행만 (Decimal 보관 행이 없으면 mask 그대로)"""
+        if not self._spilled:
+            return mask
+        exact = self.exact[: self._size]
+        return exact if mask is None else mask & exact
+
+    def _spilled_rows(self, mask: Optional[np.ndarray]) -> Iterator[Tuple[int, Decimal, Decimal]]:
+        """마스크 안의 Decimal 보관 행: (행, projected, actual)"""
+        for item_id, (projected, actual) in self._spilled.items():
+            row = self._rows[item_id]
+            if mask is None or mask[row]:
+                yield row, projected, actual
+
+    def _spilled_totals(
+        self, codes: np.ndarray, mask: Optional[np.ndarray]
+    ) -> Dict[int, Tuple[Decimal, Decimal]]:
+        """Decimal 보관 행의 코드별 (projected, actual) 합계 (codes: 그룹 코드 열)"""
+        totals: Dict[int, Tuple[Decimal, Decimal]] = {}
+        for row, projected, actual in self._spilled_rows(mask):
+            code = int(codes[row])
+            total_projected, total_actual = totals.get(code, (ZERO, ZERO))
+            totals[code] = (total_projected + projected, total_actual + actual)
+        return totals
+
+    def category_breakdown(self, event_id: Optional[UUID] = None) -> Dict[str, Dict[str, Any]]:
+        """카테고리별 projected / actual / variance / count"""
+        mask = self._mask(event_id)
+        codes = self._view(self.category, mask).astype(np.intp)
+        projected = self._view(self.projected, mask)
+        actual = self._view(self.actual, mask)
+
+        counts = np.bincount(codes, minlength=len(CATEGORIES))
+        projected_sums = group_sum(codes, projected, len(CATEGORIES))
+        actual_sums = group_sum(codes, actual, len(CATEGORIES))
+        spilled = self._spilled_totals(self.category, mask)
+
+        result: Dict[str, Dict[str, Any]] = {}
+        for code, category in enumerate(CATEGORIES):
+            if counts[code]:
+                if code in spilled:
+                    extra_projected, extra_actual = spilled[code]
+                    total_projected = from_units(projected_sums[code]) + extra_projected
+                    total_actual = from_units(actual_sums[code]) + extra_actual
+                    variance = total_projected - total_actual
+                else:
+                    total_projected = from_units(projected_sums[code])
+                    total_actual = from_units(actual_sums[code])
+                    variance = from_units(projected_sums[code] - actual_sums[code])
+                result[category.value] = {
+                    "projected": total_projected,
+                    "actual": total_actual,
+                    "variance": variance,
+                    "count": int(counts[code]),
+                }
+        return result
+
+    def over_budget(self, event_id: Optional[UUID] = None, limit: int = 100) -> List[Dict[str, Any]]:
+        """실제 지출이 예상을 초과한 항목 (초과액 큰 순)"""
+        mask = self._mask(event_id)
+        exact = self._exact(mask)
+        rows = np.arange(self._size) if exact is None else np.flatnonzero(exact)
+        overrun = self.actual[rows] - self.projected[rows]
+        hits = np.flatnonzero(overrun > 0)
+        if hits.size > limit:
+            hits = hits[np.argpartition(-overrun[hits], limit - 1)[:limit]]
+        hits = hits[np.argsort(-overrun[hits], kind="stable")]
+        # (행, projected, actual): 정수 열 상위 limit개 + Decimal 보관 행 중 초과 항목
+        found = [
+            (int(rows[i]), from_units(self.projected[rows[i]]), from_units(self.actual[rows[i]]))
+            for i in hits
+        ]
+        spilled = [
+            (row, projected, actual)
+            for row, projected, actual in self._spilled_rows(mask)
+            if actual > projected
+        ]
+        if spilled:
+            found = sorted(found + spilled, key=lambda hit: hit[1] - hit[2])[:limit]
+        return [
+            {
+                "id": self._ids[row],
+                "category": CATEGORIES[int(self.category[row])].value,
+                "projected_amount": projected,
+                "actual_amount": actual,
+                "variance": projected - actual,
+            }
+            for row, projected, actual in found
+        ]
+
+    def percentiles(
+        self,
+        field: str,
+        quantiles: Sequence[float],
+        event_id: Optional[UUID] = None,
+    ) -> Dict[str, Decimal]:
+        """
+        금액 분포 백분위 (nearest-rank 방식 → 실제 항목 값 그대로 반환).
+        field: projected | actual | variance
+        """
+        if field not in AMOUNT_FIELDS:
+            raise ValueError(f"Unknown amount field: {field}")
+        mask = self._mask(event_id)
+        exact = self._exact(mask)
+        if field == "variance":
+            values = self._view(self.projected, exact) - self._view(self.actual, exact)
+        else:
+            values = self._view(getattr(self, field), exact)
+        spilled = [
+            projected - actual if field == "variance" else (projected if field == "projected" else actual)
+            for _, projected, actual in self._spilled_rows(mask)
+        ]
+        size = values.size + len(spilled)
+        if size == 0:
+            return {}
+        # nearest-rank: k = ceil(q/100 * n) 번째 값 (정수 그대로 선택, 부동소수 변환 없음)
+        ranks = [min(size - 1, max(0, int(np.ceil(q / 100 * size)) - 1)) for q in quantiles]
+        if spilled:
+            # Decimal 보관 행이 섞이면 Decimal로 정렬 (드문 경로)
+            ordered = sorted([from_units(v) for v in values.tolist()] + spilled)
+            return {f"p{q:g}": ordered[k] for q, k in zip(quantiles, ranks)}
+        picked = np.partition(values, sorted(set(ranks)))
+        return {f"p{q:g}": from_units(picked[k]) for q, k in zip(quantiles, ranks)}
+
+    def event_totals(self) -> List[Dict[str, Any]]:
+        """이벤트별 총 projected / actual / variance / count (교차 이벤트 분석)"""
+        codes = self.event[: self._size].astype(np.intp)
+        groups = len(self._events)
+        counts = np.bincount(codes, minlength=groups)
+        projected_sums = group_sum(codes, self.projected[: self._size], groups)
+        actual_sums = group_sum(codes, self.actual[: self._size], groups)
+        spilled = self._spilled_totals(self.event, None)
+        totals: List[Dict[str, Any]] = []
+        for code, event_id in enumerate(self._events):
+            if not counts[code]:
+                continue
+            extra_projected, extra_actual = spilled.get(code, (ZERO, ZERO))
+            total_projected = from_units(projected_sums[code]) + extra_projected
+            total_actual = from_units(actual_sums[code]) + extra_actual
+            totals.append({
+                "event_id": event_id,
+                "total_projected": total_projected,
+                "total_actual": total_actual,
+                "total_variance": total_projected - total_actual,
+                "count": int(counts[code]),
+            })
+        return totals
@@ -0,0 +1,259 @@
+"""
+Cash Flow Projection
+
+이벤트 현금 흐름을 날짜 정렬 인덱스 + 누적합(prefix sum)으로 계산.
+- 예상 지출: 예산 항목 payment_due_date의 projected_amount (CANCELLED 제외, 결제일 없는 항목 제외)
+- 예상 수입: 금액 확정 이후(COMMITTED/CONTRACTED/FULFILLED) 스폰서의 committed_amount
+  (일자: 계약 체결일, 없으면 등록일 / 통화: 선택한 패키지 통화)
+- 실제 수입/지출: 거래(Transaction) — INCOME(+수입), REFUND(−수입), EXPENSE(+지출),
+  ADJUSTMENT(부호 그대로 수입에 반영)
+- 통화별로 날짜 정렬 배열과 4개 지표의 누적합(최소 단위 정수)을 유지
+  → 임의 기간 [start, end] 합계 = 누적합 차이, 이분 탐색 O(log n)
+- 인덱스는 (이벤트, 리비전) 단위로 한 번 만들고 캐시 → 기간별 재스캔 없음
+
+Author: Event Agent System
+"""
+
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from datetime import date, timedelta
+from decimal import Decimal
+from enum import Enum
+from itertools import accumulate
+from typing import Awaitable, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+from uuid import UUID
+
+from schemas.financial import (
+    BudgetLineItem,
+    BudgetStatus,
+    CashFlowProjection,
+    Sponsor,
+    Transaction,
+    TransactionType,
+)
+from schemas.money import from_minor, quantize, to_minor
+from storage.aggregates import COMMITTED_STATUSES
+
+
+# 지표 순서 (누적합 배열 인덱스)
+PROJECTED_INCOME = 0
+PROJECTED_EXPENSE = 1
+ACTUAL_INCOME = 2
+ACTUAL_EXPENSE = 3
+METRICS = 4
+
+# (일자, 통화, 지표, 최소 단위 금액)
+Flow = Tuple[date, str, int, int]
+
+
+class CashFlowPeriod(str, Enum):
+    """현금 흐름 기간 단위"""
+    WEEKLY = "weekly"
+    MONTHLY = "monthly"
+
+
+class CashFlowBasis(str, Enum):
+    """기초 잔액 기준: 이전 기간 누적 예상 순흐름 / 실제 순흐름"""
+    PROJECTED = "projected"
+    ACTUAL = "actual"
+
+
+# =============================================================================
+# FLOWS
+# =============================================================================
+
+def budget_flows(items: Iterable[BudgetLineItem]) -> Iterator[Flow]:
+    for item in items:
+        if item.payment_due_date is None or item.status == BudgetStatus.CANCELLED:
+            continue
+        yield (item.payment_due_date, item.currency.value, PROJECTED_EXPENSE, item.projected_money.units)
+
+
+def sponsor_flows(
+    sponsors: Iterable[Sponsor],
+    package_currencies: Dict[UUID, str],
+    default_currency: str,
+) -> Iterator[Flow]:
+    """스폰서 확정 금액 (통화: 선택한 패키지의 통화, 없으면 default_currency)"""
+    for sponsor in sponsors:
+        if sponsor.status.value not in COMMITTED_STATUSES:
+            continue
+        currency = package_currencies.get(sponsor.package_id, default_currency)
+        day = (sponsor.contract_signed_at or sponsor.created_at).date()
+        yield (day, currency, PROJECTED_INCOME, to_minor(sponsor.committed_amount, currency))
+
+
+def transaction_flows(transactions: Iterable[Transaction]) -> Iterator[Flow]:
+    for tx in transactions:
+        currency = tx.currency.value
+        units = to_minor(tx.amount, currency)
+        day = tx.transaction_date.date()
+        if tx.transaction_type == TransactionType.EXPENSE:
+            yield (day, currency, ACTUAL_EXPENSE, units)
+        elif tx.transaction_type == TransactionType.REFUND:
+            yield (day, currency, ACTUAL_INCOME, -units)
+        else:
+            yield (day, currency, ACTUAL_INCOME, units)
+
+
+# =============================================================================
+# INDEX
+# =============================================================================
+
+class CashFlowIndex:
+    """
+    통화별 날짜 정렬 인덱스 + 지표별 누적합.
+
+    dates[c][k]는 k번째 고유 일자, prefix[c][m][k]는 dates[c][:k] 일자의 지표 m 합계
+    (prefix[c][m][0] = 0). 기간 합계는 두 번의 이분 탐색과 뺄셈으로 계산한다.
+    """
+
+    def __init__(self, flows: Iterable[Flow]):
+        daily: Dict[str, Dict[date, List[int]]] = {}
+        for day, currency, metric, units in flows:
+            by_day = daily.setdefault(currency, {})
+            totals = by_day.get(day)
+            if totals is None:
+                totals = by_day[day] = [0] * METRICS
+            totals[metric] += units
+
+        self.dates: Dict[str, List[date]] = {}
+        self.prefix: Dict[str, List[List[int]]] = {}
+        for currency, by_day in daily.items():
+            days = sorted(by_day)
+            self.dates[currency] = days
+            self.prefix[currency] = [
+                list(accumulate((by_day[day][metric] for day in days), initial=0))
+                for metric in range(METRICS)
+            ]
+
+    @property
+    def currencies(self) -> List[str]:
+        return sorted(self.dates)
+
+    def span(self) -> Optional[Tuple[date, date]]:
+        """첫 / 마지막 흐름 일자 (흐름이 없으면 None)"""
+        if not self.dates:
+            return None
+        return (min(d[0] for d in self.dates.values()), max(d[-1] for d in self.dates.values()))
+
+    def totals(self, start: Optional[date], end: Optional[date]) -> Dict[str, List[int]]:
+        """[start, end] (None = 무한) 기간 통화별 지표 합계 (최소 단위)"""
+        result: Dict[str, List[int]] = {}
+        for currency, days in self.dates.items():
+            lo = 0 if start is None else bisect_left(days, start)
+            hi = len(days) if end is None else bisect_right(days, end)
+            if hi <= lo:
+                continue
+            prefix = self.prefix[currency]
+            result[currency] = [prefix[m][hi] - prefix[m][lo] for m in range(METRICS)]
+        return result
+
+
+# =============================================================================
+# PROJECTION
+# =============================================================================
+
+def period_bounds(period: CashFlowPeriod, start: date, end: date) -> List[Tuple[date, date]]:
+    """start가 속한 기간부터 end가 속한 기간까지 (주: 월요일 시작, 월: 1일 시작)"""
+    bounds: List[Tuple[date, date]] = []
+    if period == CashFlowPeriod.WEEKLY:
+        current = start - timedelta(days=start.weekday())
+        while current <= end:
+            bounds.append((current, current + timedelta(days=6)))
+            current += timedelta(days=7)
+    else:
+        current = start.replace(day=1)
+        while current <= end:
+            following = (current.replace(day=28) + timedelta(days=4)).replace(day=1)
+            bounds.append((current, following - timedelta(days=1)))
+            current = following
+    return bounds
+
+
+def project(
+    index: CashFlowIndex,
+    event_id: UUID,
+    period: CashFlowPeriod,
+    bounds: List[Tuple[date, date]],
+    currency: str,
+    factor: Callable[[str, date], Decimal],
+    basis: CashFlowBasis = CashFlowBasis.PROJECTED,
+    starting_balance: Decimal = Decimal("0"),
+) -> List[CashFlowProjection]:
+    """
+    기간별 현금 흐름 (각 기간 O(통화 수 × log n)).
+    통화별 합계는 factor(통화, 기간 시작일)로 보고 통화 환산 후 기간 단위로 한 번 반올림.
+    기초 잔액 = starting_balance + 첫 기간 이전 누적 순흐름(basis), 이후 기간은 이전 기간 기말 잔액.
+    """
+    if not bounds:
+        return []
+
+    def convert(totals: Dict[str, List[int]], day: date) -> List[Decimal]:
+        values = [Decimal("0")] * METRICS
+        for code, units in totals.items():
+            rate = factor(code, day)
+            for metric in range(METRICS):
+                if units[metric]:
+                    values[metric] += from_minor(units[metric], code) * rate
+        return [quantize(value, currency) for value in values]
+
+    income, expense = (
+        (PROJECTED_INCOME, PROJECTED_EXPENSE) if basis == CashFlowBasis.PROJECTED
+        else (ACTUAL_INCOME, ACTUAL_EXPENSE)
+    )
+    first_start = bounds[0][0]
+    before = convert(index.totals(None, first_start - timedelta(days=1)), first_start)
+    balance = starting_balance + before[income] - before[expense]
+
+    projections: List[CashFlowProjection] = []
+    for period_start, period_end in bounds:
+        values = convert(index.totals(period_start, period_end), period_start)
+        projection = CashFlowProjection(
+            event_id=event_id,
+            period_type=period.value,
+            period_start=period_start,
+            period_end=period_end,
+            projected_income=values[PROJECTED_INCOME],
+            projected_expense=values[PROJECTED_EXPENSE],
+            actual_income=values[ACTUAL_INCOME],
+            actual_expense=values[ACTUAL_EXPENSE],
+            opening_balance=balance,
+        )
+        projections.append(projection)
+        balance += values[income] - values[expense]
+    return projections
+
+
+# =============================================================================
+# CACHE
+# =============================================================================
+
+class CashFlowIndexCache:
+    """(이벤트, 리비전) → CashFlowIndex LRU 캐시 (이벤트 데이터가 바뀌면 리비전이 달라져 재구성)"""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[UUID, Tuple[Hashable, CashFlowIndex]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    async def get(
+        self,
+        event_id: UUID,
+        revision: Hashable,
+        build: Callable[[], Awaitable[CashFlowIndex]],
+    ) -> CashFlowIndex:
+        entry = self._entries.get(event_id)
+        if entry is not None and entry[0] == revision:
+            self._entries.move_to_end(event_id)
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        index = await build()
+        self._entries[event_id] = (revision, index)
+        self._entries.move_to_end(event_id)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return index
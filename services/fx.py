@@ -0,0 +1,220 @@
+"""
+FX Rates
+
+보고 통화 환산용 환율 테이블.
+- 로컬 JSON 파일 (FINANCE_FX_RATES_PATH, 기본: services/fx_rates.json)
+- 버전: 파일의 "version" 값, 파일이 바뀌면(mtime) 다음 조회 시 다시 로드
+- 적용일 기준 조회: 조회일 이전(포함) 가장 최근 적용일의 환율 (이분 탐색)
+- 환산은 이벤트 통화별 소계(원 통화 Decimal, BudgetAggregate.by_currency)에 적용
+  → 항목 수와 무관하게 O(통화 수), 항목별 환율 조회 없음
+- 환산 결과는 (이벤트 리비전, 보고 통화, 환율 버전, 적용일) 키로 캐시
+  → 예산 항목 또는 환율이 바뀔 때만 다시 계산
+
+파일 형식:
+    {
+      "version": "2026-10-01",
+      "base": "USD",
+      "rates": [
+        {"effective_date": "2026-01-01", "rates": {"KRW": "1350.00", "JPY": "148.50", ...}}
+      ]
+    }
+    rates 값은 기준 통화(base) 1 단위당 해당 통화 금액.
+
+Author: Event Agent System
+"""
+
+import json
+import os
+from bisect import bisect_right
+from collections import OrderedDict
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+from schemas.money import CURRENCY_EXPONENTS, quantize
+
+
+DEFAULT_RATES_PATH = Path(__file__).with_name("fx_rates.json")
+
+
+class FXRateError(LookupError):
+    """환율 없음 (미지원 통화, 첫 적용일 이전 조회, 잘못된 환율 파일)"""
+
+
+class CurrencyConversion(BaseModel):
+    """보고 통화 환산 결과"""
+    currency: str = Field(..., description="보고 통화")
+    rates_version: str = Field(..., description="환율 테이블 버전")
+    rate_date: date = Field(..., description="적용된 환율의 적용일")
+    total_projected: Decimal
+    total_actual: Decimal
+    total_variance: Decimal
+    rates: Dict[str, Decimal] = Field(
+        default_factory=dict, description="원 통화 → 보고 통화 환산 계수"
+    )
+
+
+# =============================================================================
+# RATE TABLE
+# =============================================================================
+
+class FXRateTable:
+    """적용일별 환율 (기준 통화 1 단위당 통화 금액)"""
+
+    def __init__(self, version: str, base: str, periods: List[Tuple[date, Dict[str, Decimal]]]):
+        if not periods:
+            raise FXRateError("FX rate table has no periods")
+        periods = sorted(periods, key=lambda period: period[0])
+        self.version = version
+        self.base = base
+        self.effective_dates: List[date] = [day for day, _ in periods]
+        self._rates: List[Dict[str, Decimal]] = []
+        for _, rates in periods:
+            rates = dict(rates)
+            rates[base] = Decimal("1")
+            self._rates.append(rates)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "FXRateTable":
+        try:
+            return cls(
+                version=str(data["version"]),
+                base=data["base"],
+                periods=[
+                    (
+                        date.fromisoformat(period["effective_date"]),
+                        {code: Decimal(str(rate)) for code, rate in period["rates"].items()},
+                    )
+                    for period in data["rates"]
+                ],
+            )
+        except (KeyError, TypeError, ValueError, ArithmeticError) as exc:
+            raise FXRateError(f"Invalid FX rate table: {exc}") from exc
+
+    @classmethod
+    def load(cls, path: Path) -> "FXRateTable":
+        return cls.from_dict(json.loads(Path(path).read_text(encoding="utf-8")))
+
+    def effective_date(self, day: date) -> date:
+        """day에 적용되는 환율의 적용일"""
+        return self.effective_dates[self._period(day)]
+
+    def factor(self, source: str, target: str, day: date) -> Decimal:
+        """source 1 단위 → target 금액 계수"""
+        rates = self._rates[self._period(day)]
+        return self._factor(rates, source, target)
+
+    def convert(
+        self,
+        by_currency: Dict[str, Dict[str, Any]],
+        target: str,
+        day: date,
+    ) -> CurrencyConversion:
+        """
+        통화별 소계 → 보고 통화 합계.
+        통화별 환산 값은 반올림하지 않고 합산한 뒤 보고 통화 최소 단위로 한 번만 반올림.
+        """
+        period = self._period(day)
+        rates = self._rates[period]
+        projected = Decimal("0")
+        actual = Decimal("0")
+        factors: Dict[str, Decimal] = {}
+        for code, bucket in by_currency.items():
+            factor = factors[code] = self._factor(rates, code, target)
+            projected += bucket["projected"] * factor
+            actual += bucket["actual"] * factor
+        projected = quantize(projected, target)
+        actual = quantize(actual, target)
+        return CurrencyConversion(
+            currency=target,
+            rates_version=self.version,
+            rate_date=self.effective_dates[period],
+            total_projected=projected,
+            total_actual=actual,
+            total_variance=projected - actual,
+            rates=factors,
+        )
+
+    def _period(self, day: date) -> int:
+        position = bisect_right(self.effective_dates, day) - 1
+        if position < 0:
+            raise FXRateError(f"No FX rates effective on {day} (first: {self.effective_dates[0]})")
+        return position
+
+    @staticmethod
+    def _factor(rates: Dict[str, Decimal], source: str, target: str) -> Decimal:
+        if source == target:
+            return Decimal("1")
+        for code in (source, target):
+            if code not in rates or code not in CURRENCY_EXPONENTS:
+                raise FXRateError(f"No FX rate for {code}")
+        return rates[target] / rates[source]
+
+
+# =============================================================================
+# FILE SOURCE
+# =============================================================================
+
+class FXRateSource:
+    """환율 파일 로더 (mtime이 바뀌면 다시 로드)"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = Path(path or os.environ.get("FINANCE_FX_RATES_PATH", DEFAULT_RATES_PATH))
+        self._table: Optional[FXRateTable] = None
+        self._mtime: Optional[int] = None
+
+    def table(self) -> FXRateTable:
+        try:
+            mtime = self.path.stat().st_mtime_ns
+        except OSError as exc:
+            raise FXRateError(f"FX rate file unavailable: {self.path}") from exc
+        if self._table is None or mtime != self._mtime:
+            self._table = FXRateTable.load(self.path)
+            self._mtime = mtime
+        return self._table
+
+
+# =============================================================================
+# CONVERTER
+# =============================================================================
+
+class CurrencyConverter:
+    """환산 결과 LRU 캐시 (키: 호출자 캐시 키 + 보고 통화 + 환율 버전 + 적용일)"""
+
+    def __init__(self, source: FXRateSource, max_entries: int = 4096):
+        self.source = source
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[Hashable, CurrencyConversion]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def convert(
+        self,
+        by_currency: Dict[str, Dict[str, Any]],
+        target: str,
+        day: date,
+        cache_key: Optional[Hashable] = None,
+    ) -> CurrencyConversion:
+        """
+        통화별 소계 → 보고 통화 환산.
+        cache_key는 by_currency 내용이 같을 때만 같아야 한다 (예: (event_id, 이벤트 리비전)).
+        """
+        table = self.source.table()
+        if cache_key is None:
+            return table.convert(by_currency, target, day)
+
+        key = (cache_key, target, table.version, table.effective_date(day))
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        conversion = self._cache[key] = table.convert(by_currency, target, day)
+        if len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+        return conversion
@@ -0,0 +1,207 @@
+"""
+Background Jobs
+
+요청 밖에서 실행하는 비동기 작업 큐 (리포트 생성 등).
+- submit: 작업 ID를 바로 반환, 실행은 백그라운드 태스크 (동시 실행 수 제한: 세마포어)
+- 같은 키의 작업이 대기 / 실행 중이면 새로 만들지 않고 그 작업을 반환 (중복 제거)
+- 대기 작업이 max_queued개면 QueueFull (호출 측에서 503 + Retry-After)
+- CPU 계산 단계는 run_in_pool로 전용 스레드 풀에서 실행 → 이벤트 루프는 다른 요청 처리
+- 완료된 작업은 최근 retention개만 보관 (조회 / 대기용)
+- 지표: 대기 / 실행 중 작업 수, 제출 / 중복 / 거부 / 성공 / 실패 수, 대기 시간 · 실행 시간 히스토그램
+
+작업 상태는 프로세스 로컬 (여러 워커 프로세스면 작업을 만든 워커에서만 조회 가능).
+
+Author: Event Agent System
+"""
+
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from enum import Enum
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Set, Tuple, TypeVar
+from uuid import UUID, uuid4
+
+from services.metrics import Histogram
+
+
+R = TypeVar("R")
+
+# 작업 대기 / 실행 시간 히스토그램 버킷 (초)
+JOB_DURATION_BUCKETS: Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0,
+)
+
+
+class JobStatus(str, Enum):
+    """작업 상태"""
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class QueueFull(Exception):
+    """대기 작업 수 한도 초과"""
+
+
+class Job:
+    """단일 작업 상태 (이벤트 루프 스레드에서만 갱신)"""
+
+    __slots__ = (
+        "id", "key", "payload", "status", "created_at", "started_at", "finished_at",
+        "result", "error", "done", "_queued", "_started",
+    )
+
+    def __init__(self, key: Hashable, payload: Any = None):
+        self.id: UUID = uuid4()
+        self.key = key
+        self.payload = payload
+        self.status = JobStatus.QUEUED
+        self.created_at = datetime.utcnow()
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.done = asyncio.Event()
+        self._queued = perf_counter()
+        self._started = 0.0
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (JobStatus.SUCCEEDED, JobStatus.FAILED)
+
+
+class JobQueue:
+    """키 단위 중복 제거 + 동시 실행 수 제한 작업 큐"""
+
+    def __init__(self, workers: int = 2, max_queued: int = 100, retention: int = 1000):
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        self.workers = workers
+        self.max_queued = max_queued
+        self.retention = retention
+        self._slots = asyncio.Semaphore(workers)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._jobs: Dict[UUID, Job] = {}
+        self._active: Dict[Hashable, Job] = {}
+        self._finished: "OrderedDict[UUID, None]" = OrderedDict()
+        self._tasks: Set["asyncio.Task[None]"] = set()
+        self.queued = 0
+        self.running = 0
+        self.submitted = 0
+        self.deduplicated = 0
+        self.rejected = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.wait_time = Histogram(JOB_DURATION_BUCKETS)
+        self.run_time = Histogram(JOB_DURATION_BUCKETS)
+
+    # -------------------------------------------------------------------------
+    # 제출 / 조회
+    # -------------------------------------------------------------------------
+
+    def submit(
+        self, key: Hashable, run: Callable[[], Awaitable[Any]], payload: Any = None
+    ) -> Tuple[Job, bool]:
+        """
+        작업 제출 → (작업, 새로 만들었는지). payload는 상태 조회용 요청 내용.
+        같은 키의 작업이 대기 / 실행 중이면 그 작업을 반환하고 run은 실행하지 않는다.
+        """
+        active = self._active.get(key)
+        if active is not None:
+            self.deduplicated += 1
+            return active, False
+        if self.queued >= self.max_queued:
+            self.rejected += 1
+            raise QueueFull(f"{self.queued} jobs are already queued")
+
+        job = Job(key, payload)
+        self._jobs[job.id] = job
+        self._active[key] = job
+        self.queued += 1
+        self.submitted += 1
+        task = asyncio.create_task(self._execute(job, run))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return job, True
+
+    def get(self, job_id: UUID) -> Optional[Job]:
+        return self._jobs.get(job_id)
+
+    async def wait(self, job: Job, timeout: float) -> Job:
+        """작업 완료까지 최대 timeout초 대기 (시간 초과 시 현재 상태 그대로 반환)"""
+        if not job.finished and timeout > 0:
+            try:
+                await asyncio.wait_for(job.done.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        return job
+
+    async def run_in_pool(self, fn: Callable[..., R], *args: Any) -> R:
+        """CPU 계산을 작업 전용 스레드 풀에서 실행"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="finance-jobs")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, fn, *args)
+
+    # -------------------------------------------------------------------------
+    # 실행
+    # -------------------------------------------------------------------------
+
+    async def _execute(self, job: Job, run: Callable[[], Awaitable[Any]]) -> None:
+        try:
+            async with self._slots:
+                self.queued -= 1
+                self.running += 1
+                job.status = JobStatus.RUNNING
+                job.started_at = datetime.utcnow()
+                job._started = perf_counter()
+                self.wait_time.observe(job._started - job._queued)
+                try:
+                    job.result = await run()
+                    job.status = JobStatus.SUCCEEDED
+                    self.succeeded += 1
+                except Exception as exc:
+                    job.error = str(getattr(exc, "detail", None) or exc) or type(exc).__name__
+                    job.status = JobStatus.FAILED
+                    self.failed += 1
+                finally:
+                    self.running -= 1
+                    self.run_time.observe(perf_counter() - job._started)
+        finally:
+            job.finished_at = datetime.utcnow()
+            if self._active.get(job.key) is job:
+                del self._active[job.key]
+            self._retain(job)
+            job.done.set()
+
+    def _retain(self, job: Job) -> None:
+        self._finished[job.id] = None
+        while len(self._finished) > self.retention:
+            expired, _ = self._finished.popitem(last=False)
+            self._jobs.pop(expired, None)
+
+    async def close(self) -> None:
+        """대기 / 실행 중 작업 취소, 스레드 풀 종료"""
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "queued": self.queued,
+            "running": self.running,
+            "submitted": self.submitted,
+            "deduplicated": self.deduplicated,
+            "rejected": self.rejected,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "wait_time": self.wait_time,
+            "run_time": self.run_time,
+        }
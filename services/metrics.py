@@ -0,0 +1,298 @@
+"""
+Request Metrics
+
+라우트별 요청 지표 수집 및 Prometheus 텍스트 포맷 출력.
+- 순수 ASGI 미들웨어 (BaseHTTPMiddleware 미사용 → 요청당 오버헤드 수 µs 이내)
+- 라우트 템플릿(/finance/budget-items/{item_id}) 단위로 집계 → 라벨 카디널리티 고정
+- 지연 / 응답 크기 히스토그램, 상태 코드별 요청 수, 오류 수(5xx·예외), 처리 중 요청 수
+- 저장소 통계(FinanceRepository.stats)를 함께 출력 (저널 사용 시 commit / 스냅샷 / 복구 지표 포함)
+- 백그라운드 작업 큐 지표 (대기 / 실행 중 작업 수, 대기 · 실행 시간 히스토그램)
+- 콜드 스타트 단계별 소요 시간 (모듈 로드 / 저장소 복구 / 워밍업 / 첫 응답)
+
+Author: Event Agent System
+"""
+
+from bisect import bisect_left
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# 지연 히스토그램 버킷 (초)
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+# 응답 크기 히스토그램 버킷 (bytes)
+SIZE_BUCKETS: Tuple[float, ...] = (
+    256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216,
+)
+
+# 라우트에 매칭되지 않은 요청 (404 등) 라벨
+UNMATCHED_ROUTE = "<unmatched>"
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+# =============================================================================
+# HISTOGRAM
+# =============================================================================
+
+class Histogram:
+    """고정 버킷 히스토그램 (버킷별 개수는 비누적으로 저장, 출력 시 누적)"""
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def render(self, name: str, labels: str, lines: List[str]) -> None:
+        cumulative = 0
+        for bound, count in zip(self.bounds, self.counts):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{labels},le="{bound:g}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {self.count}')
+        lines.append(f"{name}_sum{{{labels}}} {self.sum!r}")
+        lines.append(f"{name}_count{{{labels}}} {self.count}")
+
+
+class RouteMetrics:
+    """단일 (method, route) 지표"""
+
+    __slots__ = ("latency", "size", "statuses", "errors")
+
+    def __init__(self):
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.size = Histogram(SIZE_BUCKETS)
+        self.statuses: Dict[int, int] = {}
+        self.errors = 0
+
+
+# =============================================================================
+# REGISTRY
+# =============================================================================
+
+class RequestMetrics:
+    """라우트별 요청 지표 저장소 (이벤트 루프 스레드에서만 갱신)"""
+
+    def __init__(self, started: Optional[float] = None):
+        self.routes: Dict[Tuple[str, str], RouteMetrics] = {}
+        self.in_flight = 0
+        # 콜드 스타트 기준 시각 (perf_counter, 기본: 생성 시각)과 단계별 경과 시간 (초)
+        self.started = perf_counter() if started is None else started
+        self.startup: Dict[str, float] = {}
+
+    def mark_startup(self, phase: str) -> None:
+        """콜드 스타트 단계 완료 기록 (단계별 최초 1회만)"""
+        if phase not in self.startup:
+            self.startup[phase] = perf_counter() - self.started
+
+    def observe(self, method: str, route: str, status: int, seconds: float, size: int) -> None:
+        key = (method, route)
+        metrics = self.routes.get(key)
+        if metrics is None:
+            metrics = self.routes[key] = RouteMetrics()
+        metrics.latency.observe(seconds)
+        metrics.size.observe(size)
+        metrics.statuses[status] = metrics.statuses.get(status, 0) + 1
+        if status >= 500:
+            metrics.errors += 1
+
+    def render(self, lines: List[str]) -> None:
+        """Prometheus 텍스트 포맷으로 lines에 추가"""
+        routes = sorted(self.routes.items())
+
+        lines.append("# HELP app_startup_seconds Seconds from module load start to each cold-start phase.")
+        lines.append("# TYPE app_startup_seconds gauge")
+        for phase, seconds in self.startup.items():
+            lines.append(f'app_startup_seconds{{phase="{phase}"}} {seconds!r}')
+
+        lines.append("# HELP http_requests_in_flight Requests currently being processed.")
+        lines.append("# TYPE http_requests_in_flight gauge")
+        lines.append(f"http_requests_in_flight {self.in_flight}")
+
+        lines.append("# HELP http_requests_total Completed requests by route and status code.")
+        lines.append("# TYPE http_requests_total counter")
+        for (method, route), metrics in routes:
+            for status, count in sorted(metrics.statuses.items()):
+                lines.append(
+                    f'http_requests_total{{{_route_labels(method, route)},status="{status}"}} {count}'
+                )
+
+        lines.append("# HELP http_request_errors_total Requests that failed with 5xx or an exception.")
+        lines.append("# TYPE http_request_errors_total counter")
+        for (method, route), metrics in routes:
+            lines.append(f"http_request_errors_total{{{_route_labels(method, route)}}} {metrics.errors}")
+
+        lines.append("# HELP http_request_duration_seconds Request latency by route.")
+        lines.append("# TYPE http_request_duration_seconds histogram")
+        for (method, route), metrics in routes:
+            metrics.latency.render("http_request_duration_seconds", _route_labels(method, route), lines)
+
+        lines.append("# HELP http_response_size_bytes Response body size by route.")
+        lines.append("# TYPE http_response_size_bytes histogram")
+        for (method, route), metrics in routes:
+            metrics.size.render("http_response_size_bytes", _route_labels(method, route), lines)
+
+
+def _route_labels(method: str, route: str) -> str:
+    return f'method="{method}",route="{_escape(route)}"'
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# =============================================================================
+# MIDDLEWARE
+# =============================================================================
+
+class MetricsMiddleware:
+    """
+    요청 지표 수집 ASGI 미들웨어.
+
+    라우팅 후 scope["route"]에 기록되는 라우트 템플릿을 라벨로 사용하며,
+    응답 시작 메시지에서 상태 코드를, 본문 메시지에서 크기를 집계한다.
+    """
+
+    def __init__(self, app, metrics: RequestMetrics):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        size = 0
+
+        async def send_wrapper(message):
+            nonlocal status, size
+            if message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            elif message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        metrics = self.metrics
+        metrics.in_flight += 1
+        start = perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception:
+            status = 500
+            raise
+        finally:
+            elapsed = perf_counter() - start
+            metrics.in_flight -= 1
+            if "first_response" not in metrics.startup:
+                metrics.mark_startup("first_response")
+            route = scope.get("route")
+            metrics.observe(
+                scope["method"],
+                getattr(route, "path", UNMATCHED_ROUTE),
+                status,
+                elapsed,
+                size,
+            )
+
+
+# =============================================================================
+# EXPOSITION
+# =============================================================================
+
+def render_store_stats(backend: str, stats: Dict[str, Any], lines: List[str]) -> None:
+    """FinanceRepository.stats() 결과 → Prometheus 텍스트"""
+    collections = sorted(stats["collections"].items())
+    gauges = (
+        ("records", "finance_store_records", "Records per collection."),
+        ("indexes", "finance_store_indexes", "Secondary indexes per collection."),
+        ("index_keys", "finance_store_index_keys", "Distinct secondary index keys per collection."),
+        ("route_cache", "finance_store_route_cache", "Cached record id to shard routes per collection."),
+    )
+    for key, name, help_text in gauges:
+        values = [(collection, s[key]) for collection, s in collections if key in s]
+        if not values:
+            continue
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} gauge")
+        for collection, value in values:
+            lines.append(f'{name}{{backend="{backend}",collection="{collection}"}} {value}')
+
+    cache = stats["aggregate_cache"]
+    for key in ("hits", "misses"):
+        name = f"finance_aggregate_cache_{key}_total"
+        lines.append(f"# HELP {name} Budget aggregate lookups ({key}).")
+        lines.append(f"# TYPE {name} counter")
+        lines.append(f'{name}{{backend="{backend}"}} {cache[key]}')
+
+    journal = stats.get("journal")
+    if journal:
+        series = (
+            ("appended", "finance_journal_records_total", "counter", "Changes appended to the journal buffer."),
+            ("commits", "finance_journal_commits_total", "counter", "Journal group commits (write + fsync)."),
+            ("committed_bytes", "finance_journal_bytes_total", "counter", "Bytes written to journal segments."),
+            ("commit_seconds", "finance_journal_commit_seconds_total", "counter", "Time spent in journal commits."),
+            ("errors", "finance_journal_errors_total", "counter", "Failed journal commits or snapshots."),
+            ("pending", "finance_journal_pending", "gauge", "Buffered changes not yet committed."),
+            ("since_snapshot", "finance_journal_since_snapshot", "gauge", "Changes journaled since the last snapshot."),
+            ("snapshot_records", "finance_snapshot_records", "gauge", "Records in the last snapshot."),
+            ("snapshot_seconds", "finance_snapshot_seconds", "gauge", "Duration of the last snapshot write."),
+            ("recovery_seconds", "finance_recovery_seconds", "gauge", "Snapshot load + journal replay time at startup."),
+        )
+        for key, name, kind, help_text in series:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.append(f'{name}{{backend="{backend}"}} {journal[key]}')
+
+
+def render_job_stats(job_stats: Dict[str, Dict[str, Any]], lines: List[str]) -> None:
+    """JobQueue.stats() 결과 (큐 이름 → 통계) → Prometheus 텍스트"""
+    queues = sorted(job_stats.items())
+    series = (
+        ("queued", "finance_jobs_queued", "gauge", "Jobs waiting for a worker slot."),
+        ("running", "finance_jobs_running", "gauge", "Jobs currently running."),
+        ("workers", "finance_jobs_workers", "gauge", "Maximum concurrently running jobs."),
+        ("submitted", "finance_jobs_submitted_total", "counter", "Jobs created."),
+        ("deduplicated", "finance_jobs_deduplicated_total", "counter", "Requests joined to an existing job."),
+        ("rejected", "finance_jobs_rejected_total", "counter", "Requests rejected because the queue was full."),
+        ("succeeded", "finance_jobs_succeeded_total", "counter", "Jobs finished successfully."),
+        ("failed", "finance_jobs_failed_total", "counter", "Jobs finished with an error."),
+    )
+    for key, name, kind, help_text in series:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        for queue, stats in queues:
+            lines.append(f'{name}{{queue="{queue}"}} {stats[key]}')
+
+    histograms = (
+        ("wait_time", "finance_job_wait_seconds", "Time from submission to start."),
+        ("run_time", "finance_job_duration_seconds", "Job run time."),
+    )
+    for key, name, help_text in histograms:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} histogram")
+        for queue, stats in queues:
+            stats[key].render(name, f'queue="{queue}"', lines)
+
+
+def render_prometheus(
+    metrics: RequestMetrics,
+    backend: str,
+    store_stats: Dict[str, Any],
+    job_stats: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> str:
+    lines: List[str] = []
+    metrics.render(lines)
+    render_store_stats(backend, store_stats, lines)
+    if job_stats:
+        render_job_stats(job_stats, lines)
+    lines.append("")
+    return "\n".join(lines)
@@ -0,0 +1,306 @@
+"""
+Pricing Tier Index
+
+이벤트 가격 등급을 적용 기간(valid_from ~ valid_until) 구간 인덱스로 유지.
+- 등급 경계 시각 m개 → 기본 구간(slot) 2m+1개: 경계 사이의 열린 구간과 경계 시각 자체
+  (적용 기간은 양 끝을 포함하므로 경계 시각에만 겹치는 등급이 있을 수 있음)
+- 구간별 구매 가능 등급(매진 제외)을 가격순으로 미리 계산 → 시각 T 조회는 이분 탐색 O(log m)
+- 대량 견적: 등록 시각(epoch 마이크로초 int64) 배열을 np.searchsorted로 한 번에 구간에 매핑, 금액은 통화 최소 단위 정수
+  (consume_capacity면 등록 시각 순서대로 남은 수량을 소진하며 가장 싼 등급부터 배정)
+- 인덱스는 (이벤트, 리비전) 단위로 한 번 만들고 캐시 (등급 판매 수량이 바뀌면 리비전이 달라져 재구성)
+
+구성 비용은 O(등급 수 × 구간 수) — 이벤트당 등급은 수십 개 이하를 가정.
+NumPy는 대량 견적에서만 임포트 (콜드 스타트 경로에서 제외).
+
+Author: Event Agent System
+"""
+
+from bisect import bisect_left
+from collections import OrderedDict
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from schemas.financial import CurrencyCode, PricingTier, utc_naive
+from schemas.money import from_minor, to_minor
+
+
+# =============================================================================
+# MODELS
+# =============================================================================
+
+class TierPrice(BaseModel):
+    """특정 시각에 구매 가능한 가격 등급"""
+    tier_id: UUID = Field(..., description="가격 등급 ID")
+    name: str = Field(..., description="등급명")
+    currency: CurrencyCode = Field(..., description="통화")
+    base_price: Decimal = Field(..., description="기본 가격 (통화 최소 단위 반올림)")
+    member_price: Decimal = Field(..., description="회원 가격 (통화 최소 단위 반올림)")
+    remaining: Optional[int] = Field(default=None, description="남은 판매 수량 (무제한이면 null)")
+    valid_from: Optional[datetime] = Field(default=None, description="적용 시작일")
+    valid_until: Optional[datetime] = Field(default=None, description="적용 종료일")
+
+
+class AvailableTiers(BaseModel):
+    """시각 T의 구매 가능 등급 (가격 오름차순)"""
+    event_id: UUID
+    at: datetime
+    tiers: List[TierPrice] = Field(default_factory=list)
+
+
+class TierQuote(BaseModel):
+    """대량 견적의 등급별 배정 결과"""
+    tier_id: UUID
+    name: str
+    currency: CurrencyCode
+    registrations: int = Field(..., description="배정된 등록 수")
+    members: int = Field(..., description="그중 회원 수")
+    revenue: Decimal = Field(..., description="예상 수익")
+    remaining: Optional[int] = Field(default=None, description="배정 후 남은 수량 (무제한이면 null)")
+
+
+class PriceQuote(BaseModel):
+    """대량 등록 견적 (수익 예측)"""
+    event_id: UUID
+    registrations: int = Field(..., description="견적 요청 등록 수")
+    priced: int = Field(..., description="가격이 정해진 등록 수")
+    unpriced: int = Field(..., description="구매 가능 등급이 없는 등록 수")
+    revenue: Dict[str, Decimal] = Field(default_factory=dict, description="통화별 예상 수익")
+    tiers: List[TierQuote] = Field(default_factory=list)
+    tier_ids: Optional[List[Optional[UUID]]] = Field(
+        default=None, description="등록별 배정 등급 (요청 순서, 등급 없음은 null)"
+    )
+    prices: Optional[List[Optional[Decimal]]] = Field(
+        default=None, description="등록별 가격 (요청 순서, 등급 없음은 null)"
+    )
+
+
+# =============================================================================
+# INDEX
+# =============================================================================
+
+EPOCH = datetime(1970, 1, 1)
+EPOCH_UTC = EPOCH.replace(tzinfo=timezone.utc)
+
+
+def epoch_micros(at: datetime) -> int:
+    """시각 → UTC epoch 마이크로초 (시간대 없으면 UTC; np.datetime64 변환보다 수 배 빠름)"""
+    delta = at - (EPOCH if at.tzinfo is None else EPOCH_UTC)
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+class PricingIndex:
+    """
+    이벤트 가격 등급 구간 인덱스.
+
+    points는 정렬된 고유 경계 시각. 구간 2i는 points[i] 직전의 열린 구간
+    (2m은 마지막 경계 이후), 구간 2i+1은 시각 points[i] 자체.
+    slots[s]는 구간 s에서 구매 가능한 등급 코드(tiers 위치, 가격순) 튜플.
+    """
+
+    def __init__(self, event_id: UUID, tiers: Sequence[PricingTier]):
+        self.event_id = event_id
+        self.tiers: List[PricingTier] = sorted(tiers, key=lambda t: (t.base_price, t.created_at, t.id))
+        self.points: List[datetime] = sorted({
+            utc_naive(bound)
+            for tier in self.tiers
+            for bound in (tier.valid_from, tier.valid_until)
+            if bound is not None
+        })
+        last = 2 * len(self.points)
+        slots: List[List[int]] = [[] for _ in range(last + 1)]
+        for code, tier in enumerate(self.tiers):
+            if tier.sold_out:
+                continue
+            first = 0 if tier.valid_from is None else self._point_slot(tier.valid_from)
+            final = last if tier.valid_until is None else self._point_slot(tier.valid_until)
+            for slot in range(first, final + 1):
+                slots[slot].append(code)
+        self.slots: List[Tuple[int, ...]] = [tuple(codes) for codes in slots]
+
+        self.base_units = [to_minor(t.base_price, t.currency.value) for t in self.tiers]
+        self.member_units = [to_minor(t.member_price, t.currency.value) for t in self.tiers]
+
+    def _point_slot(self, bound: datetime) -> int:
+        return 2 * bisect_left(self.points, utc_naive(bound)) + 1
+
+    def slot(self, at: datetime) -> int:
+        """시각 → 구간 번호"""
+        at = utc_naive(at)
+        i = bisect_left(self.points, at)
+        return 2 * i + 1 if i < len(self.points) and self.points[i] == at else 2 * i
+
+    def remaining(self, code: int) -> Optional[int]:
+        tier = self.tiers[code]
+        return None if tier.max_quantity is None else tier.max_quantity - tier.sold_quantity
+
+    def tier_price(self, code: int) -> TierPrice:
+        tier = self.tiers[code]
+        currency = tier.currency.value
+        return TierPrice(
+            tier_id=tier.id,
+            name=tier.name,
+            currency=tier.currency,
+            base_price=from_minor(self.base_units[code], currency),
+            member_price=from_minor(self.member_units[code], currency),
+            remaining=self.remaining(code),
+            valid_from=tier.valid_from,
+            valid_until=tier.valid_until,
+        )
+
+    def available(self, at: datetime) -> AvailableTiers:
+        """시각 at에 구매 가능한 등급 (가격 오름차순)"""
+        return AvailableTiers(
+            event_id=self.event_id,
+            at=at,
+            tiers=[self.tier_price(code) for code in self.slots[self.slot(at)]],
+        )
+
+    # -------------------------------------------------------------------------
+    # 대량 견적
+    # -------------------------------------------------------------------------
+
+    def quote(
+        self,
+        timestamps: Sequence[datetime],
+        members: Optional[Sequence[bool]] = None,
+        consume_capacity: bool = True,
+        include_quotes: bool = False,
+    ) -> PriceQuote:
+        """
+        등록 (시각, 회원 여부) 목록의 가격 배정 및 예상 수익.
+        consume_capacity=False면 각 등록은 그 시각의 가장 싼 등급 (수량 소진 없음).
+        """
+        import numpy as np
+
+        n = len(timestamps)
+        if members is not None and len(members) != n:
+            raise ValueError("members must have the same length as timestamps")
+        at = np.fromiter(map(epoch_micros, timestamps), dtype=np.int64, count=n)
+        member = np.zeros(n, dtype=bool) if members is None else np.asarray(members, dtype=bool).reshape(n)
+
+        points = np.array([epoch_micros(p) for p in self.points], dtype=np.int64)
+        position = np.searchsorted(points, at, side="left")
+        exact = np.zeros(n, dtype=bool)
+        inside = position < len(self.points)
+        exact[inside] = points[position[inside]] == at[inside]
+        slot = 2 * position + exact
+
+        remaining = [self.remaining(code) for code in range(len(self.tiers))]
+        if consume_capacity:
+            tier = self._consume(np, at, slot, remaining)
+        else:
+            cheapest = np.array([codes[0] if codes else -1 for codes in self.slots], dtype=np.int64)
+            tier = cheapest[slot]
+
+        count = len(self.tiers)
+        priced = tier >= 0
+        registrations = np.bincount(tier[priced], minlength=count).tolist()
+        member_counts = np.bincount(tier[priced & member], minlength=count).tolist()
+
+        revenue: Dict[str, int] = {}
+        tiers: List[TierQuote] = []
+        for code, tier_model in enumerate(self.tiers):
+            if not registrations[code]:
+                continue
+            currency = tier_model.currency.value
+            units = (
+                (registrations[code] - member_counts[code]) * self.base_units[code]
+                + member_counts[code] * self.member_units[code]
+            )
+            revenue[currency] = revenue.get(currency, 0) + units
+            tiers.append(TierQuote(
+                tier_id=tier_model.id,
+                name=tier_model.name,
+                currency=tier_model.currency,
+                registrations=registrations[code],
+                members=member_counts[code],
+                revenue=from_minor(units, currency),
+                remaining=remaining[code],
+            ))
+
+        result = PriceQuote(
+            event_id=self.event_id,
+            registrations=n,
+            priced=int(priced.sum()),
+            unpriced=n - int(priced.sum()),
+            revenue={currency: from_minor(units, currency) for currency, units in sorted(revenue.items())},
+            tiers=tiers,
+        )
+        if include_quotes:
+            # 가격표: [기본가 × 등급, 회원가 × 등급, 등급 없음]
+            ids: List[Optional[UUID]] = [t.id for t in self.tiers] + [None]
+            table: List[Optional[Decimal]] = [
+                from_minor(units, t.currency.value)
+                for units_list in (self.base_units, self.member_units)
+                for units, t in zip(units_list, self.tiers)
+            ] + [None]
+            codes = np.where(priced, tier, count)
+            result.tier_ids = [ids[c] for c in codes.tolist()]
+            result.prices = [table[c] for c in np.where(priced, tier + member * count, 2 * count).tolist()]
+        return result
+
+    def _consume(self, np: Any, at: Any, slot: Any, remaining: List[Optional[int]]) -> Any:
+        """
+        등록 시각 순서대로 구간별 등록 수를 가장 싼 등급부터 남은 수량만큼 배정.
+        구간은 시각 순서이므로 시각 정렬 후 구간 번호도 정렬되어 있고,
+        배정 결과는 (등급, 개수) 연속 구간으로 만든 뒤 np.repeat로 한 번에 펼친다.
+        remaining은 배정 후 남은 수량으로 갱신된다.
+        """
+        order = np.argsort(at, kind="stable")
+        per_slot = np.bincount(slot, minlength=len(self.slots))
+        codes: List[int] = []
+        takes: List[int] = []
+        for s in np.flatnonzero(per_slot).tolist():
+            left = int(per_slot[s])
+            for code in self.slots[s]:
+                capacity = remaining[code]
+                take = left if capacity is None else min(capacity, left)
+                if take:
+                    codes.append(code)
+                    takes.append(take)
+                    left -= take
+                    if capacity is not None:
+                        remaining[code] = capacity - take
+                if not left:
+                    break
+            if left:
+                codes.append(-1)
+                takes.append(left)
+
+        tier = np.empty(len(slot), dtype=np.int64)
+        tier[order] = np.repeat(np.array(codes, dtype=np.int64), np.array(takes, dtype=np.int64))
+        return tier
+
+
+class PricingIndexCache:
+    """(이벤트, 리비전) → PricingIndex LRU 캐시"""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[UUID, Tuple[Hashable, PricingIndex]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    async def get(
+        self,
+        event_id: UUID,
+        revision: Hashable,
+        build: Callable[[], Awaitable[PricingIndex]],
+    ) -> PricingIndex:
+        entry = self._entries.get(event_id)
+        if entry is not None and entry[0] == revision:
+            self._entries.move_to_end(event_id)
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        index = await build()
+        self._entries[event_id] = (revision, index)
+        self._entries.move_to_end(event_id)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return index
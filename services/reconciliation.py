@@ -0,0 +1,239 @@
+"""
+Transaction Reconciliation
+
+거래 원장(Transaction)과 예산 항목(BudgetLineItem) 대사.
+- 예산 항목으로 해시 테이블 3개를 한 번 만들고, 미대사 거래를 한 번씩 조회 (hash join)
+  1) budget_line_item_id → 항목 ID
+  2) (이벤트, 참조 번호) → 항목 (정규화: 앞뒤 공백 제거, 대문자)
+  3) (이벤트, 거래처명, 통화, 금액) → 항목 (거래처명 정규화: 공백 정리, casefold /
+     금액: 항목의 projected_amount와 값 비교)
+  → 거래 n건, 항목 m건에 대해 O(n + m), 거래별 항목 스캔 없음
+- 같은 키에 항목이 둘 이상이면 그 키는 모호(ambiguous)로 표시하고 매칭하지 않음
+- 매칭된 거래의 금액을 항목별로 합산하여 actual_amount에 반영
+  EXPENSE: +금액, REFUND: −금액, ADJUSTMENT: 부호 그대로 / INCOME: 예산 항목 대사 대상 아님
+- 매칭되지 않은 거래는 사유와 함께 반환 (is_reconciled=False 유지)
+
+Author: Event Agent System
+"""
+
+from decimal import Decimal
+from enum import Enum
+from typing import Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from schemas.financial import BudgetLineItem, CurrencyCode, Transaction, TransactionType
+
+
+class MatchRule(str, Enum):
+    """매칭 규칙 (적용 순서)"""
+    BUDGET_ITEM_ID = "budget_item_id"
+    REFERENCE_NUMBER = "reference_number"
+    VENDOR_AMOUNT = "vendor_amount"
+
+
+class UnmatchedReason(str, Enum):
+    """미매칭 사유"""
+    UNKNOWN_BUDGET_ITEM = "unknown_budget_item"
+    CURRENCY_MISMATCH = "currency_mismatch"
+    AMBIGUOUS = "ambiguous"
+    NO_MATCH = "no_match"
+
+
+class UnmatchedTransaction(BaseModel):
+    """대사되지 않은 거래"""
+    transaction_id: UUID
+    event_id: UUID
+    reason: UnmatchedReason
+    reference_number: Optional[str] = None
+    vendor_name: Optional[str] = None
+    amount: str
+    currency: str
+
+
+class ReconciliationResult(BaseModel):
+    """대사 실행 결과"""
+    dry_run: bool = Field(..., description="true면 결과만 계산하고 저장하지 않음")
+    scanned: int = Field(..., description="검사한 미대사 거래 수")
+    matched: int = Field(..., description="예산 항목에 매칭된 거래 수")
+    matched_by: Dict[MatchRule, int] = Field(default_factory=dict, description="규칙별 매칭 수")
+    unmatched: int = Field(..., description="매칭되지 않은 거래 수")
+    skipped: int = Field(..., description="대사 대상이 아닌 거래 수 (INCOME)")
+    updated_items: int = Field(..., description="actual_amount가 갱신된 예산 항목 수")
+    unmatched_transactions: List[UnmatchedTransaction] = Field(default_factory=list)
+    unmatched_truncated: bool = False
+
+
+# 같은 키에 항목이 여럿인 경우의 표식 (항목 위치 대신 저장)
+AMBIGUOUS = -1
+
+# 규칙별 카운터 위치 (루프 안에서 Enum 해시를 피하기 위해 정수 사용)
+RULES = list(MatchRule)
+BY_ID, BY_REFERENCE, BY_VENDOR_AMOUNT = range(len(RULES))
+
+# 루프 안 Enum 클래스 속성 조회(거래당 수 회)를 피하기 위한 상수
+EXPENSE = TransactionType.EXPENSE
+REFUND = TransactionType.REFUND
+ADJUSTMENT = TransactionType.ADJUSTMENT
+
+
+def normalize_reference(reference: Optional[str]) -> Optional[str]:
+    if not reference:
+        return None
+    return reference.strip().upper() or None
+
+
+def normalize_vendor(vendor: Optional[str]) -> Optional[str]:
+    if not vendor:
+        return None
+    return " ".join(vendor.split()).casefold() or None
+
+
+# =============================================================================
+# INDEX
+# =============================================================================
+
+class BudgetItemIndex:
+    """
+    대사용 예산 항목 해시 테이블 (ID / 참조 번호 / 거래처+금액 → 항목 위치).
+
+    UUID 키는 `.int`(정수)로 저장한다. UUID.__hash__는 파이썬 레벨 호출이라
+    거래마다 두세 번씩 해시하면 전체 매칭 시간의 상당 부분을 차지한다.
+    금액 키는 Decimal 그대로 사용 (같은 값이면 자릿수가 달라도 해시가 같음).
+    """
+
+    def __init__(self, items: Iterable[BudgetLineItem]):
+        self.items: List[BudgetLineItem] = list(items)
+        self.by_id: Dict[int, int] = {}
+        self.by_reference: Dict[Tuple[int, str], int] = {}
+        self.by_vendor_amount: Dict[Tuple[int, str, CurrencyCode, Decimal], int] = {}
+        for position, item in enumerate(self.items):
+            self.by_id[item.id.int] = position
+            event = item.event_id.int
+            reference = normalize_reference(item.reference_number)
+            if reference is not None:
+                _put(self.by_reference, (event, reference), position)
+            vendor = normalize_vendor(item.vendor_name)
+            if vendor is not None:
+                _put(self.by_vendor_amount, (event, vendor, item.currency, item.projected_amount), position)
+
+
+def _put(table: Dict, key: Tuple, position: int) -> None:
+    table[key] = position if key not in table else AMBIGUOUS
+
+
+# =============================================================================
+# MATCHING
+# =============================================================================
+
+class ReconciliationPlan:
+    """
+    매칭 결과: 매칭된 거래와 항목(같은 위치끼리 짝), 항목 ID별 actual_amount 변화, 미매칭 목록.
+    거래마다 (거래, 항목) 튜플을 만들지 않도록 두 리스트로 유지 (1M건 대사 시 GC 부담 감소).
+    """
+
+    def __init__(self):
+        self.matched: List[Transaction] = []
+        self.matched_items: List[BudgetLineItem] = []
+        self.deltas: Dict[UUID, Decimal] = {}
+        self.matched_by: Dict[MatchRule, int] = {rule: 0 for rule in MatchRule}
+        self.unmatched: List[Tuple[Transaction, UnmatchedReason]] = []
+        self.scanned = 0
+        self.skipped = 0
+
+    def result(self, dry_run: bool, updated_items: int, max_unmatched: int) -> ReconciliationResult:
+        return ReconciliationResult(
+            dry_run=dry_run,
+            scanned=self.scanned,
+            matched=len(self.matched),
+            matched_by=self.matched_by,
+            unmatched=len(self.unmatched),
+            skipped=self.skipped,
+            updated_items=updated_items,
+            unmatched_transactions=[
+                UnmatchedTransaction(
+                    transaction_id=tx.id,
+                    event_id=tx.event_id,
+                    reason=reason,
+                    reference_number=tx.reference_number,
+                    vendor_name=tx.vendor_name,
+                    amount=str(tx.amount),
+                    currency=tx.currency.value,
+                )
+                for tx, reason in self.unmatched[:max_unmatched]
+            ],
+            unmatched_truncated=len(self.unmatched) > max_unmatched,
+        )
+
+
+def reconcile(transactions: Iterable[Transaction], index: BudgetItemIndex) -> ReconciliationPlan:
+    """
+    미대사 거래를 규칙 순서대로 해시 조회하여 매칭 (거래당 조회 1~3회).
+    budget_line_item_id가 있는 거래는 그 항목에만 매칭한다 (없는 항목이면 미매칭).
+    """
+    plan = ReconciliationPlan()
+    items = index.items
+    by_id = index.by_id
+    by_reference = index.by_reference
+    by_vendor_amount = index.by_vendor_amount
+    matched = plan.matched
+    matched_items = plan.matched_items
+    unmatched = plan.unmatched
+    counts = [0] * len(RULES)
+    deltas: List[Optional[Decimal]] = [None] * len(items)
+    scanned = skipped = 0
+
+    for tx in transactions:
+        scanned += 1
+        kind = tx.transaction_type
+        if kind is EXPENSE or kind is ADJUSTMENT:
+            amount = tx.amount
+        elif kind is REFUND:
+            amount = -tx.amount
+        else:
+            skipped += 1
+            continue
+
+        if tx.budget_line_item_id is not None:
+            rule = BY_ID
+            position = by_id.get(tx.budget_line_item_id.int)
+            if position is None:
+                unmatched.append((tx, UnmatchedReason.UNKNOWN_BUDGET_ITEM))
+                continue
+        else:
+            position = None
+            reference = normalize_reference(tx.reference_number)
+            if reference is not None:
+                rule = BY_REFERENCE
+                position = by_reference.get((tx.event_id.int, reference))
+            if position is None:
+                vendor = normalize_vendor(tx.vendor_name)
+                if vendor is not None:
+                    rule = BY_VENDOR_AMOUNT
+                    position = by_vendor_amount.get((tx.event_id.int, vendor, tx.currency, tx.amount))
+            if position is None:
+                unmatched.append((tx, UnmatchedReason.NO_MATCH))
+                continue
+            if position == AMBIGUOUS:
+                unmatched.append((tx, UnmatchedReason.AMBIGUOUS))
+                continue
+
+        item = items[position]
+        if item.currency is not tx.currency:
+            unmatched.append((tx, UnmatchedReason.CURRENCY_MISMATCH))
+            continue
+        matched.append(tx)
+        matched_items.append(item)
+        counts[rule] += 1
+        total = deltas[position]
+        deltas[position] = amount if total is None else total + amount
+
+    plan.scanned = scanned
+    plan.skipped = skipped
+    plan.matched_by = {rule: counts[position] for position, rule in enumerate(RULES)}
+    plan.deltas = {
+        items[position].id: total for position, total in enumerate(deltas) if total is not None
+    }
+    return plan
+
@@ -0,0 +1,48 @@
+"""
+Fast JSON Response Serialization
+
+응답 모델별로 미리 컴파일한 Pydantic v2 TypeAdapter로 JSON bytes를 직접 생성.
+- jsonable_encoder → dict → json.dumps 중간 단계 없이 pydantic-core(Rust)에서 바로 직렬화
+- 응답 재검증 생략 (엔드포인트가 이미 검증된 모델 인스턴스를 반환)
+- Decimal/UUID/datetime 인코딩은 각 모델 설정을 그대로 따름
+  (예: BudgetLineItem의 json_encoders → Decimal은 float) → 기존 응답과 동일한 JSON
+
+Author: Event Agent System
+"""
+
+from typing import Any, Generic, Mapping, Optional, TypeVar
+
+from fastapi.responses import Response
+from pydantic import TypeAdapter
+
+
+T = TypeVar("T")
+
+
+class JSONBytesResponse(Response):
+    """이미 직렬화된 JSON bytes 응답 (render 단계 없음)"""
+
+    media_type = "application/json"
+
+
+class ResponseSerializer(Generic[T]):
+    """단일 응답 타입의 사전 컴파일된 직렬화기"""
+
+    __slots__ = ("response_type", "adapter")
+
+    def __init__(self, response_type: Any):
+        self.response_type = response_type
+        self.adapter: TypeAdapter[T] = TypeAdapter(response_type)
+
+    def dump(self, value: T) -> bytes:
+        """값 → JSON bytes"""
+        return self.adapter.dump_json(value)
+
+    def response(
+        self,
+        value: T,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> JSONBytesResponse:
+        """값 → JSON 응답 (라우트 데코레이터의 status_code는 적용되지 않으므로 직접 지정)"""
+        return JSONBytesResponse(self.dump(value), status_code=status_code, headers=headers)
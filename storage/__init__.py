@@ -0,0 +1,22 @@
+"""Event Agent Storage"""
+
+from .aggregates import BudgetAggregate, SponsorRevenue
+from .base import ChangeListener, Collection, FinanceRepository, PartialWrite, SoldOut, VersionConflict
+from .memory import BudgetItemStore, IndexedStore, MemoryFinanceRepository, SponsorStore
+from .config import create_repository
+
+__all__ = [
+    "BudgetAggregate",
+    "SponsorRevenue",
+    "ChangeListener",
+    "Collection",
+    "FinanceRepository",
+    "PartialWrite",
+    "SoldOut",
+    "VersionConflict",
+    "BudgetItemStore",
+    "IndexedStore",
+    "MemoryFinanceRepository",
+    "SponsorStore",
+    "create_repository",
+]
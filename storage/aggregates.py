@@ -0,0 +1,207 @@
+"""
+Budget Aggregates
+
+이벤트별 예산 집계를 증분(delta) 방식으로 유지.
+- 총 예상/실제 금액, 카테고리별 projected/actual/count, 상태별 count
+- 통화별 projected/actual/count 소계 (원 통화 Decimal, 항목 금액 그대로 합산)
+- 예산 항목 생성/수정/삭제 시 차이만 반영 → 요약 조회 O(categories)
+- 전체 재계산 결과와 비교하는 정합성 검사 지원
+- 이벤트별 스폰서 상태별 수 / 확정 금액 (리포트 스폰서십 수익 O(statuses))
+
+Author: Event Agent System
+"""
+
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List
+
+from schemas.financial import BudgetLineItem, Sponsor, SponsorshipStatus
+
+
+# =============================================================================
+# PER-EVENT AGGREGATE
+# =============================================================================
+
+class BudgetAggregate:
+    """단일 이벤트의 누적 예산 집계"""
+
+    __slots__ = (
+        "total_items", "total_projected", "total_actual", "by_category", "by_status", "by_currency"
+    )
+
+    def __init__(self):
+        self.total_items = 0
+        self.total_projected = Decimal("0")
+        self.total_actual = Decimal("0")
+        self.by_category: Dict[str, Dict[str, Any]] = {}
+        self.by_status: Dict[str, int] = {}
+        # 통화 코드 → {"projected", "actual", "count"} (반올림 없이 합산 → 합계가 total_*와 일치)
+        self.by_currency: Dict[str, Dict[str, Any]] = {}
+
+    @classmethod
+    def from_items(cls, items: Iterable[BudgetLineItem]) -> "BudgetAggregate":
+        """항목 목록으로부터 전체 재계산"""
+        aggregate = cls()
+        for item in items:
+            aggregate.apply(item, 1)
+        return aggregate
+
+    @property
+    def total_variance(self) -> Decimal:
+        return self.total_projected - self.total_actual
+
+    def copy(self) -> "BudgetAggregate":
+        """독립 사본 (버킷 dict까지 복사, 금액 값은 불변이라 공유)"""
+        other = BudgetAggregate()
+        other.total_items = self.total_items
+        other.total_projected = self.total_projected
+        other.total_actual = self.total_actual
+        other.by_category = {key: dict(bucket) for key, bucket in self.by_category.items()}
+        other.by_status = dict(self.by_status)
+        other.by_currency = {key: dict(bucket) for key, bucket in self.by_currency.items()}
+        return other
+
+    def apply(self, item: BudgetLineItem, sign: int) -> None:
+        """항목 하나를 더하거나(sign=1) 뺀다(sign=-1)"""
+        if sign > 0:
+            self.add_group(item.category.value, item.status.value, 1,
+                           item.projected_amount, item.actual_amount)
+            self.add_currency(item.currency.value, 1, item.projected_amount, item.actual_amount)
+        else:
+            self.add_group(item.category.value, item.status.value, -1,
+                           -item.projected_amount, -item.actual_amount)
+            self.add_currency(item.currency.value, -1, -item.projected_amount, -item.actual_amount)
+
+    def add_group(
+        self,
+        category: str,
+        status: str,
+        count: int,
+        projected: Decimal,
+        actual: Decimal,
+    ) -> None:
+        """(카테고리, 상태) 그룹 단위 증분 반영"""
+        self.total_items += count
+        self.total_projected += projected
+        self.total_actual += actual
+
+        bucket = self.by_category.get(category)
+        if bucket is None:
+            bucket = self.by_category[category] = {
+                "projected": Decimal("0"), "actual": Decimal("0"), "count": 0
+            }
+        bucket["projected"] += projected
+        bucket["actual"] += actual
+        bucket["count"] += count
+        if bucket["count"] == 0:
+            del self.by_category[category]
+
+        self.by_status[status] = self.by_status.get(status, 0) + count
+        if self.by_status[status] == 0:
+            del self.by_status[status]
+
+    def add_currency(self, currency: str, count: int, projected: Decimal, actual: Decimal) -> None:
+        """통화 단위 증분 반영"""
+        bucket = self.by_currency.get(currency)
+        if bucket is None:
+            bucket = self.by_currency[currency] = {
+                "projected": Decimal("0"), "actual": Decimal("0"), "count": 0
+            }
+        bucket["projected"] += projected
+        bucket["actual"] += actual
+        bucket["count"] += count
+        if bucket["count"] == 0:
+            del self.by_currency[currency]
+
+    def diff(self, other: "BudgetAggregate") -> List[Dict[str, Any]]:
+        """두 집계 간 불일치 항목 목록 (self=cached, other=recomputed)"""
+        drift: List[Dict[str, Any]] = []
+
+        def check(field: str, cached: Any, recomputed: Any) -> None:
+            if cached != recomputed:
+                drift.append({"field": field, "cached": cached, "recomputed": recomputed})
+
+        check("total_items", self.total_items, other.total_items)
+        check("total_projected", self.total_projected, other.total_projected)
+        check("total_actual", self.total_actual, other.total_actual)
+        empty = {"projected": Decimal("0"), "actual": Decimal("0"), "count": 0}
+        for cat in sorted(set(self.by_category) | set(other.by_category)):
+            mine = self.by_category.get(cat, empty)
+            theirs = other.by_category.get(cat, empty)
+            for key in ("projected", "actual", "count"):
+                check(f"by_category.{cat}.{key}", mine[key], theirs[key])
+        for st in sorted(set(self.by_status) | set(other.by_status)):
+            check(f"by_status.{st}", self.by_status.get(st, 0), other.by_status.get(st, 0))
+        for cur in sorted(set(self.by_currency) | set(other.by_currency)):
+            mine = self.by_currency.get(cur, empty)
+            theirs = other.by_currency.get(cur, empty)
+            for key in ("projected", "actual", "count"):
+                check(f"by_currency.{cur}.{key}", mine[key], theirs[key])
+        return drift
+
+
+# =============================================================================
+# PER-EVENT SPONSOR REVENUE
+# =============================================================================
+
+# 계약 체결 이후 상태 (리포트 스폰서십 수익)
+CONTRACTED_STATUSES = (SponsorshipStatus.CONTRACTED.value, SponsorshipStatus.FULFILLED.value)
+# 금액 확정 이후 상태 (파이프라인 확정 수익)
+COMMITTED_STATUSES = (SponsorshipStatus.COMMITTED.value,) + CONTRACTED_STATUSES
+
+
+class SponsorRevenue:
+    """단일 이벤트의 스폰서 상태별 누적 집계 (event_id가 있는 스폰서만)"""
+
+    __slots__ = ("by_status",)
+
+    def __init__(self):
+        # 상태 → {"count": 스폰서 수, "committed": 확정 금액 합계}
+        self.by_status: Dict[str, Dict[str, Any]] = {}
+
+    @classmethod
+    def from_sponsors(cls, sponsors: Iterable[Sponsor]) -> "SponsorRevenue":
+        """스폰서 목록으로부터 전체 재계산"""
+        revenue = cls()
+        for sponsor in sponsors:
+            revenue.apply(sponsor, 1)
+        return revenue
+
+    def copy(self) -> "SponsorRevenue":
+        """독립 사본"""
+        other = SponsorRevenue()
+        other.by_status = {key: dict(bucket) for key, bucket in self.by_status.items()}
+        return other
+
+    @property
+    def total_sponsors(self) -> int:
+        return sum(bucket["count"] for bucket in self.by_status.values())
+
+    @property
+    def contracted(self) -> Decimal:
+        """계약 체결(CONTRACTED / FULFILLED) 스폰서 확정 금액 합계"""
+        return self.total(CONTRACTED_STATUSES)
+
+    @property
+    def committed(self) -> Decimal:
+        """금액 확정(COMMITTED 이후) 스폰서 확정 금액 합계"""
+        return self.total(COMMITTED_STATUSES)
+
+    def total(self, statuses: Iterable[str]) -> Decimal:
+        return sum(
+            (self.by_status[s]["committed"] for s in statuses if s in self.by_status),
+            Decimal("0"),
+        )
+
+    def apply(self, sponsor: Sponsor, sign: int) -> None:
+        """스폰서 하나를 더하거나(sign=1) 뺀다(sign=-1)"""
+        self.add_group(sponsor.status.value, sign, sponsor.committed_amount * sign)
+
+    def add_group(self, status: str, count: int, committed: Decimal) -> None:
+        """상태 그룹 단위 증분 반영"""
+        bucket = self.by_status.get(status)
+        if bucket is None:
+            bucket = self.by_status[status] = {"count": 0, "committed": Decimal("0")}
+        bucket["count"] += count
+        bucket["committed"] += committed
+        if bucket["count"] == 0:
+            del self.by_status[status]
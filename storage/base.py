@@ -0,0 +1,402 @@
+"""
+Finance Repository Interface
+
+재무 라우터가 사용하는 저장소 추상화.
+- 컬렉션 단위 비동기 CRUD (budget_items, sponsorship_packages, sponsors, reports, transactions, pricing_tiers,
+  sponsorship_reservations)
+- 이벤트별 예산 집계 조회 / 정합성 검사
+- 스폰서십 패키지 수량 보류 / 전환 / 해제 (storage.inventory 규칙, 구현체별 원자 구간)
+- 구현체: In-Memory (storage.memory), SQLite (storage.sqlite), event_id 샤드 SQLite (storage.sharded)
+
+Author: Event Agent System
+"""
+
+import asyncio
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import (
+    AbstractSet, Any, Callable, Dict, Generic, List, Optional, Sequence, Tuple, TypeVar, Union,
+)
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from schemas.financial import (
+    BudgetLineItem,
+    FinancialReport,
+    PricingTier,
+    ReservationStatus,
+    Sponsor,
+    SponsorshipPackage,
+    SponsorshipReservation,
+    Transaction,
+)
+from storage.aggregates import BudgetAggregate, SponsorRevenue
+from storage.locking import StripedLock
+
+
+T = TypeVar("T", bound=BaseModel)
+
+# 정렬 키: (created_at 등 정렬 필드 값, id)
+SortKey = Tuple[Any, UUID]
+
+# 일괄 수정 요청: (레코드 ID, 현재 레코드 → 변경할 필드 값, 허용 버전 집합)
+FieldUpdate = Tuple[UUID, Callable[[Any], Dict[str, Any]], Optional[AbstractSet[int]]]
+
+
+# =============================================================================
+# ERRORS
+# =============================================================================
+
+class VersionConflict(Exception):
+    """레코드 버전 불일치 (낙관적 동시성 제어 실패)"""
+
+    def __init__(self, current: BaseModel):
+        super().__init__(f"Version conflict: current version is {getattr(current, 'version', None)}")
+        self.current = current
+
+
+def check_version(stored: BaseModel, record: BaseModel) -> None:
+    """버전 레코드 교체 조건: 새 레코드 버전 = 저장된 버전 + 1"""
+    # 필드 유무는 모델 클래스로 판별: 없는 속성 getattr은 pydantic __getattr__ 예외 경로라 느리다
+    if "version" not in type(record).model_fields:
+        return
+    version = record.version
+    if version is not None and version != stored.version + 1:
+        raise VersionConflict(stored)
+
+
+class PartialWrite(Exception):
+    """여러 파일(샤드)에 걸친 일괄 쓰기 중 일부만 저장됨 (저장된 부분은 되돌리지 않음)"""
+
+    def __init__(self, written: List[BaseModel], conflict: VersionConflict):
+        super().__init__(f"{len(written)} records were saved before a conflict: {conflict}")
+        self.written = written
+        self.conflict = conflict
+
+
+class SoldOut(Exception):
+    """스폰서십 패키지 남은 수량 없음 (또는 판매 중지)"""
+
+    def __init__(self, package: SponsorshipPackage):
+        super().__init__(f"Sponsorship package {package.id} has no available slots")
+        self.package = package
+
+
+# =============================================================================
+# CHANGE LISTENER
+# =============================================================================
+
+class ChangeListener(Generic[T]):
+    """
+    컬렉션 변경 구독자 (파생 인덱스/캐시 유지용).
+    쓰기가 성공한 뒤 이벤트 루프 스레드에서 호출된다.
+    """
+
+    def record_changed(self, old: Optional[T], new: Optional[T]) -> None:
+        """추가(old=None) / 수정 / 삭제(new=None)"""
+
+    def records_changed(self, changes: Sequence[Tuple[Optional[T], Optional[T]]]) -> None:
+        """일괄 쓰기 (한 번에 커밋된 변경 목록), 기본 구현은 건별 record_changed"""
+        for old, new in changes:
+            self.record_changed(old, new)
+
+    def collection_cleared(self) -> None:
+        """컬렉션 전체 삭제"""
+
+
+# =============================================================================
+# COLLECTION
+# =============================================================================
+
+class Collection(ABC, Generic[T]):
+    """
+    단일 레코드 타입에 대한 비동기 CRUD.
+
+    `version` 필드가 있는 레코드는 replace 시 저장된 버전 + 1이어야 하며
+    (아니면 VersionConflict), update()는 `lock_field` 값(예: event_id) 단위
+    분할 락 안에서 읽기-수정-쓰기와 버전 증가를 수행한다.
+    """
+
+    def __init__(self, lock_field: str = "id"):
+        self._listeners: List[ChangeListener[T]] = []
+        self.lock_field = lock_field
+        self._locks = StripedLock()
+
+    def subscribe(self, listener: ChangeListener[T]) -> None:
+        """변경 구독자 등록"""
+        self._listeners.append(listener)
+
+    def lock(self, key: Any) -> asyncio.Lock:
+        """
+        키 단위 분할 락 (update()가 `lock_field` 값으로 잡는 것과 같은 락).
+        여러 컬렉션에 걸친 읽기-수정-쓰기를 이 컬렉션 쓰기와 직렬화할 때 사용.
+        """
+        return self._locks.lock(key)
+
+    def _notify(self, old: Optional[T], new: Optional[T]) -> None:
+        for listener in self._listeners:
+            listener.record_changed(old, new)
+
+    def _notify_many(self, changes: Sequence[Tuple[Optional[T], Optional[T]]]) -> None:
+        if not changes:
+            return
+        for listener in self._listeners:
+            listener.records_changed(changes)
+
+    def _notify_clear(self) -> None:
+        for listener in self._listeners:
+            listener.collection_cleared()
+
+    @abstractmethod
+    async def get(self, record_id: UUID) -> Optional[T]:
+        """ID로 단건 조회"""
+
+    async def get_many(self, record_ids: Sequence[UUID]) -> Dict[UUID, T]:
+        """ID 목록 조회 → {ID: 레코드} (없는 ID는 제외, 구현체는 배치 조회로 최적화)"""
+        found: Dict[UUID, T] = {}
+        for record_id in record_ids:
+            record = await self.get(record_id)
+            if record is not None:
+                found[record_id] = record
+        return found
+
+    @abstractmethod
+    async def add(self, record: T) -> T:
+        """레코드 추가"""
+
+    async def add_many(self, records: List[T]) -> int:
+        """레코드 일괄 추가 (구현체는 단일 트랜잭션/배치로 최적화)"""
+        for record in records:
+            await self.add(record)
+        return len(records)
+
+    @abstractmethod
+    async def replace(self, record: T) -> Optional[T]:
+        """
+        같은 ID의 레코드를 교체하고 이전 레코드 반환 (없으면 None).
+        버전 레코드는 저장된 버전 + 1이 아니면 VersionConflict.
+        """
+
+    async def replace_many(self, records: List[T]) -> int:
+        """
+        레코드 일괄 교체 (없는 ID는 건너뜀), 교체된 수 반환.
+        한 배치에 같은 ID가 두 번 나오면 ValueError.
+        구현체는 단일 트랜잭션/배치 인덱스 갱신으로 최적화.
+        """
+        if len({record.id for record in records}) != len(records):
+            raise ValueError("Duplicate id in replace batch")
+        count = 0
+        for record in records:
+            if await self.replace(record) is not None:
+                count += 1
+        return count
+
+    async def update(
+        self,
+        record_id: UUID,
+        apply: Callable[[T], T],
+        expected_versions: Optional[AbstractSet[int]] = None,
+    ) -> Optional[T]:
+        """
+        분할 락 안에서 읽기-수정-쓰기 (레코드가 없으면 None).
+
+        apply(현재 레코드) → 수정된 레코드. 버전 레코드는 version을 1 증가시켜 저장.
+        expected_versions가 주어지고 현재 버전이 그 안에 없으면 VersionConflict.
+        """
+        record = await self.get(record_id)
+        if record is None:
+            return None
+        async with self._locks.lock(getattr(record, self.lock_field)):
+            # 락 대기 중 다른 요청이 수정했을 수 있으므로 다시 읽는다
+            current = await self.get(record_id)
+            if current is None:
+                return None
+            version = getattr(current, "version", None)
+            if expected_versions is not None and version not in expected_versions:
+                raise VersionConflict(current)
+            updated = apply(current)
+            if version is not None:
+                updated = updated.model_copy(update={"version": version + 1})
+            if await self.replace(updated) is None:
+                return None
+            return updated
+
+    async def update_many(
+        self,
+        updates: Sequence[FieldUpdate],
+        all_or_nothing: bool = False,
+    ) -> List[Union[T, VersionConflict, None]]:
+        """
+        여러 레코드를 한 번의 replace_many로 읽기-수정-쓰기, 요청 순서대로 결과 반환.
+
+        각 요청은 changes(현재 레코드) → 변경할 필드 값 dict로 주며, 버전 증가를 포함해
+        레코드당 model_copy 1회로 새 레코드를 만든다. 결과는 수정된 레코드,
+        VersionConflict(허용 버전 불일치) 또는 None(없는 ID).
+        all_or_nothing이면 하나라도 실패할 때 아무것도 저장하지 않는다
+        (이때 성공 위치의 결과는 저장되지 않은 레코드).
+        관련 `lock_field` 락을 모두 잡은 상태에서 다시 읽고 쓴다. 같은 ID가 두 번이면 ValueError.
+        """
+        record_ids = [record_id for record_id, _, _ in updates]
+        if len(set(record_ids)) != len(record_ids):
+            raise ValueError("Duplicate id in update batch")
+        existing = await self.get_many(record_ids)
+        keys = [getattr(record, self.lock_field) for record in existing.values()]
+        async with self._locks.hold(keys):
+            # 락 대기 중 다른 요청이 수정했을 수 있으므로 다시 읽는다
+            current = await self.get_many(record_ids)
+            results: List[Union[T, VersionConflict, None]] = []
+            records: List[T] = []
+            for record_id, changes, expected_versions in updates:
+                record = current.get(record_id)
+                if record is None:
+                    results.append(None)
+                    continue
+                version = getattr(record, "version", None)
+                if expected_versions is not None and version not in expected_versions:
+                    results.append(VersionConflict(record))
+                    continue
+                fields = changes(record)
+                if version is not None:
+                    fields["version"] = version + 1
+                updated = record.model_copy(update=fields)
+                results.append(updated)
+                records.append(updated)
+            if records and (not all_or_nothing or len(records) == len(results)):
+                await self.replace_many(records)
+            return results
+
+    @abstractmethod
+    async def remove(self, record_id: UUID) -> Optional[T]:
+        """ID로 삭제하고 삭제된 레코드 반환 (없으면 None)"""
+
+    @abstractmethod
+    async def find(self, **filters: Any) -> List[T]:
+        """필드 값으로 필터링 (None 값은 무시), 정렬 키 순서"""
+
+    @abstractmethod
+    async def page(
+        self,
+        limit: int,
+        after: Optional[SortKey] = None,
+        **filters: Any,
+    ) -> Tuple[List[T], Optional[SortKey]]:
+        """
+        키셋 페이지 조회: (정렬 필드, id) 순으로 `after` 다음부터 최대 limit 개.
+        다음 페이지가 있으면 마지막 항목의 정렬 키를, 없으면 None을 함께 반환.
+        """
+
+    @abstractmethod
+    async def count(self, **filters: Any) -> int:
+        """필터 조건에 해당하는 레코드 수"""
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """모든 레코드 삭제"""
+
+    async def stats(self) -> Dict[str, int]:
+        """운영 지표용 통계 (구현체는 인덱스 크기 등을 추가)"""
+        return {"records": await self.count()}
+
+
+# =============================================================================
+# REPOSITORY
+# =============================================================================
+
+class FinanceRepository(ABC):
+    """재무 도메인 저장소"""
+
+    backend: str
+    budget_items: Collection[BudgetLineItem]
+    sponsorship_packages: Collection[SponsorshipPackage]
+    sponsors: Collection[Sponsor]
+    reports: Collection[FinancialReport]
+    transactions: Collection[Transaction]
+    pricing_tiers: Collection[PricingTier]
+    sponsorship_reservations: Collection[SponsorshipReservation]
+
+    # 다른 프로세스도 같은 데이터에 쓸 수 있는지 (True면 프로세스 로컬 구독 사본은 리비전으로 검증)
+    shared: bool = False
+
+    # 이벤트 집계 조회 통계 (집계가 있으면 hit, 없으면 miss)
+    aggregate_hits: int = 0
+    aggregate_misses: int = 0
+
+    @abstractmethod
+    async def budget_aggregate(self, event_id: UUID) -> BudgetAggregate:
+        """이벤트 예산 누적 집계 (항목이 없으면 빈 집계)"""
+
+    @abstractmethod
+    async def check_budget_aggregate(self, event_id: UUID) -> List[Dict[str, Any]]:
+        """누적 집계와 전체 재계산 결과 간 drift 목록"""
+
+    @abstractmethod
+    async def sponsor_revenue(self, event_id: UUID) -> SponsorRevenue:
+        """이벤트 스폰서 상태별 누적 집계 (연결된 스폰서가 없으면 빈 집계)"""
+
+    @abstractmethod
+    async def claim_package(self, reservation: SponsorshipReservation) -> Optional[SponsorshipReservation]:
+        """
+        패키지 수량 1개를 원자적으로 확보하고 reservation 저장 (패키지가 없으면 None).
+        status HELD는 보류(held_count + 1), CONVERTED는 보류 없는 직접 판매(sold_count + 1).
+        같은 패키지의 만료된 보류를 먼저 정리하며, 남은 수량이 없으면 SoldOut.
+        """
+
+    @abstractmethod
+    async def settle_reservation(
+        self,
+        reservation_id: UUID,
+        status: ReservationStatus,
+        now: datetime,
+        sponsor_id: Optional[UUID] = None,
+    ) -> Optional[SponsorshipReservation]:
+        """
+        보류 전환(CONVERTED) / 해제(RELEASED) 후 보류 반환 (없으면 None).
+        허용되지 않는 전이(만료된 보류 전환 등)는 현재 상태 그대로 반환한다
+        (이미 만료 시각이 지난 보류는 EXPIRED로 정리).
+        """
+
+    @abstractmethod
+    async def expire_reservations(self, now: datetime) -> int:
+        """now 기준 만료된 모든 보류를 EXPIRED로 정리, 정리한 수 반환"""
+
+    @abstractmethod
+    async def revision(self, event_id: Optional[UUID] = None) -> str:
+        """
+        변경 리비전 태그 (조건부 GET ETag용).
+        event_id가 주어지면 해당 이벤트에 영향을 준 쓰기, 없으면 모든 쓰기 기준이며
+        태그가 같으면 그 사이 변경이 없었음을 보장한다.
+        """
+
+    def collections(self) -> Dict[str, Collection]:
+        """이름 → 컬렉션"""
+        return {
+            "budget_items": self.budget_items,
+            "sponsorship_packages": self.sponsorship_packages,
+            "sponsors": self.sponsors,
+            "reports": self.reports,
+            "transactions": self.transactions,
+            "pricing_tiers": self.pricing_tiers,
+            "sponsorship_reservations": self.sponsorship_reservations,
+        }
+
+    async def stats(self) -> Dict[str, Any]:
+        """컬렉션별 통계 및 집계 조회 통계"""
+        return {
+            "collections": {name: await c.stats() for name, c in self.collections().items()},
+            "aggregate_cache": {"hits": self.aggregate_hits, "misses": self.aggregate_misses},
+        }
+
+    async def reset(self) -> None:
+        """모든 컬렉션 초기화"""
+        for collection in self.collections().values():
+            await collection.clear()
+
+    async def open(self) -> None:
+        """요청 처리 전 준비 (저장된 상태 복구 등)"""
+
+    async def ping(self) -> None:
+        """저장소 가용성 확인 (실패 시 예외)"""
+
+    async def close(self) -> None:
+        """리소스 정리 (커넥션 등)"""
@@ -0,0 +1,64 @@
+"""
+Storage Configuration
+
+재무 저장소 백엔드 선택.
+
+환경 변수:
+- FINANCE_STORAGE_BACKEND: memory (기본) | sqlite | sharded
+  (여러 워커 프로세스로 실행할 때는 sqlite 또는 sharded — memory는 프로세스마다 따로 저장)
+- FINANCE_SQLITE_PATH: SQLite 파일 경로 (기본: finance.db, sharded는 finance.0.db, finance.1.db, ...)
+- FINANCE_SQLITE_POOL_SIZE: SQLite 커넥션 풀 크기 (기본: 4, sharded는 샤드당)
+- FINANCE_SQLITE_SHARDS: sharded 백엔드 샤드 수 (기본: 4, 데이터 생성 후 변경 불가)
+- FINANCE_JOURNAL_DIR: memory 백엔드 저널 / 스냅샷 디렉터리 (설정 시 재시작 후 복구, 기본: 없음)
+- FINANCE_JOURNAL_FLUSH_MS: 저널 group commit 간격 (기본: 10)
+- FINANCE_SNAPSHOT_EVERY: 마지막 스냅샷 이후 이 건수만큼 기록되면 스냅샷 (기본: 100000)
+
+Author: Event Agent System
+"""
+
+import os
+from typing import Optional
+
+from storage.base import FinanceRepository
+
+
+BACKEND_MEMORY = "memory"
+BACKEND_SQLITE = "sqlite"
+BACKEND_SHARDED = "sharded"
+
+
+def create_repository(
+    backend: Optional[str] = None,
+    sqlite_path: Optional[str] = None,
+    pool_size: Optional[int] = None,
+    journal_dir: Optional[str] = None,
+    shards: Optional[int] = None,
+) -> FinanceRepository:
+    """설정(인자 > 환경 변수 > 기본값)에 따라 저장소 생성"""
+    backend = (backend or os.environ.get("FINANCE_STORAGE_BACKEND", BACKEND_MEMORY)).lower()
+
+    if backend == BACKEND_MEMORY:
+        from storage.memory import MemoryFinanceRepository
+        return MemoryFinanceRepository(
+            journal_dir=journal_dir or os.environ.get("FINANCE_JOURNAL_DIR") or None,
+            flush_interval=float(os.environ.get("FINANCE_JOURNAL_FLUSH_MS", "10")) / 1000,
+            snapshot_every=int(os.environ.get("FINANCE_SNAPSHOT_EVERY", "100000")),
+        )
+
+    if backend == BACKEND_SQLITE:
+        # sqlite3는 필요할 때만 import (Workers 환경 고려)
+        from storage.sqlite import SQLiteFinanceRepository
+        return SQLiteFinanceRepository(
+            path=sqlite_path or os.environ.get("FINANCE_SQLITE_PATH", "finance.db"),
+            pool_size=pool_size or int(os.environ.get("FINANCE_SQLITE_POOL_SIZE", "4")),
+        )
+
+    if backend == BACKEND_SHARDED:
+        from storage.sharded import ShardedFinanceRepository
+        return ShardedFinanceRepository(
+            path=sqlite_path or os.environ.get("FINANCE_SQLITE_PATH", "finance.db"),
+            shards=shards or int(os.environ.get("FINANCE_SQLITE_SHARDS", "4")),
+            pool_size=pool_size or int(os.environ.get("FINANCE_SQLITE_POOL_SIZE", "4")),
+        )
+
+    raise ValueError(f"Unknown finance storage backend: {backend}")
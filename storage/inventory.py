@@ -0,0 +1,87 @@
+"""
+Sponsorship Inventory
+
+스폰서십 패키지 수량(판매 / 보류) 전이 규칙.
+저장소 구현이 패키지 단위 원자 구간 안에서 호출한다
+(memory: 패키지 ID 분할 락, sqlite: 패키지 샤드 파일의 쓰기 트랜잭션 — 전역 락 없음).
+- 확보: sold_count + held_count < max_sponsors이고 판매 중일 때만
+  보류(held_count + 1) 또는 직접 판매(sold_count + 1)
+- 전환: 만료 전 보류 → 판매 (held − 1, sold + 1 → 점유 수량 불변, 초과 판매 불가)
+- 해제: 보류 해제(held − 1) 또는 판매 취소(sold − 1)
+- 만료: expires_at이 지난 보류 → EXPIRED, held − 1
+  (확보 시 해당 패키지의 만료 보류를 먼저 정리 + 주기적 전체 정리)
+
+Author: Event Agent System
+"""
+
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from schemas.financial import ReservationStatus, SponsorshipPackage, SponsorshipReservation
+from storage.base import SoldOut
+
+
+def expire_holds(
+    reservations: Iterable[SponsorshipReservation], now: datetime
+) -> List[SponsorshipReservation]:
+    """만료 시각이 지난 보류의 EXPIRED 사본 목록"""
+    return [
+        reservation.model_copy(update={"status": ReservationStatus.EXPIRED, "closed_at": now})
+        for reservation in reservations
+        if reservation.status == ReservationStatus.HELD and reservation.expires_at <= now
+    ]
+
+
+def release_expired(package: SponsorshipPackage, expired: int) -> SponsorshipPackage:
+    """만료 보류 수만큼 held_count 감소"""
+    if not expired:
+        return package
+    return package.model_copy(update={"held_count": max(0, package.held_count - expired)})
+
+
+def claim_slot(package: SponsorshipPackage, reservation: SponsorshipReservation) -> SponsorshipPackage:
+    """수량 1개 확보 후 패키지 (HELD: 보류, CONVERTED: 직접 판매), 남은 수량이 없으면 SoldOut"""
+    if not package.is_active or package.sold_count + package.held_count >= package.max_sponsors:
+        raise SoldOut(package)
+    if reservation.status == ReservationStatus.HELD:
+        return package.model_copy(update={"held_count": package.held_count + 1})
+    if reservation.status == ReservationStatus.CONVERTED:
+        return package.model_copy(update={"sold_count": package.sold_count + 1})
+    raise ValueError(f"Cannot claim a slot for a {reservation.status.value} reservation")
+
+
+def settle(
+    package: Optional[SponsorshipPackage],
+    reservation: SponsorshipReservation,
+    status: ReservationStatus,
+    now: datetime,
+    sponsor_id: Optional[UUID] = None,
+) -> Optional[Tuple[Optional[SponsorshipPackage], SponsorshipReservation]]:
+    """
+    보류 전이 → (패키지, 보류) 새 값, 바뀌는 것이 없으면 None.
+    HELD → CONVERTED / RELEASED, CONVERTED → RELEASED만 허용하며
+    만료 시각이 지난 HELD는 요청과 무관하게 EXPIRED로 정리한다.
+    """
+    current = reservation.status
+    held, sold = 0, 0
+    if current == ReservationStatus.HELD and reservation.expires_at <= now:
+        status, held = ReservationStatus.EXPIRED, -1
+    elif current == ReservationStatus.HELD and status == ReservationStatus.CONVERTED:
+        held, sold = -1, 1
+    elif current == ReservationStatus.HELD and status == ReservationStatus.RELEASED:
+        held = -1
+    elif current == ReservationStatus.CONVERTED and status == ReservationStatus.RELEASED:
+        sold = -1
+    else:
+        return None
+
+    update = {"status": status, "closed_at": now}
+    if sponsor_id is not None:
+        update["sponsor_id"] = sponsor_id
+    if package is not None:
+        package = package.model_copy(update={
+            "held_count": max(0, package.held_count + held),
+            "sold_count": max(0, package.sold_count + sold),
+        })
+    return package, reservation.model_copy(update=update)
@@ -0,0 +1,40 @@
+"""
+Striped Locks
+
+키(이벤트 ID 등) 해시로 고정 개수의 asyncio.Lock 중 하나를 선택하는 분할 락.
+- 서로 다른 이벤트의 쓰기는 대부분 다른 락을 사용 → 동시에 진행
+- 같은 이벤트의 읽기-수정-쓰기는 직렬화
+- 락 개수가 고정이므로 키 수와 무관하게 메모리 일정
+
+Author: Event Agent System
+"""
+
+import asyncio
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Any, AsyncIterator, Iterable, List
+
+
+class StripedLock:
+    """고정 개수 asyncio.Lock 분할 락"""
+
+    def __init__(self, stripes: int = 64):
+        self._locks: List[asyncio.Lock] = [asyncio.Lock() for _ in range(stripes)]
+
+    def __len__(self) -> int:
+        return len(self._locks)
+
+    def lock(self, key: Any) -> asyncio.Lock:
+        """키에 해당하는 락 (같은 키는 항상 같은 락)"""
+        return self._locks[hash(key) % len(self._locks)]
+
+    @asynccontextmanager
+    async def hold(self, keys: Iterable[Any]) -> AsyncIterator[None]:
+        """
+        여러 키의 락을 함께 획득 (일괄 쓰기용).
+        분할 위치 오름차순으로 한 번씩만 획득 → 키가 겹치는 일괄 쓰기끼리 교착 없음.
+        """
+        stripes = sorted({hash(key) % len(self._locks) for key in keys})
+        async with AsyncExitStack() as stack:
+            for stripe in stripes:
+                await stack.enter_async_context(self._locks[stripe])
+            yield
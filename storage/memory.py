@@ -0,0 +1,726 @@
+"""
+In-Memory Indexed Store
+
+라우터의 In-Memory 저장소 구현.
+- ID → 레코드 기본 맵 (O(1) 단건 조회/수정/삭제)
+- 필드별 / 복합 보조 인덱스 (event_id, category, status, (event_id, status) 등)
+- 필터 조회 비용은 결과 크기에 비례
+- (created_at, id) 정렬 키 기반 키셋 페이지네이션
+- FinanceRepository 인터페이스의 In-Memory 구현
+- 변경 구독으로 유지되는 전역 / 이벤트별 리비전 (조건부 GET)
+- 스냅샷용 일괄 내보내기 / 적재 (storage.journal: 저널 + 스냅샷으로 재시작 복구)
+
+Author: Event Agent System
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from collections import defaultdict, deque
+from datetime import datetime
+from operator import attrgetter
+from typing import (
+    TYPE_CHECKING, Any, DefaultDict, Dict, Generic, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar, Union,
+)
+from uuid import UUID, uuid4
+
+from pydantic import BaseModel
+
+from schemas.financial import BudgetLineItem, ReservationStatus, Sponsor, SponsorshipReservation
+from storage.aggregates import BudgetAggregate, SponsorRevenue
+from storage.base import Collection, FinanceRepository, SortKey, check_version
+from storage.inventory import claim_slot, expire_holds, release_expired, settle
+from storage.revisions import RevisionClock
+
+if TYPE_CHECKING:
+    from storage.journal import StoreJournal
+
+
+T = TypeVar("T", bound=BaseModel)
+
+# 보조 인덱스 정의: 필드명, 또는 복합 인덱스용 필드명 튜플 (예: ("event_id", "status"))
+IndexSpec = Union[str, Tuple[str, ...]]
+
+# 일괄 교체 시 이 수 이상이면 레코드별 정렬 리스트 수정 대신 영향받은 버킷을 다시 만든다
+BULK_REINDEX_THRESHOLD = 64
+
+
+# =============================================================================
+# INDEXED STORE
+# =============================================================================
+
+class IndexedStore(Generic[T]):
+    """
+    기본 키(id) 맵과 보조 인덱스를 함께 유지하는 저장소.
+
+    전체 순서 및 보조 인덱스 버킷(`필드값 → 정렬 리스트`, 복합 인덱스는
+    `(필드값, ...) → 정렬 리스트`)은 모두
+    `(sort_field, id)` 키로 정렬되어 있으며, add / replace / remove 시
+    항상 기본 맵과 동기화된다. 조회 결과는 이 정렬 순서(생성 순)를 따른다.
+    """
+
+    def __init__(self, index_fields: Iterable[IndexSpec] = (), sort_field: str = "created_at"):
+        self.sort_field = sort_field
+        self._records: Dict[UUID, T] = {}
+        self._keys: Dict[UUID, SortKey] = {}
+        self._order: List[SortKey] = []
+        self._indexes: Dict[Tuple[str, ...], Dict[Any, List[SortKey]]] = {
+            (spec,) if isinstance(spec, str) else tuple(spec): {} for spec in index_fields
+        }
+
+    # -------------------------------------------------------------------------
+    # 기본 연산
+    # -------------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter([self._records[key[1]] for key in self._order])
+
+    def __contains__(self, record_id: UUID) -> bool:
+        return record_id in self._records
+
+    def sort_key(self, record: T) -> SortKey:
+        """레코드의 정렬 키 (sort_field, id)"""
+        return (getattr(record, self.sort_field), record.id)
+
+    def get(self, record_id: UUID) -> Optional[T]:
+        """ID로 단건 조회 (O(1))"""
+        return self._records.get(record_id)
+
+    def add(self, record: T) -> T:
+        """
+        레코드 추가.
+        정렬 위치(키 비교)를 모두 먼저 계산한 뒤 기록한다 → 비교가 실패해도
+        (예: 정렬 필드에 naive / aware datetime 혼용) 저장소는 바뀌지 않는다.
+        """
+        if record.id in self._records:
+            raise KeyError(f"Duplicate id {record.id}")
+        key = self.sort_key(record)
+        targets = [(self._order, _sorted_position(self._order, key))]
+        buckets = []
+        for fields, index in self._indexes.items():
+            value = _index_value(fields, record)
+            bucket = index.get(value)
+            if bucket is None:
+                bucket = []
+                buckets.append((index, value, bucket))
+            targets.append((bucket, _sorted_position(bucket, key)))
+
+        for keys, position in targets:
+            keys.insert(position, key)
+        for index, value, bucket in buckets:
+            index[value] = bucket
+        self._keys[record.id] = key
+        self._records[record.id] = record
+        return record
+
+    def replace(self, record: T) -> Optional[T]:
+        """
+        같은 ID의 레코드를 교체하고 이전 레코드를 반환.
+        인덱스 필드 값이 바뀐 경우에만 해당 인덱스를 갱신한다.
+        """
+        old = self._records.get(record.id)
+        if old is None:
+            return None
+        check_version(old, record)
+        old_key = self._keys[record.id]
+        new_key = self.sort_key(record)
+        if new_key != old_key:
+            _remove_sorted(self._order, old_key)
+            _insert_sorted(self._order, new_key)
+            self._keys[record.id] = new_key
+        for fields, index in self._indexes.items():
+            old_value = _index_value(fields, old)
+            new_value = _index_value(fields, record)
+            if old_value != new_value or new_key != old_key:
+                self._unindex_value(index, old_value, old_key)
+                _insert_sorted(index.setdefault(new_value, []), new_key)
+        self._records[record.id] = record
+        return old
+
+    def replace_many(self, records: Iterable[T]) -> List[Tuple[T, T]]:
+        """
+        레코드 일괄 교체, (이전, 새) 레코드 쌍 목록 반환 (없는 ID는 건너뜀).
+
+        교체 수가 BULK_REINDEX_THRESHOLD 이상이면 레코드마다 정렬 리스트에서
+        삭제/삽입(버킷 크기만큼 이동)하지 않고, 영향받은 버킷을 한 번씩 다시 만든다.
+        → 큰 버킷(예: budget_line_item_id=None)의 레코드를 대량 교체해도 O(버킷 + k log k).
+        제거 대상은 UUID.int 집합으로 관리 (UUID.__hash__는 파이썬 레벨 호출).
+        """
+        pairs: List[Tuple[T, T]] = []
+        seen = set()
+        for record in records:
+            if record.id.int in seen:
+                raise ValueError(f"Duplicate id {record.id} in replace batch")
+            seen.add(record.id.int)
+            old = self._records.get(record.id)
+            if old is not None:
+                check_version(old, record)
+                pairs.append((old, record))
+        if len(pairs) < BULK_REINDEX_THRESHOLD:
+            for _, record in pairs:
+                IndexedStore.replace(self, record)
+            return pairs
+
+        removed_order = set()
+        added_order: List[SortKey] = []
+        changes: Dict[Tuple[str, ...], Dict[Any, Tuple[set, List[SortKey]]]] = {
+            fields: {} for fields in self._indexes
+        }
+        for old, record in pairs:
+            record_id = record.id
+            old_key = self._keys[record_id]
+            new_key = self.sort_key(record)
+            moved = new_key != old_key
+            if moved:
+                removed_order.add(record_id.int)
+                added_order.append(new_key)
+                self._keys[record_id] = new_key
+            for fields, buckets in changes.items():
+                old_value = _index_value(fields, old)
+                new_value = _index_value(fields, record)
+                if moved or old_value != new_value:
+                    buckets.setdefault(old_value, (set(), []))[0].add(record_id.int)
+                    buckets.setdefault(new_value, (set(), []))[1].append(new_key)
+            self._records[record_id] = record
+
+        if added_order:
+            self._order = _rebuild_sorted(self._order, removed_order, added_order)
+        for fields, buckets in changes.items():
+            index = self._indexes[fields]
+            for value, (removed, added) in buckets.items():
+                bucket = _rebuild_sorted(index.get(value, []), removed, added)
+                if bucket:
+                    index[value] = bucket
+                else:
+                    index.pop(value, None)
+        return pairs
+
+    def remove(self, record_id: UUID) -> Optional[T]:
+        """ID로 삭제, 삭제된 레코드 반환"""
+        record = self._records.pop(record_id, None)
+        if record is None:
+            return None
+        key = self._keys.pop(record_id)
+        _remove_sorted(self._order, key)
+        for fields, index in self._indexes.items():
+            self._unindex_value(index, _index_value(fields, record), key)
+        return record
+
+    def clear(self) -> None:
+        """모든 레코드 및 인덱스 초기화"""
+        self._records.clear()
+        self._keys.clear()
+        self._order.clear()
+        for index in self._indexes.values():
+            index.clear()
+
+    # -------------------------------------------------------------------------
+    # 스냅샷
+    # -------------------------------------------------------------------------
+
+    def export(self) -> Tuple[List[T], Any]:
+        """
+        (정렬 키 순서 레코드 목록, 파생 상태 사본).
+        레코드는 불변으로 다루므로 목록만 복사한다 → 이후 쓰기와 무관한 시점 사본.
+        """
+        records = self._records
+        return [records[key[1]] for key in self._order], None
+
+    def load(self, records: Sequence[T], derived: Any = None) -> None:
+        """
+        내용을 records로 일괄 교체 (스냅샷 복구용, 변경 구독자에게 알리지 않음).
+
+        레코드마다 insort하지 않고 정렬 키를 한 번 정렬한 뒤, 그 순서대로 버킷에
+        append하여 보조 인덱스를 만든다 (export 순서로 들어오면 정렬은 O(n)).
+        """
+        self.clear()
+        ids = list(map(attrgetter("id"), records))
+        keys = list(zip(map(attrgetter(self.sort_field), records), ids))
+        self._records = dict(zip(ids, records))
+        if len(self._records) != len(records):
+            self.clear()
+            raise ValueError("Duplicate ids in snapshot")
+        self._keys = dict(zip(ids, keys))
+        positions = sorted(range(len(keys)), key=keys.__getitem__)
+        self._order = [keys[position] for position in positions]
+        ordered = [records[position] for position in positions]
+        for fields in self._indexes:
+            # defaultdict.__getitem__ + list.append을 map으로 → 레코드당 파이썬 프레임 없음
+            buckets: DefaultDict[Any, List[SortKey]] = defaultdict(list)
+            deque(map(list.append, map(buckets.__getitem__, map(attrgetter(*fields), ordered)), self._order), maxlen=0)
+            self._indexes[fields] = dict(buckets)
+
+    # -------------------------------------------------------------------------
+    # 필터 조회
+    # -------------------------------------------------------------------------
+
+    def find(self, **filters: Any) -> List[T]:
+        """필드 값으로 필터링 (None 값은 무시), 정렬 키 순서"""
+        items, _ = self.page(limit=None, **filters)
+        return items
+
+    def page(
+        self,
+        limit: Optional[int],
+        after: Optional[SortKey] = None,
+        **filters: Any,
+    ) -> Tuple[List[T], Optional[SortKey]]:
+        """
+        키셋 페이지 조회.
+
+        조건 필드로 구성된 인덱스 중 가장 작은 버킷(없으면 전체 순서)에서
+        `after` 다음 위치를 이분 탐색으로 찾고, 나머지 조건을 검사하며
+        limit 개를 모은다. 다음 페이지가 있으면 마지막 항목의 키를 함께 반환.
+        """
+        filters = {k: v for k, v in filters.items() if v is not None}
+        indexed = [fields for fields in self._indexes if all(f in filters for f in fields)]
+        if indexed:
+            keys = min(
+                (self._indexes[fields].get(_filter_value(fields, filters), []) for fields in indexed),
+                key=len,
+            )
+        else:
+            keys = self._order
+
+        start = bisect_right(keys, after) if after is not None else 0
+        records: List[T] = []
+        for position in range(start, len(keys)):
+            record = self._records[keys[position][1]]
+            if filters and not self._matches(record, filters):
+                continue
+            if limit is not None and len(records) == limit:
+                return records, self._keys[records[-1].id]
+            records.append(record)
+        return records, None
+
+    def count(self, **filters: Any) -> int:
+        """필터 조건에 해당하는 레코드 수 (조건 필드와 정확히 일치하는 인덱스가 있으면 O(1))"""
+        filters = {k: v for k, v in filters.items() if v is not None}
+        if not filters:
+            return len(self._records)
+        for fields, index in self._indexes.items():
+            if len(fields) == len(filters) and all(f in filters for f in fields):
+                return len(index.get(_filter_value(fields, filters), []))
+        return len(self.find(**filters))
+
+    def stats(self) -> Dict[str, int]:
+        """레코드 수, 인덱스 수, 인덱스 키(필드별 고유 값) 수"""
+        return {
+            "records": len(self._records),
+            "indexes": len(self._indexes),
+            "index_keys": sum(len(index) for index in self._indexes.values()),
+        }
+
+    # -------------------------------------------------------------------------
+    # 내부 헬퍼
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _unindex_value(index: Dict[Any, List[SortKey]], value: Any, key: SortKey) -> None:
+        bucket = index.get(value)
+        if bucket is None:
+            return
+        _remove_sorted(bucket, key)
+        if not bucket:
+            del index[value]
+
+    @staticmethod
+    def _matches(record: T, filters: Dict[str, Any]) -> bool:
+        return all(getattr(record, k) == v for k, v in filters.items())
+
+
+def _index_value(fields: Tuple[str, ...], record: Any) -> Any:
+    """레코드의 인덱스 버킷 키 (단일 필드는 값 그대로, 복합 인덱스는 튜플)"""
+    if len(fields) == 1:
+        return getattr(record, fields[0])
+    return tuple(getattr(record, field) for field in fields)
+
+
+def _filter_value(fields: Tuple[str, ...], filters: Dict[str, Any]) -> Any:
+    if len(fields) == 1:
+        return filters[fields[0]]
+    return tuple(filters[field] for field in fields)
+
+
+def _sorted_position(keys: List[SortKey], key: SortKey) -> int:
+    # 생성 시각 순으로 들어오는 일반적인 경우는 끝 위치 (비교 1회)
+    if not keys or keys[-1] < key:
+        return len(keys)
+    return bisect_right(keys, key)
+
+
+def _insert_sorted(keys: List[SortKey], key: SortKey) -> None:
+    # 생성 시각 순으로 들어오는 일반적인 경우는 append (O(1))
+    if not keys or keys[-1] < key:
+        keys.append(key)
+    else:
+        insort(keys, key)
+
+
+def _remove_sorted(keys: List[SortKey], key: SortKey) -> None:
+    position = bisect_left(keys, key)
+    if position < len(keys) and keys[position] == key:
+        del keys[position]
+
+
+def _rebuild_sorted(keys: List[SortKey], removed: set, added: List[SortKey]) -> List[SortKey]:
+    # removed: 제거할 레코드의 UUID.int 집합 (버킷에는 레코드당 키가 하나)
+    # 정렬된 나머지 + 추가분 정렬 (대부분 정렬된 입력이므로 timsort가 병합에 가깝게 동작)
+    kept = [key for key in keys if key[1].int not in removed] if removed else list(keys)
+    kept.extend(added)
+    kept.sort()
+    return kept
+
+
+# =============================================================================
+# BUDGET ITEM STORE
+# =============================================================================
+
+class BudgetItemStore(IndexedStore[BudgetLineItem]):
+    """이벤트별 집계를 함께 유지하는 예산 항목 저장소"""
+
+    def __init__(self):
+        super().__init__(index_fields=("event_id", "category", "status"))
+        self._aggregates: Dict[UUID, BudgetAggregate] = {}
+
+    def add(self, record: BudgetLineItem) -> BudgetLineItem:
+        super().add(record)
+        self._apply(record, 1)
+        return record
+
+    def replace(self, record: BudgetLineItem) -> Optional[BudgetLineItem]:
+        old = super().replace(record)
+        if old is not None:
+            self._apply(old, -1)
+            self._apply(record, 1)
+        return old
+
+    def replace_many(self, records: Iterable[BudgetLineItem]) -> List[Tuple[BudgetLineItem, BudgetLineItem]]:
+        pairs = super().replace_many(records)
+        for old, record in pairs:
+            self._apply(old, -1)
+            self._apply(record, 1)
+        return pairs
+
+    def remove(self, record_id: UUID) -> Optional[BudgetLineItem]:
+        record = super().remove(record_id)
+        if record is not None:
+            self._apply(record, -1)
+        return record
+
+    def clear(self) -> None:
+        super().clear()
+        self._aggregates.clear()
+
+    def export(self) -> Tuple[List[BudgetLineItem], Dict[UUID, BudgetAggregate]]:
+        records, _ = super().export()
+        return records, {event_id: aggregate.copy() for event_id, aggregate in self._aggregates.items()}
+
+    def load(
+        self,
+        records: Sequence[BudgetLineItem],
+        derived: Optional[Dict[UUID, BudgetAggregate]] = None,
+    ) -> None:
+        """집계 사본이 없으면 항목으로부터 다시 계산"""
+        super().load(records)
+        if derived is not None:
+            self._aggregates = derived
+        else:
+            for record in records:
+                self._apply(record, 1)
+
+    def aggregate(self, event_id: UUID) -> Optional[BudgetAggregate]:
+        """이벤트 집계 조회 (항목이 없으면 None)"""
+        return self._aggregates.get(event_id)
+
+    def check_aggregate(self, event_id: UUID) -> List[Dict[str, Any]]:
+        """누적 집계와 전체 재계산 결과를 비교하여 drift 목록 반환"""
+        cached = self._aggregates.get(event_id) or BudgetAggregate()
+        recomputed = BudgetAggregate.from_items(self.find(event_id=event_id))
+        return cached.diff(recomputed)
+
+    def _apply(self, record: BudgetLineItem, sign: int) -> None:
+        aggregate = self._aggregates.get(record.event_id)
+        if aggregate is None:
+            aggregate = self._aggregates[record.event_id] = BudgetAggregate()
+        aggregate.apply(record, sign)
+        if aggregate.total_items == 0:
+            del self._aggregates[record.event_id]
+
+
+# =============================================================================
+# SPONSOR STORE
+# =============================================================================
+
+class SponsorStore(IndexedStore[Sponsor]):
+    """(이벤트, 상태) 인덱스와 이벤트별 스폰서 수익 집계를 함께 유지하는 스폰서 저장소"""
+
+    def __init__(self):
+        super().__init__(index_fields=("status", "event_id", ("event_id", "status")))
+        self._revenue: Dict[UUID, SponsorRevenue] = {}
+
+    def add(self, record: Sponsor) -> Sponsor:
+        super().add(record)
+        self._apply(record, 1)
+        return record
+
+    def replace(self, record: Sponsor) -> Optional[Sponsor]:
+        old = super().replace(record)
+        if old is not None:
+            self._apply(old, -1)
+            self._apply(record, 1)
+        return old
+
+    def replace_many(self, records: Iterable[Sponsor]) -> List[Tuple[Sponsor, Sponsor]]:
+        pairs = super().replace_many(records)
+        for old, record in pairs:
+            self._apply(old, -1)
+            self._apply(record, 1)
+        return pairs
+
+    def remove(self, record_id: UUID) -> Optional[Sponsor]:
+        record = super().remove(record_id)
+        if record is not None:
+            self._apply(record, -1)
+        return record
+
+    def clear(self) -> None:
+        super().clear()
+        self._revenue.clear()
+
+    def export(self) -> Tuple[List[Sponsor], Dict[UUID, SponsorRevenue]]:
+        records, _ = super().export()
+        return records, {event_id: revenue.copy() for event_id, revenue in self._revenue.items()}
+
+    def load(self, records: Sequence[Sponsor], derived: Optional[Dict[UUID, SponsorRevenue]] = None) -> None:
+        """집계 사본이 없으면 스폰서로부터 다시 계산"""
+        super().load(records)
+        if derived is not None:
+            self._revenue = derived
+        else:
+            for record in records:
+                self._apply(record, 1)
+
+    def revenue(self, event_id: UUID) -> Optional[SponsorRevenue]:
+        """이벤트 스폰서 수익 집계 (이벤트에 연결된 스폰서가 없으면 None)"""
+        return self._revenue.get(event_id)
+
+    def _apply(self, record: Sponsor, sign: int) -> None:
+        if record.event_id is None:
+            return
+        revenue = self._revenue.get(record.event_id)
+        if revenue is None:
+            revenue = self._revenue[record.event_id] = SponsorRevenue()
+        revenue.apply(record, sign)
+        if not revenue.by_status:
+            del self._revenue[record.event_id]
+
+
+# =============================================================================
+# REPOSITORY
+# =============================================================================
+
+class MemoryCollection(Collection[T]):
+    """IndexedStore를 비동기 Collection 인터페이스로 노출"""
+
+    def __init__(self, store: IndexedStore[T], lock_field: str = "id"):
+        super().__init__(lock_field)
+        self.store = store
+
+    async def get(self, record_id: UUID) -> Optional[T]:
+        return self.store.get(record_id)
+
+    async def get_many(self, record_ids: Sequence[UUID]) -> Dict[UUID, T]:
+        found: Dict[UUID, T] = {}
+        for record_id in record_ids:
+            record = self.store.get(record_id)
+            if record is not None:
+                found[record_id] = record
+        return found
+
+    async def add(self, record: T) -> T:
+        self.store.add(record)
+        self._notify(None, record)
+        return record
+
+    async def add_many(self, records: List[T]) -> int:
+        for record in records:
+            self.store.add(record)
+        self._notify_many([(None, record) for record in records])
+        return len(records)
+
+    async def replace(self, record: T) -> Optional[T]:
+        old = self.store.replace(record)
+        if old is not None:
+            self._notify(old, record)
+        return old
+
+    async def replace_many(self, records: List[T]) -> int:
+        pairs = self.store.replace_many(records)
+        self._notify_many(pairs)
+        return len(pairs)
+
+    async def remove(self, record_id: UUID) -> Optional[T]:
+        old = self.store.remove(record_id)
+        if old is not None:
+            self._notify(old, None)
+        return old
+
+    async def find(self, **filters: Any) -> List[T]:
+        return self.store.find(**filters)
+
+    async def page(
+        self,
+        limit: int,
+        after: Optional[SortKey] = None,
+        **filters: Any,
+    ) -> Tuple[List[T], Optional[SortKey]]:
+        return self.store.page(limit, after, **filters)
+
+    async def count(self, **filters: Any) -> int:
+        return self.store.count(**filters)
+
+    async def clear(self) -> None:
+        self.store.clear()
+        self._notify_clear()
+
+    async def stats(self) -> Dict[str, int]:
+        return self.store.stats()
+
+
+class MemoryFinanceRepository(FinanceRepository):
+    """
+    프로세스 메모리 기반 재무 저장소.
+    journal_dir가 없으면 재시작 시 초기화, 있으면 변경 저널 + 스냅샷으로 open() 때 복구
+    (storage.journal).
+    """
+
+    backend = "memory"
+
+    def __init__(
+        self,
+        journal_dir: Optional[str] = None,
+        flush_interval: float = 0.01,
+        snapshot_every: int = 100_000,
+    ):
+        self.budget_item_store = BudgetItemStore()
+        self.budget_items = MemoryCollection(self.budget_item_store, lock_field="event_id")
+        self.sponsorship_packages = MemoryCollection(IndexedStore(index_fields=("event_id",)))
+        self.sponsor_store = SponsorStore()
+        self.sponsors = MemoryCollection(self.sponsor_store)
+        self.reports = MemoryCollection(
+            IndexedStore(index_fields=("event_id",), sort_field="report_date")
+        )
+        self.transactions = MemoryCollection(
+            IndexedStore(index_fields=("event_id", "budget_line_item_id"), sort_field="transaction_date")
+        )
+        self.pricing_tiers = MemoryCollection(IndexedStore(index_fields=("event_id",)))
+        self.sponsorship_reservations = MemoryCollection(
+            IndexedStore(index_fields=("event_id", "sponsor_id", "status", ("package_id", "status")))
+        )
+
+        # 프로세스마다 새 인스턴스 ID → 재시작 전 ETag와 충돌하지 않음
+        self.instance_id = uuid4().hex[:12]
+        self.revisions = RevisionClock()
+        for collection in self.collections().values():
+            collection.subscribe(self.revisions)
+
+        self.journal: Optional["StoreJournal"] = None
+        if journal_dir:
+            from storage.journal import StoreJournal
+            self.journal = StoreJournal(journal_dir, self.collections(), flush_interval, snapshot_every)
+
+    async def open(self) -> None:
+        if self.journal is not None:
+            await self.journal.open()
+
+    async def close(self) -> None:
+        if self.journal is not None:
+            await self.journal.close()
+
+    async def stats(self) -> Dict[str, Any]:
+        stats = await super().stats()
+        if self.journal is not None:
+            stats["journal"] = self.journal.stats()
+        return stats
+
+    async def budget_aggregate(self, event_id: UUID) -> BudgetAggregate:
+        aggregate = self.budget_item_store.aggregate(event_id)
+        if aggregate is None:
+            self.aggregate_misses += 1
+            return BudgetAggregate()
+        self.aggregate_hits += 1
+        return aggregate
+
+    async def check_budget_aggregate(self, event_id: UUID) -> List[Dict[str, Any]]:
+        return self.budget_item_store.check_aggregate(event_id)
+
+    async def sponsor_revenue(self, event_id: UUID) -> SponsorRevenue:
+        return self.sponsor_store.revenue(event_id) or SponsorRevenue()
+
+    async def claim_package(self, reservation: SponsorshipReservation) -> Optional[SponsorshipReservation]:
+        # 같은 패키지의 확보 / 전이만 직렬화 (패키지 ID 분할 락)
+        async with self.sponsorship_packages.lock(reservation.package_id):
+            package = await self.sponsorship_packages.get(reservation.package_id)
+            if package is None:
+                return None
+            held = await self.sponsorship_reservations.find(
+                package_id=package.id, status=ReservationStatus.HELD
+            )
+            expired = expire_holds(held, reservation.created_at)
+            updated = claim_slot(release_expired(package, len(expired)), reservation)
+            await self.sponsorship_reservations.replace_many(expired)
+            await self.sponsorship_packages.replace(updated)
+            await self.sponsorship_reservations.add(reservation)
+            return reservation
+
+    async def settle_reservation(
+        self,
+        reservation_id: UUID,
+        status: ReservationStatus,
+        now: datetime,
+        sponsor_id: Optional[UUID] = None,
+    ) -> Optional[SponsorshipReservation]:
+        reservation = await self.sponsorship_reservations.get(reservation_id)
+        if reservation is None:
+            return None
+        async with self.sponsorship_packages.lock(reservation.package_id):
+            # 락 대기 중 다른 요청이 전이했을 수 있으므로 다시 읽는다
+            reservation = await self.sponsorship_reservations.get(reservation_id)
+            if reservation is None:
+                return None
+            package = await self.sponsorship_packages.get(reservation.package_id)
+            changed = settle(package, reservation, status, now, sponsor_id)
+            if changed is None:
+                return reservation
+            package, reservation = changed
+            if package is not None:
+                await self.sponsorship_packages.replace(package)
+            await self.sponsorship_reservations.replace(reservation)
+            return reservation
+
+    async def expire_reservations(self, now: datetime) -> int:
+        expired = expire_holds(
+            await self.sponsorship_reservations.find(status=ReservationStatus.HELD), now
+        )
+        by_package: Dict[UUID, int] = defaultdict(int)
+        for reservation in expired:
+            by_package[reservation.package_id] += 1
+        count = 0
+        for package_id in by_package:
+            async with self.sponsorship_packages.lock(package_id):
+                # 락 안에서 다시 확인 (그사이 전환 / 해제 / 정리된 보류 제외)
+                held = await self.sponsorship_reservations.find(
+                    package_id=package_id, status=ReservationStatus.HELD
+                )
+                current = expire_holds(held, now)
+                package = await self.sponsorship_packages.get(package_id)
+                if package is not None:
+                    await self.sponsorship_packages.replace(release_expired(package, len(current)))
+                await self.sponsorship_reservations.replace_many(current)
+                count += len(current)
+        return count
+
+    async def revision(self, event_id: Optional[UUID] = None) -> str:
+        return f"{self.instance_id}.{self.revisions.revision(event_id)}"
@@ -0,0 +1,38 @@
+"""
+Keyset Pagination Cursor
+
+정렬 키 (sort_field 값, id) ↔ 불투명(opaque) 커서 문자열 변환.
+커서는 URL-safe base64로 인코딩된 JSON이며 클라이언트는 내용을 해석하지 않는다.
+저장된 정렬 키는 naive UTC이므로 시간대가 있는 커서 값은 naive UTC로 변환해 비교한다.
+
+Author: Event Agent System
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from schemas.financial import utc_naive
+from storage.base import SortKey
+
+
+def encode_cursor(key: Optional[SortKey]) -> Optional[str]:
+    """정렬 키 → 커서 문자열"""
+    if key is None:
+        return None
+    value, record_id = key
+    payload = json.dumps([value.isoformat(timespec="microseconds"), str(record_id)])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> SortKey:
+    """커서 문자열 → 정렬 키 (형식이 잘못되면 ValueError)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        value, record_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return utc_naive(datetime.fromisoformat(value)), UUID(record_id)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as exc:
+        raise ValueError(f"Invalid cursor: {cursor}") from exc
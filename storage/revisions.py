@@ -0,0 +1,52 @@
+"""
+Revision Clock
+
+조건부 GET(ETag / If-None-Match)용 변경 리비전.
+- 전역 시계: 모든 컬렉션의 쓰기마다 1 증가
+- 이벤트 리비전: 해당 이벤트(event_id)에 영향을 준 마지막 쓰기의 시계 값
+- 컬렉션 전체 삭제 시 모든 이벤트 리비전을 새 시계 값(floor)으로 올림
+→ 리비전이 같으면 그 사이 해당 범위의 데이터가 바뀌지 않았음을 보장
+
+Author: Event Agent System
+"""
+
+from typing import Any, Dict, Optional, Sequence, Tuple
+from uuid import UUID
+
+from storage.base import ChangeListener
+
+
+class RevisionClock(ChangeListener[Any]):
+    """컬렉션 변경 구독으로 유지되는 전역 / 이벤트별 리비전 (In-Memory 백엔드)"""
+
+    def __init__(self):
+        self.value = 0
+        self.floor = 0
+        self._events: Dict[UUID, int] = {}
+
+    def revision(self, event_id: Optional[UUID] = None) -> int:
+        """event_id가 없으면 전역 시계, 있으면 해당 이벤트의 마지막 변경 시점"""
+        if event_id is None:
+            return self.value
+        return self._events.get(event_id, self.floor)
+
+    def record_changed(self, old: Optional[Any], new: Optional[Any]) -> None:
+        self.value += 1
+        for record in (old, new):
+            event_id = getattr(record, "event_id", None)
+            if event_id is not None:
+                self._events[event_id] = self.value
+
+    def records_changed(self, changes: Sequence[Tuple[Optional[Any], Optional[Any]]]) -> None:
+        """일괄 쓰기는 시계를 한 번만 올린다 (SQLite 백엔드의 일괄 쓰기와 같은 규칙)"""
+        self.value += 1
+        for old, new in changes:
+            for record in (old, new):
+                event_id = getattr(record, "event_id", None)
+                if event_id is not None:
+                    self._events[event_id] = self.value
+
+    def collection_cleared(self) -> None:
+        self.value += 1
+        self.floor = self.value
+        self._events.clear()
@@ -0,0 +1,388 @@
+"""
+Sharded SQLite Finance Repository
+
+event_id 기준으로 여러 SQLite 파일에 나눠 저장하는 재무 저장소.
+여러 워커 프로세스(uvicorn --workers N)가 같은 파일들을 열어 하나의 데이터를 일관되게 서비스한다.
+- 샤드 = crc32(event_id) % 샤드 수 (프로세스 / 실행과 무관하게 같은 값)
+- 샤드마다 독립 WAL 파일 + 쓰기 락 → 서로 다른 이벤트의 쓰기는 병렬 진행
+- 이벤트 단위 조회 / 집계 / 리비전은 해당 샤드 1곳만 읽음
+- ID 조회는 프로세스 로컬 ID → 샤드 LRU 캐시, 모르는 ID는 모든 샤드에 동시 조회
+- 이벤트 필터 없는 목록 / 개수는 샤드별 결과를 정렬 키 순으로 병합
+- 스폰서는 event_id가 나중에 바뀔 수 있어 0번 샤드에 모아 둔다
+  (이벤트 리비전 = 이벤트 샤드 리비전 + 0번 샤드 리비전)
+
+제약:
+- 샤드 수는 데이터 생성 시 고정 (각 파일에 기록, 다른 수로 열면 ValueError)
+- 샤드 컬렉션 레코드의 event_id는 바꿀 수 없다 (replace 시 ValueError)
+- 일괄 쓰기는 샤드별 트랜잭션 (여러 샤드에 걸친 배치는 샤드 간 원자성 없음)
+  → 일괄 교체는 모든 샤드의 버전을 먼저 확인한 뒤 샤드 순서대로 쓰고, 그 사이 다른 프로세스가
+    끼어들어 일부 샤드만 저장되면 PartialWrite (저장된 레코드 목록 포함)
+  → all_or_nothing 일괄 수정은 한 샤드 안에서만 허용 (여러 샤드면 ValueError)
+
+Author: Event Agent System
+"""
+
+import asyncio
+import heapq
+import sqlite3
+import zlib
+from collections import OrderedDict, defaultdict
+from datetime import datetime
+from itertools import islice
+from operator import attrgetter
+from pathlib import Path
+from typing import Any, DefaultDict, Dict, List, Optional, Sequence, Tuple, TypeVar, Union
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from schemas.financial import ReservationStatus, SponsorshipReservation
+from storage.aggregates import BudgetAggregate, SponsorRevenue
+from storage.base import (
+    ChangeListener,
+    Collection,
+    FieldUpdate,
+    FinanceRepository,
+    PartialWrite,
+    SortKey,
+    VersionConflict,
+    check_version,
+)
+from storage.sqlite import SQLiteCollection, SQLiteFinanceRepository
+
+
+T = TypeVar("T", bound=BaseModel)
+
+# 컬렉션별 ID → 샤드 캐시 최대 항목 수 (프로세스 로컬)
+ROUTE_CACHE_SIZE = 200_000
+
+LAYOUT_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS shard_layout ("
+    "id INTEGER PRIMARY KEY CHECK (id = 1), shard INTEGER NOT NULL, shards INTEGER NOT NULL)"
+)
+
+
+def shard_index(event_id: UUID, shards: int) -> int:
+    """event_id → 샤드 번호"""
+    return zlib.crc32(event_id.bytes) % shards
+
+
+def shard_path(path: str, index: int) -> str:
+    """기준 경로 → 샤드 파일 경로 (finance.db → finance.0.db)"""
+    base = Path(path)
+    return str(base.with_name(f"{base.stem}.{index}{base.suffix or '.db'}"))
+
+
+def claim_layout(conn: sqlite3.Connection, shard: int, shards: int) -> None:
+    """샤드 파일에 (번호, 샤드 수) 기록, 이미 다른 배치로 기록되어 있으면 ValueError"""
+    conn.execute(LAYOUT_SCHEMA)
+    conn.execute(
+        "INSERT OR IGNORE INTO shard_layout (id, shard, shards) VALUES (1, ?, ?)", (shard, shards)
+    )
+    stored = tuple(conn.execute("SELECT shard, shards FROM shard_layout WHERE id = 1").fetchone())
+    if stored != (shard, shards):
+        raise ValueError(
+            f"Shard file was created as shard {stored[0]} of {stored[1]}, opened as {shard} of {shards}"
+        )
+
+
+# =============================================================================
+# COLLECTION
+# =============================================================================
+
+class ShardedCollection(Collection[T]):
+    """
+    event_id로 샤드를 고르는 컬렉션 (샤드별 SQLiteCollection 묶음).
+
+    변경 구독자는 모든 샤드 컬렉션에 등록되어 샤드 쓰기 결과를 그대로 받는다.
+    """
+
+    def __init__(self, parts: Sequence[SQLiteCollection[T]], route_cache_size: int = ROUTE_CACHE_SIZE):
+        super().__init__(parts[0].lock_field)
+        self.parts = list(parts)
+        self.sort_key = attrgetter(parts[0].mapping.sort_field, "id")
+        self.route_cache_size = route_cache_size
+        self._routes: "OrderedDict[UUID, int]" = OrderedDict()
+        self.route_hits = 0
+        self.route_misses = 0
+
+    def subscribe(self, listener: ChangeListener[T]) -> None:
+        for part in self.parts:
+            part.subscribe(listener)
+
+    # -------------------------------------------------------------------------
+    # 라우팅
+    # -------------------------------------------------------------------------
+
+    def shard_of(self, event_id: UUID) -> int:
+        return shard_index(event_id, len(self.parts))
+
+    def _remember(self, record_id: UUID, shard: int) -> None:
+        routes = self._routes
+        routes[record_id] = shard
+        routes.move_to_end(record_id)
+        if len(routes) > self.route_cache_size:
+            routes.popitem(last=False)
+
+    def _group(self, records: Sequence[T]) -> DefaultDict[int, List[T]]:
+        groups: DefaultDict[int, List[T]] = defaultdict(list)
+        for record in records:
+            groups[self.shard_of(record.event_id)].append(record)
+        return groups
+
+    def _parts_for(self, filters: Dict[str, Any]) -> List[SQLiteCollection[T]]:
+        """event_id 필터가 있으면 해당 샤드만, 없으면 전체"""
+        event_id = filters.get("event_id")
+        if event_id is None:
+            return self.parts
+        return [self.parts[self.shard_of(event_id)]]
+
+    async def _locate(self, record_id: UUID) -> Optional[Tuple[int, T]]:
+        """ID → (샤드, 레코드): 캐시된 샤드 먼저, 없으면 모든 샤드 동시 조회"""
+        shard = self._routes.get(record_id)
+        if shard is not None:
+            record = await self.parts[shard].get(record_id)
+            if record is not None:
+                self.route_hits += 1
+                self._routes.move_to_end(record_id)
+                return shard, record
+            # 삭제됨 (같은 ID가 다른 이벤트로 다시 추가되었을 수 있으므로 전체 조회)
+            del self._routes[record_id]
+        self.route_misses += 1
+        found = await asyncio.gather(*(part.get(record_id) for part in self.parts))
+        for shard, record in enumerate(found):
+            if record is not None:
+                self._remember(record_id, shard)
+                return shard, record
+        return None
+
+    # -------------------------------------------------------------------------
+    # Collection 인터페이스
+    # -------------------------------------------------------------------------
+
+    async def get(self, record_id: UUID) -> Optional[T]:
+        located = await self._locate(record_id)
+        return located[1] if located is not None else None
+
+    async def get_many(self, record_ids: Sequence[UUID]) -> Dict[UUID, T]:
+        if not record_ids:
+            return {}
+        groups: DefaultDict[int, List[UUID]] = defaultdict(list)
+        unknown: List[UUID] = []
+        for record_id in record_ids:
+            shard = self._routes.get(record_id)
+            if shard is None:
+                unknown.append(record_id)
+            else:
+                groups[shard].append(record_id)
+
+        found: Dict[UUID, T] = {}
+        results = await asyncio.gather(*(self.parts[shard].get_many(ids) for shard, ids in groups.items()))
+        for ids, records in zip(groups.values(), results):
+            found.update(records)
+            self.route_hits += len(records)
+            unknown.extend(record_id for record_id in ids if record_id not in records)
+        if unknown:
+            self.route_misses += len(unknown)
+            results = await asyncio.gather(*(part.get_many(unknown) for part in self.parts))
+            for shard, records in enumerate(results):
+                for record_id in records:
+                    self._remember(record_id, shard)
+                found.update(records)
+        return found
+
+    async def add(self, record: T) -> T:
+        shard = self.shard_of(record.event_id)
+        await self.parts[shard].add(record)
+        self._remember(record.id, shard)
+        return record
+
+    async def add_many(self, records: List[T]) -> int:
+        if not records:
+            return 0
+        groups = self._group(records)
+        counts = await asyncio.gather(*(self.parts[shard].add_many(group) for shard, group in groups.items()))
+        return sum(counts)
+
+    async def replace(self, record: T) -> Optional[T]:
+        shard = self.shard_of(record.event_id)
+        old = await self.parts[shard].replace(record)
+        if old is not None:
+            self._remember(record.id, shard)
+            return old
+        located = await self._locate(record.id)
+        if located is not None:
+            raise ValueError(f"event_id of record {record.id} cannot change in a sharded collection")
+        return None
+
+    async def replace_many(self, records: List[T]) -> int:
+        if not records:
+            return 0
+        if len({record.id for record in records}) != len(records):
+            raise ValueError("Duplicate id in replace batch")
+        groups = self._group(records)
+        if len(groups) == 1:
+            shard, group = groups.popitem()
+            return await self.parts[shard].replace_many(group)
+
+        # 샤드 간 트랜잭션이 없으므로 모든 샤드의 버전을 먼저 확인 → 충돌이면 아무것도 쓰지 않는다
+        stored = await self.get_many([record.id for record in records])
+        for record in records:
+            old = stored.get(record.id)
+            if old is not None:
+                check_version(old, record)
+
+        # 확인 이후 다른 프로세스가 끼어든 경우에만 일부 샤드가 저장된 채로 실패할 수 있다
+        count = 0
+        written: List[T] = []
+        for shard in sorted(groups):
+            group = groups[shard]
+            try:
+                count += await self.parts[shard].replace_many(group)
+            except VersionConflict as exc:
+                if written:
+                    raise PartialWrite(written, exc) from exc
+                raise
+            written.extend(record for record in group if record.id in stored)
+        return count
+
+    async def update_many(
+        self,
+        updates: Sequence[FieldUpdate],
+        all_or_nothing: bool = False,
+    ) -> List[Union[T, VersionConflict, None]]:
+        if all_or_nothing:
+            existing = await self.get_many([record_id for record_id, _, _ in updates])
+            shards = {self.shard_of(record.event_id) for record in existing.values()}
+            if len(shards) > 1:
+                raise ValueError(
+                    f"all_or_nothing batch spans {len(shards)} shards (events); "
+                    "send one batch per event or set all_or_nothing=false"
+                )
+        return await super().update_many(updates, all_or_nothing)
+
+    async def remove(self, record_id: UUID) -> Optional[T]:
+        located = await self._locate(record_id)
+        if located is None:
+            return None
+        self._routes.pop(record_id, None)
+        return await self.parts[located[0]].remove(record_id)
+
+    async def find(self, **filters: Any) -> List[T]:
+        parts = self._parts_for(filters)
+        if len(parts) == 1:
+            return await parts[0].find(**filters)
+        results = await asyncio.gather(*(part.find(**filters) for part in parts))
+        return list(heapq.merge(*results, key=self.sort_key))
+
+    async def page(
+        self,
+        limit: int,
+        after: Optional[SortKey] = None,
+        **filters: Any,
+    ) -> Tuple[List[T], Optional[SortKey]]:
+        parts = self._parts_for(filters)
+        if len(parts) == 1:
+            return await parts[0].page(limit, after, **filters)
+        # 샤드마다 같은 위치부터 limit개씩 → 정렬 키 순 병합 후 앞에서 limit개
+        results = await asyncio.gather(*(part.page(limit, after, **filters) for part in parts))
+        merged = heapq.merge(*(records for records, _ in results), key=self.sort_key)
+        records = list(islice(merged, limit + 1))
+        more = len(records) > limit or any(next_key is not None for _, next_key in results)
+        records = records[:limit]
+        if not more or not records:
+            return records, None
+        return records, self.sort_key(records[-1])
+
+    async def count(self, **filters: Any) -> int:
+        parts = self._parts_for(filters)
+        return sum(await asyncio.gather(*(part.count(**filters) for part in parts)))
+
+    async def clear(self) -> None:
+        await asyncio.gather(*(part.clear() for part in self.parts))
+        self._routes.clear()
+
+    async def stats(self) -> Dict[str, int]:
+        return {"records": await self.count(), "route_cache": len(self._routes)}
+
+
+# =============================================================================
+# REPOSITORY
+# =============================================================================
+
+class ShardedFinanceRepository(FinanceRepository):
+    """event_id 기준 샤드 SQLite 파일 묶음 (여러 워커 프로세스가 공유)"""
+
+    backend = "sharded"
+    shared = True
+
+    def __init__(self, path: str, shards: int = 4, pool_size: int = 4):
+        if shards < 1:
+            raise ValueError("shards must be >= 1")
+        self.shards = [SQLiteFinanceRepository(shard_path(path, index), pool_size) for index in range(shards)]
+        for index, shard in enumerate(self.shards):
+            shard.pool.write_sync(claim_layout, index, shards)
+
+        self.budget_items = ShardedCollection([shard.budget_items for shard in self.shards])
+        self.sponsorship_packages = ShardedCollection([shard.sponsorship_packages for shard in self.shards])
+        self.sponsors = self.shards[0].sponsors
+        self.reports = ShardedCollection([shard.reports for shard in self.shards])
+        self.transactions = ShardedCollection([shard.transactions for shard in self.shards])
+        self.pricing_tiers = ShardedCollection([shard.pricing_tiers for shard in self.shards])
+        self.sponsorship_reservations = ShardedCollection(
+            [shard.sponsorship_reservations for shard in self.shards]
+        )
+
+    def shard_for(self, event_id: UUID) -> SQLiteFinanceRepository:
+        return self.shards[shard_index(event_id, len(self.shards))]
+
+    async def budget_aggregate(self, event_id: UUID) -> BudgetAggregate:
+        return await self.shard_for(event_id).budget_aggregate(event_id)
+
+    async def check_budget_aggregate(self, event_id: UUID) -> List[Dict[str, Any]]:
+        return await self.shard_for(event_id).check_budget_aggregate(event_id)
+
+    async def sponsor_revenue(self, event_id: UUID) -> SponsorRevenue:
+        return await self.shards[0].sponsor_revenue(event_id)
+
+    async def claim_package(self, reservation: SponsorshipReservation) -> Optional[SponsorshipReservation]:
+        # 보류는 패키지와 같은 샤드 (둘 다 event_id 기준) → 한 파일의 쓰기 트랜잭션
+        return await self.shard_for(reservation.event_id).claim_package(reservation)
+
+    async def settle_reservation(
+        self,
+        reservation_id: UUID,
+        status: ReservationStatus,
+        now: datetime,
+        sponsor_id: Optional[UUID] = None,
+    ) -> Optional[SponsorshipReservation]:
+        located = await self.sponsorship_reservations._locate(reservation_id)
+        if located is None:
+            return None
+        return await self.shards[located[0]].settle_reservation(reservation_id, status, now, sponsor_id)
+
+    async def expire_reservations(self, now: datetime) -> int:
+        return sum(await asyncio.gather(*(shard.expire_reservations(now) for shard in self.shards)))
+
+    async def revision(self, event_id: Optional[UUID] = None) -> str:
+        if event_id is None:
+            shards = self.shards
+        else:
+            # 스폰서 쓰기는 0번 샤드의 이벤트 리비전을 올린다
+            shards = list(dict.fromkeys((self.shard_for(event_id), self.shards[0])))
+        return "-".join(await asyncio.gather(*(shard.revision(event_id) for shard in shards)))
+
+    async def stats(self) -> Dict[str, Any]:
+        stats = await super().stats()
+        stats["aggregate_cache"] = {
+            "hits": sum(shard.aggregate_hits for shard in self.shards),
+            "misses": sum(shard.aggregate_misses for shard in self.shards),
+        }
+        return stats
+
+    async def ping(self) -> None:
+        await asyncio.gather(*(shard.ping() for shard in self.shards))
+
+    async def close(self) -> None:
+        for shard in self.shards:
+            await shard.close()
@@ -0,0 +1,944 @@
+"""
+SQLite Finance Repository
+
+로컬 SQLite 파일 기반 재무 저장소.
+- WAL 모드 (읽기/쓰기 동시성), synchronous=NORMAL
+- 전용 스레드 풀 + 스레드별 커넥션 → asyncio 이벤트 루프를 블로킹하지 않음
+- 고정 SQL + 파라미터 바인딩 (커넥션별 statement cache 재사용)
+- event_id / category / status 인덱스, (이벤트, 카테고리, 상태) 증분 집계 테이블
+- 스폰서 (event_id, status) 인덱스, (이벤트, 상태) 스폰서 수익 증분 집계 테이블
+- 스폰서십 패키지 수량 보류 / 전환: 패키지 읽기 · 검사 · 쓰기를 한 BEGIN IMMEDIATE 트랜잭션에서 수행
+  (다른 프로세스와도 초과 판매 없음)
+- (필터 컬럼, created_at, id) 복합 인덱스 기반 키셋 페이지네이션
+- 쓰기 트랜잭션 안에서 전역 / 이벤트별 변경 리비전 갱신 (다중 프로세스에서도 일관된 ETag)
+
+스키마: storage/sqlite_schema.sql
+
+Author: Event Agent System
+"""
+
+import asyncio
+import json
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Dict, Generic, List, Optional, Sequence, Set, Tuple, Type, TypeVar
+from uuid import UUID
+
+from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
+
+from schemas.financial import (
+    BudgetLineItem,
+    FinancialReport,
+    PricingTier,
+    ReservationStatus,
+    Sponsor,
+    SponsorshipPackage,
+    SponsorshipReservation,
+    Transaction,
+)
+from storage.aggregates import BudgetAggregate, SponsorRevenue
+from storage.base import Collection, FinanceRepository, SortKey, check_version
+from storage.inventory import claim_slot, expire_holds, release_expired, settle
+
+
+T = TypeVar("T", bound=BaseModel)
+
+SCHEMA_PATH = Path(__file__).with_name("sqlite_schema.sql")
+
+# 일괄 조회 시 IN (...) 파라미터 수 (SQLite 변수 한도 이내)
+SELECT_BATCH = 500
+
+# 기존 DB 파일에 스키마 이후 추가된 컬럼 보강: (테이블, 컬럼, 정의)
+COLUMN_MIGRATIONS: Tuple[Tuple[str, str, str], ...] = (
+    ("budget_items", "version", "INTEGER NOT NULL DEFAULT 1"),
+    ("sponsors", "version", "INTEGER NOT NULL DEFAULT 1"),
+    ("sponsors", "event_id", "TEXT"),
+    ("budget_items", "reference_number", "TEXT"),
+    ("sponsorship_packages", "held_count", "INTEGER NOT NULL DEFAULT 0"),
+)
+
+
+# =============================================================================
+# CONNECTION POOL
+# =============================================================================
+
+class ConnectionPool:
+    """
+    스레드별 SQLite 커넥션 풀.
+
+    모든 쿼리는 전용 ThreadPoolExecutor에서 실행되며, 각 워커 스레드는
+    자신의 커넥션을 재사용한다 (풀 크기 = 스레드 수).
+    쓰기 작업은 BEGIN IMMEDIATE 트랜잭션으로 감싼다.
+    """
+
+    def __init__(self, path: str, size: int = 4):
+        self.path = path
+        self.size = size
+        self._executor = ThreadPoolExecutor(max_workers=size, thread_name_prefix="finance-sqlite")
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+        conn = self._connect()
+        try:
+            # 새 컬럼을 참조하는 인덱스가 있으므로 스키마 스크립트보다 먼저 보강
+            self.added_columns = self._migrate(conn)
+            conn.executescript(SCHEMA_PATH.read_text(encoding="utf-8"))
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _migrate(conn: sqlite3.Connection) -> Set[Tuple[str, str]]:
+        """기존 테이블에 없는 컬럼 추가 (테이블이 아직 없으면 건너뜀), 추가한 (테이블, 컬럼) 반환"""
+        added: Set[Tuple[str, str]] = set()
+        for table, column, definition in COLUMN_MIGRATIONS:
+            columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+            if columns and column not in columns:
+                conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+                added.add((table, column))
+        return added
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.path,
+            timeout=30,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=256,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        return conn
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def _call(self, fn: Callable[..., Any], args: Tuple[Any, ...], write: bool) -> Any:
+        conn = self._connection()
+        if not write:
+            return fn(conn, *args)
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            result = fn(conn, *args)
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        return result
+
+    async def read(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """읽기 작업을 풀 스레드에서 실행"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._call, fn, args, False)
+
+    async def write(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """쓰기 작업을 트랜잭션으로 풀 스레드에서 실행"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._call, fn, args, True)
+
+    def write_sync(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """이벤트 루프 밖(초기화 등)에서 쓰기 작업 실행 후 결과 대기"""
+        return self._executor.submit(self._call, fn, args, True).result()
+
+    def close(self) -> None:
+        """스레드 풀 종료 및 모든 커넥션 닫기"""
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+
+
+# =============================================================================
+# ROW ENCODING
+# =============================================================================
+
+def encode_value(value: Any) -> Any:
+    """Python 값 → SQLite 컬럼 값"""
+    if value is None:
+        return None
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat(timespec="microseconds")
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, bool):
+        return int(value)
+    return value
+
+
+class TableMapping(Generic[T]):
+    """모델 ↔ 테이블 행 매핑 및 고정 SQL"""
+
+    def __init__(
+        self,
+        table: str,
+        model: Type[T],
+        json_columns: Sequence[str] = (),
+        sort_field: str = "created_at",
+    ):
+        self.table = table
+        self.model = model
+        self.columns: List[str] = list(model.model_fields)
+        self.json_columns = set(json_columns)
+        self.sort_field = sort_field
+
+        cols = ", ".join(self.columns)
+        marks = ", ".join("?" for _ in self.columns)
+        sets = ", ".join(f"{c} = ?" for c in self.columns if c != "id")
+        self.insert_sql = f"INSERT INTO {table} ({cols}) VALUES ({marks})"
+        self.update_sql = f"UPDATE {table} SET {sets} WHERE id = ?"
+        self.select_sql = f"SELECT {cols} FROM {table} WHERE id = ?"
+        self._select_many_sql: Dict[int, str] = {}
+        self.delete_sql = f"DELETE FROM {table} WHERE id = ?"
+        self._find_sql: Dict[Tuple[str, ...], str] = {}
+        self._page_sql: Dict[Tuple[Tuple[str, ...], bool], str] = {}
+        self._count_sql: Dict[Tuple[str, ...], str] = {}
+
+    def encode(self, record: T) -> List[Any]:
+        values = []
+        for column in self.columns:
+            value = getattr(record, column)
+            if column in self.json_columns:
+                values.append(json.dumps(to_jsonable_python(value)))
+            else:
+                values.append(encode_value(value))
+        return values
+
+    def encode_update(self, record: T) -> List[Any]:
+        values = self.encode(record)
+        id_value = values.pop(self.columns.index("id"))
+        values.append(id_value)
+        return values
+
+    def decode(self, row: Sequence[Any]) -> T:
+        data = dict(zip(self.columns, row))
+        for column in self.json_columns:
+            if data[column] is not None:
+                data[column] = json.loads(data[column])
+        return self.model.model_validate(data)
+
+    def select_many_sql(self, count: int) -> str:
+        sql = self._select_many_sql.get(count)
+        if sql is None:
+            marks = ", ".join("?" for _ in range(count))
+            sql = f"SELECT {', '.join(self.columns)} FROM {self.table} WHERE id IN ({marks})"
+            self._select_many_sql[count] = sql
+        return sql
+
+    def find_sql(self, fields: Tuple[str, ...]) -> str:
+        sql = self._find_sql.get(fields)
+        if sql is None:
+            sql = (
+                f"SELECT {', '.join(self.columns)} FROM {self.table}{self._where(fields)} "
+                f"ORDER BY {self.sort_field}, id"
+            )
+            self._find_sql[fields] = sql
+        return sql
+
+    def page_sql(self, fields: Tuple[str, ...], has_after: bool) -> str:
+        """(sort_field, id) 행 값 비교 기반 키셋 페이지 SQL"""
+        sql = self._page_sql.get((fields, has_after))
+        if sql is None:
+            conditions = [f"{f} = ?" for f in fields]
+            if has_after:
+                conditions.append(f"({self.sort_field}, id) > (?, ?)")
+            where = " WHERE " + " AND ".join(conditions) if conditions else ""
+            sql = (
+                f"SELECT {', '.join(self.columns)} FROM {self.table}{where} "
+                f"ORDER BY {self.sort_field}, id LIMIT ?"
+            )
+            self._page_sql[(fields, has_after)] = sql
+        return sql
+
+    def count_sql(self, fields: Tuple[str, ...]) -> str:
+        sql = self._count_sql.get(fields)
+        if sql is None:
+            sql = f"SELECT COUNT(*) FROM {self.table}{self._where(fields)}"
+            self._count_sql[fields] = sql
+        return sql
+
+    def _where(self, fields: Tuple[str, ...]) -> str:
+        for field in fields:
+            if field not in self.columns:
+                raise ValueError(f"Unknown column {field} for {self.table}")
+        if not fields:
+            return ""
+        return " WHERE " + " AND ".join(f"{f} = ?" for f in fields)
+
+
+# =============================================================================
+# REVISIONS
+# =============================================================================
+
+# 전역 시계 / 이벤트별 리비전 (storage.revisions.RevisionClock과 같은 규칙, 쓰기 트랜잭션 안에서 갱신)
+REVISION_TICK = "UPDATE revision_clock SET value = value + 1 WHERE id = 1"
+REVISION_VALUE = "SELECT value FROM revision_clock WHERE id = 1"
+REVISION_STAMP = (
+    "INSERT INTO event_revisions (event_id, revision) VALUES (?, ?) "
+    "ON CONFLICT (event_id) DO UPDATE SET revision = excluded.revision"
+)
+# UPDATE의 우변은 갱신 전 값을 참조하므로 floor = 새 value
+REVISION_RESET = "UPDATE revision_clock SET value = value + 1, floor = value + 1 WHERE id = 1"
+REVISION_SELECT_GLOBAL = "SELECT instance_id, value FROM revision_clock WHERE id = 1"
+REVISION_SELECT_EVENT = (
+    "SELECT instance_id, COALESCE("
+    "(SELECT revision FROM event_revisions WHERE event_id = ?), floor"
+    ") FROM revision_clock WHERE id = 1"
+)
+
+
+def bump_revision(conn: sqlite3.Connection, records: Sequence[Optional[BaseModel]]) -> None:
+    """전역 시계 1 증가 + 레코드들의 event_id 리비전을 새 시계 값으로 기록"""
+    conn.execute(REVISION_TICK)
+    value = conn.execute(REVISION_VALUE).fetchone()[0]
+    event_ids = {
+        str(record.event_id) for record in records
+        if getattr(record, "event_id", None) is not None
+    }
+    if event_ids:
+        conn.executemany(REVISION_STAMP, [(event_id, value) for event_id in event_ids])
+
+
+def reset_revisions(conn: sqlite3.Connection) -> None:
+    """컬렉션 전체 삭제: 모든 이벤트 리비전을 새 floor로"""
+    conn.execute(REVISION_RESET)
+    conn.execute("DELETE FROM event_revisions")
+
+
+def read_revision(conn: sqlite3.Connection, event_id: Optional[UUID]) -> str:
+    if event_id is None:
+        instance_id, value = conn.execute(REVISION_SELECT_GLOBAL).fetchone()
+    else:
+        instance_id, value = conn.execute(REVISION_SELECT_EVENT, (str(event_id),)).fetchone()
+    return f"{instance_id}.{value}"
+
+
+# =============================================================================
+# COLLECTIONS
+# =============================================================================
+
+class SQLiteCollection(Collection[T]):
+    """단일 테이블에 대한 비동기 CRUD"""
+
+    def __init__(self, pool: ConnectionPool, mapping: TableMapping[T], lock_field: str = "id"):
+        super().__init__(lock_field)
+        self.pool = pool
+        self.mapping = mapping
+
+    # -------------------------------------------------------------------------
+    # 쓰기 훅 (트랜잭션 내부에서 호출)
+    # -------------------------------------------------------------------------
+
+    def _on_insert(self, conn: sqlite3.Connection, record: T) -> None:
+        pass
+
+    def _on_delete(self, conn: sqlite3.Connection, record: T) -> None:
+        pass
+
+    def _on_insert_many(self, conn: sqlite3.Connection, records: List[T]) -> None:
+        for record in records:
+            self._on_insert(conn, record)
+
+    def _on_replace_many(self, conn: sqlite3.Connection, pairs: List[Tuple[T, T]]) -> None:
+        for old, record in pairs:
+            self._on_delete(conn, old)
+            self._on_insert(conn, record)
+
+    def _on_clear(self, conn: sqlite3.Connection) -> None:
+        pass
+
+    # -------------------------------------------------------------------------
+    # 동기 구현 (풀 스레드에서 실행)
+    # -------------------------------------------------------------------------
+
+    def _get(self, conn: sqlite3.Connection, record_id: UUID) -> Optional[T]:
+        row = conn.execute(self.mapping.select_sql, (str(record_id),)).fetchone()
+        return self.mapping.decode(row) if row else None
+
+    def _add(self, conn: sqlite3.Connection, record: T) -> T:
+        conn.execute(self.mapping.insert_sql, self.mapping.encode(record))
+        self._on_insert(conn, record)
+        bump_revision(conn, (record,))
+        return record
+
+    def _add_many(self, conn: sqlite3.Connection, records: List[T]) -> int:
+        conn.executemany(self.mapping.insert_sql, [self.mapping.encode(r) for r in records])
+        self._on_insert_many(conn, records)
+        bump_revision(conn, records)
+        return len(records)
+
+    def _replace(self, conn: sqlite3.Connection, record: T) -> Optional[T]:
+        # BEGIN IMMEDIATE 트랜잭션 안에서 읽고 비교하므로 프로세스 간에도 원자적
+        old = self._get(conn, record.id)
+        if old is None:
+            return None
+        check_version(old, record)
+        conn.execute(self.mapping.update_sql, self.mapping.encode_update(record))
+        self._on_delete(conn, old)
+        self._on_insert(conn, record)
+        bump_revision(conn, (old, record))
+        return old
+
+    def _replace_many(self, conn: sqlite3.Connection, records: List[T]) -> List[Tuple[T, T]]:
+        olds = self._get_many(conn, [record.id for record in records])
+        pairs: List[Tuple[T, T]] = []
+        for record in records:
+            old = olds.pop(record.id, None)
+            if old is None:
+                continue
+            check_version(old, record)
+            pairs.append((old, record))
+        if not pairs:
+            return pairs
+        conn.executemany(self.mapping.update_sql, [self.mapping.encode_update(r) for _, r in pairs])
+        self._on_replace_many(conn, pairs)
+        bump_revision(conn, [record for pair in pairs for record in pair])
+        return pairs
+
+    def _get_many(self, conn: sqlite3.Connection, record_ids: List[UUID]) -> Dict[UUID, T]:
+        found: Dict[UUID, T] = {}
+        for start in range(0, len(record_ids), SELECT_BATCH):
+            chunk = [str(record_id) for record_id in record_ids[start:start + SELECT_BATCH]]
+            rows = conn.execute(self.mapping.select_many_sql(len(chunk)), chunk)
+            for row in rows:
+                record = self.mapping.decode(row)
+                found[record.id] = record
+        return found
+
+    def _remove(self, conn: sqlite3.Connection, record_id: UUID) -> Optional[T]:
+        old = self._get(conn, record_id)
+        if old is None:
+            return None
+        conn.execute(self.mapping.delete_sql, (str(record_id),))
+        self._on_delete(conn, old)
+        bump_revision(conn, (old,))
+        return old
+
+    def _find(self, conn: sqlite3.Connection, filters: Dict[str, Any]) -> List[T]:
+        fields = tuple(filters)
+        rows = conn.execute(self.mapping.find_sql(fields), [encode_value(v) for v in filters.values()])
+        return [self.mapping.decode(row) for row in rows]
+
+    def _page(
+        self,
+        conn: sqlite3.Connection,
+        limit: int,
+        after: Optional[SortKey],
+        filters: Dict[str, Any],
+    ) -> Tuple[List[T], Optional[SortKey]]:
+        params = [encode_value(v) for v in filters.values()]
+        if after is not None:
+            params.extend((encode_value(after[0]), str(after[1])))
+        # 다음 페이지 존재 여부 확인을 위해 1개 더 조회
+        params.append(limit + 1)
+        sql = self.mapping.page_sql(tuple(filters), after is not None)
+        records = [self.mapping.decode(row) for row in conn.execute(sql, params)]
+        if len(records) <= limit:
+            return records, None
+        records = records[:limit]
+        last = records[-1]
+        return records, (getattr(last, self.mapping.sort_field), last.id)
+
+    def _count(self, conn: sqlite3.Connection, filters: Dict[str, Any]) -> int:
+        fields = tuple(filters)
+        sql = self.mapping.count_sql(fields)
+        return conn.execute(sql, [encode_value(v) for v in filters.values()]).fetchone()[0]
+
+    def _clear(self, conn: sqlite3.Connection) -> None:
+        conn.execute(f"DELETE FROM {self.mapping.table}")
+        self._on_clear(conn)
+        reset_revisions(conn)
+
+    # -------------------------------------------------------------------------
+    # Collection 인터페이스
+    # -------------------------------------------------------------------------
+
+    async def get(self, record_id: UUID) -> Optional[T]:
+        return await self.pool.read(self._get, record_id)
+
+    async def get_many(self, record_ids: Sequence[UUID]) -> Dict[UUID, T]:
+        if not record_ids:
+            return {}
+        return await self.pool.read(self._get_many, list(record_ids))
+
+    async def add(self, record: T) -> T:
+        await self.pool.write(self._add, record)
+        self._notify(None, record)
+        return record
+
+    async def add_many(self, records: List[T]) -> int:
+        if not records:
+            return 0
+        count = await self.pool.write(self._add_many, records)
+        self._notify_many([(None, record) for record in records])
+        return count
+
+    async def replace(self, record: T) -> Optional[T]:
+        old = await self.pool.write(self._replace, record)
+        if old is not None:
+            self._notify(old, record)
+        return old
+
+    async def replace_many(self, records: List[T]) -> int:
+        if not records:
+            return 0
+        if len({record.id for record in records}) != len(records):
+            raise ValueError("Duplicate id in replace batch")
+        pairs = await self.pool.write(self._replace_many, records)
+        self._notify_many(pairs)
+        return len(pairs)
+
+    async def remove(self, record_id: UUID) -> Optional[T]:
+        old = await self.pool.write(self._remove, record_id)
+        if old is not None:
+            self._notify(old, None)
+        return old
+
+    async def find(self, **filters: Any) -> List[T]:
+        filters = {k: v for k, v in filters.items() if v is not None}
+        return await self.pool.read(self._find, filters)
+
+    async def page(
+        self,
+        limit: int,
+        after: Optional[SortKey] = None,
+        **filters: Any,
+    ) -> Tuple[List[T], Optional[SortKey]]:
+        filters = {k: v for k, v in filters.items() if v is not None}
+        return await self.pool.read(self._page, limit, after, filters)
+
+    async def count(self, **filters: Any) -> int:
+        filters = {k: v for k, v in filters.items() if v is not None}
+        return await self.pool.read(self._count, filters)
+
+    async def clear(self) -> None:
+        await self.pool.write(self._clear)
+        self._notify_clear()
+
+
+class SQLiteBudgetItems(SQLiteCollection[BudgetLineItem]):
+    """budget_item_rollups 집계 테이블을 같은 트랜잭션에서 갱신하는 예산 항목 컬렉션"""
+
+    ROLLUP_SELECT = (
+        "SELECT item_count, projected_amount, actual_amount FROM budget_item_rollups "
+        "WHERE event_id = ? AND category = ? AND status = ?"
+    )
+    ROLLUP_UPSERT = (
+        "INSERT OR REPLACE INTO budget_item_rollups "
+        "(event_id, category, status, item_count, projected_amount, actual_amount) "
+        "VALUES (?, ?, ?, ?, ?, ?)"
+    )
+    ROLLUP_DELETE = (
+        "DELETE FROM budget_item_rollups WHERE event_id = ? AND category = ? AND status = ?"
+    )
+    CURRENCY_ROLLUP_SELECT = (
+        "SELECT item_count, projected_amount, actual_amount FROM budget_currency_totals "
+        "WHERE event_id = ? AND currency = ?"
+    )
+    CURRENCY_ROLLUP_UPSERT = (
+        "INSERT OR REPLACE INTO budget_currency_totals "
+        "(event_id, currency, item_count, projected_amount, actual_amount) VALUES (?, ?, ?, ?, ?)"
+    )
+    CURRENCY_ROLLUP_DELETE = "DELETE FROM budget_currency_totals WHERE event_id = ? AND currency = ?"
+
+    def __init__(self, pool: ConnectionPool):
+        super().__init__(pool, TableMapping("budget_items", BudgetLineItem), lock_field="event_id")
+
+    def _adjust_rollup(self, conn: sqlite3.Connection, record: BudgetLineItem, sign: int) -> None:
+        key = (str(record.event_id), record.category.value, record.status.value)
+        currency_key = (str(record.event_id), record.currency.value)
+        if sign > 0:
+            self._apply_rollup(conn, key, 1, record.projected_amount, record.actual_amount)
+            self._apply_currency_rollup(conn, currency_key, 1, record.projected_amount, record.actual_amount)
+        else:
+            self._apply_rollup(conn, key, -1, -record.projected_amount, -record.actual_amount)
+            self._apply_currency_rollup(conn, currency_key, -1, -record.projected_amount, -record.actual_amount)
+
+    def _apply_rollup(
+        self,
+        conn: sqlite3.Connection,
+        key: Tuple[str, str, str],
+        delta_count: int,
+        delta_projected: Decimal,
+        delta_actual: Decimal,
+    ) -> None:
+        row = conn.execute(self.ROLLUP_SELECT, key).fetchone()
+        count, projected, actual = (
+            (row[0], Decimal(row[1]), Decimal(row[2])) if row else (0, Decimal("0"), Decimal("0"))
+        )
+        count += delta_count
+        projected += delta_projected
+        actual += delta_actual
+        if count == 0:
+            conn.execute(self.ROLLUP_DELETE, key)
+        else:
+            conn.execute(self.ROLLUP_UPSERT, (*key, count, str(projected), str(actual)))
+
+    def _apply_currency_rollup(
+        self,
+        conn: sqlite3.Connection,
+        key: Tuple[str, str],
+        delta_count: int,
+        delta_projected: Decimal,
+        delta_actual: Decimal,
+    ) -> None:
+        row = conn.execute(self.CURRENCY_ROLLUP_SELECT, key).fetchone()
+        count, projected, actual = (
+            (row[0], Decimal(row[1]), Decimal(row[2])) if row else (0, Decimal("0"), Decimal("0"))
+        )
+        count += delta_count
+        projected += delta_projected
+        actual += delta_actual
+        if count == 0:
+            conn.execute(self.CURRENCY_ROLLUP_DELETE, key)
+        else:
+            conn.execute(self.CURRENCY_ROLLUP_UPSERT, (*key, count, str(projected), str(actual)))
+
+    def _on_insert(self, conn: sqlite3.Connection, record: BudgetLineItem) -> None:
+        self._adjust_rollup(conn, record, 1)
+
+    def _on_delete(self, conn: sqlite3.Connection, record: BudgetLineItem) -> None:
+        self._adjust_rollup(conn, record, -1)
+
+    def _on_insert_many(self, conn: sqlite3.Connection, records: List[BudgetLineItem]) -> None:
+        self._apply_rollup_groups(conn, [(record, 1) for record in records])
+
+    def _on_replace_many(
+        self, conn: sqlite3.Connection, pairs: List[Tuple[BudgetLineItem, BudgetLineItem]]
+    ) -> None:
+        self._apply_rollup_groups(
+            conn, [change for old, record in pairs for change in ((old, -1), (record, 1))]
+        )
+
+    def _apply_rollup_groups(
+        self, conn: sqlite3.Connection, changes: List[Tuple[BudgetLineItem, int]]
+    ) -> None:
+        # (이벤트, 카테고리, 상태) 그룹별로 먼저 합산한 뒤 그룹당 1회 갱신
+        groups: Dict[Tuple[str, str, str], List[Any]] = {}
+        currencies: Dict[Tuple[str, str], List[Any]] = {}
+        for record, sign in changes:
+            key = (str(record.event_id), record.category.value, record.status.value)
+            group = groups.get(key)
+            if group is None:
+                group = groups[key] = [0, Decimal("0"), Decimal("0")]
+            group[0] += sign
+            group[1] += sign * record.projected_amount
+            group[2] += sign * record.actual_amount
+
+            currency_key = (key[0], record.currency.value)
+            subtotal = currencies.get(currency_key)
+            if subtotal is None:
+                subtotal = currencies[currency_key] = [0, Decimal("0"), Decimal("0")]
+            subtotal[0] += sign
+            subtotal[1] += sign * record.projected_amount
+            subtotal[2] += sign * record.actual_amount
+        for key, (count, projected, actual) in groups.items():
+            if count or projected or actual:
+                self._apply_rollup(conn, key, count, projected, actual)
+        for currency_key, (count, projected, actual) in currencies.items():
+            if count or projected or actual:
+                self._apply_currency_rollup(conn, currency_key, count, projected, actual)
+
+    def _on_clear(self, conn: sqlite3.Connection) -> None:
+        conn.execute("DELETE FROM budget_item_rollups")
+        conn.execute("DELETE FROM budget_currency_totals")
+
+    def _aggregate(self, conn: sqlite3.Connection, event_id: UUID) -> BudgetAggregate:
+        aggregate = BudgetAggregate()
+        rows = conn.execute(
+            "SELECT category, status, item_count, projected_amount, actual_amount "
+            "FROM budget_item_rollups WHERE event_id = ?",
+            (str(event_id),),
+        )
+        for category, status, count, projected, actual in rows:
+            aggregate.add_group(category, status, count, Decimal(projected), Decimal(actual))
+        rows = conn.execute(
+            "SELECT currency, item_count, projected_amount, actual_amount "
+            "FROM budget_currency_totals WHERE event_id = ?",
+            (str(event_id),),
+        )
+        for currency, count, projected, actual in rows:
+            aggregate.add_currency(currency, count, Decimal(projected), Decimal(actual))
+        return aggregate
+
+    def _recompute(self, conn: sqlite3.Connection, event_id: UUID) -> BudgetAggregate:
+        aggregate = BudgetAggregate()
+        rows = conn.execute(
+            "SELECT category, status, currency, projected_amount, actual_amount "
+            "FROM budget_items WHERE event_id = ? ORDER BY rowid",
+            (str(event_id),),
+        )
+        for category, status, currency, projected, actual in rows:
+            projected, actual = Decimal(projected), Decimal(actual)
+            aggregate.add_group(category, status, 1, projected, actual)
+            aggregate.add_currency(currency, 1, projected, actual)
+        return aggregate
+
+    def _check(self, conn: sqlite3.Connection, event_id: UUID) -> List[Dict[str, Any]]:
+        # 두 조회가 같은 스냅샷을 보도록 읽기 트랜잭션으로 묶는다
+        conn.execute("BEGIN")
+        try:
+            return self._aggregate(conn, event_id).diff(self._recompute(conn, event_id))
+        finally:
+            conn.execute("COMMIT")
+
+
+class SQLiteSponsors(SQLiteCollection[Sponsor]):
+    """sponsor_revenue_rollups 집계 테이블을 같은 트랜잭션에서 갱신하는 스폰서 컬렉션"""
+
+    ROLLUP_SELECT = (
+        "SELECT sponsor_count, committed_amount FROM sponsor_revenue_rollups "
+        "WHERE event_id = ? AND status = ?"
+    )
+    ROLLUP_UPSERT = (
+        "INSERT OR REPLACE INTO sponsor_revenue_rollups "
+        "(event_id, status, sponsor_count, committed_amount) VALUES (?, ?, ?, ?)"
+    )
+    ROLLUP_DELETE = "DELETE FROM sponsor_revenue_rollups WHERE event_id = ? AND status = ?"
+
+    def __init__(self, pool: ConnectionPool):
+        super().__init__(pool, TableMapping("sponsors", Sponsor))
+
+    def _apply_rollup(
+        self,
+        conn: sqlite3.Connection,
+        key: Tuple[str, str],
+        delta_count: int,
+        delta_committed: Decimal,
+    ) -> None:
+        row = conn.execute(self.ROLLUP_SELECT, key).fetchone()
+        count, committed = (row[0], Decimal(row[1])) if row else (0, Decimal("0"))
+        count += delta_count
+        committed += delta_committed
+        if count == 0:
+            conn.execute(self.ROLLUP_DELETE, key)
+        else:
+            conn.execute(self.ROLLUP_UPSERT, (*key, count, str(committed)))
+
+    def _on_insert(self, conn: sqlite3.Connection, record: Sponsor) -> None:
+        if record.event_id is not None:
+            key = (str(record.event_id), record.status.value)
+            self._apply_rollup(conn, key, 1, record.committed_amount)
+
+    def _on_delete(self, conn: sqlite3.Connection, record: Sponsor) -> None:
+        if record.event_id is not None:
+            key = (str(record.event_id), record.status.value)
+            self._apply_rollup(conn, key, -1, -record.committed_amount)
+
+    def _on_insert_many(self, conn: sqlite3.Connection, records: List[Sponsor]) -> None:
+        # (이벤트, 상태) 그룹별로 먼저 합산한 뒤 그룹당 1회 갱신
+        groups: Dict[Tuple[str, str], List[Any]] = {}
+        for record in records:
+            if record.event_id is None:
+                continue
+            key = (str(record.event_id), record.status.value)
+            group = groups.get(key)
+            if group is None:
+                group = groups[key] = [0, Decimal("0")]
+            group[0] += 1
+            group[1] += record.committed_amount
+        for key, (count, committed) in groups.items():
+            self._apply_rollup(conn, key, count, committed)
+
+    def _on_clear(self, conn: sqlite3.Connection) -> None:
+        conn.execute("DELETE FROM sponsor_revenue_rollups")
+
+    def _revenue(self, conn: sqlite3.Connection, event_id: UUID) -> SponsorRevenue:
+        revenue = SponsorRevenue()
+        rows = conn.execute(
+            "SELECT status, sponsor_count, committed_amount FROM sponsor_revenue_rollups "
+            "WHERE event_id = ?",
+            (str(event_id),),
+        )
+        for status, count, committed in rows:
+            revenue.add_group(status, count, Decimal(committed))
+        return revenue
+
+    def _backfill_events(self, conn: sqlite3.Connection) -> None:
+        """event_id 컬럼 추가 직후: 패키지의 event_id 연결 및 수익 집계 재구성"""
+        conn.execute(
+            "UPDATE sponsors SET event_id = "
+            "(SELECT event_id FROM sponsorship_packages WHERE id = sponsors.package_id) "
+            "WHERE package_id IS NOT NULL"
+        )
+        self._on_clear(conn)
+        self._on_insert_many(conn, self._find(conn, {}))
+
+
+class SQLiteReservations(SQLiteCollection[SponsorshipReservation]):
+    """스폰서십 패키지 보류 컬렉션 (만료 정리용 (status, expires_at) 조회)"""
+
+    def __init__(self, pool: ConnectionPool):
+        super().__init__(pool, TableMapping("sponsorship_reservations", SponsorshipReservation))
+        self.expired_sql = (
+            f"SELECT {', '.join(self.mapping.columns)} FROM sponsorship_reservations "
+            "WHERE status = ? AND expires_at <= ?"
+        )
+
+    def _expired(self, conn: sqlite3.Connection, now: datetime) -> List[SponsorshipReservation]:
+        rows = conn.execute(self.expired_sql, (ReservationStatus.HELD.value, encode_value(now)))
+        return [self.mapping.decode(row) for row in rows]
+
+
+# =============================================================================
+# REPOSITORY
+# =============================================================================
+
+class SQLiteFinanceRepository(FinanceRepository):
+    """SQLite 파일 기반 재무 저장소 (재시작 후에도 유지)"""
+
+    backend = "sqlite"
+    shared = True
+
+    def __init__(self, path: str, pool_size: int = 4):
+        self.pool = ConnectionPool(path, size=pool_size)
+        self.budget_items = SQLiteBudgetItems(self.pool)
+        self.sponsorship_packages = SQLiteCollection(
+            self.pool, TableMapping("sponsorship_packages", SponsorshipPackage, json_columns=("benefits",))
+        )
+        self.sponsors = SQLiteSponsors(self.pool)
+        self.reports = SQLiteCollection(
+            self.pool, TableMapping("financial_reports", FinancialReport, sort_field="report_date")
+        )
+        self.transactions = SQLiteCollection(
+            self.pool, TableMapping("transactions", Transaction, sort_field="transaction_date")
+        )
+        self.pricing_tiers = SQLiteCollection(self.pool, TableMapping("pricing_tiers", PricingTier))
+        self.sponsorship_reservations = SQLiteReservations(self.pool)
+        if ("sponsors", "event_id") in self.pool.added_columns:
+            self.pool.write_sync(self.sponsors._backfill_events)
+
+    async def budget_aggregate(self, event_id: UUID) -> BudgetAggregate:
+        aggregate = await self.pool.read(self.budget_items._aggregate, event_id)
+        if aggregate.total_items:
+            self.aggregate_hits += 1
+        else:
+            self.aggregate_misses += 1
+        return aggregate
+
+    async def check_budget_aggregate(self, event_id: UUID) -> List[Dict[str, Any]]:
+        return await self.pool.read(self.budget_items._check, event_id)
+
+    async def sponsor_revenue(self, event_id: UUID) -> SponsorRevenue:
+        return await self.pool.read(self.sponsors._revenue, event_id)
+
+    # -------------------------------------------------------------------------
+    # 스폰서십 패키지 수량 (패키지 읽기 · 검사 · 쓰기를 한 쓰기 트랜잭션에서)
+    # -------------------------------------------------------------------------
+
+    def _claim(self, conn: sqlite3.Connection, reservation: SponsorshipReservation) -> Optional[List[Tuple]]:
+        packages, reservations = self.sponsorship_packages, self.sponsorship_reservations
+        package = packages._get(conn, reservation.package_id)
+        if package is None:
+            return None
+        held = reservations._find(conn, {"package_id": package.id, "status": ReservationStatus.HELD})
+        expired = expire_holds(held, reservation.created_at)
+        updated = claim_slot(release_expired(package, len(expired)), reservation)
+        pairs = reservations._replace_many(conn, expired) if expired else []
+        packages._replace(conn, updated)
+        reservations._add(conn, reservation)
+        return [(package, updated), *pairs, (None, reservation)]
+
+    def _settle(
+        self,
+        conn: sqlite3.Connection,
+        reservation_id: UUID,
+        status: ReservationStatus,
+        now: datetime,
+        sponsor_id: Optional[UUID],
+    ) -> Tuple[Optional[SponsorshipReservation], List[Tuple]]:
+        reservation = self.sponsorship_reservations._get(conn, reservation_id)
+        if reservation is None:
+            return None, []
+        package = self.sponsorship_packages._get(conn, reservation.package_id)
+        changed = settle(package, reservation, status, now, sponsor_id)
+        if changed is None:
+            return reservation, []
+        updated_package, updated = changed
+        changes: List[Tuple] = []
+        if updated_package is not None:
+            self.sponsorship_packages._replace(conn, updated_package)
+            changes.append((package, updated_package))
+        self.sponsorship_reservations._replace(conn, updated)
+        changes.append((reservation, updated))
+        return updated, changes
+
+    def _expire(self, conn: sqlite3.Connection, now: datetime) -> List[Tuple]:
+        expired = expire_holds(self.sponsorship_reservations._expired(conn, now), now)
+        if not expired:
+            return []
+        by_package: Dict[UUID, int] = {}
+        for reservation in expired:
+            by_package[reservation.package_id] = by_package.get(reservation.package_id, 0) + 1
+        changes: List[Tuple] = []
+        for package_id, count in by_package.items():
+            package = self.sponsorship_packages._get(conn, package_id)
+            if package is not None:
+                updated = release_expired(package, count)
+                self.sponsorship_packages._replace(conn, updated)
+                changes.append((package, updated))
+        changes.extend(self.sponsorship_reservations._replace_many(conn, expired))
+        return changes
+
+    def _notify_inventory(self, changes: List[Tuple]) -> None:
+        """트랜잭션 커밋 후 패키지 / 보류 변경 구독자 통지"""
+        for old, new in changes:
+            record = new if new is not None else old
+            if isinstance(record, SponsorshipPackage):
+                self.sponsorship_packages._notify(old, new)
+            else:
+                self.sponsorship_reservations._notify(old, new)
+
+    async def claim_package(self, reservation: SponsorshipReservation) -> Optional[SponsorshipReservation]:
+        changes = await self.pool.write(self._claim, reservation)
+        if changes is None:
+            return None
+        self._notify_inventory(changes)
+        return reservation
+
+    async def settle_reservation(
+        self,
+        reservation_id: UUID,
+        status: ReservationStatus,
+        now: datetime,
+        sponsor_id: Optional[UUID] = None,
+    ) -> Optional[SponsorshipReservation]:
+        reservation, changes = await self.pool.write(self._settle, reservation_id, status, now, sponsor_id)
+        self._notify_inventory(changes)
+        return reservation
+
+    async def expire_reservations(self, now: datetime) -> int:
+        # 만료 보류가 없으면 쓰기 락을 잡지 않는다 (주기적 정리가 확보 요청과 경합하지 않도록)
+        if not await self.pool.read(self.sponsorship_reservations._expired, now):
+            return 0
+        changes = await self.pool.write(self._expire, now)
+        self._notify_inventory(changes)
+        return sum(1 for old, _ in changes if isinstance(old, SponsorshipReservation))
+
+    async def revision(self, event_id: Optional[UUID] = None) -> str:
+        # 다른 프로세스의 쓰기도 반영되도록 매번 DB에서 읽는다 (PK 조회 1회)
+        return await self.pool.read(read_revision, event_id)
+
+    async def ping(self) -> None:
+        await self.pool.read(lambda conn: conn.execute("SELECT 1").fetchone())
+
+    async def close(self) -> None:
+        self.pool.close()
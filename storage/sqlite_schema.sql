@@ -0,0 +1,196 @@
+-- Finance Store (Python FastAPI 라우터용 로컬 SQLite)
+-- CMP-IS Domain D: Financial Management
+-- 금액(Decimal)은 정확한 값 보존을 위해 TEXT로 저장
+
+-- 예산 항목 테이블
+CREATE TABLE IF NOT EXISTS budget_items (
+  id TEXT PRIMARY KEY,
+  event_id TEXT NOT NULL,
+  category TEXT NOT NULL,
+  name TEXT NOT NULL,
+  description TEXT,
+  vendor_name TEXT,
+  reference_number TEXT,
+  cost_type TEXT DEFAULT 'variable',
+  unit_cost TEXT NOT NULL,
+  quantity TEXT DEFAULT '1',
+  projected_amount TEXT NOT NULL,
+  actual_amount TEXT DEFAULT '0',
+  currency TEXT DEFAULT 'USD',
+  status TEXT DEFAULT 'draft',
+  payment_due_date TEXT,
+  notes TEXT,
+  created_at TEXT NOT NULL,
+  updated_at TEXT NOT NULL,
+  version INTEGER NOT NULL DEFAULT 1
+);
+
+-- 예산 집계 테이블: (이벤트, 카테고리, 상태) 단위 증분 집계
+CREATE TABLE IF NOT EXISTS budget_item_rollups (
+  event_id TEXT NOT NULL,
+  category TEXT NOT NULL,
+  status TEXT NOT NULL,
+  item_count INTEGER NOT NULL DEFAULT 0,
+  projected_amount TEXT NOT NULL DEFAULT '0',
+  actual_amount TEXT NOT NULL DEFAULT '0',
+  PRIMARY KEY (event_id, category, status)
+);
+
+-- 통화별 예산 집계 테이블: (이벤트, 통화) 단위 증분 집계 (원 통화 금액, TEXT Decimal)
+CREATE TABLE IF NOT EXISTS budget_currency_totals (
+  event_id TEXT NOT NULL,
+  currency TEXT NOT NULL,
+  item_count INTEGER NOT NULL DEFAULT 0,
+  projected_amount TEXT NOT NULL DEFAULT '0',
+  actual_amount TEXT NOT NULL DEFAULT '0',
+  PRIMARY KEY (event_id, currency)
+);
+
+-- 스폰서십 패키지 테이블
+CREATE TABLE IF NOT EXISTS sponsorship_packages (
+  id TEXT PRIMARY KEY,
+  event_id TEXT NOT NULL,
+  tier TEXT NOT NULL,
+  tier_name TEXT NOT NULL,
+  amount TEXT NOT NULL,
+  currency TEXT DEFAULT 'USD',
+  benefits TEXT, -- JSON: SponsorBenefit 목록
+  max_sponsors INTEGER DEFAULT 1,
+  sold_count INTEGER DEFAULT 0,
+  held_count INTEGER NOT NULL DEFAULT 0, -- 만료 전 보류 수 (sponsorship_reservations)
+  is_active INTEGER DEFAULT 1,
+  created_at TEXT NOT NULL
+);
+
+-- 스폰서 테이블
+CREATE TABLE IF NOT EXISTS sponsors (
+  id TEXT PRIMARY KEY,
+  company_name TEXT NOT NULL,
+  industry TEXT NOT NULL,
+  contact_name TEXT NOT NULL,
+  contact_email TEXT NOT NULL,
+  contact_phone TEXT,
+  package_id TEXT,
+  event_id TEXT, -- 선택한 패키지의 event_id (패키지 미지정 시 NULL)
+  status TEXT DEFAULT 'prospect',
+  committed_amount TEXT DEFAULT '0',
+  support_type TEXT,
+  contract_signed_at TEXT,
+  fulfillment_rate TEXT DEFAULT '0',
+  notes TEXT,
+  created_at TEXT NOT NULL,
+  version INTEGER NOT NULL DEFAULT 1
+);
+
+-- 스폰서 수익 집계 테이블: (이벤트, 상태) 단위 증분 집계 (event_id가 있는 스폰서만)
+CREATE TABLE IF NOT EXISTS sponsor_revenue_rollups (
+  event_id TEXT NOT NULL,
+  status TEXT NOT NULL,
+  sponsor_count INTEGER NOT NULL DEFAULT 0,
+  committed_amount TEXT NOT NULL DEFAULT '0',
+  PRIMARY KEY (event_id, status)
+);
+
+-- 재무 리포트 테이블
+CREATE TABLE IF NOT EXISTS financial_reports (
+  id TEXT PRIMARY KEY,
+  event_id TEXT NOT NULL,
+  report_name TEXT NOT NULL,
+  report_date TEXT NOT NULL,
+  period_start TEXT NOT NULL,
+  period_end TEXT NOT NULL,
+  currency TEXT DEFAULT 'USD',
+  total_registration_revenue TEXT DEFAULT '0',
+  total_sponsorship_revenue TEXT DEFAULT '0',
+  total_exhibit_revenue TEXT DEFAULT '0',
+  total_other_revenue TEXT DEFAULT '0',
+  total_budget TEXT NOT NULL,
+  total_actual TEXT NOT NULL,
+  total_attendees INTEGER DEFAULT 0,
+  paid_attendees INTEGER DEFAULT 0
+);
+
+-- 거래 테이블 (CMP-IS Skill 9)
+CREATE TABLE IF NOT EXISTS transactions (
+  id TEXT PRIMARY KEY,
+  event_id TEXT NOT NULL,
+  budget_line_item_id TEXT,
+  transaction_type TEXT NOT NULL,
+  amount TEXT NOT NULL,
+  currency TEXT DEFAULT 'USD',
+  payment_method TEXT NOT NULL,
+  description TEXT NOT NULL,
+  reference_number TEXT,
+  vendor_name TEXT,
+  transaction_date TEXT NOT NULL,
+  recorded_by TEXT NOT NULL,
+  is_reconciled INTEGER DEFAULT 0,
+  notes TEXT
+);
+
+-- 가격 등급 테이블
+CREATE TABLE IF NOT EXISTS pricing_tiers (
+  id TEXT PRIMARY KEY,
+  event_id TEXT NOT NULL,
+  name TEXT NOT NULL,
+  description TEXT,
+  base_price TEXT NOT NULL,
+  currency TEXT DEFAULT 'USD',
+  member_discount_rate TEXT DEFAULT '0',
+  valid_from TEXT,
+  valid_until TEXT,
+  max_quantity INTEGER,
+  sold_quantity INTEGER DEFAULT 0,
+  created_at TEXT NOT NULL
+);
+
+-- 스폰서십 패키지 수량 보류 (TTL)
+CREATE TABLE IF NOT EXISTS sponsorship_reservations (
+  id TEXT PRIMARY KEY,
+  package_id TEXT NOT NULL,
+  event_id TEXT NOT NULL,
+  holder TEXT,
+  sponsor_id TEXT,
+  status TEXT NOT NULL DEFAULT 'held',
+  expires_at TEXT NOT NULL,
+  closed_at TEXT,
+  created_at TEXT NOT NULL
+);
+
+-- 변경 리비전 (조건부 GET ETag): 단일 행 전역 시계 + 이벤트별 마지막 변경 시점
+-- instance_id는 DB 파일 생성 시 한 번 정해지며, 파일을 새로 만들면 이전 ETag와 충돌하지 않음
+CREATE TABLE IF NOT EXISTS revision_clock (
+  id INTEGER PRIMARY KEY CHECK (id = 1),
+  instance_id TEXT NOT NULL,
+  value INTEGER NOT NULL DEFAULT 0,
+  floor INTEGER NOT NULL DEFAULT 0
+);
+INSERT OR IGNORE INTO revision_clock (id, instance_id) VALUES (1, lower(hex(randomblob(6))));
+
+CREATE TABLE IF NOT EXISTS event_revisions (
+  event_id TEXT PRIMARY KEY,
+  revision INTEGER NOT NULL
+);
+
+-- 인덱스 (필터 컬럼 + 키셋 페이지네이션 정렬 키)
+CREATE INDEX IF NOT EXISTS idx_budget_items_event_id ON budget_items(event_id, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_budget_items_category ON budget_items(category, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_budget_items_status ON budget_items(status, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_budget_items_created ON budget_items(created_at, id);
+CREATE INDEX IF NOT EXISTS idx_packages_event_id ON sponsorship_packages(event_id, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_packages_created ON sponsorship_packages(created_at, id);
+CREATE INDEX IF NOT EXISTS idx_sponsors_status ON sponsors(status, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_sponsors_event_status ON sponsors(event_id, status, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_sponsors_created ON sponsors(created_at, id);
+CREATE INDEX IF NOT EXISTS idx_financial_reports_event_id ON financial_reports(event_id, report_date, id);
+CREATE INDEX IF NOT EXISTS idx_financial_reports_date ON financial_reports(report_date, id);
+CREATE INDEX IF NOT EXISTS idx_transactions_event_id ON transactions(event_id, transaction_date, id);
+CREATE INDEX IF NOT EXISTS idx_transactions_item ON transactions(budget_line_item_id, transaction_date, id);
+CREATE INDEX IF NOT EXISTS idx_transactions_date ON transactions(transaction_date, id);
+CREATE INDEX IF NOT EXISTS idx_pricing_tiers_event_id ON pricing_tiers(event_id, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_pricing_tiers_created ON pricing_tiers(created_at, id);
+CREATE INDEX IF NOT EXISTS idx_reservations_package_status ON sponsorship_reservations(package_id, status, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_reservations_status_expiry ON sponsorship_reservations(status, expires_at);
+CREATE INDEX IF NOT EXISTS idx_reservations_event_id ON sponsorship_reservations(event_id, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_reservations_sponsor ON sponsorship_reservations(sponsor_id, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_reservations_created ON sponsorship_reservations(created_at, id);
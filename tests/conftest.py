@@ -0,0 +1,64 @@
+"""
+Test Fixtures
+
+- API 테스트: main.app을 TestClient로 실행 (세션당 한 번 lifespan, 저장소는 라우터 모듈 전역)
+  → 백엔드는 FINANCE_STORAGE_BACKEND로 선택 (기본 memory, sqlite / sharded는 임시 파일)
+  → 테스트마다 새 event_id를 사용하므로 초기화 없이 서로 독립
+- 저장소 테스트: repo 픽스처가 memory / sqlite / sharded 구현을 각각 새로 생성 (anyio)
+- 레코드 / 요청 본문 생성 헬퍼: tests/factories.py
+
+실행:
+    python -m pytest -q
+    FINANCE_STORAGE_BACKEND=sharded python -m pytest -q tests/test_api.py
+
+Author: Event Agent System
+"""
+
+import os
+import tempfile
+from typing import AsyncIterator, Iterator
+from uuid import uuid4
+
+import pytest
+
+# 라우터 모듈이 임포트 시점에 저장소를 만들므로 main 임포트 전에 설정
+os.environ.setdefault("FINANCE_STORAGE_BACKEND", "memory")
+os.environ.setdefault(
+    "FINANCE_SQLITE_PATH", os.path.join(tempfile.mkdtemp(prefix="finance-tests-"), "finance.db")
+)
+
+from fastapi.testclient import TestClient
+
+from storage import FinanceRepository, create_repository
+
+
+BACKENDS = ("memory", "sqlite", "sharded")
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
+def client() -> Iterator[TestClient]:
+    import main
+    with TestClient(main.app) as client:
+        yield client
+
+
+@pytest.fixture
+def event_id() -> str:
+    return str(uuid4())
+
+
+@pytest.fixture(params=BACKENDS)
+async def repo(request: pytest.FixtureRequest, tmp_path) -> AsyncIterator[FinanceRepository]:
+    repository = create_repository(
+        backend=request.param, sqlite_path=str(tmp_path / "finance.db"), shards=2
+    )
+    await repository.open()
+    try:
+        yield repository
+    finally:
+        await repository.close()
@@ -0,0 +1,92 @@
+"""
+Test Factories
+
+테스트용 레코드 / 요청 본문 생성 (필수 필드 기본값, 필요한 필드만 지정).
+
+Author: Event Agent System
+"""
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any, Optional
+from uuid import UUID
+
+from schemas.financial import (
+    BudgetCategory, BudgetLineItem, PaymentMethod, ReservationStatus, SponsorshipPackage, SponsorshipReservation,
+    SponsorshipTier, Transaction, TransactionType,
+)
+
+
+# =============================================================================
+# RECORD FACTORIES
+# =============================================================================
+
+def budget_item(event_id: UUID, unit_cost: str = "100", quantity: str = "1", **fields: Any) -> BudgetLineItem:
+    cost, count = Decimal(unit_cost), Decimal(quantity)
+    values = dict(
+        event_id=event_id,
+        category=BudgetCategory.VENUE,
+        name="Main hall",
+        unit_cost=cost,
+        quantity=count,
+        projected_amount=cost * count,
+    )
+    values.update(fields)
+    return BudgetLineItem(**values)
+
+
+def sponsorship_package(event_id: UUID, max_sponsors: int = 2, **fields: Any) -> SponsorshipPackage:
+    values = dict(
+        event_id=event_id,
+        tier=SponsorshipTier.GOLD,
+        tier_name="Gold",
+        amount=Decimal("10000"),
+        max_sponsors=max_sponsors,
+    )
+    values.update(fields)
+    return SponsorshipPackage(**values)
+
+
+def reservation(
+    package: SponsorshipPackage,
+    status: ReservationStatus = ReservationStatus.HELD,
+    ttl: timedelta = timedelta(minutes=15),
+    now: Optional[datetime] = None,
+    **fields: Any,
+) -> SponsorshipReservation:
+    now = now or datetime.utcnow()
+    return SponsorshipReservation(
+        package_id=package.id,
+        event_id=package.event_id,
+        holder="sales",
+        status=status,
+        expires_at=now + ttl,
+        created_at=now,
+        **fields,
+    )
+
+
+def transaction(
+    event_id: UUID,
+    transaction_type: TransactionType,
+    amount: str,
+    transaction_date: datetime,
+    **fields: Any,
+) -> Transaction:
+    values = dict(
+        event_id=event_id,
+        transaction_type=transaction_type,
+        amount=Decimal(amount),
+        payment_method=PaymentMethod.BANK_TRANSFER,
+        description="Payment",
+        recorded_by="finance",
+        transaction_date=transaction_date,
+    )
+    values.update(fields)
+    return Transaction(**values)
+
+
+def budget_item_payload(event_id: str, **fields: Any) -> dict:
+    payload = {"event_id": event_id, "category": "venue", "name": "Main hall", "unit_cost": "100"}
+    payload.update(fields)
+    return payload
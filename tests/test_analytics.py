@@ -0,0 +1,81 @@
+"""
+ColumnarLedger 테스트: 정수 열 / Decimal 보관 행 합산 정확도, 변경 구독 실패 시 재적재
+
+Author: Event Agent System
+"""
+
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from services.analytics import ColumnarLedger
+from storage import create_repository
+from storage.aggregates import BudgetAggregate
+
+from factories import budget_item
+
+
+def test_breakdown_matches_decimal_path_exactly():
+    event_id = uuid4()
+    items = [
+        budget_item(event_id, unit_cost="0.00005", quantity="3"),  # 소수 5자리 → Decimal 보관
+        budget_item(event_id, unit_cost="12.3456"),
+        budget_item(event_id, unit_cost="9e20"),  # 정수 열 한도 밖
+    ]
+    ledger = ColumnarLedger(capacity=2)
+    for item in items:
+        ledger.upsert(item)
+
+    expected = BudgetAggregate.from_items(items)
+    venue = ledger.category_breakdown(event_id)["venue"]
+    assert venue["projected"] == expected.total_projected
+    assert venue["count"] == 3
+    assert ledger.event_totals()[0]["total_projected"] == expected.total_projected
+
+    assert ledger.percentiles("projected", [0, 50, 100], event_id) == {
+        "p0": Decimal("0.00015"), "p50": Decimal("12.3456"), "p100": Decimal("9e20"),
+    }
+
+
+def test_over_budget_merges_decimal_rows_in_order():
+    event_id = uuid4()
+    small = budget_item(event_id, unit_cost="1").model_copy(update={"actual_amount": Decimal("2")})
+    fine = budget_item(event_id, unit_cost="1").model_copy(update={"actual_amount": Decimal("1.00001")})
+    huge = budget_item(event_id, unit_cost="1").model_copy(update={"actual_amount": Decimal("1e20")})
+    ledger = ColumnarLedger()
+    for item in (small, fine, huge):
+        ledger.upsert(item)
+
+    hits = ledger.over_budget(event_id)
+    assert [hit["id"] for hit in hits] == [huge.id, small.id, fine.id]
+    assert hits[2]["variance"] == Decimal("-0.00001")
+    assert [hit["id"] for hit in ledger.over_budget(event_id, limit=1)] == [huge.id]
+
+    # 정수 열로 돌아가면 보관 값도 사라진다
+    ledger.upsert(huge.model_copy(update={"actual_amount": Decimal("0")}))
+    ledger.delete(fine.id)
+    assert [hit["id"] for hit in ledger.over_budget(event_id)] == [small.id]
+
+
+@pytest.mark.anyio
+async def test_listener_failure_marks_ledger_stale_and_reloads(monkeypatch):
+    repo = create_repository(backend="memory")
+    await repo.open()
+    event_id = uuid4()
+    ledger = ColumnarLedger()
+    repo.budget_items.subscribe(ledger)
+    await repo.budget_items.add(budget_item(event_id))
+    await ledger.ensure_loaded(repo.budget_items)
+
+    def fail(item):
+        raise RuntimeError("ledger bug")
+
+    monkeypatch.setattr(ledger, "upsert", fail)
+    # 커밋된 쓰기는 구독자 실패와 무관하게 성공
+    await repo.budget_items.add(budget_item(event_id, unit_cost="5"))
+    monkeypatch.undo()
+
+    await ledger.ensure_loaded(repo.budget_items)
+    assert ledger.category_breakdown(event_id)["venue"]["projected"] == Decimal("105")
+    await repo.close()
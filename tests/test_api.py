@@ -0,0 +1,464 @@
+"""
+재무 API 왕복 테스트 (TestClient, FINANCE_STORAGE_BACKEND 백엔드)
+- 예산 항목 생성 / 조회 / 수정, If-Match(412) · If-None-Match(304)
+- 목록 커서 페이지네이션
+- 일괄 수정, 예산 요약 정합성
+- 대량 등록 (NDJSON / CSV, 행 번호별 오류)
+- 내보내기 (NDJSON / CSV, 필드 선택)
+- 스폰서십 패키지 보류 / 판매 / 해제
+
+Author: Event Agent System
+"""
+
+import asyncio
+import base64
+import json
+import logging
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from factories import budget_item_payload
+
+
+def create_items(client, event_id, count):
+    items = []
+    for i in range(count):
+        response = client.post("/finance/budget-items", json=budget_item_payload(event_id, name=f"Item {i}"))
+        assert response.status_code == 201
+        items.append(response.json())
+    return items
+
+
+# =============================================================================
+# BUDGET ITEMS
+# =============================================================================
+
+def test_budget_item_round_trip_with_etags(client, event_id):
+    created = client.post("/finance/budget-items", json=budget_item_payload(event_id, quantity="3"))
+    assert created.status_code == 201
+    item = created.json()
+    assert float(item["projected_amount"]) == 300
+    assert created.headers["ETag"] == '"1"'
+
+    fetched = client.get(f"/finance/budget-items/{item['id']}")
+    assert fetched.json()["id"] == item["id"]
+
+    updated = client.patch(
+        f"/finance/budget-items/{item['id']}", json={"actual_amount": "250"}, headers={"If-Match": '"1"'}
+    )
+    assert updated.status_code == 200
+    assert updated.headers["ETag"] == '"2"'
+
+    stale = client.patch(
+        f"/finance/budget-items/{item['id']}", json={"actual_amount": "260"}, headers={"If-Match": '"1"'}
+    )
+    assert stale.status_code == 412
+    assert stale.headers["ETag"] == '"2"'
+
+    assert client.get(f"/finance/budget-items/{uuid4()}").status_code == 404
+
+
+def test_list_cursor_pages_through_event(client, event_id):
+    items = create_items(client, event_id, 5)
+
+    seen, cursor = [], None
+    while True:
+        params = {"event_id": event_id, "limit": 2, "include_total": True}
+        if cursor:
+            params["cursor"] = cursor
+        page = client.get("/finance/budget-items", params=params).json()
+        assert page["total_count"] == 5
+        seen.extend(item["id"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == [item["id"] for item in items]
+
+    assert client.get("/finance/budget-items", params={"cursor": "not-a-cursor"}).status_code == 400
+
+    # 시간대가 있는 커서 값은 naive UTC로 비교 (첫 항목 생성 시각을 +09:00으로 표현)
+    first = datetime.fromisoformat(items[0]["created_at"]).replace(tzinfo=timezone.utc)
+    value = first.astimezone(timezone(timedelta(hours=9))).isoformat()
+    aware = base64.urlsafe_b64encode(json.dumps([value, items[0]["id"]]).encode()).decode().rstrip("=")
+    page = client.get("/finance/budget-items", params={"event_id": event_id, "cursor": aware})
+    assert page.status_code == 200
+    assert [item["id"] for item in page.json()["items"]] == [item["id"] for item in items[1:]]
+
+
+def test_list_if_none_match_until_event_changes(client, event_id):
+    create_items(client, event_id, 1)
+    first = client.get("/finance/budget-items", params={"event_id": event_id})
+    etag = first.headers["ETag"]
+
+    cached = client.get("/finance/budget-items", params={"event_id": event_id}, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+
+    # 다른 이벤트의 쓰기는 이 이벤트의 ETag를 바꾸지 않는다
+    create_items(client, str(uuid4()), 1)
+    assert client.get(
+        "/finance/budget-items", params={"event_id": event_id}, headers={"If-None-Match": etag}
+    ).status_code == 304
+
+    create_items(client, event_id, 1)
+    changed = client.get("/finance/budget-items", params={"event_id": event_id}, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+
+def test_batch_update_and_summary_consistency(client, event_id):
+    items = create_items(client, event_id, 3)
+    response = client.patch("/finance/budget-items", json={
+        "updates": [
+            {"id": items[0]["id"], "changes": {"actual_amount": "90", "status": "paid"}},
+            {"id": items[1]["id"], "changes": {"actual_amount": "110"}, "if_match": '"1"'},
+            {"id": str(uuid4()), "changes": {"status": "paid"}},
+        ],
+    })
+    result = response.json()
+    assert (result["updated"], result["failed"]) == (2, 1)
+    assert [r["status"] for r in result["results"]] == [200, 200, 404]
+
+    summary = client.get(f"/finance/budget-items/summary/{event_id}").json()
+    assert summary["total_items"] == 3
+    assert float(summary["total_actual"]) == 200
+    assert client.get(f"/finance/budget-items/summary/{event_id}/consistency").status_code == 200
+
+
+def test_out_of_range_amount_is_rejected_before_any_write(client, event_id):
+    item = create_items(client, event_id, 1)[0]
+
+    assert client.post(
+        "/finance/budget-items", json=budget_item_payload(event_id, unit_cost="1e30")
+    ).status_code == 422
+    assert client.post(
+        "/finance/budget-items", json=budget_item_payload(event_id, unit_cost="1e10", quantity="1e10")
+    ).status_code == 422
+    assert client.patch(f"/finance/budget-items/{item['id']}", json={"quantity": "1e30"}).status_code == 422
+    assert client.patch(f"/finance/budget-items/{item['id']}", json={"unit_cost": "1e10"}).status_code == 200
+    assert client.patch(f"/finance/budget-items/{item['id']}", json={"quantity": "1e10"}).status_code == 422
+
+    page = client.get("/finance/budget-items", params={"event_id": event_id, "include_total": True}).json()
+    assert page["total_count"] == len(page["items"]) == 1
+    assert client.get(f"/finance/budget-items/summary/{event_id}/consistency").status_code == 200
+
+
+def test_batch_update_reports_out_of_range_item_as_422(client, event_id):
+    items = create_items(client, event_id, 3)
+    updates = [
+        {"id": items[0]["id"], "changes": {"quantity": "1e15"}},
+        {"id": items[1]["id"], "changes": {"quantity": "2"}},
+        {"id": items[2]["id"], "changes": {"unit_cost": "1e10", "quantity": "1e10"}},
+    ]
+
+    result = client.patch("/finance/budget-items", json={"updates": updates, "all_or_nothing": True})
+    assert result.status_code == 409
+    assert [r["status"] for r in result.json()["results"]] == [422, 424, 422]
+
+    result = client.patch("/finance/budget-items", json={"updates": updates})
+    assert result.status_code == 200
+    assert [r["status"] for r in result.json()["results"]] == [422, 200, 422]
+    assert (result.json()["updated"], result.json()["failed"]) == (1, 2)
+    page = client.get("/finance/budget-items", params={"event_id": event_id}).json()
+    stored = {item["id"]: item for item in page["items"]}
+    assert [stored[item["id"]]["version"] for item in items] == [1, 2, 1]
+
+    duplicate = [{"id": items[1]["id"], "changes": {"quantity": "3"}}] * 2
+    assert client.patch("/finance/budget-items", json={"updates": duplicate}).status_code == 400
+    assert client.get(f"/finance/budget-items/summary/{event_id}/consistency").status_code == 200
+
+
+def test_currency_subtotals_match_totals_exactly(client, event_id):
+    for _ in range(3):
+        assert client.post(
+            "/finance/budget-items", json=budget_item_payload(event_id, unit_cost="0.005")
+        ).status_code == 201
+
+    summary = client.get(f"/finance/budget-items/summary/{event_id}").json()
+    assert summary["by_currency"]["USD"]["count"] == 3
+    assert float(summary["by_currency"]["USD"]["projected"]) == float(summary["total_projected"]) == 0.015
+    assert client.get(f"/finance/budget-items/summary/{event_id}/consistency").status_code == 200
+
+
+# =============================================================================
+# BULK IMPORT
+# =============================================================================
+
+def test_ndjson_import_skips_invalid_rows_by_row_number(client, event_id):
+    rows = [
+        json.dumps(budget_item_payload(event_id, name="Stage")),
+        json.dumps(budget_item_payload(event_id, name=None)),
+        "",
+        json.dumps(budget_item_payload(event_id, name="Sound", unit_cost="25.5", quantity="2")),
+    ]
+    response = client.post(
+        "/finance/budget-items/import", params={"batch_size": 2},
+        content="\n".join(rows), headers={"Content-Type": "application/x-ndjson"},
+    )
+    result = response.json()
+    assert (result["total_rows"], result["imported"], result["failed"]) == (3, 2, 1)
+    assert result["errors"][0]["row"] == 2
+    assert result["errors"][0]["errors"][0]["loc"] == ["name"]
+
+    page = client.get("/finance/budget-items", params={"event_id": event_id}).json()
+    assert {item["name"]: float(item["projected_amount"]) for item in page["items"]} == {"Stage": 100, "Sound": 51}
+
+
+def test_csv_import_keeps_quoted_newlines_in_one_row(client, event_id):
+    body = (
+        "event_id,category,name,description,unit_cost,quantity\r\n"
+        f'{event_id},food_beverage,Lunch,"Buffet\nfor speakers",30,10\r\n'
+        f"{event_id},venue,Hall,,500,\r\n"
+    )
+    response = client.post("/finance/budget-items/import", content=body, headers={"Content-Type": "text/csv"})
+    assert response.json()["imported"] == 2
+
+    page = client.get("/finance/budget-items", params={"event_id": event_id}).json()
+    lunch, hall = page["items"]
+    assert lunch["description"] == "Buffet\nfor speakers"
+    assert (float(lunch["projected_amount"]), float(hall["quantity"])) == (300, 1)
+
+
+# =============================================================================
+# EXPORT
+# =============================================================================
+
+def test_export_selected_fields_as_ndjson_and_csv(client, event_id):
+    items = create_items(client, event_id, 3)
+    client.patch(f"/finance/budget-items/{items[0]['id']}", json={"actual_amount": "120"})
+    params = {"event_id": event_id, "fields": "id,name,variance"}
+
+    ndjson = client.get("/finance/budget-items/export", params=params)
+    assert ndjson.headers["content-type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in ndjson.text.splitlines()]
+    assert [row["id"] for row in rows] == [item["id"] for item in items]
+    assert set(rows[0]) == {"id", "name", "variance"}
+    assert float(rows[0]["variance"]) == -20
+
+    csv_export = client.get("/finance/budget-items/export", params={**params, "format": "csv"})
+    assert csv_export.headers["content-disposition"] == 'attachment; filename="budget_items.csv"'
+    lines = csv_export.text.splitlines()
+    assert lines[0] == "id,name,variance"
+    assert len(lines) == 4 and lines[1].startswith(f"{items[0]['id']},Item 0,")
+
+    unknown = client.get("/finance/budget-items/export", params={"fields": "id,secret"})
+    assert unknown.status_code == 400
+
+
+# =============================================================================
+# SPONSORSHIP RESERVATIONS
+# =============================================================================
+
+def create_package(client, event_id, max_sponsors):
+    response = client.post("/finance/sponsorship-packages", params={
+        "event_id": event_id, "tier": "gold", "tier_name": "Gold", "amount": "10000", "max_sponsors": max_sponsors,
+    })
+    assert response.status_code == 201
+    return response.json()
+
+
+def create_sponsor(client, name="Acme"):
+    response = client.post("/finance/sponsors", params={
+        "company_name": name, "industry": "tech", "contact_name": "Kim", "contact_email": "kim@example.com",
+    })
+    assert response.status_code == 201
+    return response.json()
+
+
+def get_package(client, event_id, package_id):
+    page = client.get("/finance/sponsorship-packages", params={"event_id": event_id}).json()
+    return next(package for package in page["items"] if package["id"] == package_id)
+
+
+def test_hold_until_sold_out_then_release(client, event_id):
+    package = create_package(client, event_id, 2)
+    path = f"/finance/sponsorship-packages/{package['id']}/reservations"
+
+    holds = [client.post(path, json={"holder": "sales"}) for _ in range(3)]
+    assert [hold.status_code for hold in holds] == [201, 201, 409]
+    assert holds[2].json()["detail"]["held_count"] == 2
+
+    released = client.post(f"/finance/sponsorship-reservations/{holds[0].json()['id']}/release")
+    assert released.json()["status"] == "released"
+    assert client.post(path, json={"holder": "sales"}).status_code == 201
+
+    page = client.get("/finance/sponsorship-reservations", params={"package_id": package["id"], "status": "held"})
+    assert len(page.json()["items"]) == 2
+    assert client.post(f"/finance/sponsorship-packages/{uuid4()}/reservations", json={"holder": "x"}).status_code == 404
+
+
+def test_contract_converts_hold_and_cancel_frees_slot(client, event_id):
+    package = create_package(client, event_id, 1)
+    sponsor = create_sponsor(client)
+    hold = client.post(
+        f"/finance/sponsorship-packages/{package['id']}/reservations",
+        json={"holder": "sales", "sponsor_id": sponsor["id"]},
+    ).json()
+
+    contracted = client.patch(
+        f"/finance/sponsors/{sponsor['id']}/status", params={"status": "contracted", "package_id": package["id"]}
+    )
+    assert contracted.status_code == 200
+    assert client.get(f"/finance/sponsorship-reservations/{hold['id']}").json()["status"] == "converted"
+    stored = get_package(client, event_id, package["id"])
+    assert (stored["held_count"], stored["sold_count"]) == (0, 1)
+
+    # 남은 수량이 없으면 보류 없는 직접 판매는 409
+    other = create_sponsor(client, "Globex")
+    assert client.patch(
+        f"/finance/sponsors/{other['id']}/status", params={"status": "contracted", "package_id": package["id"]}
+    ).status_code == 409
+
+    cancelled = client.patch(f"/finance/sponsors/{sponsor['id']}/status", params={"status": "cancelled"})
+    assert cancelled.status_code == 200
+    assert get_package(client, event_id, package["id"])["sold_count"] == 0
+
+
+def test_leaving_contract_frees_slot(client, event_id):
+    package = create_package(client, event_id, 1)
+    sponsor = create_sponsor(client)
+    path = f"/finance/sponsors/{sponsor['id']}/status"
+    assert client.patch(path, params={"status": "contracted", "package_id": package["id"]}).status_code == 200
+
+    # 계약 이후 협상 단계로 되돌리면 판매 수량 반환 → 다른 스폰서가 계약 가능
+    assert client.patch(path, params={"status": "negotiating"}).status_code == 200
+    assert get_package(client, event_id, package["id"])["sold_count"] == 0
+    other = create_sponsor(client, "Globex")
+    assert client.patch(
+        f"/finance/sponsors/{other['id']}/status", params={"status": "contracted", "package_id": package["id"]}
+    ).status_code == 200
+
+    # 계약 상태에서 다른 패키지로 옮기면 이전 패키지 수량 반환
+    second = create_package(client, event_id, 1)
+    moved = client.patch(
+        f"/finance/sponsors/{other['id']}/status", params={"status": "fulfilled", "package_id": second["id"]}
+    )
+    assert moved.status_code == 200
+    assert get_package(client, event_id, package["id"])["sold_count"] == 0
+    assert get_package(client, event_id, second["id"])["sold_count"] == 1
+
+
+def test_failed_status_change_keeps_slot_sold(client, event_id, monkeypatch):
+    from routers import finance
+
+    package = create_package(client, event_id, 1)
+    sponsor = create_sponsor(client)
+    path = f"/finance/sponsors/{sponsor['id']}/status"
+    contracted = client.patch(path, params={"status": "contracted", "package_id": package["id"]})
+    etag = contracted.headers["ETag"]
+
+    assert client.patch(path, params={"status": "negotiating"}, headers={"If-Match": '"1"'}).status_code == 412
+    assert get_package(client, event_id, package["id"])["sold_count"] == 1
+
+    # 조회 직후 다른 요청이 먼저 수정 → 버전 충돌, 판매 수량은 그대로
+    sponsors = finance.repository.sponsors
+    get = sponsors.get
+
+    async def get_then_interleave(sponsor_id):
+        found = await get(sponsor_id)
+        monkeypatch.setattr(sponsors, "get", get)
+        await sponsors.update(sponsor_id, lambda s: s.model_copy(update={"notes": "edited"}))
+        return found
+
+    monkeypatch.setattr(sponsors, "get", get_then_interleave)
+    assert client.patch(path, params={"status": "negotiating"}, headers={"If-Match": etag}).status_code == 412
+    assert get_package(client, event_id, package["id"])["sold_count"] == 1
+
+
+def test_reservation_sweep_logs_failures_and_stops_on_cancel(client, monkeypatch, caplog):
+    from routers import finance
+
+    calls = []
+
+    async def fail(now):
+        calls.append(now)
+        raise RuntimeError("storage down")
+
+    async def sweep_twice():
+        task = asyncio.create_task(finance.expire_reservations_periodically(interval=0))
+        while len(calls) < 2:
+            await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    monkeypatch.setattr(finance.repository, "expire_reservations", fail)
+    with caplog.at_level(logging.ERROR, logger="routers.finance"):
+        client.portal.call(sweep_twice)
+    # 실패해도 다음 주기에 계속 시도하고, 실패마다 traceback과 함께 기록
+    assert len(calls) >= 2
+    assert caplog.records and all(record.exc_info for record in caplog.records)
+
+
+# =============================================================================
+# REPORTS
+# =============================================================================
+
+def test_report_inputs_are_snapshots(client, event_id):
+    from routers.finance import ReportGenerateRequest, report_inputs
+
+    create_items(client, event_id, 2)
+    request = ReportGenerateRequest(event_id=event_id, period_start="2026-01-01", period_end="2026-12-31")
+    revision, aggregate, revenue = client.portal.call(report_inputs, request)
+
+    # 이후 쓰기는 이미 넘긴 입력(스레드 풀 계산 중인 사본)에 반영되지 않는다
+    create_items(client, event_id, 1)
+    assert revision is not None
+    assert (aggregate.total_items, aggregate.by_currency["USD"]["count"]) == (2, 2)
+    assert revenue.total_sponsors == 0
+
+    job = client.post("/finance/reports/generate", params={"mode": "async"}, json=request.model_dump(mode="json"))
+    assert job.status_code == 202
+    done = client.get(f"/finance/reports/jobs/{job.json()['id']}", params={"wait": 5}).json()
+    assert done["status"] == "succeeded"
+    assert float(done["report"]["total_budget"]) == 300
+
+
+# =============================================================================
+# TRANSACTIONS
+# =============================================================================
+
+def transaction_payload(event_id, **fields):
+    payload = {
+        "event_id": event_id, "transaction_type": "expense", "amount": "10", "payment_method": "credit_card",
+        "description": "Deposit", "recorded_by": "finance",
+    }
+    payload.update(fields)
+    return payload
+
+
+def test_transaction_date_with_timezone_is_stored_as_utc(client, event_id):
+    assert client.post("/finance/transactions", json=transaction_payload(event_id)).status_code == 201
+    created = client.post(
+        "/finance/transactions", json=transaction_payload(event_id, transaction_date="2026-01-01T09:00:00+09:00")
+    )
+    assert created.status_code == 201
+    assert created.json()["transaction_date"] == "2026-01-01T00:00:00"
+
+    page = client.get("/finance/transactions", params={"event_id": event_id, "include_total": True}).json()
+    assert len(page["items"]) == page["total_count"] == 2
+
+
+# =============================================================================
+# PRICING TIERS
+# =============================================================================
+
+def test_pricing_tier_bounds_with_timezone_are_stored_as_utc(client, event_id):
+    created = client.post("/finance/pricing-tiers", json={
+        "event_id": event_id, "name": "Early Bird", "base_price": "100",
+        "valid_from": "2026-01-01T00:00:00Z", "valid_until": "2026-03-01T09:00:00+09:00",
+    })
+    assert created.status_code == 201
+    assert created.json()["valid_until"] == "2026-03-01T00:00:00"
+
+    listed = client.get("/finance/pricing-tiers", params={"event_id": event_id})
+    assert listed.status_code == 200
+    assert len(listed.json()["items"]) == 1
+
+    def available(at):
+        page = client.get("/finance/pricing-tiers/available", params={"event_id": event_id, "at": at}).json()
+        return [tier["name"] for tier in page["tiers"]]
+
+    assert available("2026-02-28T23:59:00Z") == ["Early Bird"]
+    assert available("2026-03-01T09:00:01+09:00") == []
@@ -0,0 +1,98 @@
+"""
+Budget 집계 캐시 테스트
+- 직렬화 시 라인 항목 1회 순회, add / remove / replace 증분 갱신
+- 리스트 재할당 / 직접 append / model_copy는 다시 계산, 제자리 수정은 invalidate_totals
+- /budgets/{event_id} 응답 집계 + ETag
+
+Author: Event Agent System
+"""
+
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from schemas.financial import Budget, BudgetCategory, BudgetTotals
+
+from factories import budget_item, budget_item_payload
+
+
+@pytest.fixture
+def passes(monkeypatch):
+    """BudgetTotals.from_items 호출 횟수 (라인 항목 전체 순회 횟수)"""
+    calls = []
+    from_items = BudgetTotals.from_items.__func__
+
+    def counting(cls, items):
+        calls.append(len(items))
+        return from_items(cls, items)
+
+    monkeypatch.setattr(BudgetTotals, "from_items", classmethod(counting))
+    return calls
+
+
+def make_budget(event_id, items):
+    return Budget(event_id=event_id, name="Annual", fiscal_year=2026, line_items=items)
+
+
+def test_dump_walks_line_items_once_and_updates_incrementally(passes):
+    event_id = uuid4()
+    hall = budget_item(event_id, unit_cost="100")
+    catering = budget_item(event_id, unit_cost="40", category=BudgetCategory.FOOD_BEVERAGE)
+    budget = make_budget(event_id, [hall, catering])
+
+    dumped = budget.model_dump()
+    assert (dumped["total_projected"], dumped["contingency_amount"]) == (Decimal("140"), Decimal("14"))
+    assert passes == [2]
+
+    extra = budget_item(event_id, unit_cost="10", category=BudgetCategory.FOOD_BEVERAGE)
+    budget.add_line_item(extra)
+    budget.replace_line_item(hall.model_copy(update={"actual_amount": Decimal("90")}))
+    assert budget.remove_line_item(catering.id) == catering
+    assert budget.remove_line_item(uuid4()) is None
+    assert (budget.total_projected, budget.total_actual) == (Decimal("110"), Decimal("90"))
+    assert budget.budget_by_category == {"venue": Decimal("100"), "food_beverage": Decimal("10")}
+    assert passes == [2]
+
+
+def test_outside_list_changes_recompute(passes):
+    event_id = uuid4()
+    budget = make_budget(event_id, [budget_item(event_id)])
+    assert budget.total_projected == Decimal("100")
+
+    # 캐시 사본을 고쳐도 집계는 그대로
+    budget.budget_by_category["venue"] = Decimal("0")
+    assert budget.budget_by_category == {"venue": Decimal("100")}
+
+    budget.line_items.append(budget_item(event_id, unit_cost="5"))
+    assert budget.total_projected == Decimal("105")
+    budget.line_items = [budget_item(event_id, unit_cost="7")]
+    assert budget.total_projected == Decimal("7")
+    copied = budget.model_copy(update={"line_items": [budget_item(event_id, unit_cost="3")]})
+    assert (copied.total_projected, budget.total_projected) == (Decimal("3"), Decimal("7"))
+
+    budget.line_items[0] = budget_item(event_id, unit_cost="9")
+    assert budget.total_projected == Decimal("7")
+    budget.invalidate_totals()
+    assert budget.total_projected == Decimal("9")
+    assert len(passes) == 5
+
+
+def test_budget_endpoint_totals_and_etag(client, event_id):
+    path = f"/finance/budgets/{event_id}"
+    assert client.get(path).status_code == 404
+    for unit_cost in ("100", "50"):
+        client.post("/finance/budget-items", json=budget_item_payload(event_id, unit_cost=unit_cost))
+
+    response = client.get(path, params={"fiscal_year": 2026, "contingency_percentage": "20"})
+    budget = response.json()
+    assert len(budget["line_items"]) == 2
+    assert (float(budget["total_projected"]), float(budget["contingency_amount"])) == (150, 30)
+
+    etag = response.headers["ETag"]
+    params = {"fiscal_year": 2026, "contingency_percentage": "20"}
+    assert client.get(path, params=params, headers={"If-None-Match": etag}).status_code == 304
+    other_year = client.get(path, params={**params, "fiscal_year": 2027}, headers={"If-None-Match": etag})
+    assert other_year.status_code == 200
+    client.post("/finance/budget-items", json=budget_item_payload(event_id))
+    assert client.get(path, params=params, headers={"If-None-Match": etag}).status_code == 200
@@ -0,0 +1,111 @@
+"""
+현금 흐름 예측 테스트
+- 기간 경계 (주: 월요일 시작, 월: 1일 시작)
+- 누적합 기간 합계, 취소 / 결제일 없는 항목 제외, 기초 잔액 이월 (projected / actual)
+- (이벤트, 리비전) 인덱스 캐시, API ETag
+
+Author: Event Agent System
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from schemas.financial import BudgetStatus, TransactionType
+from services.cashflow import (
+    CashFlowBasis, CashFlowIndex, CashFlowIndexCache, CashFlowPeriod, budget_flows, period_bounds, project,
+    transaction_flows,
+)
+
+from factories import budget_item, budget_item_payload, transaction
+
+
+def same_currency(code, day):
+    return Decimal("1")
+
+
+def test_period_bounds_align_to_week_and_month():
+    assert period_bounds(CashFlowPeriod.WEEKLY, date(2026, 3, 4), date(2026, 3, 9)) == [
+        (date(2026, 3, 2), date(2026, 3, 8)),
+        (date(2026, 3, 9), date(2026, 3, 15)),
+    ]
+    assert period_bounds(CashFlowPeriod.MONTHLY, date(2026, 1, 31), date(2026, 3, 1)) == [
+        (date(2026, 1, 1), date(2026, 1, 31)),
+        (date(2026, 2, 1), date(2026, 2, 28)),
+        (date(2026, 3, 1), date(2026, 3, 31)),
+    ]
+
+
+def test_projection_sums_periods_and_carries_balance():
+    event_id = uuid4()
+    items = [
+        budget_item(event_id, unit_cost="100", payment_due_date=date(2026, 1, 15)),
+        budget_item(event_id, unit_cost="50.25", payment_due_date=date(2026, 2, 10)),
+        budget_item(event_id, unit_cost="70", payment_due_date=date(2026, 2, 11), status=BudgetStatus.CANCELLED),
+        budget_item(event_id, unit_cost="999"),
+    ]
+    transactions = [
+        transaction(event_id, TransactionType.INCOME, "300", datetime(2026, 1, 20)),
+        transaction(event_id, TransactionType.REFUND, "20", datetime(2026, 2, 1)),
+        transaction(event_id, TransactionType.EXPENSE, "40.5", datetime(2026, 2, 5, 23, 59)),
+    ]
+    index = CashFlowIndex([*budget_flows(items), *transaction_flows(transactions)])
+    assert index.span() == (date(2026, 1, 15), date(2026, 2, 10))
+
+    bounds = period_bounds(CashFlowPeriod.MONTHLY, date(2026, 2, 1), date(2026, 3, 1))
+    actual = project(
+        index, event_id, CashFlowPeriod.MONTHLY, bounds, "USD", same_currency,
+        CashFlowBasis.ACTUAL, Decimal("1000"),
+    )
+    february, march = actual
+    assert february.projected_expense == Decimal("50.25")
+    assert (february.actual_income, february.actual_expense) == (Decimal("-20"), Decimal("40.5"))
+    # 기초 잔액: 시작 잔액 + 1월 실제 순흐름, 3월은 2월 기말
+    assert february.opening_balance == Decimal("1300")
+    assert march.opening_balance == Decimal("1239.5")
+
+    projected = project(index, event_id, CashFlowPeriod.MONTHLY, bounds, "USD", same_currency)
+    assert [p.opening_balance for p in projected] == [Decimal("-100"), Decimal("-150.25")]
+
+
+@pytest.mark.anyio
+async def test_index_cache_rebuilds_only_on_new_revision():
+    cache = CashFlowIndexCache()
+    event_id = uuid4()
+    builds = []
+
+    async def build():
+        builds.append(1)
+        return CashFlowIndex([])
+
+    first = await cache.get(event_id, 1, build)
+    assert await cache.get(event_id, 1, build) is first
+    assert await cache.get(event_id, 2, build) is not first
+    assert (len(builds), cache.hits, cache.misses) == (2, 1, 2)
+
+
+def test_cash_flow_endpoint_with_etag(client, event_id):
+    payload = budget_item_payload(event_id, unit_cost="200", payment_due_date="2026-05-20")
+    assert client.post("/finance/budget-items", json=payload).status_code == 201
+    path = f"/finance/cash-flow/{event_id}"
+
+    response = client.get(path, params={"period": "weekly"})
+    report = response.json()
+    assert (report["currency"], report["rates_version"]) == ("USD", None)
+    assert [p["period_start"] for p in report["periods"]] == ["2026-05-18"]
+    assert float(report["periods"][0]["projected_expense"]) == 200
+
+    etag = response.headers["ETag"]
+    assert client.get(path, headers={"If-None-Match": etag}).status_code == 304
+    payment = {
+        "event_id": event_id, "transaction_type": "income", "amount": "500", "payment_method": "bank_transfer",
+        "description": "Sponsor payment", "recorded_by": "finance", "transaction_date": "2026-06-02T09:00:00",
+    }
+    assert client.post("/finance/transactions", json=payment).status_code == 201
+    changed = client.get(path, params={"basis": "actual"}, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    june = changed.json()["periods"][-1]
+    assert (june["period_start"], float(june["actual_income"])) == ("2026-06-01", 500)
+    assert client.get(path, params={"start": "2026-06-01", "end": "2026-05-01"}).status_code == 400
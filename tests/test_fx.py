@@ -0,0 +1,114 @@
+"""
+환율 테이블 / 환산 테스트
+- 적용일 기준 환율 조회, 통화별 소계 합산 후 1회 반올림
+- 환산 캐시 (환율 파일이 바뀌면 새 버전으로 다시 계산)
+- 예산 요약 환산 + ETag (환율 적용일이 바뀌면 새 ETag)
+
+Author: Event Agent System
+"""
+
+import json
+import os
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from services.fx import CurrencyConverter, FXRateError, FXRateSource, FXRateTable
+
+from factories import budget_item_payload
+
+
+def rate_file(path, version, eur="2"):
+    path.write_text(json.dumps({
+        "version": version,
+        "base": "USD",
+        "rates": [
+            {"effective_date": "2026-01-01", "rates": {"EUR": eur, "GBP": "4"}},
+            {"effective_date": "2026-07-01", "rates": {"EUR": "1", "GBP": "1"}},
+        ],
+    }))
+    return path
+
+
+def bucket(projected, actual="0"):
+    return {"count": 1, "projected": Decimal(projected), "actual": Decimal(actual)}
+
+
+# =============================================================================
+# RATE TABLE
+# =============================================================================
+
+def test_rates_follow_effective_date(tmp_path):
+    table = FXRateTable.load(rate_file(tmp_path / "rates.json", "v1"))
+
+    assert table.factor("EUR", "USD", date(2026, 6, 30)) == Decimal("0.5")
+    assert table.factor("EUR", "GBP", date(2026, 6, 30)) == Decimal("2")
+    assert table.factor("EUR", "USD", date(2026, 7, 1)) == Decimal("1")
+    assert table.effective_date(date(2026, 12, 31)) == date(2026, 7, 1)
+    with pytest.raises(FXRateError):
+        table.factor("EUR", "USD", date(2025, 12, 31))
+    with pytest.raises(FXRateError):
+        table.factor("CHF", "USD", date(2026, 3, 1))
+
+
+def test_convert_rounds_once_after_summing(tmp_path):
+    table = FXRateTable.load(rate_file(tmp_path / "rates.json", "v1"))
+
+    # 통화별 0.005 USD씩 → 각각 반올림하면 0.00 + 0.00, 합산 후 반올림하면 0.01
+    conversion = table.convert(
+        {"EUR": bucket("0.01", "0.02"), "GBP": bucket("0.02"), "USD": bucket("1")}, "USD", date(2026, 3, 1)
+    )
+    assert conversion.total_projected == Decimal("1.01")
+    assert conversion.total_actual == Decimal("0.01")
+    assert conversion.total_variance == Decimal("1.00")
+    assert (conversion.rates_version, conversion.rate_date) == ("v1", date(2026, 1, 1))
+
+
+# =============================================================================
+# CONVERTER CACHE
+# =============================================================================
+
+def test_converter_cache_follows_rate_file_version(tmp_path):
+    path = rate_file(tmp_path / "rates.json", "v1")
+    converter = CurrencyConverter(FXRateSource(str(path)))
+    subtotals = {"EUR": bucket("10")}
+
+    first = converter.convert(subtotals, "USD", date(2026, 3, 1), cache_key=("event", 1))
+    assert converter.convert(subtotals, "USD", date(2026, 3, 2), cache_key=("event", 1)) is first
+    assert (converter.hits, converter.misses) == (1, 1)
+
+    rate_file(path, "v2", eur="4")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    second = converter.convert(subtotals, "USD", date(2026, 3, 1), cache_key=("event", 1))
+    assert (second.rates_version, second.total_projected) == ("v2", Decimal("2.50"))
+    assert converter.misses == 2
+
+
+# =============================================================================
+# BUDGET SUMMARY
+# =============================================================================
+
+def test_summary_converts_mixed_currencies_with_rate_date_etag(client, event_id):
+    for currency, unit_cost in (("USD", "100"), ("EUR", "92"), ("KRW", "138000")):
+        payload = budget_item_payload(event_id, unit_cost=unit_cost, currency=currency)
+        assert client.post("/finance/budget-items", json=payload).status_code == 201
+    path = f"/finance/budget-items/summary/{event_id}"
+
+    summary = client.get(path, params={"as_of": "2026-03-01"})
+    converted = summary.json()["converted"]
+    # 기본 환율 파일 (2026-01-01: EUR 0.92, KRW 1380) → 기준 통화 USD
+    assert converted["currency"] == "USD"
+    assert float(converted["total_projected"]) == 300
+    assert summary.json()["by_currency"]["KRW"]["count"] == 1
+
+    etag = summary.headers["ETag"]
+    assert client.get(path, params={"as_of": "2026-06-30"}, headers={"If-None-Match": etag}).status_code == 304
+    later = client.get(path, params={"as_of": "2026-08-01"}, headers={"If-None-Match": etag})
+    assert later.status_code == 200
+    assert later.headers["ETag"] != etag
+    assert later.json()["converted"]["rate_date"] == "2026-07-01"
+
+    in_krw = client.get(path, params={"as_of": "2026-03-01", "reporting_currency": "KRW"}).json()
+    assert float(in_krw["converted"]["total_projected"]) == 414000
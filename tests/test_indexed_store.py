@@ -0,0 +1,126 @@
+"""
+IndexedStore 테스트: 기본 맵 / 정렬 순서 / 보조 인덱스 동기화, 키셋 페이지, 일괄 교체
+
+Author: Event Agent System
+"""
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from schemas.financial import BudgetStatus
+from storage import VersionConflict
+from storage.memory import BULK_REINDEX_THRESHOLD, BudgetItemStore, IndexedStore
+
+from factories import budget_item
+
+
+def items_for(event_id, count, start=datetime(2026, 1, 1)):
+    return [budget_item(event_id, name=f"Item {i}", created_at=start + timedelta(seconds=i)) for i in range(count)]
+
+
+def test_add_find_count_follow_indexes():
+    store = IndexedStore(index_fields=("event_id", "status", ("event_id", "status")))
+    first, second = uuid4(), uuid4()
+    for item in items_for(first, 3) + items_for(second, 2):
+        store.add(item)
+
+    assert len(store) == 5
+    assert [item.name for item in store.find(event_id=first)] == ["Item 0", "Item 1", "Item 2"]
+    assert store.count(event_id=second) == 2
+    assert store.count(event_id=first, status=BudgetStatus.DRAFT) == 3
+    assert store.count(event_id=first, status=BudgetStatus.PAID) == 0
+
+
+def test_duplicate_add_is_rejected():
+    store = IndexedStore(index_fields=("event_id",))
+    item = budget_item(uuid4())
+    store.add(item)
+    with pytest.raises(KeyError):
+        store.add(item)
+    assert len(store) == 1
+
+
+def test_replace_moves_index_buckets_and_checks_version():
+    store = IndexedStore(index_fields=("status",))
+    item = store.add(budget_item(uuid4()))
+
+    paid = item.model_copy(update={"status": BudgetStatus.PAID, "version": 2})
+    assert store.replace(paid) is item
+    assert store.count(status=BudgetStatus.DRAFT) == 0
+    assert store.find(status=BudgetStatus.PAID) == [paid]
+
+    with pytest.raises(VersionConflict):
+        store.replace(paid.model_copy(update={"version": 2}))
+
+
+def test_remove_cleans_every_index():
+    store = IndexedStore(index_fields=("event_id", "status"))
+    item = store.add(budget_item(uuid4()))
+    assert store.remove(item.id) is item
+    assert store.remove(item.id) is None
+    assert store.stats() == {"records": 0, "indexes": 2, "index_keys": 0}
+
+
+def test_page_walks_every_record_once_in_sort_order():
+    store = IndexedStore(index_fields=("event_id",))
+    event_id = uuid4()
+    items = items_for(event_id, 7)
+    for item in reversed(items):
+        store.add(item)
+
+    seen, after = [], None
+    while True:
+        page, after = store.page(3, after, event_id=event_id)
+        seen.extend(page)
+        if after is None:
+            break
+    assert seen == items
+
+
+@pytest.mark.parametrize("count", [3, BULK_REINDEX_THRESHOLD + 5])
+def test_replace_many_keeps_indexes_in_sync(count):
+    store = IndexedStore(index_fields=("event_id", "status"))
+    event_id = uuid4()
+    items = items_for(event_id, count)
+    for item in items:
+        store.add(item)
+
+    paid = [item.model_copy(update={"status": BudgetStatus.PAID, "version": 2}) for item in items[::2]]
+    pairs = store.replace_many(paid)
+
+    assert len(pairs) == len(paid)
+    assert store.find(status=BudgetStatus.PAID) == paid
+    assert store.count(status=BudgetStatus.DRAFT) == count - len(paid)
+    assert [item.id for item in store.find(event_id=event_id)] == [item.id for item in items]
+
+
+def test_budget_item_store_aggregate_matches_recomputation():
+    store = BudgetItemStore()
+    event_id = uuid4()
+    items = [budget_item(event_id, unit_cost="12.50", quantity="4"), budget_item(event_id, unit_cost="3")]
+    for item in items:
+        store.add(item)
+    store.replace(items[0].model_copy(update={"actual_amount": Decimal("40"), "version": 2}))
+    store.remove(items[1].id)
+
+    assert store.aggregate(event_id).total_items == 1
+    assert store.check_aggregate(event_id) == []
+
+
+def test_failed_add_leaves_store_unchanged():
+    store = IndexedStore(index_fields=("event_id",))
+    event_id = uuid4()
+    store.add(budget_item(event_id, created_at=datetime(2026, 1, 2)))
+
+    # naive / aware datetime 정렬 키 비교 실패 → 기본 맵 / 순서 / 인덱스 모두 그대로
+    aware = budget_item(uuid4(), created_at=datetime(2026, 1, 1, tzinfo=timezone.utc))
+    with pytest.raises(TypeError):
+        store.add(aware)
+
+    assert len(store) == 1
+    assert aware.id not in store
+    assert store.count(event_id=aware.event_id) == 0
+    assert len(store.find()) == 1
@@ -0,0 +1,84 @@
+"""
+백그라운드 작업 큐 테스트
+- 같은 키 중복 제거, 동시 실행 수 제한, 대기 한도 (QueueFull)
+- 실패 작업의 오류 기록, 완료 작업 보관 개수, 대기 시간 초과
+- 비동기 리포트 생성 (202 + Location → 상태 조회 long polling)
+
+Author: Event Agent System
+"""
+
+import asyncio
+
+import pytest
+
+from services.jobs import JobQueue, JobStatus, QueueFull
+
+from factories import budget_item_payload
+
+
+@pytest.mark.anyio
+async def test_queue_deduplicates_and_limits_concurrency():
+    queue = JobQueue(workers=1, max_queued=1)
+    gate = asyncio.Event()
+
+    async def blocked():
+        await gate.wait()
+        return "a"
+
+    first, created = queue.submit("a", blocked)
+    await asyncio.sleep(0)
+    assert (created, first.status, queue.running) == (True, JobStatus.RUNNING, 1)
+    assert queue.submit("a", blocked) == (first, False)
+
+    second, _ = queue.submit("b", lambda: asyncio.sleep(0, result="b"))
+    await asyncio.sleep(0)
+    assert second.status == JobStatus.QUEUED
+    with pytest.raises(QueueFull):
+        queue.submit("c", blocked)
+
+    gate.set()
+    await queue.wait(second, timeout=1)
+    assert (first.result, second.result) == ("a", "b")
+    stats = queue.stats()
+    assert (stats["submitted"], stats["deduplicated"], stats["rejected"], stats["succeeded"]) == (2, 1, 1, 2)
+    assert stats["wait_time"].count == 2
+    await queue.close()
+
+
+@pytest.mark.anyio
+async def test_failed_jobs_keep_error_and_old_jobs_expire():
+    queue = JobQueue(retention=1)
+
+    async def fail():
+        raise ValueError("no budget items")
+
+    failed, _ = queue.submit("fail", fail)
+    assert (await queue.wait(failed, timeout=1)).error == "no budget items"
+    assert failed.status == JobStatus.FAILED and queue.get(failed.id) is failed
+
+    # 같은 키도 완료 후에는 새 작업
+    retried, created = queue.submit("fail", lambda: asyncio.sleep(0, result=1))
+    await queue.wait(retried, timeout=1)
+    assert created and queue.get(failed.id) is None and queue.get(retried.id) is retried
+
+    slow, _ = queue.submit("slow", lambda: asyncio.sleep(10))
+    assert (await queue.wait(slow, timeout=0.01)).finished is False
+    await queue.close()
+
+
+def test_async_report_generation_is_polled_to_completion(client, event_id):
+    client.post("/finance/budget-items", json=budget_item_payload(event_id, unit_cost="300"))
+    request = {"event_id": event_id, "period_start": "2026-01-01", "period_end": "2026-12-31"}
+
+    accepted = client.post("/finance/reports/generate", params={"mode": "async"}, json=request)
+    assert accepted.status_code == 202
+    job = accepted.json()
+    assert accepted.headers["Location"] == f"/finance/reports/jobs/{job['id']}"
+    assert job["status"] in ("queued", "running", "succeeded")
+
+    done = client.get(accepted.headers["Location"], params={"wait": 5}).json()
+    assert done["status"] == "succeeded"
+    assert float(done["report"]["total_budget"]) == 300
+    assert client.get(f"/finance/reports/{done['report']['id']}").status_code == 200
+
+    assert client.get("/finance/reports/jobs/00000000-0000-0000-0000-000000000000").status_code == 404
@@ -0,0 +1,84 @@
+"""
+StoreJournal 테스트: memory 저장소 재시작 복구 (저널 재생 / 스냅샷 + 꼬리 재생 / 잘린 프레임)
+
+Author: Event Agent System
+"""
+
+from decimal import Decimal
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+from schemas.financial import BudgetStatus
+from storage import create_repository
+
+from factories import budget_item, reservation, sponsorship_package
+
+
+pytestmark = pytest.mark.anyio
+
+
+async def reopen(directory: Path, snapshot_every: int = 100_000):
+    repo = create_repository(backend="memory", journal_dir=str(directory))
+    repo.journal.snapshot_every = snapshot_every
+    await repo.open()
+    return repo
+
+
+async def test_restart_replays_every_write(tmp_path):
+    event_id = uuid4()
+    repo = await reopen(tmp_path)
+    items = [budget_item(event_id, name=f"Item {i}") for i in range(5)]
+    await repo.budget_items.add_many(items)
+    await repo.budget_items.update(items[0].id, lambda i: i.model_copy(update={"status": BudgetStatus.PAID}))
+    await repo.budget_items.remove(items[1].id)
+    package = await repo.sponsorship_packages.add(sponsorship_package(event_id))
+    hold = await repo.claim_package(reservation(package))
+    await repo.close()
+
+    restored = await reopen(tmp_path)
+    try:
+        assert await restored.budget_items.count(event_id=event_id) == 4
+        assert (await restored.budget_items.get(items[0].id)).status == BudgetStatus.PAID
+        assert await restored.budget_items.get(items[1].id) is None
+        assert (await restored.sponsorship_packages.get(package.id)).held_count == 1
+        assert await restored.sponsorship_reservations.get(hold.id) == hold
+        aggregate = await restored.budget_aggregate(event_id)
+        assert aggregate.total_projected == Decimal("400")
+        assert await restored.check_budget_aggregate(event_id) == []
+    finally:
+        await restored.close()
+
+
+async def test_snapshot_then_tail_replay(tmp_path):
+    event_id = uuid4()
+    repo = await reopen(tmp_path, snapshot_every=10)
+    items = [budget_item(event_id, name=f"Item {i}") for i in range(30)]
+    for item in items:
+        await repo.budget_items.add(item)
+    await repo.close()
+    assert list(tmp_path.glob("snapshot-*.bin"))
+
+    restored = await reopen(tmp_path)
+    try:
+        assert [item.id for item in await restored.budget_items.find(event_id=event_id)] == [i.id for i in items]
+    finally:
+        await restored.close()
+
+
+async def test_torn_tail_frame_is_ignored(tmp_path):
+    event_id = uuid4()
+    repo = await reopen(tmp_path)
+    await repo.budget_items.add(budget_item(event_id))
+    await repo.close()
+
+    segment = max(tmp_path.glob("journal-*.log"))
+    with open(segment, "ab") as journal:
+        journal.write(b"\x00\x00\x10\x00partial")
+
+    restored = await reopen(tmp_path)
+    try:
+        assert await restored.budget_items.count(event_id=event_id) == 1
+    finally:
+        await restored.close()
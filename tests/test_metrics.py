@@ -0,0 +1,57 @@
+"""
+요청 지표 테스트
+- Histogram: 비누적 저장 → 누적 버킷 출력
+- /metrics: 라우트 템플릿 단위 라벨, 상태 코드별 요청 수, 저장소 / 작업 큐 지표
+
+Author: Event Agent System
+"""
+
+from uuid import uuid4
+
+from services.metrics import CONTENT_TYPE, Histogram
+
+
+def sample(text, series):
+    """지표 텍스트에서 한 시계열 값 (없으면 0)"""
+    for line in text.splitlines():
+        if line.startswith(series + " "):
+            return float(line.rsplit(" ", 1)[1])
+    return 0.0
+
+
+def test_histogram_renders_cumulative_buckets():
+    histogram = Histogram((1, 2))
+    for value in (0.5, 1, 1.5, 3):
+        histogram.observe(value)
+
+    lines = []
+    histogram.render("latency", 'route="/x"', lines)
+    assert lines == [
+        'latency_bucket{route="/x",le="1"} 2',
+        'latency_bucket{route="/x",le="2"} 3',
+        'latency_bucket{route="/x",le="+Inf"} 4',
+        'latency_sum{route="/x"} 6.0',
+        'latency_count{route="/x"} 4',
+    ]
+
+
+def test_metrics_label_requests_by_route_template(client):
+    not_found = 'http_requests_total{method="GET",route="/finance/budget-items/{item_id}",status="404"}'
+    unmatched = 'http_requests_total{method="GET",route="<unmatched>",status="404"}'
+    before = client.get("/metrics").text
+
+    missing = uuid4()
+    for _ in range(2):
+        assert client.get(f"/finance/budget-items/{missing}").status_code == 404
+    assert client.get("/no-such-route").status_code == 404
+
+    response = client.get("/metrics")
+    assert response.headers["content-type"] == CONTENT_TYPE
+    text = response.text
+    # 요청 경로의 ID가 아니라 라우트 템플릿이 라벨 → 카디널리티 고정
+    assert str(missing) not in text
+    assert sample(text, not_found) - sample(before, not_found) == 2
+    assert sample(text, unmatched) - sample(before, unmatched) == 1
+    assert 'http_request_duration_seconds_count{method="GET",route="/finance/budget-items/{item_id}"}' in text
+    assert "# TYPE finance_store_records gauge" in text
+    assert 'finance_jobs_workers{queue="reports"}' in text
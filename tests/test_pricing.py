@@ -0,0 +1,97 @@
+"""
+가격 등급 인덱스 / 대량 견적 테스트
+- 시각별 구매 가능 등급 (적용 기간 양 끝 포함, 매진 제외, 시간대 → UTC)
+- 견적: 등록 시각 순서로 남은 수량 소진, 회원가, 요청 순서 가격, 등급 없는 등록
+- API: 등급 생성 → 견적
+
+Author: Event Agent System
+"""
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from schemas.financial import PricingTier
+from services.pricing import PricingIndex
+
+
+MARCH = datetime(2026, 3, 1)
+
+
+def tier(event_id, name, base_price, **fields):
+    return PricingTier(event_id=event_id, name=name, base_price=Decimal(base_price), **fields)
+
+
+@pytest.fixture
+def index():
+    event_id = uuid4()
+    return PricingIndex(event_id, [
+        tier(event_id, "VIP", "500"),
+        tier(event_id, "Early", "80", valid_until=MARCH, max_quantity=2, member_discount_rate=Decimal("25")),
+        tier(event_id, "Regular", "100", valid_from=MARCH),
+        tier(event_id, "Flash", "10", max_quantity=1, sold_quantity=1),
+    ])
+
+
+def names(index, at):
+    return [t.name for t in index.available(at).tiers]
+
+
+def test_available_tiers_include_both_window_ends(index):
+    assert names(index, datetime(2026, 2, 1)) == ["Early", "VIP"]
+    assert names(index, MARCH) == ["Early", "Regular", "VIP"]
+    assert names(index, MARCH + timedelta(microseconds=1)) == ["Regular", "VIP"]
+    seoul = timezone(timedelta(hours=9))
+    assert names(index, datetime(2026, 3, 1, 9, tzinfo=seoul)) == ["Early", "Regular", "VIP"]
+    assert index.available(MARCH).tiers[0].member_price == Decimal("60.00")
+
+
+def test_quote_consumes_capacity_in_registration_order(index):
+    timestamps = [datetime(2026, 2, 10), datetime(2026, 2, 1), datetime(2026, 2, 5), datetime(2026, 3, 2)]
+    members = [False, True, False, False]
+
+    quote = index.quote(timestamps, members, include_quotes=True)
+    assert quote.prices == [Decimal("500"), Decimal("60.00"), Decimal("80"), Decimal("100")]
+    assert quote.revenue == {"USD": Decimal("740.00")}
+    by_name = {t.name: t for t in quote.tiers}
+    assert (by_name["Early"].registrations, by_name["Early"].members, by_name["Early"].remaining) == (2, 1, 0)
+    assert (quote.priced, quote.unpriced) == (4, 0)
+
+    cheapest = index.quote(timestamps, members, consume_capacity=False, include_quotes=True)
+    assert cheapest.prices == [Decimal("80"), Decimal("60.00"), Decimal("80"), Decimal("100")]
+    assert cheapest.revenue == {"USD": Decimal("320.00")}
+
+    with pytest.raises(ValueError):
+        index.quote(timestamps, members[:2])
+
+
+def test_quote_reports_registrations_without_a_tier():
+    event_id = uuid4()
+    index = PricingIndex(event_id, [tier(event_id, "Early", "80", valid_until=MARCH)])
+
+    quote = index.quote([datetime(2026, 2, 1), datetime(2026, 4, 1)], include_quotes=True)
+    assert (quote.priced, quote.unpriced) == (1, 1)
+    assert quote.tier_ids[1] is None and quote.prices == [Decimal("80"), None]
+
+
+def test_quote_endpoint(client, event_id):
+    for payload in (
+        {"name": "Early", "base_price": "80", "valid_until": "2026-03-01T00:00:00Z", "max_quantity": 1},
+        {"name": "Regular", "base_price": "100"},
+    ):
+        assert client.post("/finance/pricing-tiers", json={"event_id": event_id, **payload}).status_code == 201
+
+    request = {
+        "event_id": event_id,
+        "timestamps": ["2026-02-01T00:00:00", "2026-02-02T00:00:00", "2026-05-01T00:00:00"],
+        "members": [False, False, True],
+        "include_quotes": True,
+    }
+    quote = client.post("/finance/pricing-tiers/quote", json=request).json()
+    assert [float(price) for price in quote["prices"]] == [80, 100, 100]
+    assert float(quote["revenue"]["USD"]) == 280
+
+    request["members"] = [True]
+    assert client.post("/finance/pricing-tiers/quote", json=request).status_code == 422
@@ -0,0 +1,84 @@
+"""
+거래 대사 테스트
+- 매칭 규칙 순서 (항목 ID → 참조 번호 → 거래처 + 금액), 정규화, 거래 유형별 부호
+- 미매칭 사유 (no_match / ambiguous / currency_mismatch / unknown_budget_item)
+- API: dry_run은 저장하지 않음, 대사 완료 거래는 다시 반영되지 않음
+
+Author: Event Agent System
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from uuid import uuid4
+
+from schemas.financial import CurrencyCode, TransactionType
+from services.reconciliation import BudgetItemIndex, MatchRule, UnmatchedReason, reconcile
+
+from factories import budget_item, budget_item_payload, transaction
+
+
+EXPENSE = TransactionType.EXPENSE
+DAY = datetime(2026, 3, 1)
+
+
+def test_reconcile_applies_rules_in_order_and_reports_reasons():
+    event_id = uuid4()
+    invoice = budget_item(event_id, reference_number="INV-1")
+    catering = budget_item(event_id, unit_cost="250", vendor_name="Acme Events")
+    duplicates = [budget_item(event_id, vendor_name="Dup Co") for _ in range(2)]
+    euro = budget_item(event_id, reference_number="EU-9", currency=CurrencyCode.EUR)
+    index = BudgetItemIndex([invoice, catering, *duplicates, euro])
+
+    transactions = [
+        transaction(event_id, EXPENSE, "120", DAY, budget_line_item_id=invoice.id),
+        transaction(event_id, EXPENSE, "30", DAY, reference_number=" inv-1 "),
+        transaction(event_id, TransactionType.REFUND, "10", DAY, reference_number="INV-1"),
+        transaction(event_id, EXPENSE, "250.00", DAY, vendor_name="acme   EVENTS"),
+        transaction(event_id, EXPENSE, "250", DAY, vendor_name="Acme Events", currency=CurrencyCode.EUR),
+        transaction(event_id, EXPENSE, "100", DAY, vendor_name="Dup Co"),
+        transaction(event_id, EXPENSE, "5", DAY, reference_number="EU-9"),
+        transaction(event_id, EXPENSE, "5", DAY, budget_line_item_id=uuid4()),
+        transaction(event_id, TransactionType.INCOME, "1000", DAY, reference_number="INV-1"),
+    ]
+    plan = reconcile(transactions, index)
+
+    assert plan.deltas == {invoice.id: Decimal("140"), catering.id: Decimal("250.00")}
+    assert plan.matched_by == {
+        MatchRule.BUDGET_ITEM_ID: 1, MatchRule.REFERENCE_NUMBER: 2, MatchRule.VENDOR_AMOUNT: 1,
+    }
+    assert [reason for _, reason in plan.unmatched] == [
+        UnmatchedReason.NO_MATCH,
+        UnmatchedReason.AMBIGUOUS,
+        UnmatchedReason.CURRENCY_MISMATCH,
+        UnmatchedReason.UNKNOWN_BUDGET_ITEM,
+    ]
+    assert (plan.scanned, plan.skipped) == (9, 1)
+
+    result = plan.result(dry_run=True, updated_items=2, max_unmatched=3)
+    assert (result.matched, result.unmatched, len(result.unmatched_transactions)) == (4, 4, 3)
+    assert result.unmatched_truncated
+
+
+def test_reconcile_endpoint_applies_each_transaction_once(client, event_id):
+    payload = budget_item_payload(event_id, unit_cost="500", reference_number="PO-77")
+    item = client.post("/finance/budget-items", json=payload).json()
+    expense = {
+        "event_id": event_id, "transaction_type": "expense", "amount": "180.5", "payment_method": "invoice",
+        "description": "Deposit", "recorded_by": "finance", "reference_number": "po-77",
+    }
+    assert client.post("/finance/transactions", json=expense).status_code == 201
+
+    dry_run = client.post("/finance/transactions/reconcile", json={"event_id": event_id, "dry_run": True}).json()
+    assert (dry_run["matched"], dry_run["updated_items"]) == (1, 1)
+    assert float(client.get(f"/finance/budget-items/{item['id']}").json()["actual_amount"]) == 0
+
+    result = client.post("/finance/transactions/reconcile", json={"event_id": event_id}).json()
+    assert result["matched_by"]["reference_number"] == 1
+    stored = client.get(f"/finance/budget-items/{item['id']}").json()
+    assert (float(stored["actual_amount"]), stored["version"]) == (180.5, 2)
+    transactions = client.get("/finance/transactions", params={"event_id": event_id}).json()["items"]
+    assert transactions[0]["is_reconciled"] and transactions[0]["budget_line_item_id"] == item["id"]
+
+    again = client.post("/finance/transactions/reconcile", json={"event_id": event_id}).json()
+    assert (again["scanned"], again["matched"]) == (0, 0)
+    assert float(client.get(f"/finance/budget-items/{item['id']}").json()["actual_amount"]) == 180.5
@@ -0,0 +1,245 @@
+"""
+FinanceRepository 테스트 (memory / sqlite / sharded 공통)
+- 컬렉션 CRUD, 버전 충돌, 키셋 페이지, 일괄 수정
+- 예산 집계 정합성
+- sharded 샤드 간 일괄 쓰기 (all_or_nothing 거부, 일부 저장 보고)
+- 스폰서십 패키지 보류 / 전환 / 해제 / 만료
+
+Author: Event Agent System
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from schemas.financial import BudgetStatus, ReservationStatus
+from storage import PartialWrite, SoldOut, VersionConflict
+
+from factories import budget_item, reservation, sponsorship_package
+
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_crud_round_trip(repo):
+    item = await repo.budget_items.add(budget_item(uuid4()))
+    assert await repo.budget_items.get(item.id) == item
+
+    updated = await repo.budget_items.update(item.id, lambda i: i.model_copy(update={"name": "Ballroom"}))
+    assert updated.version == 2
+    assert (await repo.budget_items.get(item.id)).name == "Ballroom"
+
+    with pytest.raises(VersionConflict):
+        await repo.budget_items.update(item.id, lambda i: i, expected_versions={1})
+
+    assert await repo.budget_items.remove(item.id) == updated
+    assert await repo.budget_items.get(item.id) is None
+
+
+async def test_page_cursor_covers_every_item_once(repo):
+    event_id = uuid4()
+    start = datetime(2026, 1, 1)
+    items = [budget_item(event_id, name=f"Item {i}", created_at=start + timedelta(seconds=i)) for i in range(7)]
+    await repo.budget_items.add_many(list(reversed(items)))
+
+    seen, after = [], None
+    while True:
+        page, after = await repo.budget_items.page(3, after, event_id=event_id)
+        seen.extend(page)
+        if after is None:
+            break
+    assert [item.id for item in seen] == [item.id for item in items]
+    assert await repo.budget_items.count(event_id=event_id) == 7
+
+
+async def test_update_many_all_or_nothing_writes_nothing_on_conflict(repo):
+    event_id = uuid4()
+    items = [budget_item(event_id, name=f"Item {i}") for i in range(3)]
+    await repo.budget_items.add_many(items)
+
+    paid = lambda item: {"status": BudgetStatus.PAID}
+    results = await repo.budget_items.update_many(
+        [(items[0].id, paid, None), (items[1].id, paid, {99}), (items[2].id, paid, None)],
+        all_or_nothing=True,
+    )
+
+    assert isinstance(results[1], VersionConflict)
+    assert all(item.status == BudgetStatus.DRAFT for item in await repo.budget_items.find(event_id=event_id))
+
+
+async def test_replace_many_conflict_across_events_writes_nothing(repo):
+    items = [budget_item(uuid4(), name=f"Item {i}") for i in range(4)]
+    await repo.budget_items.add_many(items)
+
+    renamed = [item.model_copy(update={"name": "Renamed", "version": 2}) for item in items]
+    renamed[-1] = renamed[-1].model_copy(update={"version": 5})
+    with pytest.raises(VersionConflict):
+        await repo.budget_items.replace_many(renamed)
+
+    stored = await repo.budget_items.get_many([item.id for item in items])
+    assert all(item.name != "Renamed" for item in stored.values())
+
+
+async def test_budget_aggregate_tracks_writes(repo):
+    event_id = uuid4()
+    first = await repo.budget_items.add(budget_item(event_id, unit_cost="12.50", quantity="4"))
+    await repo.budget_items.add(budget_item(event_id, unit_cost="3"))
+    await repo.budget_items.update(first.id, lambda i: i.model_copy(update={"actual_amount": Decimal("45")}))
+
+    aggregate = await repo.budget_aggregate(event_id)
+    assert aggregate.total_items == 2
+    assert aggregate.total_projected == Decimal("53")
+    assert aggregate.total_actual == Decimal("45")
+    assert aggregate.by_currency["USD"] == {"projected": Decimal("53"), "actual": Decimal("45"), "count": 2}
+    assert await repo.check_budget_aggregate(event_id) == []
+
+
+# =============================================================================
+# SHARDED BATCHES
+# =============================================================================
+
+def event_on_shard(collection, shard):
+    while True:
+        event_id = uuid4()
+        if collection.shard_of(event_id) == shard:
+            return event_id
+
+
+async def test_sharded_all_or_nothing_rejects_cross_shard_batch(repo):
+    if repo.backend != "sharded":
+        pytest.skip("sharded only")
+    items = [budget_item(event_on_shard(repo.budget_items, shard)) for shard in (0, 1)]
+    await repo.budget_items.add_many(items)
+
+    paid = lambda item: {"status": BudgetStatus.PAID}
+    with pytest.raises(ValueError):
+        await repo.budget_items.update_many([(item.id, paid, None) for item in items], all_or_nothing=True)
+    stored = await repo.budget_items.get_many([item.id for item in items])
+    assert all(item.status == BudgetStatus.DRAFT for item in stored.values())
+
+
+async def test_sharded_conflict_after_check_reports_saved_records(repo, monkeypatch):
+    if repo.backend != "sharded":
+        pytest.skip("sharded only")
+    collection = repo.budget_items
+    first, second = (budget_item(event_on_shard(collection, shard)) for shard in (0, 1))
+    await collection.add_many([first, second])
+
+    # 0번 샤드 저장 직후 다른 프로세스가 1번 샤드 항목을 먼저 수정한 상황
+    replace_many = collection.parts[0].replace_many
+
+    async def replace_then_interleave(records):
+        count = await replace_many(records)
+        await collection.parts[1].replace(second.model_copy(update={"name": "Other", "version": 2}))
+        return count
+
+    monkeypatch.setattr(collection.parts[0], "replace_many", replace_then_interleave)
+    batch = [item.model_copy(update={"name": "Renamed", "version": 2}) for item in (first, second)]
+    with pytest.raises(PartialWrite) as raised:
+        await collection.replace_many(batch)
+
+    assert [record.id for record in raised.value.written] == [first.id]
+    assert (await collection.get(first.id)).name == "Renamed"
+    assert (await collection.get(second.id)).name == "Other"
+
+
+# =============================================================================
+# RESERVATIONS
+# =============================================================================
+
+async def test_collection_lock_serializes_with_update(repo):
+    item = await repo.budget_items.add(budget_item(uuid4()))
+    async with repo.budget_items.lock(item.event_id):
+        pending = asyncio.ensure_future(
+            repo.budget_items.update(item.id, lambda i: i.model_copy(update={"name": "Ballroom"}))
+        )
+        await asyncio.sleep(0.01)
+        assert not pending.done()
+    assert (await pending).name == "Ballroom"
+
+
+async def test_claim_stops_at_capacity(repo):
+    package = await repo.sponsorship_packages.add(sponsorship_package(uuid4(), max_sponsors=2))
+
+    await repo.claim_package(reservation(package))
+    await repo.claim_package(reservation(package, status=ReservationStatus.CONVERTED))
+    with pytest.raises(SoldOut):
+        await repo.claim_package(reservation(package))
+
+    stored = await repo.sponsorship_packages.get(package.id)
+    assert (stored.held_count, stored.sold_count, stored.available_count) == (1, 1, 0)
+
+
+async def test_concurrent_claims_never_oversell(repo):
+    package = await repo.sponsorship_packages.add(sponsorship_package(uuid4(), max_sponsors=5))
+
+    async def claim():
+        try:
+            return await repo.claim_package(reservation(package))
+        except SoldOut:
+            return None
+
+    claimed = [r for r in await asyncio.gather(*(claim() for _ in range(40))) if r is not None]
+
+    stored = await repo.sponsorship_packages.get(package.id)
+    held = await repo.sponsorship_reservations.find(
+        event_id=package.event_id, package_id=package.id, status=ReservationStatus.HELD
+    )
+    assert len(claimed) == 5
+    assert stored.held_count == len(held) == 5
+
+
+async def test_settle_converts_and_releases(repo):
+    package = await repo.sponsorship_packages.add(sponsorship_package(uuid4(), max_sponsors=1))
+    hold = await repo.claim_package(reservation(package))
+    now = datetime.utcnow()
+    sponsor_id = uuid4()
+
+    converted = await repo.settle_reservation(hold.id, ReservationStatus.CONVERTED, now, sponsor_id)
+    assert (converted.status, converted.sponsor_id) == (ReservationStatus.CONVERTED, sponsor_id)
+    stored = await repo.sponsorship_packages.get(package.id)
+    assert (stored.held_count, stored.sold_count) == (0, 1)
+
+    # 전환된 보류를 다시 전환해도 그대로
+    again = await repo.settle_reservation(hold.id, ReservationStatus.CONVERTED, now)
+    assert again.status == ReservationStatus.CONVERTED
+    assert (await repo.sponsorship_packages.get(package.id)).sold_count == 1
+
+    released = await repo.settle_reservation(hold.id, ReservationStatus.RELEASED, now)
+    assert released.status == ReservationStatus.RELEASED
+    assert (await repo.sponsorship_packages.get(package.id)).available_count == 1
+    assert await repo.settle_reservation(uuid4(), ReservationStatus.RELEASED, now) is None
+
+
+async def test_expired_holds_free_their_slots(repo):
+    package = await repo.sponsorship_packages.add(sponsorship_package(uuid4(), max_sponsors=1))
+    past = datetime.utcnow() - timedelta(hours=1)
+    stale = await repo.claim_package(reservation(package, ttl=timedelta(minutes=1), now=past))
+
+    # 확보 시 같은 패키지의 만료 보류를 먼저 정리
+    fresh = await repo.claim_package(reservation(package))
+    assert (await repo.sponsorship_reservations.get(stale.id)).status == ReservationStatus.EXPIRED
+
+    # 만료된 보류는 전환할 수 없다
+    await repo.settle_reservation(fresh.id, ReservationStatus.RELEASED, datetime.utcnow())
+    late = await repo.claim_package(reservation(package, ttl=timedelta(minutes=1), now=past))
+    settled = await repo.settle_reservation(late.id, ReservationStatus.CONVERTED, datetime.utcnow())
+    assert settled.status == ReservationStatus.EXPIRED
+
+    stored = await repo.sponsorship_packages.get(package.id)
+    assert (stored.held_count, stored.sold_count) == (0, 0)
+
+
+async def test_expire_reservations_sweeps_all_packages(repo):
+    past = datetime.utcnow() - timedelta(hours=1)
+    packages = [await repo.sponsorship_packages.add(sponsorship_package(uuid4())) for _ in range(3)]
+    await repo.claim_package(reservation(packages[0]))
+    for package in packages:
+        await repo.claim_package(reservation(package, ttl=timedelta(minutes=1), now=past))
+
+    assert await repo.expire_reservations(datetime.utcnow()) == 3
+    assert [(await repo.sponsorship_packages.get(p.id)).held_count for p in packages] == [1, 0, 0]
+    assert await repo.expire_reservations(datetime.utcnow()) == 0
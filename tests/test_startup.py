@@ -0,0 +1,45 @@
+"""
+콜드 스타트 테스트
+- main 임포트 시 분석 엔진(numpy)은 로드하지 않음 (첫 분석 요청 때 로드)
+- 워밍업은 엔드포인트 실행 / 요청 지표 기록 없이 끝남
+- 단계별 시작 시간 (/health startup_ms, /metrics app_startup_seconds)
+
+Author: Event Agent System
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_importing_main_defers_analytics_engine():
+    probe = (
+        "import sys, main; "
+        "print(sorted(m for m in ('numpy', 'services.analytics') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", probe], cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_warm_up_runs_no_endpoint_and_records_no_metrics(client):
+    import main
+
+    routes = {key: dict(metrics.statuses) for key, metrics in main.request_metrics.routes.items()}
+    client.portal.call(main.warm_up, main.app)
+    assert {key: dict(metrics.statuses) for key, metrics in main.request_metrics.routes.items()} == routes
+    assert main.request_metrics.in_flight == 0
+
+
+def test_startup_phases_are_reported(client):
+    client.get("/finance/budget-items", params={"limit": 1})
+    startup = client.get("/health").json()["startup_ms"]
+    assert set(startup) == {"import", "storage", "warmup", "first_response"}
+    assert startup["import"] <= startup["storage"] <= startup["warmup"] <= startup["first_response"]
+
+    metrics = client.get("/metrics").text
+    assert 'app_startup_seconds{phase="warmup"}' in metrics